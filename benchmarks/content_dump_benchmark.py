@@ -0,0 +1,98 @@
+"""
+Compares dumping a synthetic content repository in a single process and in several processes.
+
+Usage (from the root of the repository):
+    python -m benchmarks.content_dump_benchmark --packs 50 --processes 1 --processes 4
+"""
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+import typer
+from typing_extensions import Annotated
+
+import demisto_sdk.commands.content_graph.objects.base_content as bc
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logging_setup
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+app = typer.Typer()
+
+
+def time_dump(
+    content_dto: ContentDTO,
+    output: Path,
+    marketplace: MarketplaceVersions,
+    processes: int,
+    repeat: int,
+) -> float:
+    """
+    Returns:
+        float: the best time of dumping the repository, in seconds
+    """
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        content_dto.dump(
+            output / f"{processes}-{i}",
+            marketplace,
+            output_stem=f"{processes}-{i}",
+            processes=processes,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@app.command()
+def benchmark(
+    packs: Annotated[int, typer.Option(help="The number of packs to create")] = 20,
+    processes: Annotated[
+        List[int], typer.Option(help="The numbers of processes to compare")
+    ] = [1, cpu_count()],
+    repeat: Annotated[int, typer.Option(help="The number of runs of each mode")] = 3,
+    marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+    output_file: Annotated[
+        Path, typer.Option(help="A JSON file to write the results to")
+    ] = Path("content_dump_benchmark.json"),
+):
+    """Dump a synthetic repository in a single process and in several processes, and compare the timings."""
+    with TemporaryDirectory() as repo_dir, TemporaryDirectory() as output_dir:
+        repo = Repo(Path(repo_dir))
+        repo.setup_content_repo(packs)
+        bc.CONTENT_PATH = Path(repo.path)
+        content_dto = ContentDTO.from_path(Path(repo.path))
+
+        results = {
+            "packs": packs,
+            "cpu_count": cpu_count(),
+            "marketplace": marketplace.value,
+            "seconds": {
+                str(processes_count): time_dump(
+                    content_dto,
+                    Path(output_dir),
+                    marketplace,
+                    processes_count,
+                    repeat,
+                )
+                for processes_count in processes
+            },
+        }
+
+    serial = results["seconds"].get("1")
+    for processes_count, seconds in results["seconds"].items():
+        speedup = f" (x{serial / seconds:.2f})" if serial else ""
+        typer.echo(f"{processes_count} processes: {seconds:.2f} seconds{speedup}")
+    output_file.write_text(json.dumps(results, indent=4))
+
+
+def main():
+    logging_setup()
+    app()
+
+
+if __name__ == "__main__":
+    main()
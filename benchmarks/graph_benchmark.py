@@ -0,0 +1,394 @@
+"""
+Times the phases of creating, querying, exporting, importing and updating the content graph of a synthetic content
+repository, and compares them to the results of a previous run to catch regressions.
+
+The synthetic repository has packs with an integration with some commands, and a playbook with some tasks. Every task
+runs a command of its own pack, or of another pack (with the probability of the USES density), so the density
+controls the number of dependencies between the packs.
+
+Requires a running neo4j service, or docker to start one, unless `--parse-only` is used.
+
+Usage (from the root of the repository):
+    python -m benchmarks.graph_benchmark --packs 100 --commands 10 --tasks 30 --uses-density 0.2
+    python -m benchmarks.graph_benchmark --packs 100 --baseline graph_benchmark.json --max-regression 0.25
+"""
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+import demisto_sdk.commands.content_graph.objects.base_content as bc
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logging_setup
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
+from demisto_sdk.commands.content_graph.objects import repository
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+app = typer.Typer()
+
+MARKETPLACES = [
+    MarketplaceVersions.XSOAR.value,
+    MarketplaceVersions.MarketplaceV2.value,
+]
+# the number of object ids to search one by one
+SEARCHED_OBJECT_IDS = 50
+
+
+def pack_name(pack_index: int) -> str:
+    return f"BenchmarkPack{pack_index}"
+
+
+def command_name(pack_index: int, command_index: int) -> str:
+    return f"benchmark-pack{pack_index}-command{command_index}"
+
+
+def playbook_yml(
+    name: str,
+    pack_index: int,
+    packs: int,
+    commands: int,
+    tasks: int,
+    uses_density: float,
+    random_generator: random.Random,
+) -> dict:
+    """
+    Returns:
+        dict: a playbook with a start task, and a chain of command tasks after it. Every task runs a command of
+            another pack with the probability of `uses_density`, and a command of its own pack otherwise.
+    """
+    playbook_tasks: Dict[str, dict] = {
+        "0": {
+            "id": "0",
+            "taskid": "0",
+            "type": "start",
+            "task": {"id": "0", "version": -1, "name": "", "iscommand": False},
+            "nexttasks": {"#none#": ["1"]} if tasks else {},
+        }
+    }
+    for task_index in range(1, tasks + 1):
+        used_pack_index = (
+            random_generator.randrange(packs)
+            if random_generator.random() < uses_density
+            else pack_index
+        )
+        command = command_name(used_pack_index, random_generator.randrange(commands))
+        playbook_tasks[str(task_index)] = {
+            "id": str(task_index),
+            "taskid": str(task_index),
+            "type": "regular",
+            "task": {
+                "id": str(task_index),
+                "version": -1,
+                "name": command,
+                "script": f"|||{command}",
+                "type": "regular",
+                "iscommand": True,
+            },
+            "nexttasks": {"#none#": [str(task_index + 1)]}
+            if task_index < tasks
+            else {},
+            # some of the tasks can be skipped, so some of the dependencies are not mandatory
+            "skipunavailable": random_generator.random() < 0.1,
+        }
+    return {
+        "id": name,
+        "version": -1,
+        "name": name,
+        "description": f"Synthetic playbook of {pack_name(pack_index)}",
+        "starttaskid": "0",
+        "tasks": playbook_tasks,
+        "inputs": [],
+        "outputs": [],
+        "fromversion": "6.10.0",
+    }
+
+
+def create_synthetic_repo(
+    repo_dir: Path,
+    packs: int,
+    commands: int,
+    tasks: int,
+    uses_density: float,
+    seed: int,
+) -> Repo:
+    """Creates a content repository with the given size. The same arguments always create the same repository."""
+    random_generator = random.Random(seed)
+    repo = Repo(repo_dir)
+    for pack_index in range(packs):
+        pack = repo.create_pack(pack_name(pack_index))
+        pack.pack_metadata.update({"marketplaces": MARKETPLACES})
+        integration_name = f"{pack_name(pack_index)}Integration"
+        pack.create_integration(
+            integration_name,
+            yml={
+                "commonfields": {"id": integration_name, "version": -1},
+                "name": integration_name,
+                "display": integration_name,
+                "description": f"Synthetic integration of {pack_name(pack_index)}",
+                "category": "Utilities",
+                "script": {
+                    "type": "python",
+                    "subtype": "python3",
+                    "script": "",
+                    "commands": [
+                        {
+                            "name": command_name(pack_index, command_index),
+                            "description": "Synthetic command",
+                            "arguments": [],
+                            "outputs": [],
+                        }
+                        for command_index in range(commands)
+                    ],
+                },
+                "configuration": [],
+                "fromversion": "6.10.0",
+            },
+        )
+        playbook_name = f"{pack_name(pack_index)}Playbook"
+        pack.create_playbook(
+            playbook_name,
+            yml=playbook_yml(
+                playbook_name,
+                pack_index,
+                packs,
+                commands,
+                tasks,
+                uses_density,
+                random_generator,
+            ),
+        )
+    return repo
+
+
+@contextmanager
+def timed_phase(timings: Dict[str, float], phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    timings[phase] = time.perf_counter() - start
+
+
+def parse_repo(repo_path: Path) -> ContentDTO:
+    # the parsed repository is cached by its path, so it is parsed again in every run
+    repository.from_path.cache_clear()
+    return ContentDTO.from_path(repo_path)
+
+
+def run_graph_phases(
+    content_graph_interface: ContentGraphInterface,
+    repo_path: Path,
+    timings: Dict[str, float],
+    marketplace: MarketplaceVersions,
+    update_packs: int,
+) -> Dict[str, int]:
+    """Creates the graph of the repository, and times each phase of creating, querying, exporting, importing and
+    updating it.
+
+    Returns:
+        Dict[str, int]: the number of nodes and relationships of the graph.
+    """
+    with timed_phase(timings, "parse"):
+        content_dto = parse_repo(repo_path)
+    builder = ContentGraphBuilder(content_graph_interface)
+    with timed_phase(timings, "collect"):
+        builder._collect_nodes_and_relationships_from_model(content_dto)
+    with timed_phase(timings, "init_database"):
+        builder.init_database()
+    with timed_phase(timings, "write_nodes"):
+        content_graph_interface.create_nodes(builder.nodes)
+        if builder.defer_indexes:
+            content_graph_interface.create_indexes()
+    with timed_phase(timings, "write_relationships"):
+        content_graph_interface.create_relationships(builder.relationships)
+        content_graph_interface.remove_non_repo_items()
+    with timed_phase(timings, "create_pack_dependencies"):
+        content_graph_interface.create_pack_dependencies()
+
+    with timed_phase(timings, "validations"):
+        content_graph_interface.find_uses_paths_with_invalid_fromversion([])
+        content_graph_interface.find_uses_paths_with_invalid_toversion([])
+        content_graph_interface.find_uses_paths_with_invalid_marketplaces([])
+        content_graph_interface.find_items_using_deprecated_items([])
+        content_graph_interface.get_unknown_content_uses([], raises_error=True)
+        content_graph_interface.validate_duplicate_ids([])
+
+    object_ids = sorted(
+        content_item.object_id
+        for pack in content_dto.packs
+        for content_item in pack.content_items
+    )[:SEARCHED_OBJECT_IDS]
+    # every search phase starts with a new mapping, so the nodes are created again like in a new command
+    content_graph_interface._id_to_obj = {}
+    with timed_phase(timings, "search_by_object_id"):
+        for object_id in object_ids:
+            content_graph_interface.search(marketplace, object_id=object_id)
+    content_graph_interface._id_to_obj = {}
+    with timed_phase(timings, "search_by_object_id_lazy"):
+        for object_id in object_ids:
+            content_graph_interface.search(
+                marketplace, object_id=object_id, lazy_relationships=True
+            )
+    content_graph_interface._id_to_obj = {}
+    with timed_phase(timings, "search_packs_all_level_dependencies"):
+        content_graph_interface.search(
+            marketplace, content_type=ContentType.PACK, all_level_dependencies=True
+        )
+
+    with timed_phase(timings, "export"):
+        content_graph_interface.export_graph(override_commit=False)
+    builder.init_database()
+    with timed_phase(timings, "import"):
+        content_graph_interface.import_graph()
+
+    packs_to_update = tuple(pack.object_id for pack in content_dto.packs[:update_packs])
+    with timed_phase(timings, "update"):
+        repository.from_path.cache_clear()
+        update_builder = ContentGraphBuilder(content_graph_interface)
+        update_builder._collect_nodes_and_relationships_from_model(
+            ContentDTO.from_path(repo_path, packs_to_update)
+        )
+        update_builder._create_or_update_graph()
+        content_graph_interface.create_pack_dependencies()
+
+    return {
+        "nodes": sum(len(nodes) for nodes in builder.nodes.values()),
+        "relationships": sum(
+            len(relationships) for relationships in builder.relationships.values()
+        ),
+    }
+
+
+def find_regressions(results: dict, baseline: dict, max_regression: float) -> List[str]:
+    """
+    Returns:
+        List[str]: the phases which took longer than in the baseline by more than `max_regression` (a fraction).
+    """
+    if results["config"] != baseline.get("config"):
+        typer.echo(
+            "The baseline was created with a different configuration, the results are compared anyway"
+        )
+    regressions = []
+    for phase, seconds in results["seconds"].items():
+        baseline_seconds = baseline.get("seconds", {}).get(phase)
+        if baseline_seconds and seconds > baseline_seconds * (1 + max_regression):
+            regressions.append(
+                f"{phase}: {seconds:.3f}s (baseline {baseline_seconds:.3f}s, x{seconds / baseline_seconds:.2f})"
+            )
+    return regressions
+
+
+@app.command()
+def benchmark(
+    packs: Annotated[int, typer.Option(help="The number of packs to create")] = 50,
+    commands: Annotated[
+        int, typer.Option(help="The number of commands of every integration")
+    ] = 10,
+    tasks: Annotated[
+        int, typer.Option(help="The number of command tasks of every playbook")
+    ] = 20,
+    uses_density: Annotated[
+        float,
+        typer.Option(
+            help="The probability of a playbook task to use a command of another pack"
+        ),
+    ] = 0.1,
+    update_packs: Annotated[
+        int, typer.Option(help="The number of packs to parse again in the update phase")
+    ] = 5,
+    seed: Annotated[int, typer.Option(help="The seed of the synthetic repository")] = 0,
+    repeat: Annotated[
+        int,
+        typer.Option(help="The number of runs, the best time of every phase is kept"),
+    ] = 3,
+    marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+    parse_only: Annotated[
+        bool, typer.Option(help="Only time parsing the repository, without neo4j")
+    ] = False,
+    output_file: Annotated[
+        Path, typer.Option(help="A JSON file to write the results to")
+    ] = Path("graph_benchmark.json"),
+    baseline: Annotated[
+        Optional[Path],
+        typer.Option(
+            help="The JSON results of a previous run, to fail if any phase regressed"
+        ),
+    ] = None,
+    max_regression: Annotated[
+        float,
+        typer.Option(
+            help="The fraction by which a phase can be slower than in the baseline"
+        ),
+    ] = 0.25,
+):
+    """Create, query, export, import and update the graph of a synthetic repository, and time every phase."""
+    baseline_results = json.loads(baseline.read_text()) if baseline else None
+    results: dict = {
+        "config": {
+            "packs": packs,
+            "commands": commands,
+            "tasks": tasks,
+            "uses_density": uses_density,
+            "update_packs": update_packs,
+            "seed": seed,
+            "marketplace": marketplace.value,
+            "parse_only": parse_only,
+        },
+        "seconds": {},
+    }
+    runs: List[Dict[str, float]] = []
+    with TemporaryDirectory() as repo_dir:
+        repo = create_synthetic_repo(
+            Path(repo_dir), packs, commands, tasks, uses_density, seed
+        )
+        repo_path = Path(repo.path)
+        bc.CONTENT_PATH = repo_path
+        if parse_only:
+            for _ in range(repeat):
+                timings: Dict[str, float] = {}
+                with timed_phase(timings, "parse"):
+                    parse_repo(repo_path)
+                runs.append(timings)
+        else:
+            with ContentGraphInterface() as content_graph_interface:
+                content_graph_interface.repo_path = repo_path
+                for _ in range(repeat):
+                    timings = {}
+                    results["graph"] = run_graph_phases(
+                        content_graph_interface,
+                        repo_path,
+                        timings,
+                        marketplace,
+                        update_packs,
+                    )
+                    runs.append(timings)
+
+    for phase in runs[0]:
+        results["seconds"][phase] = min(run[phase] for run in runs)
+    for phase, seconds in results["seconds"].items():
+        typer.echo(f"{phase}: {seconds:.3f}s")
+    output_file.write_text(json.dumps(results, indent=4))
+
+    if baseline_results:
+        if regressions := find_regressions(results, baseline_results, max_regression):
+            typer.echo("Regressions:\n" + "\n".join(regressions))
+            raise typer.Exit(1)
+        typer.echo("No regressions")
+
+
+def main():
+    logging_setup()
+    app()
+
+
+if __name__ == "__main__":
+    main()
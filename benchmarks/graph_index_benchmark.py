@@ -0,0 +1,163 @@
+"""
+Compares the time of creating the content graph of a synthetic content repository with different index profiles,
+and profiles the indexes which the graph queries use.
+
+Requires a running neo4j service, or docker to start one.
+
+Usage (from the root of the repository):
+    python -m benchmarks.graph_index_benchmark --packs 50 --profile-output index_profile.json
+"""
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, Optional
+
+import typer
+from typing_extensions import Annotated
+
+import demisto_sdk.commands.content_graph.objects.base_content as bc
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logging_setup
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
+    DEMISTO_SDK_GRAPH_INDEX_PROFILE,
+    FULL_INDEX_PROFILE_NAME,
+    index_profile_from_usage,
+)
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+app = typer.Typer()
+
+# name: (index profile, whether to create the indexes after loading the nodes)
+MODES = {
+    "full": (FULL_INDEX_PROFILE_NAME, False),
+    "default": ("", False),
+    "default-deferred": ("", True),
+}
+
+
+@contextmanager
+def index_profile(profile: str) -> Iterator[None]:
+    previous = os.environ.pop(DEMISTO_SDK_GRAPH_INDEX_PROFILE, None)
+    if profile:
+        os.environ[DEMISTO_SDK_GRAPH_INDEX_PROFILE] = profile
+    try:
+        yield
+    finally:
+        os.environ.pop(DEMISTO_SDK_GRAPH_INDEX_PROFILE, None)
+        if previous is not None:
+            os.environ[DEMISTO_SDK_GRAPH_INDEX_PROFILE] = previous
+
+
+def create_graph(
+    content_graph_interface: ContentGraphInterface,
+    content_dto: ContentDTO,
+    defer_indexes: bool,
+) -> Dict[str, float]:
+    """
+    Returns:
+        Dict[str, float]: the seconds of each phase of creating the graph from the parsed repository
+    """
+    builder = ContentGraphBuilder(content_graph_interface, defer_indexes=defer_indexes)
+    builder._collect_nodes_and_relationships_from_model(content_dto)
+
+    start = time.perf_counter()
+    builder.init_database()
+    initialized = time.perf_counter()
+    builder._create_or_update_graph()
+    created = time.perf_counter()
+    content_graph_interface.create_pack_dependencies()
+    done = time.perf_counter()
+    return {
+        "init_database": initialized - start,
+        "create_graph": created - initialized,
+        "create_pack_dependencies": done - created,
+        "total": done - start,
+    }
+
+
+def run_workload(
+    content_graph_interface: ContentGraphInterface, marketplace: MarketplaceVersions
+) -> None:
+    """Runs the queries of the commands which read the graph: validations, searches and dependencies."""
+    content_graph_interface.find_uses_paths_with_invalid_fromversion([])
+    content_graph_interface.find_uses_paths_with_invalid_toversion([])
+    content_graph_interface.find_uses_paths_with_invalid_marketplaces([])
+    content_graph_interface.find_items_using_deprecated_items([])
+    content_graph_interface.get_unknown_content_uses([], raises_error=True)
+    content_graph_interface.validate_duplicate_ids([])
+    packs = content_graph_interface.search(
+        marketplace, content_type=ContentType.PACK, all_level_dependencies=True
+    )
+    for pack in packs:
+        content_graph_interface.search(marketplace, object_id=pack.object_id)
+        content_graph_interface.search(path=pack.path)
+
+
+@app.command()
+def benchmark(
+    packs: Annotated[int, typer.Option(help="The number of packs to create")] = 20,
+    repeat: Annotated[int, typer.Option(help="The number of runs of each mode")] = 3,
+    marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+    output_file: Annotated[
+        Path, typer.Option(help="A JSON file to write the results to")
+    ] = Path("graph_index_benchmark.json"),
+    profile_output: Annotated[
+        Optional[Path],
+        typer.Option(
+            help="A JSON file to write the index profile of the indexes which the workload used"
+        ),
+    ] = None,
+):
+    """Create the graph of a synthetic repository with each index mode, and compare the timings."""
+    with TemporaryDirectory() as repo_dir:
+        repo = Repo(Path(repo_dir))
+        repo.setup_content_repo(packs)
+        bc.CONTENT_PATH = Path(repo.path)
+        content_dto = ContentDTO.from_path(Path(repo.path))
+
+        results: dict = {"packs": packs, "marketplace": marketplace.value, "modes": {}}
+        with ContentGraphInterface() as content_graph_interface:
+            for mode, (profile, defer_indexes) in MODES.items():
+                with index_profile(profile):
+                    timings = [
+                        create_graph(
+                            content_graph_interface, content_dto, defer_indexes
+                        )
+                        for _ in range(repeat)
+                    ]
+                results["modes"][mode] = min(timings, key=lambda t: t["total"])
+
+            if profile_output:
+                with index_profile(FULL_INDEX_PROFILE_NAME):
+                    create_graph(content_graph_interface, content_dto, False)
+                run_workload(content_graph_interface, marketplace)
+                profile = index_profile_from_usage(
+                    content_graph_interface.get_index_usage()
+                )
+                profile_output.write_text(json.dumps(profile, indent=4))
+                typer.echo(f"Wrote the index profile to {profile_output}")
+
+    for mode, timing in results["modes"].items():
+        phases = ", ".join(
+            f"{phase}: {seconds:.2f}s" for phase, seconds in timing.items()
+        )
+        typer.echo(f"{mode}: {phases}")
+    output_file.write_text(json.dumps(results, indent=4))
+
+
+def main():
+    logging_setup()
+    app()
+
+
+if __name__ == "__main__":
+    main()
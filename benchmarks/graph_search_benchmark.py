@@ -0,0 +1,160 @@
+"""
+Compares the ways of creating content models from the nodes which graph searches return, and times graph searches.
+
+`materialize` does not need neo4j, `search` requires a running neo4j service, or docker to start one.
+
+Usage (from the root of the repository):
+    python -m benchmarks.graph_search_benchmark materialize --packs 20
+    python -m benchmarks.graph_search_benchmark search --packs 20
+    python -m benchmarks.graph_search_benchmark search --packs 20 --lazy-relationships
+"""
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, List, Tuple, Type
+
+import typer
+from typing_extensions import Annotated
+
+import demisto_sdk.commands.content_graph.objects.base_content as bc
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logging_setup
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
+from demisto_sdk.commands.content_graph.interface.neo4j.node_materializer import (
+    materialize_node,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import (
+    CONTENT_TYPE_TO_MODEL,
+    BaseNode,
+)
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+app = typer.Typer()
+
+METHODS: Dict[str, Callable[[Type[BaseNode], dict], BaseNode]] = {
+    "parse_obj": lambda model, node: model.parse_obj(node),
+    "materialize_node": materialize_node,
+}
+
+
+def create_content_dto(repo_dir: str, packs: int) -> ContentDTO:
+    repo = Repo(Path(repo_dir))
+    repo.setup_content_repo(packs)
+    bc.CONTENT_PATH = Path(repo.path)
+    return ContentDTO.from_path(Path(repo.path))
+
+
+def graph_nodes(content_dto: ContentDTO) -> List[Tuple[Type[BaseNode], dict]]:
+    """
+    Returns:
+        List[Tuple[Type[BaseNode], dict]]: the model and the properties of the graph node of every content item,
+            as neo4j returns them
+    """
+    return [
+        (
+            CONTENT_TYPE_TO_MODEL[content_item.content_type],
+            json.loads(json.dumps(content_item.to_dict(), default=str)),
+        )
+        for pack in content_dto.packs
+        for content_item in [pack, *pack.content_items]
+    ]
+
+
+@app.command()
+def materialize(
+    packs: Annotated[int, typer.Option(help="The number of packs to create")] = 20,
+    repeat: Annotated[int, typer.Option(help="The number of runs of each method")] = 5,
+    output_file: Annotated[
+        Path, typer.Option(help="A JSON file to write the results to")
+    ] = Path("graph_materialize_benchmark.json"),
+):
+    """Create models from the graph nodes of a synthetic repository with each method, and compare the timings."""
+    with TemporaryDirectory() as repo_dir:
+        nodes = graph_nodes(create_content_dto(repo_dir, packs))
+
+    results: dict = {"packs": packs, "nodes": len(nodes), "seconds": {}}
+    for name, method in METHODS.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for model, node in nodes:
+                method(model, node)
+            timings.append(time.perf_counter() - start)
+        results["seconds"][name] = min(timings)
+
+    baseline = results["seconds"]["parse_obj"]
+    for name, seconds in results["seconds"].items():
+        typer.echo(
+            f"{name}: {seconds * 1000:.2f} ms for {len(nodes)} nodes (x{baseline / seconds:.2f})"
+        )
+    output_file.write_text(json.dumps(results, indent=4))
+
+
+@app.command()
+def search(
+    packs: Annotated[int, typer.Option(help="The number of packs to create")] = 20,
+    marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+    lazy_relationships: Annotated[
+        bool, typer.Option(help="Search without fetching the relationships")
+    ] = False,
+    output_file: Annotated[
+        Path, typer.Option(help="A JSON file to write the results to")
+    ] = Path("graph_search_benchmark.json"),
+):
+    """Create the graph of a synthetic repository, and time searching each of its content items by object id."""
+    with TemporaryDirectory() as repo_dir:
+        content_dto = create_content_dto(repo_dir, packs)
+        object_ids = sorted(
+            {
+                content_item.object_id
+                for pack in content_dto.packs
+                for content_item in pack.content_items
+            }
+        )
+        with ContentGraphInterface() as content_graph_interface:
+            builder = ContentGraphBuilder(content_graph_interface)
+            builder._collect_nodes_and_relationships_from_model(content_dto)
+            builder.init_database()
+            builder._create_or_update_graph()
+
+            timings = []
+            for object_id in object_ids:
+                # a new mapping, so the nodes are created again like in a new command
+                content_graph_interface._id_to_obj = {}
+                start = time.perf_counter()
+                content_graph_interface.search(
+                    marketplace,
+                    object_id=object_id,
+                    lazy_relationships=lazy_relationships,
+                )
+                timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    results = {
+        "packs": packs,
+        "marketplace": marketplace.value,
+        "lazy_relationships": lazy_relationships,
+        "searches": len(timings),
+        "total_seconds": sum(timings),
+        "median_ms": timings[len(timings) // 2] * 1000,
+        "max_ms": timings[-1] * 1000,
+    }
+    typer.echo(
+        f"{results['searches']} searches: total {results['total_seconds']:.2f}s, "
+        f"median {results['median_ms']:.2f}ms, max {results['max_ms']:.2f}ms"
+    )
+    output_file.write_text(json.dumps(results, indent=4))
+
+
+def main():
+    logging_setup()
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Configuring tests for the content suite
 """
+import os
 import shutil
 from pathlib import Path
 from typing import Generator
@@ -10,6 +11,7 @@ from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory, _mk_tmp
 
 import demisto_sdk.commands.common.tools as tools
+from demisto_sdk.commands.common.docker.dockerhub_cache import DOCKERHUB_CACHE_DIR
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
 from TestSuite.integration import Integration
 from TestSuite.json_based import JSONBased
@@ -165,6 +167,20 @@ def mock_update_id_set_cpu_count() -> Generator:
         yield _fixture
 
 
+@pytest.fixture(scope="session", autouse=True)
+def dockerhub_cache_dir(tmp_path_factory: TempPathFactory) -> Generator:
+    """
+    Keep the docker hub responses cached by the tests out of the user's cache directory.
+    """
+    with mock.patch.dict(
+        os.environ,
+        {DOCKERHUB_CACHE_DIR: str(tmp_path_factory.mktemp("dockerhub_cache"))},
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
     tools.get_file.cache_clear()
+    if dockerhub_cache := os.getenv(DOCKERHUB_CACHE_DIR):
+        shutil.rmtree(dockerhub_cache, ignore_errors=True)
@@ -1456,6 +1456,14 @@ def coverage_analyze(ctx, **kwargs):
     is_flag=True,
     default=True,
 )
+@click.option(
+    "--workers",
+    help="The number of processes to format with. Used only together with --assume-yes/--assume-no, "
+    "in which case the formatted files are validated together once all of them were formatted.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
 @click.argument("file_paths", nargs=-1, type=click.Path(exists=True, resolve_path=True))
 @click.pass_context
 @logging_setup_decorator
@@ -1493,6 +1501,7 @@ def format(ctx, **kwargs):
             add_tests=kwargs.get("add_tests", False),
             id_set_path=kwargs.get("id_set_path"),
             use_graph=kwargs.get("graph", True),
+            workers=kwargs.get("workers", 1),
         )
 
 
@@ -1890,6 +1899,12 @@ def run_playbook(ctx, **kwargs):
     help="Timeout for the command. The test-playbook will continue to run in your instance",
 )
 @click.option("--insecure", help="Skip certificate validation.", is_flag=True)
+@click.option(
+    "--concurrent",
+    is_flag=True,
+    help="Run all the test playbooks at once and wait for all of them to finish, "
+    "instead of running them one after the other.",
+)
 @click.pass_context
 @logging_setup_decorator
 def run_test_playbook(ctx, **kwargs):
@@ -2542,6 +2557,13 @@ def merge_id_sets(ctx, **kwargs):
     help="If new version contains breaking changes.",
     is_flag=True,
 )
+@click.option(
+    "--workers",
+    help="The number of packs to update concurrently when updating all the changed packs.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
 @click.pass_context
 @logging_setup_decorator
 def update_release_notes(ctx, **kwargs):
@@ -2579,6 +2601,7 @@ def update_release_notes(ctx, **kwargs):
             prev_ver=kwargs.get("prev_ver"),
             is_force=kwargs.get("force", False),
             is_bc=kwargs.get("breaking_changes", False),
+            workers=kwargs.get("workers") or 1,
         )
         rn_mng.manage_rn_update()
         sys.exit(0)
@@ -3036,6 +3059,13 @@ def openapi_codegen(ctx, **kwargs):
     "determine success according to most of the runs",
     default=False,
 )
+@click.option(
+    "--concurrent-tests-per-server",
+    type=int,
+    help="The number of mock-disabled test playbooks to run in parallel on each server. "
+    "Only test playbooks which use different integrations are run in parallel.",
+    default=1,
+)
 @click.option(
     "--server-type",
     help="On which server type runs the tests:XSIAM, XSOAR, XSOAR SAAS",
@@ -3426,7 +3456,7 @@ def create_content_graph(
     ctx.invoke(
         create,
         ctx,
-        marketplace=marketplace,
+        marketplace=[marketplace],
         no_dependencies=no_dependencies,
         output_path=output_path,
         **kwargs,
@@ -3506,7 +3536,7 @@ def update_content_graph(
         update,
         ctx,
         use_git=use_git,
-        marketplace=marketplace,
+        marketplace=[marketplace],
         imported_path=imported_path,
         packs_to_update=packs,
         no_dependencies=no_dependencies,
@@ -0,0 +1,145 @@
+import copy
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+from demisto_sdk.commands.common.timers import CacheStatInfo, register_cache
+
+# types which are never copied when handed out, since they can not be mutated
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    weight: int
+
+
+class BoundedCache:
+    """
+    A thread safe LRU cache, bounded both by the number of entries and by their total weight (e.g. size in bytes).
+
+    Values are deep-copied when handed out, so callers can mutate the returned objects without corrupting the cached
+    value for later callers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 4096,
+        max_weight: int = 256 * 1024 * 1024,
+        copy_value: Callable[[Any], Any] = copy.deepcopy,
+    ):
+        """
+        Args:
+            name: the name of the cache, as shown in the timers report
+            max_entries: the maximal number of cached entries
+            max_weight: the maximal total weight of the cached entries
+            copy_value: copies a cached value before it is handed out
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self._copy_value = copy_value
+        self._lock = RLock()
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._weight = 0
+        self.hits = 0
+        self.misses = 0
+        register_cache(name, self.stat_info)
+
+    def _copy(self, value: Any) -> Any:
+        return value if isinstance(value, IMMUTABLE_TYPES) else self._copy_value(value)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Get a copy of a cached value.
+
+        Args:
+            key: the key of the value
+
+        Returns:
+            Tuple[bool, Any]: whether the key was found, and a copy of its value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return True, self._copy(entry.value)
+
+    def put(self, key: Hashable, value: Any, weight: int = 0) -> Any:
+        """
+        Cache a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key: the key of the value
+            value: the value to cache, it should not be used by the caller afterwards
+            weight: the weight of the value
+
+        Returns:
+            Any: a copy of the value, to be handed out to the caller
+        """
+        with self._lock:
+            if weight > self.max_weight:
+                return value
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._weight -= previous.weight
+            self._entries[key] = _CacheEntry(value, weight)
+            self._weight += weight
+            while (
+                len(self._entries) > self.max_entries or self._weight > self.max_weight
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._weight -= evicted.weight
+        return self._copy(value)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]):
+        """
+        Remove all the entries whose key matches the predicate.
+
+        Args:
+            predicate: returns whether an entry with the given key should be removed
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._weight -= self._entries.pop(key).weight
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def stat_info(self) -> CacheStatInfo:
+        with self._lock:
+            return CacheStatInfo(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self._entries),
+                weight=self._weight,
+            )
+
+
+def get_or_load(
+    cache: BoundedCache,
+    key: Hashable,
+    load: Callable[[], Any],
+    weight: Optional[int] = None,
+) -> Any:
+    """
+    Get a copy of a cached value, loading and caching it on a cache miss.
+
+    Args:
+        cache: the cache
+        key: the key of the value
+        load: loads the value
+        weight: the weight of the value
+
+    Returns:
+        Any: a copy of the cached value
+    """
+    found, value = cache.get(key)
+    if found:
+        return value
+    return cache.put(key, load(), weight=weight or 0)
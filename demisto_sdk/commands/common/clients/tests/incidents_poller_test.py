@@ -0,0 +1,132 @@
+import pytest
+
+from demisto_sdk.commands.common.clients.errors import PollTimeout
+from demisto_sdk.commands.common.clients.xsoar.incidents_poller import (
+    IncidentsPoller,
+)
+from demisto_sdk.commands.common.constants import (
+    IncidentState,
+    InvestigationPlaybookState,
+)
+
+
+class FakeServer:
+    def __init__(self, incidents: dict):
+        self.incidents = incidents
+        self.searches = []
+
+    def search(self, incident_ids):
+        self.searches.append(list(incident_ids))
+        return [
+            {"id": incident_id, **self.incidents[incident_id]}
+            for incident_id in incident_ids
+            if incident_id in self.incidents
+        ]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_poll_resolves_many_incidents_with_a_single_search(mocker):
+    """
+    Given:
+        - A poller watching three incidents, two of them are already closed
+    When:
+        - Running a single poll tick
+    Then:
+        - Ensure a single search request was sent for all the incidents
+        - Ensure only the futures of the closed incidents were resolved
+    """
+    server = FakeServer(
+        {"1": {"status": 2}, "2": {"status": 1}, "3": {"status": IncidentState.CLOSED}}
+    )
+    poller = IncidentsPoller(client=mocker.MagicMock())
+    mocker.patch.object(poller, "_search_incidents", side_effect=server.search)
+    futures = {incident_id: poller.watch_incident(incident_id) for incident_id in "123"}
+
+    poller.poll()
+
+    assert server.searches == [["1", "2", "3"]]
+    assert futures["1"].result()["id"] == "1"
+    assert futures["3"].result()["id"] == "3"
+    assert not futures["2"].done()
+    assert poller.pending == 1
+
+
+def test_poll_splits_large_batches(mocker):
+    """
+    Given:
+        - A poller with a max batch size of 2, watching 5 playbooks
+    When:
+        - Running a single poll tick
+    Then:
+        - Ensure the incidents were searched in batches of 2
+    """
+    server = FakeServer({str(i): {"runStatus": "completed"} for i in range(5)})
+    poller = IncidentsPoller(client=mocker.MagicMock(), max_batch_size=2)
+    mocker.patch.object(poller, "_search_incidents", side_effect=server.search)
+    futures = [poller.watch_playbook(str(i)) for i in range(5)]
+
+    poller.poll()
+
+    assert server.searches == [["0", "1"], ["2", "3"], ["4"]]
+    assert all(future.done() for future in futures)
+
+
+def test_watch_playbook_timeout(mocker):
+    """
+    Given:
+        - A poller watching a playbook which keeps running
+    When:
+        - Polling after the watch timeout has expired
+    Then:
+        - Ensure the future is resolved with a PollTimeout error
+    """
+    clock = FakeClock()
+    server = FakeServer({"1": {"runStatus": "inprogress"}})
+    poller = IncidentsPoller(client=mocker.MagicMock(), clock=clock)
+    mocker.patch.object(poller, "_search_incidents", side_effect=server.search)
+    future = poller.watch_playbook(
+        "1",
+        expected_states=(
+            InvestigationPlaybookState.COMPLETED,
+            InvestigationPlaybookState.FAILED,
+        ),
+        timeout=10,
+    )
+
+    poller.poll()
+    assert not future.done()
+    clock.now = 10
+    poller.poll()
+    with pytest.raises(PollTimeout):
+        future.result()
+    assert not poller.pending
+
+
+def test_background_polling(mocker):
+    """
+    Given:
+        - A started poller watching a playbook which completes on the second poll
+    When:
+        - Waiting for the playbook future
+    Then:
+        - Ensure the future is resolved by the background thread
+    """
+    run_statuses = iter(["inprogress", "completed"])
+    poller = IncidentsPoller(client=mocker.MagicMock(), interval=0.01)
+    mocker.patch.object(
+        poller,
+        "_search_incidents",
+        side_effect=lambda ids: [
+            {"id": incident_id, "runStatus": next(run_statuses, "completed")}
+            for incident_id in ids
+        ],
+    )
+    with poller:
+        assert poller.watch_playbook("1").result(timeout=5)["runStatus"] == "completed"
@@ -0,0 +1,289 @@
+import time
+from concurrent.futures import Future
+from threading import Condition, Thread
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import demisto_client
+from demisto_client.demisto_api.api.default_api import DefaultApi
+
+from demisto_sdk.commands.common.clients.errors import PollTimeout
+from demisto_sdk.commands.common.constants import (
+    IncidentState,
+    InvestigationPlaybookState,
+)
+from demisto_sdk.commands.common.logger import logger
+
+# the numeric incident statuses returned by the server
+INCIDENT_STATUSES = {
+    "0": IncidentState.NEW,
+    "1": IncidentState.IN_PROGRESS,
+    "2": IncidentState.CLOSED,
+}
+
+# the run status of the playbook attached to an incident, as returned by the incidents search
+PLAYBOOK_RUN_STATUSES = {
+    "": InvestigationPlaybookState.NEW,
+    "pending": InvestigationPlaybookState.NEW,
+    "inprogress": InvestigationPlaybookState.IN_PROGRESS,
+    "paused": InvestigationPlaybookState.PAUSED,
+    "waiting": InvestigationPlaybookState.WAITING,
+    "completed": InvestigationPlaybookState.COMPLETED,
+    "error": InvestigationPlaybookState.FAILED,
+    "failed": InvestigationPlaybookState.FAILED,
+}
+
+
+def get_incident_state(incident: dict) -> Optional[IncidentState]:
+    status = str(incident.get("status"))
+    if status in INCIDENT_STATUSES:
+        return INCIDENT_STATUSES[status]
+    try:
+        return IncidentState(status)
+    except ValueError:
+        return None
+
+
+def get_playbook_state(incident: dict) -> Optional[InvestigationPlaybookState]:
+    return PLAYBOOK_RUN_STATUSES.get(str(incident.get("runStatus") or "").lower())
+
+
+class _Watch(NamedTuple):
+    future: Future
+    get_state: Callable[[dict], Optional[str]]
+    expected_states: Tuple[str, ...]
+    deadline: float
+    timeout: float
+    description: str
+
+
+class IncidentsPoller:
+    """
+    Polls the states of many incidents at once.
+
+    Instead of polling each incident with its own loop, every poll tick runs a single incidents search request
+    filtered by the IDs of all the watched incidents, and resolves the future of each incident that reached
+    one of its expected states.
+    """
+
+    def __init__(
+        self,
+        client: DefaultApi,
+        interval: float = 5,
+        max_batch_size: int = 100,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            client: the demisto client of the server
+            interval: the interval between two poll ticks, in seconds
+            max_batch_size: the maximal number of incident IDs to query in a single search request
+            clock: returns the current time, in seconds
+        """
+        self.client = client
+        self.interval = interval
+        self.max_batch_size = max_batch_size
+        self._clock = clock
+        self._watches: Dict[str, List[_Watch]] = {}
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._stopped = False
+
+    def _watch(
+        self,
+        incident_id: str,
+        get_state: Callable[[dict], Optional[str]],
+        expected_states: Iterable[str],
+        timeout: float,
+        description: str,
+    ) -> Future:
+        if timeout <= 0:
+            raise ValueError("timeout argument must be larger than 0")
+        future: Future = Future()
+        watch = _Watch(
+            future=future,
+            get_state=get_state,
+            expected_states=tuple(expected_states),
+            deadline=self._clock() + timeout,
+            timeout=timeout,
+            description=description,
+        )
+        with self._condition:
+            self._watches.setdefault(str(incident_id), []).append(watch)
+            self._condition.notify_all()
+        return future
+
+    def watch_incident(
+        self,
+        incident_id: str,
+        expected_states: Tuple[IncidentState, ...] = (IncidentState.CLOSED,),
+        timeout: float = 120,
+    ) -> Future:
+        """
+        Watches an incident until it reaches one of the expected states.
+
+        Args:
+            incident_id: the incident ID to watch
+            expected_states: which states are considered to be valid for the incident to reach
+            timeout: how long to watch until the incident reaches the expected state
+
+        Returns:
+            a future that is resolved with the raw incident, or with a PollTimeout exception.
+        """
+        return self._watch(
+            incident_id,
+            get_incident_state,
+            expected_states,
+            timeout,
+            description=f"status of incident {incident_id}",
+        )
+
+    def watch_playbook(
+        self,
+        incident_id: str,
+        expected_states: Tuple[InvestigationPlaybookState, ...] = (
+            InvestigationPlaybookState.COMPLETED,
+        ),
+        timeout: float = 120,
+    ) -> Future:
+        """
+        Watches the playbook running on an incident until it reaches one of the expected states.
+
+        Args:
+            incident_id: incident ID that the playbook is running on
+            expected_states: which states are considered to be valid for the playbook to reach
+            timeout: how long to watch until the playbook reaches the expected state
+
+        Returns:
+            a future that is resolved with the raw incident, or with a PollTimeout exception.
+        """
+        return self._watch(
+            incident_id,
+            get_playbook_state,
+            expected_states,
+            timeout,
+            description=f"status of the playbook running in incident {incident_id}",
+        )
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return sum(len(watches) for watches in self._watches.values())
+
+    def _search_incidents(self, incident_ids: List[str]) -> List[dict]:
+        raw_response, _, _ = demisto_client.generic_request_func(
+            self=self.client,
+            method="POST",
+            path="/incidents/search",
+            body={"filter": {"id": incident_ids, "page": 0, "size": len(incident_ids)}},
+            response_type="object",
+        )
+        return (raw_response or {}).get("data") or []
+
+    def poll(self):
+        """
+        Runs a single poll tick - searches all the watched incidents and resolves the futures of the incidents that
+        reached their expected state or timed out.
+        """
+        with self._condition:
+            incident_ids = list(self._watches)
+        incidents: Dict[str, dict] = {}
+        for start in range(0, len(incident_ids), self.max_batch_size):
+            batch = incident_ids[start : start + self.max_batch_size]
+            try:
+                for incident in self._search_incidents(batch):
+                    incidents[str(incident.get("id"))] = incident
+            except Exception as error:
+                logger.debug(f"Could not search incidents {batch}, error: {error}")
+
+        now = self._clock()
+        resolved: List[Tuple[Future, dict]] = []
+        timed_out: List[Tuple[Future, PollTimeout]] = []
+        with self._condition:
+            for incident_id in incident_ids:
+                remaining = []
+                for watch in self._watches.get(incident_id, []):
+                    incident = incidents.get(incident_id)
+                    state = watch.get_state(incident) if incident else None
+                    if state in watch.expected_states:
+                        resolved.append((watch.future, incident))  # type: ignore[arg-type]
+                    elif now >= watch.deadline:
+                        timed_out.append(
+                            (
+                                watch.future,
+                                PollTimeout(
+                                    f"{watch.description} is {state}",
+                                    expected_states=watch.expected_states,
+                                    timeout=int(watch.timeout),
+                                ),
+                            )
+                        )
+                    else:
+                        remaining.append(watch)
+                if remaining:
+                    self._watches[incident_id] = remaining
+                else:
+                    self._watches.pop(incident_id, None)
+        # futures are resolved outside the lock, since their callbacks may watch other incidents
+        for future, incident in resolved:
+            future.set_result(incident)
+        for future, error in timed_out:
+            future.set_exception(error)
+
+    def wait(self, futures: Optional[Iterable[Future]] = None):
+        """
+        Polls in the current thread until the given futures (or all the watched incidents) are done.
+
+        Args:
+            futures: the futures to wait for, all the watched incidents if not provided
+        """
+        futures = list(futures) if futures is not None else None
+
+        def is_done() -> bool:
+            if futures is None:
+                return not self.pending
+            return all(future.done() for future in futures)
+
+        while not is_done():
+            self.poll()
+            if not is_done():
+                time.sleep(self.interval)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._watches and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            self.poll()
+            with self._condition:
+                if self._watches and not self._stopped:
+                    self._condition.wait(self.interval)
+
+    def start(self) -> "IncidentsPoller":
+        """
+        Starts polling in a background thread, which sleeps while no incident is watched.
+        """
+        with self._condition:
+            if self._thread:
+                return self
+            self._stopped = False
+            self._thread = Thread(
+                target=self._run, name="incidents-poller", daemon=True
+            )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread, self._thread = self._thread, None
+        if thread:
+            thread.join()
+
+    def __enter__(self) -> "IncidentsPoller":
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
@@ -27,6 +27,9 @@ from demisto_sdk.commands.common.clients.errors import (
     UnAuthorized,
     UnHealthyServer,
 )
+from demisto_sdk.commands.common.clients.xsoar.incidents_poller import (
+    IncidentsPoller,
+)
 from demisto_sdk.commands.common.constants import (
     MINIMUM_XSOAR_SAAS_VERSION,
     IncidentState,
@@ -743,6 +746,19 @@ class XsoarClient:
             timeout=timeout,
         )
 
+    def get_incidents_poller(self, interval: float = 5) -> IncidentsPoller:
+        """
+        Returns a poller which tracks the states of many incidents (or of the playbooks running on them) at once,
+        using a single incidents search request per poll tick.
+
+        Args:
+            interval: the interval between two poll ticks, in seconds
+
+        Returns:
+            an IncidentsPoller of the server
+        """
+        return IncidentsPoller(self._xsoar_client, interval=interval)
+
     @retry(exceptions=ApiException)
     def delete_incidents(
         self,
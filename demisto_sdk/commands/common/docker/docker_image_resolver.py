@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from demisto_sdk.commands.common.docker.docker_image import DockerImage
+from demisto_sdk.commands.common.docker.dockerhub_client import DockerHubClient
+from demisto_sdk.commands.common.logger import logger
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class DockerImageResolver:
+    """
+    Resolves the docker hub metadata of many docker images concurrently, before they are needed one by one.
+
+    The metadata is fetched through the shared DockerHubClient, whose connection pool and rate-limit are shared by all
+    the workers, and whose caches keep the results for every later user of the client in the run, such as DockerImage
+    and the docker validators.
+    """
+
+    def __init__(
+        self,
+        dockerhub_client: Optional[DockerHubClient] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        Args:
+            dockerhub_client: the client to resolve the images with, the client of DockerImage by default
+            max_workers: the maximal number of concurrent requests
+        """
+        self.dockerhub_client = dockerhub_client or DockerImage._dockerhub_client
+        self.max_workers = max_workers
+
+    def _run(self, func: Callable[[str], object], args: List[str], description: str):
+        def run_one(arg: str):
+            try:
+                func(arg)
+            except Exception as error:
+                # the error is raised again when the metadata is needed, and handled there
+                logger.debug(f"Could not resolve the {description} of {arg}: {error}")
+
+        if not args:
+            return
+        logger.debug(f"Resolving the {description} of {len(args)} docker images")
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(args))
+        ) as executor:
+            list(executor.map(run_one, args))
+
+    def resolve(
+        self,
+        docker_images: Iterable[str],
+        latest_tags: bool = True,
+        tags_metadata: bool = False,
+        envs: bool = False,
+    ) -> Dict[str, DockerImage]:
+        """
+        Resolve the metadata of the unique valid docker images.
+
+        Args:
+            docker_images: the docker images, e.g: demisto/python3:3.10.13.1
+            latest_tags: whether to resolve the latest tag of each image
+            tags_metadata: whether to resolve the metadata of each tag (existence and creation date)
+            envs: whether to resolve the environment variables of each tag (python version)
+
+        Returns:
+            Dict[str, DockerImage]: the valid docker images by their full name
+        """
+        images = {
+            image: parsed
+            for image in sorted(set(filter(None, docker_images)))
+            if (parsed := DockerImage(image)).repository
+            and parsed.image_name
+            and parsed.tag
+        }
+        client = self.dockerhub_client
+        if latest_tags:
+            self._run(
+                client.get_latest_docker_image_tag,
+                sorted({image.name for image in images.values()}),
+                "latest tag",
+            )
+        if tags_metadata:
+            self._run(
+                lambda image: client.get_image_tag_metadata(
+                    images[image].name, tag=images[image].tag
+                ),
+                list(images),
+                "tag metadata",
+            )
+        if envs:
+            self._run(
+                lambda image: client.get_image_env(
+                    images[image].name, tag=images[image].tag
+                ),
+                list(images),
+                "environment",
+            )
+        return images
@@ -0,0 +1,143 @@
+import os
+import time
+from hashlib import sha1
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+from demisto_sdk.commands.common.constants import CACHE_DIR
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import write_dict
+
+DOCKERHUB_CACHE_DIR = "DEMISTO_SDK_DOCKERHUB_CACHE_DIR"
+DOCKERHUB_CACHE_TTL = "DEMISTO_SDK_DOCKERHUB_CACHE_TTL"
+DEFAULT_CACHE_DIR = CACHE_DIR / "dockerhub"
+# tags are pushed rarely, and a stale tag list only delays noticing a new tag
+DEFAULT_CACHE_TTL_SECONDS = 6 * 60 * 60
+# content addressable objects (e.g. blobs by their digest) never change
+IMMUTABLE_URL_PARTS = ("/blobs/sha256:",)
+
+
+class CachedResponse(NamedTuple):
+    body: Any
+    etag: Optional[str]
+    stored_at: float
+    immutable: bool
+
+    def is_fresh(self, ttl: float) -> bool:
+        return self.immutable or time.time() - self.stored_at < ttl
+
+
+class DockerHubResponseCache:
+    """
+    An on-disk cache of the JSON responses of docker hub and of the docker registry, shared between runs.
+
+    Responses are kept for a TTL (DEMISTO_SDK_DOCKERHUB_CACHE_TTL seconds), after which they are revalidated with a
+    conditional request (If-None-Match), and served as is when docker hub can not be reached.
+    Responses of content addressable objects never expire.
+    """
+
+    @property
+    def cache_dir(self) -> Path:
+        return Path(os.getenv(DOCKERHUB_CACHE_DIR) or DEFAULT_CACHE_DIR)
+
+    @property
+    def ttl(self) -> float:
+        try:
+            return float(os.getenv(DOCKERHUB_CACHE_TTL, DEFAULT_CACHE_TTL_SECONDS))
+        except ValueError:
+            logger.debug(
+                f"Invalid {DOCKERHUB_CACHE_TTL}={os.getenv(DOCKERHUB_CACHE_TTL)}, "
+                f"using {DEFAULT_CACHE_TTL_SECONDS} seconds"
+            )
+            return DEFAULT_CACHE_TTL_SECONDS
+
+    @staticmethod
+    def get_key(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        accept: Optional[str] = None,
+    ) -> str:
+        """
+        Get the cache key of a request, the authorization of the request is not part of the key.
+
+        Args:
+            url: full URL
+            params: the query parameters
+            accept: the Accept header, which selects the representation of the response
+        """
+        params_string = "&".join(
+            f"{key}={value}" for key, value in sorted((params or {}).items())
+        )
+        return sha1(f"{url}?{params_string}#{accept or ''}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get a cached response, whether it is fresh or not.
+
+        Args:
+            key: the cache key of the request
+        """
+        try:
+            entry = json.loads(self._path(key).read_text())
+            return CachedResponse(
+                body=entry["body"],
+                etag=entry.get("etag"),
+                stored_at=entry["stored_at"],
+                immutable=entry.get("immutable", False),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.debug(f"Ignoring corrupted docker hub cache entry {key}: {error}")
+            return None
+
+    def get_fresh(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get a cached response only if its TTL has not passed yet.
+
+        Args:
+            key: the cache key of the request
+        """
+        if (cached := self.get(key)) and cached.is_fresh(self.ttl):
+            return cached
+        return None
+
+    def put(self, key: str, url: str, body: Any, etag: Optional[str] = None):
+        """
+        Cache a response, failing to cache is not an error.
+
+        Args:
+            key: the cache key of the request
+            url: the URL of the request, kept for debugging
+            body: the JSON body of the response
+            etag: the ETag header of the response
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_dict(
+                self._path(key),
+                {
+                    "url": url,
+                    "etag": etag,
+                    "stored_at": time.time(),
+                    "immutable": any(part in url for part in IMMUTABLE_URL_PARTS),
+                    "body": body,
+                },
+            )
+        except Exception as error:
+            logger.debug(f"Could not cache the docker hub response of {url}: {error}")
+
+    def refresh(self, key: str, url: str, cached: CachedResponse):
+        """
+        Restart the TTL of a cached response which was revalidated.
+
+        Args:
+            key: the cache key of the request
+            url: the URL of the request
+            cached: the revalidated response
+        """
+        self.put(key, url, cached.body, etag=cached.etag)
@@ -1,13 +1,17 @@
 import os
+import time
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
 
 import dateparser
 import requests
 from packaging.version import InvalidVersion, Version
-from requests.exceptions import ConnectionError, RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 
+from demisto_sdk.commands.common.docker.dockerhub_cache import DockerHubResponseCache
 from demisto_sdk.commands.common.handlers.xsoar_handler import JSONDecodeError
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.StrEnum import StrEnum
@@ -16,6 +20,13 @@ from demisto_sdk.commands.common.tools import retry
 DOCKERHUB_USER = "DOCKERHUB_USER"
 DOCKERHUB_PASSWORD = "DOCKERHUB_PASSWORD"
 DEFAULT_REPOSITORY = "demisto"
+# docker hub rate-limits the requests of each IP, spread the concurrent requests of a run over time
+DEFAULT_MAX_REQUESTS_PER_SECOND = 10
+DEFAULT_CONNECTION_POOL_SIZE = 16
+REGISTRY_ACCEPT_HEADER = (
+    "application/vnd.docker.distribution.manifest.v2+json,"
+    "application/vnd.docker.distribution.manifest.list.v2+json"
+)
 
 
 class DockerHubAuthScope(StrEnum):
@@ -35,6 +46,30 @@ class DockerHubRequestException(Exception):
         return f"Error - {self.message} - Exception - {self.exception}"
 
 
+class RateLimiter:
+    """
+    Spaces the calls of all the threads of a process so that at most max_per_second calls start every second.
+    """
+
+    def __init__(self, max_per_second: float):
+        self.interval = 1 / max_per_second
+        self._lock = Lock()
+        self._next_call = 0.0
+        self._last_call = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._last_call:
+                # the clock went backwards (e.g. it was mocked), start over
+                self._next_call = now
+            self._last_call = now
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 @lru_cache
 class DockerHubClient:
 
@@ -49,6 +84,7 @@ class DockerHubClient:
         username: str = "",
         password: str = "",
         verify_ssl: bool = False,
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
     ):
 
         self.registry_api_url = registry or self.DEFAULT_REGISTRY
@@ -59,8 +95,17 @@ class DockerHubClient:
             (self.username, self.password) if self.username and self.password else None
         )
         self._session = requests.Session()
+        # the session is shared by the threads which resolve docker images concurrently
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_CONNECTION_POOL_SIZE,
+            pool_maxsize=DEFAULT_CONNECTION_POOL_SIZE,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._rate_limiter = RateLimiter(max_requests_per_second)
         self._docker_hub_auth_tokens: Dict[str, Any] = {}
         self.verify_ssl = verify_ssl
+        self._response_cache = DockerHubResponseCache()
 
     def __enter__(self):
         return self
@@ -94,6 +139,7 @@ class DockerHubClient:
             "scope": f"repository:{repo}:{scope}",
         }
 
+        self._rate_limiter.wait()
         response = self._session.get(
             self.TOKEN_URL,
             params=params,
@@ -148,36 +194,90 @@ class DockerHubClient:
         return token
 
     @retry(times=5, exceptions=(ConnectionError, Timeout))
+    def _send_get_request(
+        self,
+        url: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        auth = None if headers and "Authorization" in headers else self.auth
+
+        self._rate_limiter.wait()
+        response = self._session.get(
+            url,
+            headers=headers,
+            params=params,
+            verify=self.verify_ssl,
+            auth=auth,
+        )
+        response.raise_for_status()
+        return response
+
     def get_request(
         self,
         url: str,
         headers: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        get_auth_headers: Optional[Callable[[], Dict[str, str]]] = None,
     ):
         """
         Do a get request to a dockerhub endpoint service
 
+        Responses are cached on disk: fresh responses are returned without a request, stale responses are revalidated
+        with their ETag and are returned as is when dockerhub can not be reached or rate-limits the request.
+
         Args:
             url: full URL
             headers: headers if needed
             params: params if needed
+            get_auth_headers: returns authorization headers, called only if the request is actually sent
         """
-        auth = None if headers and "Authorization" in headers else self.auth
-
-        response = self._session.get(
-            url,
-            headers=headers,
-            params=params,
-            verify=self.verify_ssl,
-            auth=auth,
+        cache_key = self._response_cache.get_key(
+            url, params=params, accept=(headers or {}).get("Accept")
         )
-        response.raise_for_status()
+        cached = self._response_cache.get(cache_key)
+        if cached and cached.is_fresh(self._response_cache.ttl):
+            logger.debug(f"Using the cached response of {url=}")
+            return cached.body
+
+        request_headers = dict(headers or {})
+        if get_auth_headers:
+            request_headers.update(get_auth_headers())
+        if cached and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+
         try:
-            return response.json()
+            response = self._send_get_request(
+                url, headers=request_headers or None, params=params
+            )
+        except RequestException as error:
+            if cached is None or (
+                isinstance(error, HTTPError)
+                and error.response is not None
+                and error.response.status_code != requests.codes.too_many_requests
+                and error.response.status_code < 500
+            ):
+                raise
+            logger.debug(
+                f"Could not get {url=}, using its stale cached response, error: {error}"
+            )
+            return cached.body
+
+        if cached and response.status_code == requests.codes.not_modified:
+            logger.debug(f"The cached response of {url=} was not modified")
+            self._response_cache.refresh(cache_key, url, cached)
+            return cached.body
+
+        try:
+            body = response.json()
         except JSONDecodeError as e:
             raise RuntimeError(
                 f"Failed to get response of {url=}, {response.text=}"
             ) from e
+        self._response_cache.put(
+            cache_key, url, body, etag=response.headers.get("ETag")
+        )
+        return body
 
     @lru_cache
     def do_docker_hub_get_request(
@@ -259,17 +359,21 @@ class DockerHubClient:
         if not url_suffix.startswith("/"):
             url_suffix = f"/{url_suffix}"
 
+        if headers:
+            return self.get_request(
+                f"{self.registry_api_url}/{docker_image}{url_suffix}",
+                headers={key: value for key, value in headers},
+                params={key: value for key, value in params} if params else None,
+            )
+
         return self.get_request(
             f"{self.registry_api_url}/{docker_image}{url_suffix}",
-            headers={key: value for key, value in headers}
-            if headers
-            else None
-            or {
-                "Accept": "application/vnd.docker.distribution.manifest.v2+json,"
-                "application/vnd.docker.distribution.manifest.list.v2+json",
-                "Authorization": f"Bearer {self.get_token(docker_image, scope=scope)}",
-            },
+            headers={"Accept": REGISTRY_ACCEPT_HEADER},
             params={key: value for key, value in params} if params else None,
+            # a token is requested only if the response is not cached
+            get_auth_headers=lambda: {
+                "Authorization": f"Bearer {self.get_token(docker_image, scope=scope)}"
+            },
         )
 
     def get_image_manifests(self, docker_image: str, tag: str) -> Dict[str, Any]:
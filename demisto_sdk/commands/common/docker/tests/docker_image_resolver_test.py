@@ -0,0 +1,108 @@
+from packaging.version import Version
+
+from demisto_sdk.commands.common.docker import (
+    dockerhub_client as dockerhub_client_module,
+)
+from demisto_sdk.commands.common.docker.docker_image_resolver import (
+    DockerImageResolver,
+)
+from demisto_sdk.commands.common.docker.dockerhub_client import (
+    DockerHubClient,
+    RateLimiter,
+)
+
+REGISTRY = "https://registry.local/v2"
+DOCKER_HUB_API = "https://hub.local/v2"
+
+
+def test_resolve_requests_each_unique_image_once(requests_mock):
+    """
+    Given:
+        - a local registry stub with two docker images
+        - duplicate, invalid and empty docker images
+
+    When:
+        - resolving the latest tags and tag metadata of the docker images concurrently
+
+    Then:
+        - ensure only the valid docker images are returned
+        - ensure the tags and the tag metadata of each unique docker image were requested once
+        - ensure getting the latest tags afterwards does not send any request
+    """
+    client = DockerHubClient(
+        docker_hub_api_url=DOCKER_HUB_API,
+        registry=REGISTRY,
+        max_requests_per_second=1000,
+    )
+    requests_mock.get(
+        client.TOKEN_URL,
+        json={"token": "1234", "issued_at": "1234", "expires_in": 300},
+    )
+    for image, tags in (
+        ("demisto/python3", ["3.10.1.1", "3.10.2.3"]),
+        ("demisto/pan-os-python", ["1.0.0.5"]),
+    ):
+        requests_mock.get(f"{REGISTRY}/{image}/tags/list", json={"tags": tags})
+        for tag in tags:
+            requests_mock.get(
+                f"{DOCKER_HUB_API}/repositories/{image}/tags/{tag}",
+                json={"last_updated": "2024-01-01T00:00:00.000000Z"},
+            )
+    docker_images = [
+        "demisto/python3:3.10.1.1",
+        "demisto/python3:3.10.2.3",
+        "demisto/python3:3.10.1.1",
+        "demisto/pan-os-python:1.0.0.5",
+        "python3",
+        "",
+    ]
+
+    images = DockerImageResolver(client, max_workers=4).resolve(
+        docker_images, latest_tags=True, tags_metadata=True
+    )
+
+    assert sorted(images) == [
+        "demisto/pan-os-python:1.0.0.5",
+        "demisto/python3:3.10.1.1",
+        "demisto/python3:3.10.2.3",
+    ]
+    requested_urls = [
+        request.url.split("?")[0] for request in requests_mock.request_history
+    ]
+    for image in images:
+        name, tag = image.split(":")
+        assert (
+            requested_urls.count(f"{DOCKER_HUB_API}/repositories/{name}/tags/{tag}")
+            == 1
+        )
+    assert len([url for url in requested_urls if url.endswith("/tags/list")]) == 2
+
+    requests_count = requests_mock.call_count
+    assert client.get_latest_docker_image_tag("demisto/python3") == Version("3.10.2.3")
+    assert requests_mock.call_count == requests_count
+
+
+def test_rate_limiter_spaces_calls(mocker):
+    """
+    Given:
+        - a rate limiter of 10 calls per second
+
+    When:
+        - calling it three times at the same moment, and then once after the clock went backwards
+
+    Then:
+        - ensure the first call does not wait, and the later calls are spaced by 0.1 seconds
+        - ensure the call after the clock went backwards does not wait
+    """
+    mocker.patch.object(
+        dockerhub_client_module.time,
+        "monotonic",
+        side_effect=[100.0, 100.0, 100.0, 5.0],
+    )
+    sleep = mocker.patch.object(dockerhub_client_module.time, "sleep")
+    rate_limiter = RateLimiter(max_per_second=10)
+
+    for _ in range(4):
+        rate_limiter.wait()
+
+    assert [round(call.args[0], 6) for call in sleep.call_args_list] == [0.1, 0.2]
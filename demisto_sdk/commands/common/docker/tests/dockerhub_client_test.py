@@ -2,10 +2,12 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
 import pytest
+import requests
 from freezegun import freeze_time
 from packaging.version import Version
 from requests import Response, Session
 
+from demisto_sdk.commands.common.docker.dockerhub_cache import DOCKERHUB_CACHE_TTL
 from demisto_sdk.commands.common.docker.dockerhub_client import DockerHubClient
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 
@@ -209,27 +211,27 @@ def test_get_latest_docker_image_tag(
     [
         (
             [
-                {"count": 100, "results": list(range(30)), "next": "next_link"},
-                {"count": 100, "results": list(range(30)), "next": "next_link"},
-                {"count": 100, "results": list(range(30)), "next": "next_link"},
+                {"count": 100, "results": list(range(30)), "next": "next_link?page=2"},
+                {"count": 100, "results": list(range(30)), "next": "next_link?page=3"},
+                {"count": 100, "results": list(range(30)), "next": "next_link?page=4"},
                 {"count": 100, "results": list(range(10)), "next": None},
             ],
             100,
         ),
         (
             [
-                {"count": 600, "results": list(range(100)), "next": "next_link"},
-                {"count": 600, "results": list(range(100)), "next": "next_link"},
-                {"count": 600, "results": list(range(100)), "next": "next_link"},
-                {"count": 600, "results": list(range(100)), "next": "next_link"},
-                {"count": 600, "results": list(range(100)), "next": "next_link"},
+                {"count": 600, "results": list(range(100)), "next": "next_link?page=2"},
+                {"count": 600, "results": list(range(100)), "next": "next_link?page=3"},
+                {"count": 600, "results": list(range(100)), "next": "next_link?page=4"},
+                {"count": 600, "results": list(range(100)), "next": "next_link?page=5"},
+                {"count": 600, "results": list(range(100)), "next": "next_link?page=6"},
                 {"count": 600, "results": list(range(100)), "next": None},
             ],
             600,
         ),
         (
             [
-                {"count": 158, "results": list(range(100)), "next": "next_link"},
+                {"count": 158, "results": list(range(100)), "next": "next_link?page=2"},
                 {"count": 158, "results": list(range(58)), "next": None},
             ],
             158,
@@ -285,3 +287,93 @@ def test_do_docker_hub_get_request_single_object(
     )
 
     assert dockerhub_client.do_docker_hub_get_request("/test") == {"test": "test"}
+
+
+def test_registry_responses_are_cached_on_disk(
+    requests_mock, dockerhub_client: DockerHubClient
+):
+    """
+    Given:
+        - the tags of a docker image which were already retrieved by a previous run
+
+    When:
+        - running get_image_tags method in a new run, before the cache TTL passed
+
+    Then:
+        - ensure that the tags are returned from the disk cache, without requesting a token or the tags
+    """
+    requests_mock.get(
+        "https://auth.docker.io/token",
+        json={"token": "1234", "issued_at": "1234", "expires_in": 300},
+    )
+    tags_url = f"{dockerhub_client.DEFAULT_REGISTRY}/demisto/python3/tags/list"
+    requests_mock.get(tags_url, json={"tags": ["3.10.13.1"]})
+    assert dockerhub_client.get_image_tags("demisto/python3") == ["3.10.13.1"]
+
+    # a new run does not have the in-memory caches
+    dockerhub_client.do_registry_get_request.cache_clear()
+    dockerhub_client._docker_hub_auth_tokens = {}
+    requests_mock.reset_mock()
+
+    assert dockerhub_client.get_image_tags("demisto/python3") == ["3.10.13.1"]
+    assert not requests_mock.called
+
+
+def test_stale_response_is_revalidated(
+    requests_mock, monkeypatch, dockerhub_client: DockerHubClient
+):
+    """
+    Given:
+        - a cached response of docker hub with an ETag, whose TTL passed
+
+    When:
+        - requesting the same URL again, and docker hub responds that it was not modified
+
+    Then:
+        - ensure that the request was sent with the ETag of the cached response
+        - ensure that the cached response is returned
+    """
+    monkeypatch.setenv(DOCKERHUB_CACHE_TTL, "0")
+    url = f"{dockerhub_client.DOCKER_HUB_API_BASE_URL}/repositories/demisto/python3/tags/1.0.0"
+    requests_mock.get(
+        url, json={"last_updated": "2024-01-01T00:00:00.000Z"}, headers={"ETag": "v1"}
+    )
+    assert dockerhub_client.get_request(url) == {
+        "last_updated": "2024-01-01T00:00:00.000Z"
+    }
+
+    requests_mock.get(url, status_code=304)
+    assert dockerhub_client.get_request(url) == {
+        "last_updated": "2024-01-01T00:00:00.000Z"
+    }
+    assert requests_mock.last_request.headers["If-None-Match"] == "v1"
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        {"status_code": 429},
+        {"exc": requests.exceptions.ConnectionError},
+    ],
+)
+def test_stale_response_is_used_when_dockerhub_is_unavailable(
+    mocker, requests_mock, monkeypatch, dockerhub_client: DockerHubClient, failure
+):
+    """
+    Given:
+        - a cached response of docker hub whose TTL passed
+
+    When:
+        - requesting the same URL again, while docker hub rate-limits the requests or can not be reached
+
+    Then:
+        - ensure that the stale cached response is returned
+    """
+    mocker.patch("demisto_sdk.commands.common.tools.time.sleep")
+    monkeypatch.setenv(DOCKERHUB_CACHE_TTL, "0")
+    url = f"{dockerhub_client.DOCKER_HUB_API_BASE_URL}/repositories/demisto"
+    requests_mock.get(url, json={"name": "python3"})
+    assert dockerhub_client.get_request(url) == {"name": "python3"}
+
+    requests_mock.get(url, **failure)
+    assert dockerhub_client.get_request(url) == {"name": "python3"}
@@ -13,8 +13,6 @@ import requests
 import urllib3
 from docker.types import Mount
 from packaging.version import InvalidVersion, Version
-from requests import JSONDecodeError
-from requests.exceptions import RequestException
 
 from demisto_sdk.commands.common.constants import (
     DEFAULT_DOCKER_REGISTRY_URL,
@@ -27,6 +25,10 @@ from demisto_sdk.commands.common.constants import (
     TYPE_PYTHON2,
     TYPE_PYTHON3,
 )
+from demisto_sdk.commands.common.docker.dockerhub_client import (
+    DockerHubClient,
+    DockerHubRequestException,
+)
 from demisto_sdk.commands.common.docker_images_metadata import DockerImagesMetadata
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import retry
@@ -228,10 +230,9 @@ class DockerBase:
             else:
                 try:
                     repo, tag = image.split(":")
-                    token = _get_docker_hub_token(repo)
-                    if _get_image_digest(repo, tag, token):
+                    if DockerHubClient().get_image_digest(repo, tag=tag):
                         return True
-                except RuntimeError as e:
+                except (RuntimeError, DockerHubRequestException) as e:
                     logger.debug(f"Error getting image data {image}: {e}")
                     return False
         return False
@@ -541,62 +542,6 @@ def _get_python_version_from_tag_by_regex(image: str) -> Optional[Version]:
     return None
 
 
-@retry(times=5, exceptions=(RuntimeError, RequestException))
-def _get_docker_hub_token(repo: str) -> str:
-    auth = None
-
-    # If the user has credentials for docker hub, use them to get the token
-    if (docker_user := os.getenv("DOCKERHUB_USER")) and (
-        docker_pass := os.getenv("DOCKERHUB_PASSWORD")
-    ):
-        logger.debug("Using docker hub credentials to get token")
-        auth = (docker_user, docker_pass)
-
-    response = requests.get(
-        f"https://auth.docker.io/token?service=registry.docker.io&scope=repository:{repo}:pull",
-        auth=auth,
-    )
-    if not response.ok:
-        raise RuntimeError(f"Failed to get docker hub token: {response.text}")
-    try:
-        return response.json()["token"]
-    except (JSONDecodeError, KeyError) as e:
-        raise RuntimeError(f"Failed to get docker hub token: {response.text}") from e
-
-
-def _get_image_digest(repo: str, tag: str, token: str) -> str:
-    response = requests.get(
-        f"https://registry-1.docker.io/v2/{repo}/manifests/{tag}",
-        headers={
-            "Accept": "application/vnd.docker.distribution.manifest.v2+json",
-            "Authorization": f"Bearer {token}",
-        },
-    )
-    if not response.ok:
-        raise RuntimeError(f"Failed to get docker image digest: {response.text}")
-    try:
-        return response.json()["config"]["digest"]
-    except (JSONDecodeError, KeyError) as e:
-        raise RuntimeError(f"Failed to get docker image digest: {response.text}") from e
-
-
-@functools.lru_cache
-def _get_image_env(repo: str, digest: str, token: str) -> List[str]:
-    response = requests.get(
-        f"https://registry-1.docker.io/v2/{repo}/blobs/{digest}",
-        headers={
-            "Accept": "application/vnd.docker.distribution.manifest.v2+json",
-            "Authorization": f"Bearer {token}",
-        },
-    )
-    if not response.ok:
-        raise RuntimeError(f"Failed to get docker image env: {response.text}")
-    try:
-        return response.json()["config"]["Env"]
-    except (JSONDecodeError, KeyError) as e:
-        raise RuntimeError(f"Failed to get docker image env: {response.text}") from e
-
-
 def _get_python_version_from_env(env: List[str]) -> Version:
     python_version_envs = tuple(
         filter(lambda env: env.startswith("PYTHON_VERSION="), env)
@@ -699,9 +644,8 @@ def _get_python_version_from_dockerhub_api(image: str) -> Version:
         # we need to remove the gitlab prefix, as we query the API
         repo = repo.replace(f"{DOCKER_REGISTRY_URL}/", "")
     try:
-        token = _get_docker_hub_token(repo)
-        digest = _get_image_digest(repo, tag, token)
-        env = _get_image_env(repo, digest, token)
+        # the image env is cached on disk by the client, so it is requested once across runs
+        env = DockerHubClient().get_image_env(repo, tag=tag)
         return _get_python_version_from_env(env)
     except Exception as e:
         logger.error(
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import ClassVar, Dict, NamedTuple, Optional, Union
+
+from git import Repo  # noqa: TID251: required to read the raw git objects
+
+from demisto_sdk.commands.common.logger import logger
+
+# the default memory budget of the cached blobs of a single repository
+DEFAULT_MAX_CACHED_BLOBS_BYTES = 64 * 1024 * 1024
+# the default number of commits whose trees are kept in memory
+DEFAULT_MAX_CACHED_TREES = 8
+
+
+class TreeEntry(NamedTuple):
+    mode: str
+    type: str  # blob, tree or commit (submodules)
+    sha: str
+
+
+class GitObjectReader:
+    """
+    Reads files of historical commits without spawning a git process per file.
+
+    Each commit tree is listed once with `git ls-tree -r -t`, which resolves every path of the commit to its blob sha,
+    and blobs are read through the persistent `git cat-file --batch` process of the repository.
+    Since commits and blobs are immutable, both are cached by their sha: the trees of the last few commits, and the
+    blobs up to a memory budget, evicting the least recently used ones.
+
+    A single reader is shared by all the GitUtil instances of the same repository, use `GitObjectReader.for_repo`.
+    """
+
+    _readers: ClassVar[Dict[str, "GitObjectReader"]] = {}
+    _readers_lock: ClassVar[RLock] = RLock()
+
+    def __init__(
+        self,
+        repo: Repo,
+        max_cached_blobs_bytes: int = DEFAULT_MAX_CACHED_BLOBS_BYTES,
+        max_cached_trees: int = DEFAULT_MAX_CACHED_TREES,
+    ):
+        """
+        Args:
+            repo: the repository to read the objects from
+            max_cached_blobs_bytes: the maximal total size of the cached blobs
+            max_cached_trees: the maximal number of commit trees to cache
+        """
+        self.repo = repo
+        self.max_cached_blobs_bytes = max_cached_blobs_bytes
+        self.max_cached_trees = max_cached_trees
+        # the persistent cat-file process of GitPython is not thread safe
+        self._lock = RLock()
+        self._trees: "OrderedDict[str, Dict[str, TreeEntry]]" = OrderedDict()
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_blobs_bytes = 0
+
+    @classmethod
+    def for_repo(cls, repo: Repo) -> "GitObjectReader":
+        """
+        Get the shared reader of a repository, creating it on first use.
+
+        Args:
+            repo: the repository to read the objects from
+
+        Returns:
+            GitObjectReader: the reader of the repository
+        """
+        key = str(Path(repo.git_dir).absolute())
+        with cls._readers_lock:
+            if key not in cls._readers:
+                cls._readers[key] = cls(repo)
+            return cls._readers[key]
+
+    @classmethod
+    def clear_readers(cls):
+        with cls._readers_lock:
+            cls._readers.clear()
+
+    def _list_tree(self, commit_sha: str) -> Dict[str, TreeEntry]:
+        tree: Dict[str, TreeEntry] = {}
+        for line in self.repo.git.ls_tree("-r", "-t", "-z", commit_sha).split("\x00"):
+            if not line:
+                continue
+            info, path = line.split("\t", 1)
+            mode, object_type, sha = info.split(" ")
+            tree[path] = TreeEntry(mode, object_type, sha)
+        return tree
+
+    def get_tree(self, commit_sha: str) -> Dict[str, TreeEntry]:
+        """
+        Get all the entries of a commit tree.
+
+        Args:
+            commit_sha: the full sha of the commit
+
+        Returns:
+            Dict[str, TreeEntry]: the tree entries of the commit by their posix path relative to the repository root
+        """
+        with self._lock:
+            if commit_sha in self._trees:
+                self._trees.move_to_end(commit_sha)
+                return self._trees[commit_sha]
+            logger.debug(f"Listing the tree of commit {commit_sha}")
+            tree = self._trees[commit_sha] = self._list_tree(commit_sha)
+            while len(self._trees) > self.max_cached_trees:
+                self._trees.popitem(last=False)
+            return tree
+
+    def get_entry(self, commit_sha: str, path: Union[Path, str]) -> Optional[TreeEntry]:
+        return self.get_tree(commit_sha).get(Path(path).as_posix())
+
+    def has_path(self, commit_sha: str, path: Union[Path, str]) -> bool:
+        """Whether a file or a directory exists in a commit."""
+        return self.get_entry(commit_sha, path) is not None
+
+    def read_blob(self, blob_sha: str) -> bytes:
+        """
+        Read the content of a blob.
+
+        Args:
+            blob_sha: the full sha of the blob
+
+        Returns:
+            bytes: the content of the blob
+        """
+        with self._lock:
+            if blob_sha in self._blobs:
+                self._blobs.move_to_end(blob_sha)
+                return self._blobs[blob_sha]
+            try:
+                _, _, size, data = self.repo.git.get_object_data(blob_sha)
+            except ValueError:
+                # the persistent cat-file process may not see objects written after it had started, restart it
+                self.repo.git.clear_cache()
+                _, _, size, data = self.repo.git.get_object_data(blob_sha)
+            if size <= self.max_cached_blobs_bytes:
+                self._blobs[blob_sha] = data
+                self._cached_blobs_bytes += size
+                while self._cached_blobs_bytes > self.max_cached_blobs_bytes:
+                    _, evicted = self._blobs.popitem(last=False)
+                    self._cached_blobs_bytes -= len(evicted)
+            return data
+
+    def read_file(self, commit_sha: str, path: Union[Path, str]) -> Optional[bytes]:
+        """
+        Read the content of a file in a commit.
+
+        Args:
+            commit_sha: the full sha of the commit
+            path: the path of the file, relative to the repository root
+
+        Returns:
+            bytes: the content of the file, or None if the file does not exist in the commit
+        """
+        entry = self.get_entry(commit_sha, path)
+        if not entry or entry.type != "blob":
+            return None
+        return self.read_blob(entry.sha)
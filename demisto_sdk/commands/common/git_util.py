@@ -2,7 +2,7 @@ import os
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Sequence, Set, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 import click
 import gitdb
@@ -12,7 +12,7 @@ from git import (
 )
 from git.diff import Lit_change_type
 from git.exc import GitError
-from git.objects import Blob, Commit
+from git.objects import Commit
 from git.remote import Remote
 
 from demisto_sdk.commands.common.constants import (
@@ -20,6 +20,7 @@ from demisto_sdk.commands.common.constants import (
     DEMISTO_GIT_UPSTREAM,
     PACKS_FOLDER,
 )
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
 from demisto_sdk.commands.common.logger import logger
 
 
@@ -43,6 +44,218 @@ class GitFileNotFoundError(FileNotFoundError):
         )
 
 
+class GitChange(NamedTuple):
+    status: str  # the git status letter (M, A, D, R, C, T)
+    path: Path  # the current path of the file
+    old_path: Optional[Path] = None  # the previous path of a renamed/copied file
+    score: Optional[int] = None  # the similarity score of a renamed/copied file
+
+
+class GitStatusEntry(NamedTuple):
+    short_status: str  # the status as displayed by `git status --short`, e.g. "M", "AM", "??"
+    path: Path
+    old_path: Optional[Path] = None
+    score: Optional[int] = None
+
+
+class GitChangeSnapshot:
+    def __init__(
+        self,
+        committed: List[GitChange],
+        staged: List[GitChange],
+        status: List[GitStatusEntry],
+    ):
+        """
+        The changes of the current branch, computed once and queried by all the GitUtil status methods.
+
+        Args:
+            committed: The changes committed on the branch since it diverged from the base ref.
+            staged: The changes staged in the index against HEAD.
+            status: The entries of `git status`, including unstaged and untracked files.
+        """
+        self.committed = committed
+        self.staged = staged
+        self.status = status
+        self._committed_statuses = {change.path: change for change in committed}
+
+    @classmethod
+    def from_repo(cls, repo: Repo, base: str, head: str) -> "GitChangeSnapshot":
+        """
+        Computes the snapshot from a single `git diff --name-status` and a single `git status`.
+
+        Args:
+            repo: The git repository.
+            base: The base ref (e.g. origin/master or a commit sha) the branch is compared to.
+            head: The commit sha of the branch.
+        """
+        committed = cls.parse_name_status(
+            repo.git.diff("--name-status", "-M", "-z", f"{base}...{head}")
+        )
+        staged, status = cls.parse_porcelain_status(
+            repo.git.status("--porcelain=v2", "-z", "--untracked-files=all")
+        )
+        return cls(committed, staged, status)
+
+    @staticmethod
+    def _parse_score(status: str) -> Optional[int]:
+        return int(status[1:]) if status[0] in ("R", "C") and status[1:] else None
+
+    @classmethod
+    def parse_name_status(cls, output: str) -> List[GitChange]:
+        """Parses the output of `git diff --name-status -z`."""
+        tokens = output.split("\x00")
+        changes = []
+        i = 0
+        while i < len(tokens):
+            status = tokens[i]
+            i += 1
+            if not status:
+                continue
+            if status[0] in ("R", "C"):
+                old_path, path = tokens[i], tokens[i + 1]
+                i += 2
+                changes.append(
+                    GitChange(
+                        status[0], Path(path), Path(old_path), cls._parse_score(status)
+                    )
+                )
+            else:
+                changes.append(GitChange(status[0], Path(tokens[i])))
+                i += 1
+        return changes
+
+    @classmethod
+    def parse_porcelain_status(
+        cls, output: str
+    ) -> Tuple[List[GitChange], List[GitStatusEntry]]:
+        """
+        Parses the output of `git status --porcelain=v2 -z`.
+
+        Returns:
+            The changes staged in the index, and the status entries of all the changed files.
+        """
+        tokens = output.split("\x00")
+        staged: List[GitChange] = []
+        status: List[GitStatusEntry] = []
+        i = 0
+        while i < len(tokens):
+            entry = tokens[i]
+            i += 1
+            if not entry:
+                continue
+            kind = entry[0]
+            old_path: Optional[Path] = None
+            score: Optional[int] = None
+            if kind == "1":
+                fields = entry.split(" ", 8)
+                xy, path = fields[1], Path(fields[8])
+            elif kind == "2":
+                fields = entry.split(" ", 9)
+                xy, path, old_path = fields[1], Path(fields[9]), Path(tokens[i])
+                score = cls._parse_score(fields[8])
+                i += 1
+            elif kind == "u":
+                fields = entry.split(" ", 10)
+                xy, path = fields[1], Path(fields[10])
+            elif kind == "?":
+                status.append(GitStatusEntry("??", Path(entry[2:])))
+                continue
+            else:
+                # ignored files
+                continue
+            status.append(
+                GitStatusEntry(xy.replace(".", " ").strip(), path, old_path, score)
+            )
+            if kind != "u" and xy[0] != ".":
+                staged.append(
+                    GitChange(
+                        xy[0],
+                        path,
+                        old_path if xy[0] in ("R", "C") else None,
+                        score if xy[0] in ("R", "C") else None,
+                    )
+                )
+        return staged, status
+
+    @property
+    def changed_files(self) -> Set[Path]:
+        """All the files changed on the branch regardless of their status."""
+        return set(self._committed_statuses)
+
+    @property
+    def staged_files(self) -> Set[Path]:
+        return {change.path for change in self.staged}
+
+    @staticmethod
+    def _files_by_status(changes: List[GitChange], status: str) -> Set[Path]:
+        return {change.path for change in changes if change.status == status}
+
+    def committed_files(self, status: str) -> Set[Path]:
+        return self._files_by_status(self.committed, status)
+
+    def staged_changes(self, status: str) -> Set[Path]:
+        return self._files_by_status(self.staged, status)
+
+    @staticmethod
+    def _full_renames(changes: List[GitChange]) -> Set[Tuple[Path, Path]]:
+        return {
+            (change.old_path, change.path)  # type: ignore[misc]
+            for change in changes
+            if change.status == "R" and change.score == 100
+        }
+
+    def committed_renames(self) -> Set[Tuple[Path, Path]]:
+        """The files renamed on the branch with a 100% score, as (old path, new path) tuples."""
+        return self._full_renames(self.committed)
+
+    def staged_renames(self) -> Set[Tuple[Path, Path]]:
+        """The files renamed in the index with a 100% score, as (old path, new path) tuples."""
+        return self._full_renames(self.staged)
+
+    def committed_status(self, path: Path) -> str:
+        """
+        The status of a single file on the branch, as reported by `git diff --name-status <base>...<head> -- <path>`.
+        Renamed and copied files are reported as added since their source is not a part of the diff.
+        """
+        if not (change := self._committed_statuses.get(path)):
+            return ""
+        return "A" if change.status in ("R", "C") else change.status
+
+    def wrongly_renamed_files(self, status: str, staged: bool) -> Set[Path]:
+        """The files recognized as renamed with a non-100% score, whose actual status on the branch is 'status'."""
+        return {
+            change.path
+            for change in (self.staged if staged else self.committed)
+            if change.status == "R"
+            and (change.score or 0) < 100
+            and self.committed_status(change.path) == status
+        }
+
+    def untracked_files(self, requested_status: str) -> set:
+        """
+        All the files of the given status in `git status`, including unstaged and untracked files.
+
+        Args:
+            requested_status (str): M, A, R, D - the git status to return
+        Returns:
+            Set: of Paths which include the untracked files of a certain status,
+            or (old path, new path) tuples of fully renamed files.
+        """
+        extracted_paths: set = set()
+        for entry in self.status:
+            file_status = (
+                "A" if entry.short_status.startswith("?") else entry.short_status
+            )
+            if not file_status.startswith(requested_status):
+                continue
+            if requested_status == "R":
+                if entry.score == 100:
+                    extracted_paths.add((entry.old_path, entry.path))
+            else:
+                extracted_paths.add(entry.path)
+        return extracted_paths
+
+
 class GitUtil:
     # in order to use Repo class/static methods
     REPO_CLS = Repo
@@ -66,6 +279,9 @@ class GitUtil:
             raise InvalidGitRepositoryError(
                 f"Unable to find Repository from current {repo_path.absolute()} - aborting"
             )
+        self._change_snapshots: Dict[
+            Tuple[Optional[str], str, str], GitChangeSnapshot
+        ] = {}
 
     @classmethod
     def from_content_path(cls, path: Optional[Path] = None) -> "GitUtil":
@@ -73,6 +289,10 @@ class GitUtil:
             return cls(Path(content_path), search_parent_directories=False)
         return cls(path)
 
+    @property
+    def object_reader(self) -> GitObjectReader:
+        return GitObjectReader.for_repo(self.repo)
+
     def path_from_git_root(self, path: Union[Path, str]) -> Path:
 
         """
@@ -192,13 +412,12 @@ class GitUtil:
             else str(path)
         )
 
-        try:
-            blob: Blob = commit.tree / path
-        except KeyError:
+        content = self.object_reader.read_file(commit.hexsha, path)
+        if content is None:
             raise GitFileNotFoundError(
                 commit_or_branch, path=path, from_remote=from_remote
             )
-        return blob.data_stream.read()
+        return content
 
     def is_file_exist_in_commit_or_branch(
         self, path: Union[Path, str], commit_or_branch: str, from_remote: bool = True
@@ -210,12 +429,7 @@ class GitUtil:
             logger.exception(f"Could not get commit {commit_or_branch}")
             return False
 
-        path = str(self.path_from_git_root(path))
-
-        try:
-            return commit.tree[path].path == path
-        except KeyError:
-            return False
+        return self.object_reader.has_path(commit.hexsha, self.path_from_git_root(path))
 
     @lru_cache
     def get_all_files(self) -> Set[Path]:
@@ -239,9 +453,6 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the modified files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="M")
         if last_commit:
@@ -250,48 +461,24 @@ class GitUtil:
             )
             return last_commit
 
+        snapshot = self.get_change_snapshot(prev_ver)
+
         # get all renamed files - some of these can be identified as modified by git,
         # but we want to identify them as renamed - so will remove them from the returned files.
         renamed = {item[0] for item in self.renamed_files(prev_ver, committed_only, staged_only)}  # type: ignore[index]
 
         # handle a case where a file is wrongly recognized as renamed (not 100% score) and
         # is actually of modified status
-        untrue_rename_staged = self.handle_wrong_renamed_status(
-            status="M", remote=remote, branch=branch, staged_only=True
-        )
-        untrue_rename_committed = self.handle_wrong_renamed_status(
-            status="M", remote=remote, branch=branch, staged_only=False
-        )
+        untrue_rename_staged = snapshot.wrongly_renamed_files("M", staged=True)
+        untrue_rename_committed = snapshot.wrongly_renamed_files("M", staged=False)
 
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         committed = set()
 
         if not staged_only:
-            # get all committed files identified as modified which are changed from prev_ver.
-            # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed modified files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            # get all committed files identified as modified which were changed on this branch.
+            committed = snapshot.committed_files("M").union(untrue_rename_committed)
 
         # remove the renamed and deleted files from the committed
         committed = committed - renamed - deleted
@@ -305,16 +492,11 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked modified files
-            untracked = self._get_untracked_files("M")
+            untracked = snapshot.untracked_files("M")
 
         # get all the files that are staged on the branch and identified as modified.
         staged = (
-            {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.head.commit.diff().iter_change_type("M")
-            }
-            .union(untracked)
-            .union(untrue_rename_staged)
+            snapshot.staged_changes("M").union(untracked).union(untrue_rename_staged)
         )
 
         # If a file is Added in regards to prev_ver
@@ -322,23 +504,7 @@ class GitUtil:
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
+        committed_added = snapshot.committed_files("A")
 
         staged = staged - committed_added - renamed - deleted
 
@@ -372,9 +538,6 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the added files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="A")
         if last_commit:
@@ -383,40 +546,16 @@ class GitUtil:
             )
             return last_commit
 
+        snapshot = self.get_change_snapshot(prev_ver)
+
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
-        untrue_rename_staged = self.handle_wrong_renamed_status(
-            status="A", remote=remote, branch=branch, staged_only=True
-        )
-        untrue_rename_committed = self.handle_wrong_renamed_status(
-            status="A", remote=remote, branch=branch, staged_only=False
-        )
+        untrue_rename_staged = snapshot.wrongly_renamed_files("A", staged=True)
+        untrue_rename_committed = snapshot.wrongly_renamed_files("A", staged=False)
 
-        # get all committed files identified as added which are changed from prev_ver.
-        # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
-
-        # identify all files that were touched on this branch regardless of status
-        # intersect these with all the committed files to identify the committed added files.
-        all_branch_changed_files = self._get_all_changed_files(prev_ver)
-        committed = committed.intersection(all_branch_changed_files)
+        # get all committed files identified as added which were changed on this branch.
+        committed = snapshot.committed_files("A").union(untrue_rename_committed)
 
         # remove deleted files
         committed = committed - deleted
@@ -431,26 +570,22 @@ class GitUtil:
         untracked_modified: Set = set()
         if include_untracked:
             # get all untracked added files
-            untracked_added = self._get_untracked_files("A")
+            untracked_added = snapshot.untracked_files("A")
 
             # get all untracked modified files
-            untracked_modified = self._get_untracked_files("M")
+            untracked_modified = snapshot.untracked_files("M")
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("A")
-        }.union(untrue_rename_staged)
+        staged = snapshot.staged_changes("A").union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
-        committed_added_locally_modified = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("M")
-        }.intersection(committed)
+        committed_added_locally_modified = snapshot.staged_changes("M").intersection(
+            committed
+        )
         untracked = untracked_added.union(untracked_modified.intersection(committed))
 
         staged = staged.union(committed_added_locally_modified).union(untracked)
@@ -486,41 +621,17 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the deleted files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="D")
         if last_commit:
             return last_commit
 
+        snapshot = self.get_change_snapshot(prev_ver)
         committed = set()
 
         if not staged_only:
-            # get all committed files identified as added which are changed from prev_ver.
-            # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            # get all committed files identified as deleted which were changed on this branch.
+            committed = snapshot.committed_files("D")
 
         if committed_only:
             return committed
@@ -528,13 +639,10 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked deleted files
-            untracked = self._get_untracked_files("D")
+            untracked = snapshot.untracked_files("D")
 
-        # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("D")
-        }.union(untracked)
+        # get all the files that are staged on the branch and identified as deleted.
+        staged = snapshot.staged_changes("D").union(untracked)
 
         if staged_only:
             return staged
@@ -562,9 +670,6 @@ class GitUtil:
             Set: A set of Tuples of Paths to the renamed files -
             first element being the old file path and the second is the new.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="R")
         if last_commit:
@@ -573,42 +678,16 @@ class GitUtil:
             )
             return last_commit
 
+        snapshot = self.get_change_snapshot(prev_ver)
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
         committed = set()
 
         if not staged_only:
-            # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
-            # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
+            # get all committed files identified as renamed with 100% score which were changed on this branch.
             committed = {
                 tuple_item
-                for tuple_item in committed
-                if (
-                    tuple_item[1] in all_branch_changed_files
-                    and tuple_item[1] not in deleted
-                )
+                for tuple_item in snapshot.committed_renames()
+                if tuple_item[1] not in deleted
             }
 
         if committed_only:
@@ -624,14 +703,10 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked renamed files
-            untracked = self._get_untracked_files("R")
+            untracked = snapshot.untracked_files("R")
 
         # get all the files that are staged on the branch and identified as renamed and are with 100% score.
-        staged = {
-            (Path(item.a_path), Path(item.b_path))
-            for item in self.repo.head.commit.diff().iter_change_type("R")
-            if item.score == 100
-        }.union(untracked)
+        staged = snapshot.staged_renames().union(untracked)
 
         if staged_only:
             self.debug_print(
@@ -655,39 +730,43 @@ class GitUtil:
         return all_renamed_files
 
     def get_all_changed_pack_ids(self, prev_ver: str) -> Set[str]:
+        snapshot = self.get_change_snapshot(prev_ver)
         return {
             file.parts[1]
-            for file in self._get_all_changed_files(prev_ver) | self._get_staged_files()
+            for file in snapshot.changed_files | snapshot.staged_files
             if file.parts[0] == PACKS_FOLDER
         }
 
-    def _get_untracked_files(self, requested_status: str) -> set:
-        """return all untracked files of the given requested status.
-        Args:
-            requested_status (str): M, A, R, D - the git status to return
-        Returns:
-            Set: of path strings which include the untracked files of a certain status.
+    def get_change_snapshot(
+        self, prev_ver: Optional[str] = None, refresh: bool = False
+    ) -> GitChangeSnapshot:
         """
-        git_status = self.repo.git.status("--short", "-u").split("\n")
+        Get the snapshot of the changes of the current branch against prev_ver.
+        The snapshot is computed once per prev_ver and HEAD commit, so a long-living GitUtil does not see later
+        changes of the index or the working tree, unless refresh is set.
 
-        # in case there are no local changes - return
-        if git_status == [""]:
-            return set()
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+            refresh (bool): Whether to recompute the snapshot.
 
-        extracted_paths = set()
-        for line in git_status:
-            line = line.strip()
-            file_status = line.split()[0].upper() if not line.startswith("?") else "A"
-            if file_status.startswith(requested_status):
-                if requested_status == "R":
-                    if file_status == "R100":
-                        extracted_paths.add(
-                            (Path(line.split()[-2]), Path(line.split()[-1]))
-                        )
-                else:
-                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
+        Returns:
+            GitChangeSnapshot: The changes snapshot.
+        """
+        remote, branch = self.handle_prev_ver(prev_ver)
+        return self._get_change_snapshot(remote, branch, refresh=refresh)
 
-        return extracted_paths
+    def _get_change_snapshot(
+        self, remote: Optional[str], branch: str, refresh: bool = False
+    ) -> GitChangeSnapshot:
+        current_hash = self.get_current_commit_hash()
+        key = (remote, branch, current_hash)
+        if refresh or key not in self._change_snapshots:
+            self.fetch()
+            base = f"{remote}/{branch}" if remote else branch
+            self._change_snapshots[key] = GitChangeSnapshot.from_repo(
+                self.repo, base, current_hash
+            )
+        return self._change_snapshots[key]
 
     @lru_cache
     def _get_staged_files(self) -> Set[Path]:
@@ -712,29 +791,7 @@ class GitUtil:
         Returns:
             Set[Path]: of Paths to files changed in the current branch.
         """
-
-        self.fetch()
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_hash = self.get_current_commit_hash()
-
-        if remote:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{remote}/{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
+        return self.get_change_snapshot(prev_ver).changed_files
 
     def _only_last_commit(
         self, prev_ver: str, requested_status: Lit_change_type
@@ -897,45 +954,9 @@ class GitUtil:
         Returns:
             Set: of Paths to non 100% renamed files which are of a given status.
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if staged_only:
-            return {
-                Path(item.b_path)
-                for item in self.repo.head.commit.diff().iter_change_type("R")
-                if item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        if remote:
-            return {
-                Path(item.b_path)
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("R")
-                if item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        return {
-            Path(item.b_path)
-            for item in self.repo.commit(rev=branch)
-            .diff(current_branch_or_hash)
-            .iter_change_type("R")
-            if item.score < 100
-            and self._check_file_status(
-                file_path=str(item.b_path), remote=remote, branch=branch
-            )
-            == status
-        }
+        return self._get_change_snapshot(remote, branch).wrongly_renamed_files(
+            status, staged=staged_only
+        )
 
     def _check_file_status(self, file_path: str, remote: str, branch: str) -> str:
         """Get the git status of a given file path
@@ -976,6 +997,20 @@ class GitUtil:
         Returns:
             The fetched file content.
         """
+        rev, _, path = git_file_path.partition(":")
+        try:
+            content = self.object_reader.read_file(self.repo.commit(rev).hexsha, path)
+        except Exception as error:
+            logger.debug(
+                f"Could not read {git_file_path} from the git objects: {error}"
+            )
+            content = None
+        if content is not None:
+            # same as the output of `git show`, which strips the last newline
+            file_content = content.decode(errors="surrogateescape")
+            return file_content[:-1] if file_content.endswith("\n") else file_content
+
+        # let git show read the file, or raise the relevant error
         file_content = self.repo.git.show(git_file_path)
         return file_content
 
@@ -1026,7 +1061,6 @@ class GitUtil:
         Returns:
             Set[Path]: A set of all the changed files in the given branch when comparing to prev_ver
         """
-        self.fetch()
         modified_files: Set[Path] = self.modified_files(
             prev_ver=prev_ver,
             committed_only=committed_only,
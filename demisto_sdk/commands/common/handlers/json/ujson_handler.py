@@ -53,6 +53,7 @@ class UJSON_Handler(XSOAR_Handler):
                 indent=indent if indent is not None else self.indent,
                 sort_keys=sort_keys,
                 escape_forward_slashes=kwargs.get("escape_forward_slashes", False),
+                encode_html_chars=kwargs.get("encode_html_chars", False),
                 ensure_ascii=kwargs.get("ensure_ascii", False),
             )
         except ValueError as e:
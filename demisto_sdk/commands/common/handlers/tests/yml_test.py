@@ -1,6 +1,8 @@
 from io import StringIO
 
+import pytest
 from ruamel.yaml import YAML  # noqa: TID251
+from ruamel.yaml.representer import RepresenterError  # noqa: TID251
 
 from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
 
@@ -38,3 +40,24 @@ class TestYAMLHandler:
 
         assert yaml_dump.yaml.indent.call_count == 1
         yaml_dump.yaml.indent.assert_called_with(sequence=4)
+
+    def test_yaml_handler_reuses_dumper(self):
+        """
+        Given:
+            - A RUAMEL_Handler object
+        When:
+            - Dumping several documents, one of which fails to be dumped
+        Then:
+            - Ensure the same dumper is used for all the documents of the same indent
+            - Ensure the documents dumped after the failure are dumped correctly
+        """
+        yaml = RUAMEL_Handler()
+        first = yaml.dumps({"a": [1, 2]})
+        dumper = yaml._dumpers.by_indent[0]
+
+        assert yaml.dumps({"a": [1, 2]}) == first == "a:\n- 1\n- 2\n"
+        assert yaml._dumpers.by_indent[0] is dumper
+        with pytest.raises(RepresenterError):
+            yaml.dumps({"a": object()})
+        assert yaml.dumps({"b": 1}) == "b: 1\n"
+        assert yaml.dumps({"a": [1, 2]}, indent=4) == "a:\n-   1\n-   2\n"
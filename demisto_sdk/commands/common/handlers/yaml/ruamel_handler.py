@@ -1,3 +1,4 @@
+import threading
 from io import StringIO
 
 from ruamel.yaml import YAML  # noqa:TID251 - this is the handler
@@ -34,6 +35,17 @@ class RUAMEL_Handler(XSOAR_Handler):
         self._width = width
         self._allow_unicode = not ensure_ascii
         self.indent = indent
+        # ruamel instances are not thread safe, the dumpers are cached per thread
+        self._dumpers = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_dumpers"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._dumpers = threading.local()
 
     @property
     def yaml(self) -> YAML:
@@ -45,17 +57,30 @@ class RUAMEL_Handler(XSOAR_Handler):
         yaml.allow_unicode = self._allow_unicode
         return yaml
 
+    def _dump(self, data, stream, indent):
+        """
+        Dump with a cached dumper of the current thread.
+        Unlike loading, dumping does not keep state between calls, so a dumper can be reused for many files.
+        """
+        cached_dumpers = self._dumpers.__dict__.setdefault("by_indent", {})
+        if (yaml := cached_dumpers.get(indent)) is None:
+            yaml = cached_dumpers[indent] = self.yaml
+            if indent:
+                yaml.indent(sequence=indent)
+        try:
+            yaml.dump(data, stream)
+        except Exception:
+            # a failed dump leaves the dumper in the middle of a document, it can not be reused
+            cached_dumpers.pop(indent, None)
+            raise
+
     def load(self, stream):
         return self.yaml.load(stream)
 
     def dump(self, data, stream, indent=None, sort_keys=False, **kwargs):
         if sort_keys:
             data = order_dict(data)
-        yaml = self.yaml
-        indent = indent if indent is not None else self.indent
-        if indent:
-            yaml.indent(sequence=indent)
-        yaml.dump(data, stream)
+        self._dump(data, stream, indent if indent is not None else self.indent)
 
     def dumps(self, data, indent=None, sort_keys=False, **kwargs):
         """
@@ -11,6 +11,10 @@ from demisto_sdk.commands.common.hook_validations.content_entity_validator impor
     ContentEntityValidator,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.playbook_task_graph import (
+    PlaybookTaskGraph,
+    get_ask_condition_branches,
+)
 from demisto_sdk.commands.common.tools import is_string_uuid
 
 
@@ -305,55 +309,21 @@ class PlaybookValidator(ContentEntityValidator):
             bool. if the task handles all condition branches correctly.
         """
         is_all_condition_branches_handled: bool = True
-        next_tasks: Dict = task.get("nexttasks", {})
-
-        # ADD all replyOptions to unhandled_reply_options (UPPER)
-        unhandled_reply_options = set(
-            map(str.upper, task.get("message", {}).get("replyOptions", []))
-        )
+        branches = get_ask_condition_branches(task)
 
-        # Rename the keys in dictionary to upper case
-        next_tasks_upper = {k.upper(): v for k, v in next_tasks.items()}
+        for next_task_branch in branches.unreachable_branches:
+            error_message, error_code = Errors.playbook_unreachable_condition(
+                task.get("id"), next_task_branch
+            )
+            if self.handle_error(error_message, error_code, file_path=self.file_path):
+                self.is_valid = is_all_condition_branches_handled = False
 
-        mapper_dict = {
-            "YES": ["YES", "TRUE POSITIVE"],
-            "TRUE POSITIVE": ["YES", "TRUE POSITIVE"],
-            "NO": ["NO", "FALSE POSITIVE"],
-            "FALSE POSITIVE": ["NO", "FALSE POSITIVE"],
-        }
-
-        # Remove all nexttasks from unhandled_reply_options (UPPER)
-        for next_task_branch, next_task_id in next_tasks_upper.items():
-            key_to_remove = None
-            if next_task_id and next_task_branch != "#DEFAULT#":
-                for mapping in mapper_dict.get(next_task_branch, [next_task_branch]):
-                    if mapping in unhandled_reply_options:
-                        key_to_remove = mapping
-                if key_to_remove:
-                    unhandled_reply_options.remove(key_to_remove)
-                else:
-                    error_message, error_code = Errors.playbook_unreachable_condition(
-                        task.get("id"), next_task_branch
-                    )
-                    if self.handle_error(
-                        error_message, error_code, file_path=self.file_path
-                    ):
-                        self.is_valid = is_all_condition_branches_handled = False
-
-        if unhandled_reply_options:
-            # if there's only one unhandled_reply_options and there's a #default#
-            # then all good.
-            # Otherwise - Error
-            if not (
-                len(unhandled_reply_options) == 1 and "#DEFAULT#" in next_tasks_upper
-            ):
-                error_message, error_code = Errors.playbook_unhandled_reply_options(
-                    task.get("id"), unhandled_reply_options
-                )
-                if self.handle_error(
-                    error_message, error_code, file_path=self.file_path
-                ):
-                    self.is_valid = is_all_condition_branches_handled = False
+        if branches.unhandled_reply_options:
+            error_message, error_code = Errors.playbook_unhandled_reply_options(
+                task.get("id"), branches.unhandled_reply_options
+            )
+            if self.handle_error(error_message, error_code, file_path=self.file_path):
+                self.is_valid = is_all_condition_branches_handled = False
         return is_all_condition_branches_handled
 
     @error_codes("PB124")
@@ -466,18 +436,7 @@ class PlaybookValidator(ContentEntityValidator):
         Return:
             bool. if the Playbook has root is connected to all tasks.
         """
-        start_task_id = self.current_file.get("starttaskid")
-        tasks = self.current_file.get("tasks", {})
-        tasks_bucket = set()
-        next_tasks_bucket = set()
-        for task_id, task in tasks.items():
-            if task_id != start_task_id:
-                tasks_bucket.add(task_id)
-            next_tasks = task.get("nexttasks", {})
-            for next_task_ids in next_tasks.values():
-                if next_task_ids:
-                    next_tasks_bucket.update(next_task_ids)
-        orphan_tasks = tasks_bucket.difference(next_tasks_bucket)
+        orphan_tasks = PlaybookTaskGraph.from_playbook(self.current_file).orphan_tasks
         if orphan_tasks:
             error_message, error_code = Errors.playbook_unconnected_tasks(orphan_tasks)
             if not self.handle_error(
@@ -485,7 +444,7 @@ class PlaybookValidator(ContentEntityValidator):
             ):
                 return False
 
-        return tasks_bucket.issubset(next_tasks_bucket)
+        return not orphan_tasks
 
     @error_codes("PB104")
     def is_valid_as_deprecated(self) -> bool:
@@ -0,0 +1,176 @@
+from collections import deque
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Set
+
+import networkx
+
+DEFAULT_BRANCH = "#DEFAULT#"
+
+# The reply options which each branch of an ask condition handles (upper case)
+ASK_CONDITION_BRANCH_MAPPING = {
+    "YES": ["YES", "TRUE POSITIVE"],
+    "TRUE POSITIVE": ["YES", "TRUE POSITIVE"],
+    "NO": ["NO", "FALSE POSITIVE"],
+    "FALSE POSITIVE": ["NO", "FALSE POSITIVE"],
+}
+
+
+class AskConditionBranches(NamedTuple):
+    # the id of the task, as written in the task
+    task_id: str
+    # branches with next tasks, which are not reply options
+    unreachable_branches: List[str]
+    # reply options without next tasks (empty when the default branch handles them)
+    unhandled_reply_options: Set[str]
+
+
+def get_ask_condition_branches(task: dict) -> AskConditionBranches:
+    """Matches the branches of an ask condition task to its reply options.
+    NOTE: The branches and the reply options are compared in upper case, to be case insensitive
+
+    Args:
+        task (dict): An ask condition task.
+
+    Returns:
+        AskConditionBranches: The unreachable branches and the unhandled reply options of the task.
+    """
+    next_tasks_upper = {
+        branch.upper(): next_task_ids
+        for branch, next_task_ids in task.get("nexttasks", {}).items()
+    }
+    unhandled_reply_options = set(
+        map(str.upper, task.get("message", {}).get("replyOptions", []))
+    )
+    unreachable_branches = []
+    for branch, next_task_ids in next_tasks_upper.items():
+        if not next_task_ids or branch == DEFAULT_BRANCH:
+            continue
+        reply_option_to_remove = None
+        for reply_option in ASK_CONDITION_BRANCH_MAPPING.get(branch, [branch]):
+            if reply_option in unhandled_reply_options:
+                reply_option_to_remove = reply_option
+        if reply_option_to_remove:
+            unhandled_reply_options.remove(reply_option_to_remove)
+        else:
+            unreachable_branches.append(branch)
+
+    # a single unhandled reply option is handled by the default branch
+    if len(unhandled_reply_options) == 1 and DEFAULT_BRANCH in next_tasks_upper:
+        unhandled_reply_options = set()
+    return AskConditionBranches(
+        task.get("id"), unreachable_branches, unhandled_reply_options
+    )
+
+
+class PlaybookTaskGraph:
+    """The flow of the tasks of a playbook, compiled once and shared by the playbook parsers and validators.
+
+    The tasks which are reachable from the start task, and whether they are mandatory, are found in a single BFS.
+    A task is mandatory if there is a path to it from the start task, on which no task can be skipped
+    (`skipunavailable`). A task which was first reached by an optional path is visited again when a mandatory path
+    to it is found, so every task is visited at most twice.
+    """
+
+    def __init__(self, tasks: Dict[str, dict], start_task_id: str = "") -> None:
+        """
+        Args:
+            tasks (Dict[str, dict]): The tasks of the playbook, by their ids.
+            start_task_id (str): The id of the start task of the playbook.
+        """
+        self.tasks = tasks
+        self.start_task_id = start_task_id
+        # the ids of the next tasks of each task, which are tasks of the playbook
+        self.next_tasks: Dict[str, List[str]] = {
+            task_id: list(
+                dict.fromkeys(
+                    next_task_id
+                    for next_task_ids in (task.get("nexttasks") or {}).values()
+                    for next_task_id in next_task_ids or []
+                    if next_task_id in tasks
+                )
+            )
+            for task_id, task in tasks.items()
+        }
+        # the reachable tasks, and whether they are mandatory
+        self.mandatory: Dict[str, bool] = self._find_reachable_tasks()
+
+    @classmethod
+    def from_playbook(cls, playbook_data: dict) -> "PlaybookTaskGraph":
+        """
+        Args:
+            playbook_data (dict): playbook yml data.
+
+        Returns:
+            PlaybookTaskGraph: the task graph of the playbook.
+        """
+        return cls(
+            playbook_data.get("tasks") or {}, playbook_data.get("starttaskid", "")
+        )
+
+    def _find_reachable_tasks(self) -> Dict[str, bool]:
+        # the start task is the root of the graph, and is mandatory even if it is missing from the tasks
+        mandatory = {self.start_task_id: True}
+        queue = deque([self.start_task_id])
+        while queue:
+            task_id = queue.popleft()
+            task_mandatory = mandatory[task_id]
+            for next_task_id in self.next_tasks.get(task_id, []):
+                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
+                next_task_mandatory = task_mandatory and not self.tasks[
+                    next_task_id
+                ].get("skipunavailable", False)
+                if next_task_id not in mandatory:
+                    mandatory[next_task_id] = next_task_mandatory
+                    queue.append(next_task_id)
+                elif next_task_mandatory and not mandatory[next_task_id]:
+                    # If one of the paths to the task is mandatory - set as mandatory, and its next tasks too.
+                    mandatory[next_task_id] = True
+                    queue.append(next_task_id)
+        return mandatory
+
+    def is_reachable(self, task_id: str) -> bool:
+        return task_id in self.mandatory
+
+    def is_mandatory(self, task_id: str) -> bool:
+        """
+        Returns:
+            bool: whether the task is reachable by a path of tasks which cannot be skipped.
+        """
+        return self.mandatory.get(task_id, False)
+
+    @cached_property
+    def unreachable_tasks(self) -> List[str]:
+        """The ids of the tasks which cannot be reached from the start task"""
+        return [task_id for task_id in self.tasks if task_id not in self.mandatory]
+
+    @cached_property
+    def orphan_tasks(self) -> Set[str]:
+        """The ids of the tasks, except for the start task, which are not the next task of any task"""
+        next_task_ids = {
+            next_task_id
+            for next_task_ids in self.next_tasks.values()
+            for next_task_id in next_task_ids
+        }
+        return set(self.tasks) - next_task_ids - {self.start_task_id}
+
+    @cached_property
+    def ask_conditions(self) -> Dict[str, AskConditionBranches]:
+        """The branches of the ask condition tasks, by the ids of the tasks"""
+        return {
+            task_id: get_ask_condition_branches(task)
+            for task_id, task in self.tasks.items()
+            if task.get("type") == "condition" and task.get("message")
+        }
+
+    def to_networkx(self) -> networkx.DiGraph:
+        """
+        Returns:
+            networkx.DiGraph: the reachable tasks, with their "mandatory" attribute, and the edges between them.
+        """
+        graph = networkx.DiGraph()
+        for task_id, mandatory in self.mandatory.items():
+            graph.add_node(task_id, mandatory=mandatory)
+        for task_id in self.mandatory:
+            for next_task_id in self.next_tasks.get(task_id, []):
+                graph.add_edge(task_id, next_task_id)
+        return graph
@@ -0,0 +1,71 @@
+from demisto_sdk.commands.common.bounded_cache import BoundedCache, get_or_load
+from demisto_sdk.commands.common.timers import registered_caches
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    """
+    Given
+        - A cache bounded to 2 entries and a total weight of 10
+    When
+        - Adding more entries than allowed, and a heavier entry than allowed
+    Then
+        - Ensure the least recently used entries are evicted
+        - Ensure an entry heavier than the whole cache is not cached
+    """
+    cache = BoundedCache("test_evictions", max_entries=2, max_weight=10)
+    cache.put("a", 1, weight=4)
+    cache.put("b", 2, weight=4)
+    cache.get("a")
+    cache.put("c", 3, weight=4)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+
+    cache.put("d", 4, weight=6)
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, 3)
+
+    cache.put("e", 5, weight=11)
+    assert cache.get("e") == (False, None)
+    assert cache.stat_info().weight == 10
+
+
+def test_bounded_cache_values_are_copied():
+    """
+    Given
+        - A cache with a loaded mutable value
+    When
+        - Mutating the value handed out by the cache
+    Then
+        - Ensure the cached value is not affected
+        - Ensure the hits and misses are counted and reported to the timers
+    """
+    cache = BoundedCache("test_copies")
+    loaded = get_or_load(cache, "key", lambda: {"a": [1]})
+    loaded["a"].append(2)
+
+    assert get_or_load(cache, "key", lambda: {}) == {"a": [1]}
+    stat_info = registered_caches["test_copies"]()
+    assert (stat_info.hits, stat_info.misses, stat_info.entries) == (1, 1, 1)
+
+
+def test_bounded_cache_invalidate():
+    """
+    Given
+        - A cache with entries of two files
+    When
+        - Invalidating the entries of one file
+    Then
+        - Ensure only the entries of that file were removed
+    """
+    cache = BoundedCache("test_invalidate")
+    cache.put(("a", 1), 1, weight=1)
+    cache.put(("a", 2), 2, weight=1)
+    cache.put(("b", 1), 3, weight=1)
+
+    cache.invalidate(lambda key: key[0] == "a")
+
+    assert cache.get(("b", 1)) == (True, 3)
+    assert cache.stat_info().entries == 1
+    assert cache.stat_info().weight == 1
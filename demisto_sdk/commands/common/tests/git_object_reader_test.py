@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import git
+import pytest
+from git import Repo  # noqa: TID251
+
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+from demisto_sdk.commands.common.git_util import GitFileNotFoundError, GitUtil
+
+
+@pytest.fixture
+def repo(tmp_path) -> Repo:
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@test.com")
+    yield repo
+    GitObjectReader.clear_readers()
+
+
+def commit_files(repo: Repo, files: dict) -> str:
+    for path, content in files.items():
+        full_path = Path(repo.working_dir) / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    repo.git.add(A=True)
+    return repo.index.commit("commit").hexsha
+
+
+def test_read_file_content_lists_each_commit_once(mocker, repo):
+    """
+    Given
+        - Two commits of a repository with several files
+    When
+        - Reading the files of both commits many times, from several GitUtil instances
+    Then
+        - Ensure the content of each file is read from the right commit
+        - Ensure each commit tree was listed once, and each blob was read once
+        - Ensure missing files raise a GitFileNotFoundError
+    """
+    first = commit_files(
+        repo, {"Packs/A/pack_metadata.json": "first\n", "Packs/B/README.md": "b\n"}
+    )
+    second = commit_files(repo, {"Packs/A/pack_metadata.json": "second\n"})
+    execute = mocker.spy(git.cmd.Git, "execute")
+    get_object_data = mocker.spy(git.cmd.Git, "get_object_data")
+
+    for _ in range(3):
+        git_util = GitUtil(Path(repo.working_dir))
+        assert (
+            git_util.read_file_content(
+                "Packs/A/pack_metadata.json", first, from_remote=False
+            )
+            == b"first\n"
+        )
+        assert (
+            git_util.read_file_content(
+                Path(repo.working_dir) / "Packs/A/pack_metadata.json",
+                second,
+                from_remote=False,
+            )
+            == b"second\n"
+        )
+        assert (
+            git_util.read_file_content("Packs/B/README.md", second, from_remote=False)
+            == b"b\n"
+        )
+        assert git_util.is_file_exist_in_commit_or_branch(
+            Path(repo.working_dir) / "Packs/B", second, from_remote=False
+        )
+        with pytest.raises(GitFileNotFoundError):
+            git_util.read_file_content("Packs/C/README.md", first, from_remote=False)
+
+    commands = [call.args[1][1] for call in execute.call_args_list]
+    assert commands.count("ls-tree") == 2
+    # the README blob is the same in both commits
+    assert get_object_data.call_count == 3
+
+
+def test_get_local_remote_file_content(repo):
+    """
+    Given
+        - A commit of a repository
+    When
+        - Getting the content of a file in the `<ref>:<path>` format
+    Then
+        - Ensure the content is the same as the output of `git show`
+        - Ensure a missing file raises the error of `git show`
+    """
+    commit_files(repo, {"README.md": "line 1\nline 2\n"})
+    git_util = GitUtil(Path(repo.working_dir))
+
+    assert git_util.get_local_remote_file_content("HEAD:README.md") == repo.git.show(
+        "HEAD:README.md"
+    )
+    with pytest.raises(git.GitCommandError):
+        git_util.get_local_remote_file_content("HEAD:missing.md")
+
+
+def test_get_local_remote_file_content_not_utf8(repo):
+    """
+    Given
+        - A committed file which is not valid UTF-8
+    When
+        - Getting the content of the file in the `<ref>:<path>` format
+    Then
+        - Ensure the content is the same as the output of `git show`, instead of failing to decode it
+    """
+    (Path(repo.working_dir) / "README.md").write_bytes(b"caf\xe9\n")
+    repo.git.add(A=True)
+    repo.index.commit("commit")
+    git_util = GitUtil(Path(repo.working_dir))
+
+    assert git_util.get_local_remote_file_content("HEAD:README.md") == repo.git.show(
+        "HEAD:README.md"
+    )
+
+
+def test_blob_cache_is_bounded(repo):
+    """
+    Given
+        - A reader whose blob cache is limited to 10 bytes
+    When
+        - Reading three blobs of 4 bytes
+    Then
+        - Ensure the least recently used blob was evicted
+    """
+    sha = commit_files(repo, {"a": "aaaa", "b": "bbbb", "c": "cccc"})
+    reader = GitObjectReader(repo, max_cached_blobs_bytes=10)
+
+    for path in ("a", "b", "c"):
+        reader.read_file(sha, path)
+
+    tree = reader.get_tree(sha)
+    assert list(reader._blobs) == [tree["b"].sha, tree["c"].sha]
+    assert reader._cached_blobs_bytes == 8
@@ -1,3 +1,6 @@
+from pathlib import Path
+
+
 def test_find_primary_branch():
     """
     Given
@@ -49,3 +52,80 @@ def test_find_primary_branch():
     refs_other.refs = ["a", "b"]
     repo_with_remotes_refs_other.remotes.append(refs_other)
     assert not GitUtil.find_primary_branch(repo_with_remotes_refs_other)
+
+
+def test_change_snapshot_is_computed_once(mocker, tmp_path):
+    """
+    Given
+        - A branch which modified, deleted, renamed and added files against the base commit
+        - A staged added file, an untracked file and an unstaged modification of a committed added file
+
+    When
+        - Querying the modified, added, deleted and renamed files and the changed pack ids
+
+    Then
+        - Ensure every status is computed as before
+        - Ensure a single `git diff` and a single `git status` were executed for all the queries
+    """
+    import git
+    from git import Repo  # noqa: TID251
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    origin = Repo.init(tmp_path / "origin", bare=True)
+    repo = Repo.init(tmp_path / "repo")
+    repo.create_remote("origin", str(origin.working_dir))
+    root = Path(repo.working_dir)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@test.com")
+
+    def write(path: str, content: str):
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+
+    write("Packs/Modified/file.txt", "base\n")
+    write("Packs/Deleted/file.txt", "deleted\n")
+    write("Packs/Renamed/old.txt", "renamed\n")
+    repo.git.add(A=True)
+    base = repo.index.commit("base").hexsha
+
+    write("Packs/Modified/file.txt", "modified\n")
+    repo.git.rm("Packs/Deleted/file.txt")
+    repo.git.mv("Packs/Renamed/old.txt", "Packs/Renamed/new.txt")
+    write("Packs/Added/file.txt", "added\n")
+    repo.git.add(A=True)
+    repo.index.commit("branch changes")
+
+    write("Packs/Staged/file.txt", "staged\n")
+    repo.git.add("Packs/Staged/file.txt")
+    write("Packs/Untracked/file.txt", "untracked\n")
+    write("Packs/Added/file.txt", "added and modified\n")
+
+    execute = mocker.spy(git.cmd.Git, "execute")
+    git_util = GitUtil(root)
+
+    assert git_util.modified_files(base) == {Path("Packs/Modified/file.txt")}
+    assert git_util.added_files(base, include_untracked=True) == {
+        Path("Packs/Added/file.txt"),
+        Path("Packs/Staged/file.txt"),
+        Path("Packs/Untracked/file.txt"),
+    }
+    assert git_util.added_files(base, committed_only=True) == {
+        Path("Packs/Added/file.txt")
+    }
+    assert git_util.deleted_files(base) == {Path("Packs/Deleted/file.txt")}
+    assert git_util.renamed_files(base) == {
+        (Path("Packs/Renamed/old.txt"), Path("Packs/Renamed/new.txt"))
+    }
+    assert git_util.get_all_changed_pack_ids(base) == {
+        "Modified",
+        "Deleted",
+        "Renamed",
+        "Added",
+        "Staged",
+    }
+
+    commands = [call.args[1][1] for call in execute.call_args_list]
+    assert commands.count("diff") == 1
+    assert commands.count("status") == 1
@@ -0,0 +1,111 @@
+from demisto_sdk.commands.common.playbook_task_graph import PlaybookTaskGraph
+from demisto_sdk.commands.common.update_id_set import build_tasks_graph
+
+
+def create_task(*next_task_ids: str, **kwargs) -> dict:
+    return {"nexttasks": {"#none#": list(next_task_ids)}, **kwargs}
+
+
+def test_mandatory_path_found_after_optional_path():
+    """
+    Given:
+        - a playbook where task 3 is first reached through a skippable task, and then through a mandatory path
+
+    When:
+        - compiling the task graph
+
+    Then:
+        - ensure task 3 and the task after it are mandatory
+        - ensure the skippable task is not mandatory
+    """
+    playbook = {
+        "starttaskid": "0",
+        "tasks": {
+            "0": create_task("1", "2"),
+            "1": create_task("3", skipunavailable=True),
+            "2": create_task("4"),
+            "3": create_task("5"),
+            "4": create_task("3"),
+            "5": create_task(),
+        },
+    }
+
+    task_graph = PlaybookTaskGraph.from_playbook(playbook)
+
+    assert task_graph.is_mandatory("3")
+    assert task_graph.is_mandatory("5")
+    assert not task_graph.is_mandatory("1")
+    assert build_tasks_graph(playbook).nodes["5"]["mandatory"]
+
+
+def test_unreachable_and_orphan_tasks():
+    """
+    Given:
+        - a playbook with a task which no task leads to, a task which only it leads to, and a missing next task
+
+    When:
+        - compiling the task graph
+
+    Then:
+        - ensure both tasks are unreachable, and not mandatory
+        - ensure only the task which no task leads to is an orphan
+        - ensure the missing task is ignored
+    """
+    playbook = {
+        "starttaskid": "0",
+        "tasks": {
+            "0": create_task("1", "missing"),
+            "1": create_task(),
+            "2": create_task("3"),
+            "3": create_task(),
+        },
+    }
+
+    task_graph = PlaybookTaskGraph.from_playbook(playbook)
+
+    assert task_graph.unreachable_tasks == ["2", "3"]
+    assert task_graph.orphan_tasks == {"2"}
+    assert not task_graph.is_mandatory("3")
+    assert not task_graph.is_reachable("missing")
+    assert set(build_tasks_graph(playbook).nodes) == {"0", "1"}
+
+
+def test_ask_conditions():
+    """
+    Given:
+        - an ask condition task with a branch which is not a reply option, and a reply option without a branch
+        - an ask condition task whose single unhandled reply option is handled by the default branch
+
+    When:
+        - compiling the task graph
+
+    Then:
+        - ensure the unreachable branch and the unhandled reply option of the first task are found
+        - ensure the second task has no unhandled reply options
+    """
+    playbook = {
+        "starttaskid": "0",
+        "tasks": {
+            "0": {
+                "id": "ask",
+                "type": "condition",
+                "message": {"replyOptions": ["Yes", "Maybe"]},
+                "nexttasks": {"true positive": ["1"], "no": ["1"]},
+            },
+            "1": {
+                "id": "ask with default",
+                "type": "condition",
+                "message": {"replyOptions": ["Yes", "No"]},
+                "nexttasks": {"yes": ["2"], "#default#": ["2"]},
+            },
+            "2": create_task(),
+        },
+    }
+
+    ask_conditions = PlaybookTaskGraph.from_playbook(playbook).ask_conditions
+
+    assert ask_conditions["0"].task_id == "ask"
+    assert ask_conditions["0"].unreachable_branches == ["NO"]
+    assert ask_conditions["0"].unhandled_reply_options == {"MAYBE"}
+    assert ask_conditions["1"].unreachable_branches == []
+    assert ask_conditions["1"].unhandled_reply_options == set()
@@ -117,6 +117,8 @@ from demisto_sdk.commands.common.tools import (
     str2bool,
     string_to_bool,
     to_kebab_case,
+    write_dict,
+    write_file_if_changed,
 )
 from demisto_sdk.tests.constants_test import (
     DUMMY_SCRIPT_PATH,
@@ -788,6 +790,47 @@ class TestGetFile:
         assert file_data
         assert file_data.get("name") is not None
 
+    def test_get_file_result_is_copy_safe(self, tmp_path):
+        """
+        Given
+        - A json file which was already read
+
+        When
+        - Mutating the returned data and reading the file again
+
+        Then
+        - Ensure the second read was served from the cache and is not affected by the mutation
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": {"b": 1}}')
+        hits = tools._FILES_CACHE.hits
+
+        first = get_file(file_path)
+        first["a"]["b"] = 2
+        second = get_file(file_path)
+
+        assert second == {"a": {"b": 1}}
+        assert tools._FILES_CACHE.hits == hits + 1
+
+    def test_get_file_is_read_again_when_changed(self, tmp_path):
+        """
+        Given
+        - A yml file which was already read
+
+        When
+        - Changing the file and reading it again
+
+        Then
+        - Ensure the new content is returned
+        """
+        file_path = tmp_path / "file.yml"
+        file_path.write_text("a: 1\n")
+        assert get_file(file_path) == {"a": 1}
+
+        file_path.write_text("a: 22\n")
+
+        assert get_file(file_path) == {"a": 22}
+
 
 def test_get_latest_release_notes_text_invalid():
     """
@@ -3330,3 +3373,74 @@ def test_check_timestamp_format():
     assert not check_timestamp_format(missing_z)
     assert not check_timestamp_format(only_date)
     assert not check_timestamp_format(with_hyphen)
+
+
+class TestWriteFileIfChanged:
+    def test_unchanged_file_is_not_written(self, tmp_path: Path):
+        """
+        Given
+        - A json file.
+
+        When
+        - Writing the same data into the file again, and then different data.
+
+        Then
+        - Ensure the file was not rewritten when its content did not change, so its modification time was kept.
+        - Ensure the file was replaced when its content changed, keeping its permissions.
+        """
+        path = tmp_path / "file.json"
+        assert write_dict(path, {"a": 1}, indent=4)
+        path.chmod(0o640)
+        os.utime(path, ns=(0, 0))
+
+        assert not write_dict(path, {"a": 1}, indent=4)
+        assert path.stat().st_mtime_ns == 0
+
+        assert write_dict(path, {"a": 2}, indent=4)
+        assert path.stat().st_mtime_ns != 0
+        assert json.loads(path.read_text()) == {"a": 2}
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_keeps_file(self, tmp_path: Path, mocker):
+        """
+        Given
+        - A text file.
+
+        When
+        - Failing in the middle of writing new content into the file.
+
+        Then
+        - Ensure the original file was kept as is, and the temporary file was removed.
+        """
+        path = tmp_path / "README.md"
+        path.write_text("original")
+        mocker.patch.object(os, "replace", side_effect=OSError)
+
+        with pytest.raises(OSError):
+            write_file_if_changed(path, "new content")
+
+        assert path.read_text() == "original"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_unicode_error_falls_back_to_unicode_write(self, tmp_path: Path, mocker):
+        """
+        Given
+        - A json file which is not encoded as unicode.
+
+        When
+        - Failing to write new data into the file atomically with a unicode error.
+
+        Then
+        - Ensure the file was rewritten as unicode with the new data.
+        """
+        path = tmp_path / "file.json"
+        path.write_bytes('{"name": "caf\u00e9"}'.encode("cp1252"))
+        mocker.patch.object(
+            tools,
+            "write_file_if_changed",
+            side_effect=UnicodeEncodeError("utf-8", "", 0, 1, ""),
+        )
+
+        assert write_dict(path, {"name": "caf\u00e9 2"}, indent=4)
+        assert json.loads(path.read_text(encoding="utf-8")) == {"name": "caf\u00e9 2"}
@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from functools import wraps
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Callable, Dict, Optional, Sequence
 
 # Third party packages
 from tabulate import tabulate
@@ -16,20 +16,26 @@ from tabulate import tabulate
 from demisto_sdk.commands.common.logger import logger
 
 StatInfo = namedtuple("StatInfo", ["total_time", "call_count", "avg_time"])
+CacheStatInfo = namedtuple("CacheStatInfo", ["hits", "misses", "entries", "weight"])
 
 registered_timers: dict = defaultdict(set)
 
+# the caches are shared by all the commands, so they are reported with every timers group
+registered_caches: Dict[str, Callable[[], CacheStatInfo]] = {}
+
 packs: dict = {}
 
 
 class MeasureType(Enum):
     FUNCTIONS = "functions"
     PACKS = "packs"
+    CACHES = "caches"
 
 
 MEASURE_TYPE_TO_HEADERS: Dict[MeasureType, Sequence[str]] = {
     MeasureType.FUNCTIONS: ["Function", "Avg", "Total", "Call count"],
     MeasureType.PACKS: ["Pack", "Start Time", "End Time", "Total Time"],
+    MeasureType.CACHES: ["Cache", "Hits", "Misses", "Hit rate", "Entries", "Weight"],
 }
 
 
@@ -133,6 +139,17 @@ def timer(group_name="Common"):
     return group_timer
 
 
+def register_cache(name: str, stat_info: Callable[[], CacheStatInfo]):
+    """
+    Register a cache, so its hit/miss counters are reported with the time measurements
+
+    Arg:
+        name(str): the name of the cache
+        stat_info(Callable): returns the current counters of the cache
+    """
+    registered_caches[name] = stat_info
+
+
 def report_time_measurements(
     group_name="Common", time_measurements_dir="time_measurements"
 ):
@@ -158,6 +175,30 @@ def report_time_measurements(
             write_measure_to_file(
                 time_measurements_dir, func_name, data, measure_type=MeasureType.PACKS
             )
+    if registered_caches:
+        cache_states = []
+        for name, stat_info in sorted(registered_caches.items()):
+            info = stat_info()
+            lookups = info.hits + info.misses
+            cache_states.append(
+                [
+                    name,
+                    f"{info.hits}",
+                    f"{info.misses}",
+                    f"{info.hits / lookups if lookups else 0:0.4f}",
+                    f"{info.entries}",
+                    f"{info.weight}",
+                ]
+            )
+        write_measure_to_logger(
+            f"{group_name} caches", cache_states, MeasureType.CACHES, debug=True
+        )
+        write_measure_to_file(
+            time_measurements_dir=time_measurements_dir,
+            name=f"{group_name}_caches",
+            csv_data=cache_states,
+            measure_type=MeasureType.CACHES,
+        )
     timers = registered_timers.get(group_name)
     if timers:
 
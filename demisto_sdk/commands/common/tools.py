@@ -5,7 +5,9 @@ import glob
 import os
 import re
 import shlex
+import stat
 import sys
+import tempfile
 import time
 import traceback
 import urllib.parse
@@ -50,6 +52,7 @@ from packaging.version import Version
 from pebble import ProcessFuture, ProcessPool
 from requests.exceptions import HTTPError
 
+from demisto_sdk.commands.common.bounded_cache import BoundedCache, get_or_load
 from demisto_sdk.commands.common.constants import (
     ALL_FILES_VALIDATION_IGNORE_WHITELIST,
     API_MODULES_PACK,
@@ -844,35 +847,70 @@ def safe_write_unicode(
         _write()  # recreates the file
 
 
-@lru_cache
-def get_file(
-    file_path: str | Path,
-    clear_cache: bool = False,
-    return_content: bool = False,
-    keep_order: bool = False,
-    raise_on_error: bool = False,
-    git_sha: Optional[str] = None,
-):
+def _get_default_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# the permissions of newly written files, as if they were created with open()
+DEFAULT_FILE_MODE = _get_default_file_mode()
+
+
+def write_file_if_changed(path: Union[Path, str], content: Union[str, bytes]) -> bool:
     """
-    Get file contents.
-    if raise_on_error = False, this function will return empty dict
+    Write content into a file atomically, skipping the write when the file already has the same content.
+
+    Skipping unchanged files keeps their modification time, so caches keyed by it (e.g. get_file) and tools which
+    detect changed files by it are not invalidated needlessly.
+    The content is written to a temporary file in the same directory which then replaces the file, so readers never
+    see a partially written file.
+
+    Args:
+        path: the path of the file
+        content: the content to write, strings are encoded as utf-8
+
+    Returns:
+        bool: whether the file was written
     """
-    if clear_cache:
-        get_file.cache_clear()
-    file_path = Path(file_path)  # type: ignore[arg-type]
-    if git_sha:
-        if file_path.is_absolute():
-            file_path = file_path.relative_to(get_content_path())
-        return get_remote_file(
-            str(file_path), tag=git_sha, return_content=return_content
+    path = Path(os.path.realpath(path))
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    try:
+        current_stat: Optional[os.stat_result] = path.stat()
+    except FileNotFoundError:
+        current_stat = None
+    if current_stat and current_stat.st_size == len(data) and path.read_bytes() == data:
+        logger.debug(f"Skipping writing {path}, its content did not change")
+        return False
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(
+            temp_path,
+            stat.S_IMODE(current_stat.st_mode) if current_stat else DEFAULT_FILE_MODE,
         )
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return True
 
-    type_of_file = file_path.suffix.lower()
 
-    if not file_path.exists():
-        file_path = Path(get_content_path()) / file_path  # type: ignore[arg-type]
-    if not file_path.exists():
-        raise FileNotFoundError(file_path)
+# the parsed files are cached by their path, modification time, size, git sha and reading mode
+_FILES_CACHE = BoundedCache("get_file", max_entries=4096, max_weight=256 * 1024 * 1024)
+
+
+def _read_file(
+    file_path: Path,
+    return_content: bool = False,
+    keep_order: bool = False,
+    raise_on_error: bool = False,
+):
+    type_of_file = file_path.suffix.lower()
     try:
         file_content = safe_read_unicode(file_path.read_bytes())
         if return_content:
@@ -902,6 +940,60 @@ def get_file(
         return {}
 
 
+def get_file(
+    file_path: str | Path,
+    clear_cache: bool = False,
+    return_content: bool = False,
+    keep_order: bool = False,
+    raise_on_error: bool = False,
+    git_sha: Optional[str] = None,
+):
+    """
+    Get file contents.
+    if raise_on_error = False, this function will return empty dict
+
+    The parsed files are cached, every caller gets its own copy of the file contents.
+    A file is read again once its modification time or size change, or when clear_cache is set.
+    """
+    file_path = Path(file_path)  # type: ignore[arg-type]
+    mode = (return_content, keep_order, raise_on_error)
+    if git_sha:
+        if file_path.is_absolute():
+            file_path = file_path.relative_to(get_content_path())
+        if clear_cache:
+            _FILES_CACHE.invalidate(lambda key: key[0] == str(file_path))
+        return get_or_load(
+            _FILES_CACHE,
+            (str(file_path), None, None, git_sha, mode),
+            lambda: get_remote_file(
+                str(file_path), tag=git_sha, return_content=return_content
+            ),
+        )
+
+    if not file_path.exists():
+        file_path = Path(get_content_path()) / file_path  # type: ignore[arg-type]
+    if not file_path.exists():
+        raise FileNotFoundError(file_path)
+
+    absolute_path = str(file_path.absolute())
+    if clear_cache:
+        _FILES_CACHE.invalidate(lambda key: key[0] == absolute_path)
+    try:
+        stat = file_path.stat()
+    except OSError:
+        # can not be cached without its modification time, let the read report the error
+        return _read_file(file_path, return_content, keep_order, raise_on_error)
+    return get_or_load(
+        _FILES_CACHE,
+        (absolute_path, stat.st_mtime_ns, stat.st_size, None, mode),
+        lambda: _read_file(file_path, return_content, keep_order, raise_on_error),
+        weight=stat.st_size,
+    )
+
+
+get_file.cache_clear = _FILES_CACHE.clear  # type: ignore[attr-defined]
+
+
 def get_file_or_remote(file_path: Path, clear_cache=False):
     content_path = get_content_path()
     relative_file_path = None
@@ -936,16 +1028,12 @@ def get_yaml(
     keep_order: bool = False,
     git_sha: Optional[str] = None,
 ):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(
         file_path, clear_cache=cache_clear, keep_order=keep_order, git_sha=git_sha
     )
 
 
 def get_json(file_path: str | Path, cache_clear=False, git_sha: Optional[str] = None):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(file_path, clear_cache=cache_clear, git_sha=git_sha)
 
 
@@ -2907,9 +2995,14 @@ def write_dict(
     indent: int = 0,
     sort_keys: bool = False,
     **kwargs,
-):
+) -> bool:
     """
     Write unicode content into a json/yml file.
+    The file is written atomically, and only if the serialized content differs from the content of the file.
+    If the content can not be written as unicode, the file is written with safe_write_unicode instead.
+
+    Returns:
+        bool: whether the file was written
     """
     path = Path(path)
     if not handler:
@@ -2921,9 +3014,16 @@ def write_dict(
         else:
             raise ValueError(f"The file {path} is neither json/yml")
 
-    safe_write_unicode(
-        lambda f: handler.dump(data, f, indent, sort_keys, **kwargs), path  # type: ignore[union-attr]
-    )
+    try:
+        return write_file_if_changed(
+            path, handler.dumps(data, indent, sort_keys, **kwargs)
+        )
+    except UnicodeError:
+        logger.debug(f"Could not write {path} atomically, writing it as unicode")
+        safe_write_unicode(
+            lambda f: handler.dump(data, f, indent, sort_keys, **kwargs), path  # type: ignore[union-attr]
+        )
+        return True
 
 
 def to_kebab_case(s: str):
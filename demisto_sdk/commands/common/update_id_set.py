@@ -59,6 +59,7 @@ from demisto_sdk.commands.common.content_constant_paths import (
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.playbook_task_graph import PlaybookTaskGraph
 from demisto_sdk.commands.common.tools import (
     find_type,
     get_current_repo,
@@ -350,49 +351,7 @@ def build_tasks_graph(playbook_data):
     Returns:
         DiGraph: all tasks of given playbook.
     """
-    initial_task = playbook_data.get("starttaskid", "")
-    tasks = playbook_data.get("tasks", {})
-
-    graph = networkx.DiGraph()
-    graph.add_node(
-        initial_task, mandatory=True
-    )  # add starting task as root of the direct graph
-
-    found_new_tasks = True
-    while found_new_tasks:
-        current_number_of_nodes = graph.number_of_nodes()
-        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
-
-        for leaf in leaf_nodes:
-            leaf_task = tasks.get(leaf)
-            leaf_mandatory = graph.nodes[leaf]["mandatory"]
-
-            # In this case the playbook is invalid, starttaskid contains invalid task id.
-            if not leaf_task:
-                continue
-
-            leaf_next_tasks = sum(leaf_task.get("nexttasks", {}).values(), [])  # type: ignore
-
-            for task_id in leaf_next_tasks:
-                task = tasks.get(task_id)
-                if not task:
-                    continue
-
-                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
-                mandatory = leaf_mandatory and not task.get("skipunavailable", False)
-                if task_id not in graph.nodes():
-                    graph.add_node(task_id, mandatory=mandatory)
-                else:
-                    # If task already in graph, update mandatory field.
-                    # If one of the paths to the task is mandatory - set as mandatory.
-                    graph.nodes[task_id]["mandatory"] = (
-                        graph.nodes[task_id]["mandatory"] or mandatory
-                    )
-                graph.add_edge(leaf, task_id)
-
-        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
-
-    return graph
+    return PlaybookTaskGraph.from_playbook(playbook_data).to_networkx()
 
 
 def get_lists_names_from_playbook(
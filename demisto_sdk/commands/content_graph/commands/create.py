@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
@@ -31,6 +31,7 @@ def create_content_graph(
     marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
     dependencies: bool = True,
     output_path: Optional[Path] = None,
+    marketplaces: Optional[List[MarketplaceVersions]] = None,
 ) -> None:
     """This function creates a new content graph database in neo4j from the content path
 
@@ -39,6 +40,8 @@ def create_content_graph(
         marketplace (MarketplaceVersions): The marketplace to update.
         dependencies (bool): Whether to create the dependencies.
         output_path (Path): The path to export the graph zip to.
+        marketplaces (List[MarketplaceVersions], optional): The marketplaces to export the graph zip for, instead of
+            `marketplace`. The graph is created once for all of them.
     """
     builder = ContentGraphBuilder(content_graph_interface)
     builder.init_database()
@@ -46,7 +49,10 @@ def create_content_graph(
     if dependencies:
         content_graph_interface.create_pack_dependencies()
     content_graph_interface.export_graph(
-        output_path, override_commit=True, marketplace=marketplace
+        output_path,
+        override_commit=True,
+        marketplace=marketplace,
+        marketplaces=marketplaces,
     )
     logger.info(
         f"Successfully created the content graph. UI representation "
@@ -61,11 +67,12 @@ def create_content_graph(
 )
 def create(
     ctx: typer.Context,
-    marketplace: MarketplaceVersions = typer.Option(
-        MarketplaceVersions.XSOAR,
+    marketplace: List[MarketplaceVersions] = typer.Option(
+        [MarketplaceVersions.XSOAR],
         "-mp",
         "--marketplace",
-        help="The marketplace to generate the graph for.",
+        help="The marketplace to generate the graph for. "
+        "Can be used several times, to create the graph once and export it for each marketplace.",
     ),
     no_dependencies: bool = typer.Option(
         False,
@@ -114,9 +121,10 @@ def create(
     with ContentGraphInterface() as content_graph_interface:
         create_content_graph(
             content_graph_interface=content_graph_interface,
-            marketplace=marketplace,
+            marketplace=marketplace[0],
             dependencies=not no_dependencies,
             output_path=output_path,
+            marketplaces=marketplace,
         )
 
 
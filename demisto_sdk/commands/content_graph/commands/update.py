@@ -75,6 +75,7 @@ def update_content_graph(
     packs_to_update: Optional[List[str]] = None,
     dependencies: bool = True,
     output_path: Optional[Path] = None,
+    marketplaces: Optional[List[MarketplaceVersions]] = None,
 ) -> None:
     """This function updates a new content graph database in neo4j from the content path
     Args:
@@ -85,6 +86,8 @@ def update_content_graph(
         packs_to_update (List[str]): The packs to update.
         dependencies (bool): Whether to create the dependencies.
         output_path (Path): The path to export the graph zip to.
+        marketplaces (List[MarketplaceVersions], optional): The marketplaces to export the graph zip for, instead of
+            `marketplace`. The graph is updated once for all of them.
     """
     force_create_graph = os.getenv("DEMISTO_SDK_GRAPH_FORCE_CREATE")
     logger.debug(f"DEMISTO_SDK_GRAPH_FORCE_CREATE = {force_create_graph}")
@@ -92,7 +95,11 @@ def update_content_graph(
     if string_to_bool(force_create_graph, False):
         logger.info("DEMISTO_SDK_GRAPH_FORCE_CREATE is set. Will create a new graph")
         create_content_graph(
-            content_graph_interface, marketplace, dependencies, output_path
+            content_graph_interface,
+            marketplace,
+            dependencies,
+            output_path,
+            marketplaces,
         )
         return
 
@@ -119,6 +126,7 @@ def update_content_graph(
             override_commit=use_git,
             marketplace=marketplace,
             clean_import_dir=False,
+            marketplaces=marketplaces,
         )
 
         return
@@ -145,7 +153,11 @@ def update_content_graph(
                     "Importing graph from bucket failed. Creating from scratch"
                 )
                 create_content_graph(
-                    content_graph_interface, marketplace, dependencies, output_path
+                    content_graph_interface,
+                    marketplace,
+                    dependencies,
+                    output_path,
+                    marketplaces,
                 )
                 return
     if use_git and (commit := content_graph_interface.commit) and not is_external_repo:
@@ -156,7 +168,11 @@ def update_content_graph(
                 f"Failed to get changed packs from git. Creating from scratch. Error: {e}"
             )
             create_content_graph(
-                content_graph_interface, marketplace, dependencies, output_path
+                content_graph_interface,
+                marketplace,
+                dependencies,
+                output_path,
+                marketplaces,
             )
             return
         packs_to_update.extend(git_util.get_all_changed_pack_ids(commit))
@@ -169,7 +185,10 @@ def update_content_graph(
     if dependencies:
         content_graph_interface.create_pack_dependencies()
     content_graph_interface.export_graph(
-        output_path, override_commit=use_git, marketplace=marketplace
+        output_path,
+        override_commit=use_git,
+        marketplace=marketplace,
+        marketplaces=marketplaces,
     )
     logger.info(
         f"Successfully updated the content graph. UI representation is available at {NEO4J_DATABASE_HTTP} "
@@ -190,11 +209,12 @@ def update(
         is_flag=True,
         help="If true, uses git to determine the packs to update.",
     ),
-    marketplace: MarketplaceVersions = typer.Option(
-        MarketplaceVersions.XSOAR,
+    marketplace: List[MarketplaceVersions] = typer.Option(
+        [MarketplaceVersions.XSOAR],
         "-mp",
         "--marketplace",
-        help="The marketplace to generate the graph for.",
+        help="The marketplace to generate the graph for. "
+        "Can be used several times, to update the graph once and export it for each marketplace.",
     ),
     imported_path: Path = typer.Option(
         None,
@@ -259,10 +279,11 @@ def update(
     with ContentGraphInterface() as content_graph_interface:
         update_content_graph(
             content_graph_interface,
-            marketplace=marketplace,
+            marketplace=marketplace[0],
             use_git=use_git,
             imported_path=imported_path,
             packs_to_update=list(packs_to_update) if packs_to_update else [],
             dependencies=not no_dependencies,
             output_path=output_path,
+            marketplaces=marketplace,
         )
@@ -1,7 +1,22 @@
 import os
 import re
+import sys
+from array import array
+from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
 
 from neo4j import graph
 from pydantic import BaseModel
@@ -292,30 +307,180 @@ class Relationship(BaseModel):
     name: Optional[str] = None
 
 
+class _Missing:
+    """The value of a property which a record does not have in its column.
+    It is pickled by reference, so it is the same object after the parsed packs are sent between processes."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class Columns(Sequence):
+    """A collection of records, e.g: the properties of nodes or relationships, which are stored as a column (list)
+    per property instead of a dict per record.
+
+    Strings are interned and lists of strings are stored as shared tuples, so values which many records have
+    (ids, content types, marketplaces) are stored once. Iterating the collection returns the records as dicts,
+    which can be sent to the UNWIND queries as they are.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self.columns: Dict[str, MutableSequence] = {}
+        self._length = 0
+        self._interned: Dict[tuple, tuple] = {}
+        for record in records:
+            self.append(record)
+
+    def _new_column(self, key: str, length: int) -> MutableSequence:
+        """Returns a column of the key, of `length` records which do not have the key"""
+        return [MISSING] * length
+
+    @staticmethod
+    def _intern_string(value: str) -> str:
+        # enum members are already stored once, and cannot be interned
+        return value if isinstance(value, Enum) else sys.intern(value)
+
+    def _store(self, key: str, value: Any) -> Any:
+        """Returns the value to store in the column of the key"""
+        if isinstance(value, str):
+            return self._intern_string(value)
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            value = tuple(self._intern_string(item) for item in value)
+            return self._interned.setdefault(value, value)
+        return value
+
+    def _load(self, key: str, value: Any) -> Any:
+        """Returns the value of the record from the value stored in the column, or MISSING"""
+        return list(value) if isinstance(value, tuple) else value
+
+    def append(self, record: Dict[str, Any]) -> None:
+        for key, column in self.columns.items():
+            column.append(self._store(key, record.get(key, MISSING)))
+        if not self.columns.keys() >= record.keys():
+            for key, value in record.items():
+                if key not in self.columns:
+                    column = self._new_column(key, self._length)
+                    column.append(self._store(key, value))
+                    self.columns[sys.intern(key)] = column
+        self._length += 1
+
+    def extend(self, other: "Columns") -> None:
+        """Adds the records of another collection of the same type, without converting them to dicts"""
+        for key in other.columns:
+            if key not in self.columns:
+                self.columns[key] = self._new_column(key, self._length)
+        for key, column in self.columns.items():
+            column.extend(other.columns.get(key) or self._new_column(key, len(other)))
+        self._length += len(other)
+
+    def _record(self, values: Iterable[Any]) -> Dict[str, Any]:
+        record = {}
+        for key, value in zip(self.columns, values):
+            value = self._load(key, value)
+            if value is not MISSING:
+                record[key] = value
+        return record
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return self._record(column[index] for column in self.columns.values())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.columns:
+            return ({} for _ in range(self._length))
+        return map(self._record, zip(*self.columns.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Columns, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)})"
+
+
+class RelationshipColumns(Columns):
+    """The relationships of a single type. The boolean properties are stored in byte arrays, and since the
+    relationships do not have None values, None is not stored."""
+
+    BOOLEAN_PROPERTIES = {
+        name
+        for name, field in Relationship.__fields__.items()
+        if field.outer_type_ is bool
+    }
+    MISSING_BOOLEAN = -1
+
+    def _new_column(self, key: str, length: int) -> MutableSequence:
+        if key in self.BOOLEAN_PROPERTIES:
+            return array("b", [self.MISSING_BOOLEAN]) * length
+        return super()._new_column(key, length)
+
+    def _store(self, key: str, value: Any) -> Any:
+        if key in self.BOOLEAN_PROPERTIES:
+            return (
+                self.MISSING_BOOLEAN
+                if value is None or value is MISSING
+                else int(value)
+            )
+        return MISSING if value is None else super()._store(key, value)
+
+    def _load(self, key: str, value: Any) -> Any:
+        if key in self.BOOLEAN_PROPERTIES:
+            return MISSING if value == self.MISSING_BOOLEAN else bool(value)
+        return super()._load(key, value)
+
+
 class Relationships(dict):
-    def add(self, relationship: RelationshipType, **kwargs):
+    """A mapping of relationship types to the relationships of each type.
+
+    The relationships are validated once, when they are added. Relationships which are added from another
+    `Relationships` object were already validated, so they are not validated again.
+    """
+
+    def _columns(self, relationship: RelationshipType) -> RelationshipColumns:
         if relationship not in self.keys():
-            self.__setitem__(relationship, [])
-        self.__getitem__(relationship).append(
+            self.__setitem__(relationship, RelationshipColumns())
+        return self.__getitem__(relationship)
+
+    def add(self, relationship: RelationshipType, **kwargs):
+        self._columns(relationship).append(
             Relationship.parse_obj(kwargs).dict(exclude_none=True)
         )
 
     def add_batch(self, relationship: RelationshipType, data: List[Dict[str, Any]]):
-        if relationship not in self.keys():
-            self.__setitem__(relationship, [])
-        data = [Relationship.parse_obj(item).dict(exclude_none=True) for item in data]
-        self.__getitem__(relationship).extend(data)
+        columns = self._columns(relationship)
+        for item in data:
+            columns.append(Relationship.parse_obj(item).dict(exclude_none=True))
 
-    def update(self, other: "Relationships") -> None:  # type: ignore
+    def update(self, other: Dict[RelationshipType, Any]) -> None:  # type: ignore
         for relationship, parsed_data in other.items():
-            if relationship not in RelationshipType or not isinstance(
-                parsed_data, list
-            ):
+            if relationship not in RelationshipType:
+                raise TypeError
+            if isinstance(parsed_data, RelationshipColumns):
+                self._columns(relationship).extend(parsed_data)
+            elif isinstance(parsed_data, list):
+                self.add_batch(relationship, parsed_data)
+            else:
                 raise TypeError
-            self.add_batch(relationship, parsed_data)
 
 
 class Nodes(dict):
+    """A mapping of content types to the properties of the nodes of each type"""
+
     def __init__(self, *args) -> None:
         super().__init__(self)
         for arg in args:
@@ -323,22 +488,29 @@ class Nodes(dict):
                 raise ValueError(f"Expected a dict: {arg}")
         self.add_batch(args)  # type: ignore[arg-type]
 
+    def _columns(self, content_type: ContentType) -> Columns:
+        if content_type not in self.keys():
+            self.__setitem__(content_type, Columns())
+        return self.__getitem__(content_type)
+
     def add(self, **kwargs):
         content_type: ContentType = ContentType(kwargs.get("content_type"))
-        if content_type not in self.keys():
-            self.__setitem__(content_type, [])
-        self.__getitem__(content_type).append(kwargs)
+        self._columns(content_type).append(kwargs)
 
-    def add_batch(self, data: Iterator[Dict[str, Any]]):
+    def add_batch(self, data: Iterable[Dict[str, Any]]):
         for obj in data:
             self.add(**obj)
 
-    def update(self, other: "Nodes") -> None:  # type: ignore[override]
-        data: Iterator[Dict[str, Any]]
+    def update(self, other: Dict[ContentType, Any]) -> None:  # type: ignore[override]
         for content_type, data in other.items():
-            if content_type not in ContentType or not isinstance(data, list):
+            if content_type not in ContentType:
+                raise TypeError
+            if isinstance(data, Columns):
+                self._columns(content_type).extend(data)
+            elif isinstance(data, list):
+                self.add_batch(data)
+            else:
                 raise TypeError
-            self.add_batch(data)
 
 
 class PackTags:
@@ -1,6 +1,8 @@
 import gc
+import os
 from typing import Optional, Tuple
 
+from demisto_sdk.commands.common.tools import string_to_bool
 from demisto_sdk.commands.content_graph.common import Nodes, Relationships
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
 from demisto_sdk.commands.content_graph.objects.repository import (
@@ -9,17 +11,31 @@ from demisto_sdk.commands.content_graph.objects.repository import (
 
 PACKS_PER_BATCH = 600
 
+DEMISTO_SDK_GRAPH_DEFER_INDEXES = "DEMISTO_SDK_GRAPH_DEFER_INDEXES"
+
 
 class ContentGraphBuilder:
-    def __init__(self, content_graph: ContentGraphInterface) -> None:
+    def __init__(
+        self,
+        content_graph: ContentGraphInterface,
+        defer_indexes: Optional[bool] = None,
+    ) -> None:
         """Given a graph DB interface:
         1. Creates a repository model
         2. Collects all nodes and relationships from the model
 
         Args:
             content_graph (ContentGraphInterface): The interface to create the graph with.
+            defer_indexes (Optional[bool]): Whether to create the indexes after loading the nodes instead of before,
+                so the nodes are written without maintaining the indexes. Defaults to the
+                DEMISTO_SDK_GRAPH_DEFER_INDEXES environment variable.
         """
         self.content_graph = content_graph
+        if defer_indexes is None:
+            defer_indexes = string_to_bool(
+                os.getenv(DEMISTO_SDK_GRAPH_DEFER_INDEXES), False
+            )
+        self.defer_indexes = defer_indexes
         self.nodes: Nodes = Nodes()
         self.relationships: Relationships = Relationships()
 
@@ -39,7 +55,9 @@ class ContentGraphBuilder:
 
     def init_database(self) -> None:
         self.content_graph.clean_graph()
-        self.content_graph.create_indexes_and_constraints()
+        self.content_graph.create_indexes_and_constraints(
+            indexes=not self.defer_indexes
+        )
 
     def _parse_and_model_content(
         self, packs_to_parse: Optional[Tuple[str, ...]] = None
@@ -71,6 +89,9 @@ class ContentGraphBuilder:
         """Runs DB queries using the collected nodes and relationships to create or update the content graph."""
         self.content_graph.create_nodes(self.nodes)
         gc.collect()
+        if self.defer_indexes:
+            # the relationships are created by matching the nodes, so they need the indexes
+            self.content_graph.create_indexes()
         self.content_graph.create_relationships(self.relationships)
         gc.collect()
         self.content_graph.remove_non_repo_items()
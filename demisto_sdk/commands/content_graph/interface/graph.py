@@ -112,7 +112,11 @@ class ContentGraphInterface(ABC):
         pass
 
     @abstractmethod
-    def create_indexes_and_constraints(self) -> None:
+    def create_indexes_and_constraints(self, indexes: bool = True) -> None:
+        pass
+
+    @abstractmethod
+    def create_indexes(self) -> None:
         pass
 
     @abstractmethod
@@ -144,6 +148,7 @@ class ContentGraphInterface(ABC):
         output_path: Optional[Path] = None,
         override_commit: bool = True,
         marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
+        marketplaces: Optional[List[MarketplaceVersions]] = None,
     ) -> None:
         pass
 
@@ -224,6 +229,7 @@ class ContentGraphInterface(ABC):
         content_type: ContentType = ContentType.BASE_NODE,
         ids_list: Optional[Iterable[int]] = None,
         all_level_dependencies: bool = False,
+        lazy_relationships: bool = False,
         **properties,
     ) -> List[BaseNode]:
         """
@@ -234,6 +240,8 @@ class ContentGraphInterface(ABC):
             content_type (ContentType]): The content_type to filter. Defaults to ContentType.BASE_NODE.
             ids_list (Optional[Iterable[int]], optional): A list of unique IDs to filter. Defaults to None.
             all_level_dependencies (bool, optional): Whether to return all level dependencies. Defaults to False.
+            lazy_relationships (bool, optional): Whether to fetch the relationships of the results only on the first
+                access to them, while the interface is open. Defaults to False.
             **properties: A key, value filter for the search. For example: `search(object_id="QRadar")`.
 
         Returns:
@@ -1,5 +1,7 @@
 import os
+import shutil
 from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
@@ -23,6 +25,9 @@ from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInter
 from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
     Neo4jImportHandler,
 )
+from demisto_sdk.commands.content_graph.interface.neo4j.node_materializer import (
+    materialize_node,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.constraints import (
     create_constraints,
     drop_constraints,
@@ -38,7 +43,12 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export im
     merge_duplicate_content_items,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
+    await_indexes,
     create_indexes,
+    drop_indexes,
+    get_index_profile,
+    get_index_usage,
+    get_indexes_not_in_profile,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
     _match,
@@ -51,6 +61,7 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.nodes import (
     remove_packs_before_creation,
     remove_server_nodes,
     return_preserved_relationships,
+    set_missing_version_keys,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
     _match_relationships,
@@ -74,18 +85,24 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.validations impo
 from demisto_sdk.commands.content_graph.objects.base_content import (
     CONTENT_TYPE_TO_MODEL,
     BaseNode,
+    LazyRelationshipsData,
     UnknownContent,
 )
 from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
 
+# The minimal number of nodes to parse in a process pool, below it the nodes are parsed in the current process,
+# since starting the worker processes and pickling the models takes longer than parsing them.
+PARSE_NODES_IN_POOL_THRESHOLD = 10_000
+
 
 def _parse_node(element_id: str, node: dict) -> BaseNode:
-    """Parses nodes to content objects and adds it to mapping
+    """Parses a node to a content object
 
     Args:
-        nodes (Iterable[graph.Node]): List of nodes to parse
+        element_id (str): The element id of the node in the database
+        node (dict): The properties of the node
 
     Raises:
         NoModelException: If no model found to parse on
@@ -93,13 +110,13 @@ def _parse_node(element_id: str, node: dict) -> BaseNode:
     obj: BaseNode
     content_type = node.get("content_type", "")
     if node.get("not_in_repository"):
-        obj = UnknownContent.parse_obj(node)
+        obj = materialize_node(UnknownContent, node)
 
     else:
         model = CONTENT_TYPE_TO_MODEL.get(content_type)
         if not model:
             raise NoModelException(f"No model for {content_type}")
-        obj = model.parse_obj(node)
+        obj = materialize_node(model, node)
     obj.database_id = element_id
     return obj
 
@@ -114,6 +131,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     ) -> None:
         self._import_handler = Neo4jImportHandler()
         self._id_to_obj: Dict[str, BaseNode] = {}
+        self._pool: Optional[PoolType] = None
 
         if not self.is_alive():
             neo4j_service.start()
@@ -129,7 +147,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         return self
 
     def __exit__(self, *args) -> None:
-        self.driver.close()
+        self.close()
 
     def _init_driver(self):
         self.driver: Driver = GraphDatabase.driver(
@@ -148,8 +166,19 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         return self._import_handler.extract_files_from_path(imported_path)
 
     def close(self) -> None:
+        if self._pool:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
         self.driver.close()
 
+    @property
+    def pool(self) -> PoolType:
+        """A process pool to parse large amounts of nodes, which is created once and reused by all the queries"""
+        if not self._pool:
+            self._pool = Pool(processes=cpu_count())
+        return self._pool
+
     def _add_relationships_to_objects(
         self,
         session: Session,
@@ -275,26 +304,74 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     ),
                 )
 
+    @staticmethod
+    def _has_relationships(obj: BaseNode) -> bool:
+        """Whether the relationships of the object were fetched, or will be fetched on their first access"""
+        return isinstance(obj.relationships_data, LazyRelationshipsData) or bool(
+            obj.relationships_data
+        )
+
+    def _set_lazy_relationships(
+        self, node_ids: Set[str], marketplace: Optional[MarketplaceVersions] = None
+    ) -> None:
+        """Sets the relationships of the objects to be fetched on the first access to the relationships of any of
+        them, in a single query for all of them.
+        The fields which are set from the relationships (e.g, the content items of a pack) are removed until then.
+
+        Args:
+            node_ids (Set[str]): The ids of the nodes of the objects.
+            marketplace (MarketplaceVersions, optional): Marketplace to filter the relationships by.
+        """
+        if not node_ids:
+            return
+        objects = [self._id_to_obj[node_id] for node_id in node_ids]
+
+        def load_relationships():
+            for obj in objects:
+                relationships_data = obj.relationships_data
+                if isinstance(relationships_data, LazyRelationshipsData):
+                    # the objects share the loader, so it should not be called again by another object
+                    relationships_data.loader = None
+                for field_name in obj.relationship_fields:
+                    obj.__dict__.setdefault(
+                        field_name, obj.__fields__[field_name].get_default()
+                    )
+            logger.debug(f"Loading the lazy relationships of {len(objects)} nodes")
+            with self.driver.session() as session:
+                relationships: Dict[
+                    str, Neo4jRelationshipResult
+                ] = session.execute_read(_match_relationships, node_ids, marketplace)
+                self._add_relationships_to_objects(session, relationships, marketplace)
+
+        for obj in objects:
+            for field_name in obj.relationship_fields:
+                obj.__dict__.pop(field_name, None)
+            obj.relationships_data = LazyRelationshipsData(load_relationships)
+
     def _add_nodes_to_mapping(self, nodes: Iterable[graph.Node]) -> None:
         """Add nodes to the content models mapping
 
         Args:
             nodes (List[graph.Node]): list of nodes to add
         """
-        nodes = filter(lambda node: node.element_id not in self._id_to_obj, nodes)
-        if not nodes:
-            logger.debug(
-                "No nodes to parse packs because all of them in mapping",
-                self._id_to_obj,
-            )
+        nodes_to_parse = {
+            node.element_id: dict(node.items())
+            for node in nodes
+            if node.element_id not in self._id_to_obj
+        }
+        if not nodes_to_parse:
+            logger.debug("No nodes to parse because all of them are in the mapping")
             return
-        with Pool(processes=cpu_count()) as pool:
-            results = pool.starmap(
-                _parse_node, ((node.element_id, dict(node.items())) for node in nodes)
-            )
-            for result in results:
-                assert result.database_id is not None
-                self._id_to_obj[result.database_id] = result
+        if len(nodes_to_parse) < PARSE_NODES_IN_POOL_THRESHOLD:
+            results = [
+                _parse_node(element_id, node)
+                for element_id, node in nodes_to_parse.items()
+            ]
+        else:
+            results = self.pool.starmap(_parse_node, nodes_to_parse.items())
+        for result in results:
+            assert result.database_id is not None
+            self._id_to_obj[result.database_id] = result
 
     def _search(
         self,
@@ -303,6 +380,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         ids_list: Optional[Iterable[int]] = None,
         all_level_dependencies: bool = False,
         all_level_imports: bool = False,
+        lazy_relationships: bool = False,
         **properties,
     ) -> List[BaseNode]:
         """
@@ -315,16 +393,30 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             self._add_nodes_to_mapping(results)
 
-            nodes_without_relationships = {
-                result.element_id
-                for result in results
-                if not self._id_to_obj[result.element_id].relationships_data
-            }
-
-            relationships: Dict[str, Neo4jRelationshipResult] = session.execute_read(
-                _match_relationships, nodes_without_relationships, marketplace
-            )
-            self._add_relationships_to_objects(session, relationships, marketplace)
+            if lazy_relationships:
+                self._set_lazy_relationships(
+                    {
+                        result.element_id
+                        for result in results
+                        if not self._has_relationships(
+                            self._id_to_obj[result.element_id]
+                        )
+                    },
+                    marketplace,
+                )
+            else:
+                # the lazy relationships of results of previous searches are loaded here too
+                nodes_without_relationships = {
+                    result.element_id
+                    for result in results
+                    if not self._id_to_obj[result.element_id].relationships_data
+                }
+                relationships: Dict[
+                    str, Neo4jRelationshipResult
+                ] = session.execute_read(
+                    _match_relationships, nodes_without_relationships, marketplace
+                )
+                self._add_relationships_to_objects(session, relationships, marketplace)
 
             pack_nodes = {
                 result.element_id
@@ -342,12 +434,40 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                 )
             return [self._id_to_obj[result.element_id] for result in results]
 
-    def create_indexes_and_constraints(self) -> None:
-        logger.debug("Creating graph indexes and constraints...")
+    def create_indexes_and_constraints(self, indexes: bool = True) -> None:
+        """
+        Args:
+            indexes: Whether to create the indexes, or only the constraints (e.g, to create the indexes after the
+                nodes are loaded).
+        """
+        if indexes:
+            self.create_indexes()
+        logger.debug("Creating graph constraints...")
         with self.driver.session() as session:
-            session.execute_write(create_indexes)
             session.execute_write(create_constraints)
 
+    def create_indexes(self) -> None:
+        """Creates the indexes of the index profile, and drops the node indexes which are not in it."""
+        profile = get_index_profile()
+        logger.debug("Creating graph indexes...")
+        with self.driver.session() as session:
+            if indexes_to_drop := session.execute_read(
+                get_indexes_not_in_profile, profile
+            ):
+                logger.debug(f"Dropping {len(indexes_to_drop)} unprofiled indexes.")
+                session.execute_write(drop_indexes, indexes_to_drop)
+            session.execute_write(create_indexes, profile)
+            session.execute_read(await_indexes)
+
+    def get_index_usage(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            List[Dict[str, Any]]: the label, properties and read count of each node index,
+                to create an index profile with `index_profile_from_usage`.
+        """
+        with self.driver.session() as session:
+            return session.execute_read(get_index_usage)
+
     def create_nodes(self, nodes: Dict[ContentType, List[Dict[str, Any]]]) -> None:
         logger.info("Creating graph nodes...")
         pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
@@ -597,6 +717,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         4. Merging duplicate nodes (conmmands/content items)
         5. Recreating the constraints
         6. Remove empty properties
+        7. Setting the version keys of nodes which were exported without them
 
         Args:
             external_import_paths (List[Path]): A list of external repositories' import paths.
@@ -640,6 +761,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(create_constraints)
             if len(graphml_filenames) > 1:
                 session.execute_write(merge_duplicate_content_items)
+            session.execute_write(set_missing_version_keys)
         has_infra_graph_been_changed = self._has_infra_graph_been_changed()
         self._id_to_obj = {}
         return not has_infra_graph_been_changed
@@ -650,7 +772,18 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         override_commit: bool = True,
         marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
         clean_import_dir: bool = True,
+        marketplaces: Optional[List[MarketplaceVersions]] = None,
     ) -> None:
+        """Exports the graph to the import dir, and zips it to the output path.
+
+        Args:
+            output_path (Path, optional): The folder to save the zip of the graph to, as `<marketplace>.zip`.
+            override_commit (bool): Whether to set the commit of the graph to the current commit.
+            marketplace (MarketplaceVersions): The marketplace to name the zip by.
+            clean_import_dir (bool): Whether to clean the import dir before exporting.
+            marketplaces (List[MarketplaceVersions], optional): The marketplaces to save a zip for, instead of
+                `marketplace`.
+        """
         if clean_import_dir:
             self.clean_import_dir()
         with self.driver.session() as session:
@@ -658,9 +791,19 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         self.dump_metadata(override_commit)
         self.dump_depends_on()
         if output_path:
-            output_path = output_path / marketplace.value
-            logger.info(f"Saving content graph in {output_path}.zip")
-            self.zip_import_dir(output_path)
+            # a marketplace which was given more than once is zipped once
+            first_marketplace, *other_marketplaces = dict.fromkeys(
+                marketplaces or [marketplace]
+            )
+            zip_path = output_path / first_marketplace.value
+            logger.info(f"Saving content graph in {zip_path}.zip")
+            self.zip_import_dir(zip_path)
+            # the graph has the content of all the marketplaces (filtered when it is queried),
+            # so it is zipped once and copied for the other marketplaces
+            for other_marketplace in other_marketplaces:
+                other_zip_path = output_path / f"{other_marketplace.value}.zip"
+                logger.info(f"Saving content graph in {other_zip_path}")
+                shutil.copyfile(f"{zip_path}.zip", other_zip_path)
 
     def clean_graph(self):
         with self.driver.session() as session:
@@ -675,6 +818,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         ids_list: Optional[Iterable[int]] = None,
         all_level_dependencies: bool = False,
         all_level_imports: bool = False,
+        lazy_relationships: bool = False,
         **properties,
     ) -> List[BaseNode]:
         """
@@ -685,6 +829,8 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             content_type (ContentType): The content_type to filter. Defaults to ContentType.BASE_NODE.
             ids_list (Optional[Iterable[int]], optional): A list of unique IDs to filter. Defaults to None.
             all_level_dependencies (bool, optional): Whether to return all level dependencies. Defaults to False.
+            lazy_relationships (bool, optional): Whether to fetch the relationships of the results only on the first
+                access to them, while the interface is open. Defaults to False.
             **properties: A key, value filter for the search. For example: `search(object_id="QRadar")`.
 
         Returns:
@@ -700,6 +846,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             ids_list,
             all_level_dependencies,
             all_level_imports,
+            lazy_relationships,
             **properties,
         )
 
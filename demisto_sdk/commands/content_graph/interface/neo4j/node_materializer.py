@@ -0,0 +1,79 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Type
+
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+from demisto_sdk.commands.content_graph.objects.base_content import BaseNode
+
+# Types which the graph stores as they are, so their values do not need to be validated
+GRAPH_PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+@lru_cache(maxsize=None)
+def fields_to_validate(model: Type[BaseNode]) -> Optional[FrozenSet[str]]:
+    """
+    Returns the names of the fields of a model which are validated when a node is materialized, i.e: fields with
+    validators, or of types which the graph does not store as they are (paths, enums, sets, models...).
+
+    Args:
+        model: The model of the node.
+
+    Returns:
+        Optional[FrozenSet[str]]: the names of the fields to validate, or None if the model has root validators,
+            so its nodes must be fully validated.
+    """
+    if model.__pre_root_validators__ or model.__post_root_validators__:
+        return None
+    return frozenset(
+        name
+        for name, field in model.__fields__.items()
+        if field.class_validators
+        or field.shape not in (SHAPE_SINGLETON, SHAPE_LIST)
+        or field.type_ not in GRAPH_PRIMITIVE_TYPES
+    )
+
+
+def materialize_node(model: Type[BaseNode], node: Dict[str, Any]) -> BaseNode:
+    """
+    Creates a model from the properties of a graph node.
+
+    The graph data was validated when the graph was created, so instead of validating all of the properties like
+    `parse_obj`, only the fields returned by `fields_to_validate` are validated, and the model is created with
+    `construct`. Falls back to `parse_obj` whenever the node cannot be materialized like that, e.g: a required
+    property is missing or invalid, so such nodes fail the same as before.
+
+    Args:
+        model: The model of the node.
+        node: The properties of the node.
+
+    Returns:
+        BaseNode: The model of the node.
+    """
+    validated_fields = fields_to_validate(model)
+    if validated_fields is None:
+        return model.parse_obj(node)
+
+    values: Dict[str, Any] = {}
+    fields_set = set()
+    for name, field in model.__fields__.items():
+        if name in node:
+            value = node[name]
+            fields_set.add(name)
+        elif field.alias in node:
+            value = node[field.alias]
+            fields_set.add(name)
+        elif field.required:
+            return model.parse_obj(node)
+        else:
+            value = field.get_default()
+            if not (name in validated_fields and field.validate_always):
+                values[name] = value
+                continue
+
+        if name in validated_fields:
+            value, errors = field.validate(value, values, loc=name, cls=model)  # type: ignore[arg-type]
+            if errors:
+                return model.parse_obj(node)
+        values[name] = value
+
+    return model.construct(_fields_set=fields_set, **values)
@@ -1,26 +1,50 @@
 import traceback
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 from neo4j import Result, Transaction
-from packaging.version import Version
 
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.common import ContentType
 
+VERSION_KEY_PARTS = 4
+VERSION_KEY_BASE = 10_000
+
 
 def labels_of(content_type: ContentType) -> str:
     return ":".join(content_type.labels)
 
 
-def versioned(property: str) -> str:
+def version_key(version: Optional[str]) -> Optional[int]:
+    """Packs a dotted version into a single integer which is ordered like the version, e.g: "6.10.0" -> 6001000000000.
+    The keys are stored on the nodes, so version predicates compare (and index) integers instead of splitting strings.
+
+    Args:
+        version (Optional[str]): The version, its first VERSION_KEY_PARTS parts are used.
+
+    Returns:
+        Optional[int]: The version key, or None if the version is missing or not numeric.
+    """
+    if not version:
+        return None
+    parts = (str(version).split(".") + ["0"] * VERSION_KEY_PARTS)[:VERSION_KEY_PARTS]
+    key = 0
     try:
-        Version(property)
-        property = f'"{property}"'
-    except Exception:
-        pass
-    return f'toIntegerList(split({property}, "."))'
+        for part in parts:
+            key = key * VERSION_KEY_BASE + int(part)
+    except ValueError:
+        return None
+    return key
+
+
+def version_key_expression(property: str) -> str:
+    """Builds a cypher expression which computes the same key as `version_key` for a version property."""
+    return (
+        f'reduce(key = 0, part IN (toIntegerList(split({property}, "."))'
+        f" + {[0] * VERSION_KEY_PARTS})[..{VERSION_KEY_PARTS}] | key * {VERSION_KEY_BASE} + part)"
+    )
 
 
 def intersects(arr1: str, arr2: str) -> str:
@@ -33,9 +57,9 @@ def is_target_available(source: str, target: str) -> str:
     """
     return f"""({intersects(f'{source}.marketplaces', f'{target}.marketplaces')}
 AND
-    {versioned(f'{source}.toversion')} >= {versioned(f'{target}.fromversion')}
+    {source}.to_version_key >= {target}.from_version_key
 AND
-    {versioned(f'{target}.toversion')} >= {versioned(f'{source}.fromversion')})
+    {target}.to_version_key >= {source}.from_version_key)
     """
 
 
@@ -44,32 +68,73 @@ def node_map(properties: Dict[str, Any]) -> str:
     return f'{{{", ".join([f"{k}: {v}" for k, v in properties.items()])}}}'
 
 
-def to_neo4j_map(properties: dict) -> str:
+def to_neo4j_value(value: Any) -> Any:
+    """Converts a value to a type which can be sent to neo4j as a query parameter."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple, list)):
+        return [to_neo4j_value(v) for v in value]
+    return value
+
+
+class QueryParameters(dict):
+    """Collects the variable data of a query, which is sent to neo4j as parameters instead of being inlined.
+
+    Neo4j caches the execution plan of a query by its text, so a query which is built with a QueryParameters has the
+    same text (and the same cached plan) for any input of the same shape.
+
+    Example:
+        >>> params = QueryParameters()
+        >>> f"MATCH (n) WHERE n.path IN {params.add(['a.yml'], 'path')} RETURN n"
+        'MATCH (n) WHERE n.path IN $path RETURN n'
+        >>> params
+        {'path': ['a.yml']}
+    """
+
+    def add(self, value: Any, name: str = "param") -> str:
+        """Adds a parameter to the query.
+
+        Args:
+            value (Any): The value of the parameter.
+            name (str, optional): The name of the parameter, suffixed with a counter if it is already used.
+
+        Returns:
+            str: The placeholder of the parameter to use in the query text, e.g: `$path`.
+        """
+        key = name if name not in self else f"{name}_{len(self)}"
+        self[key] = to_neo4j_value(value)
+        return f"${key}"
+
+
+def to_neo4j_map(properties: dict, params: QueryParameters) -> str:
     """This function creates a neo4j map cypher query.
     The idea is to filter the node by the given properties.
 
     Args:
         properties (dict): The properties to filter by.
+        params (QueryParameters): The parameters of the query, the values of the properties are added to them.
 
     Returns:
         str: The neo4j map cypher query.
     """
-    properties = {
-        k: f'"{v}"' if isinstance(v, (str, Path)) else str(v).lower()
-        for k, v in properties.items()
-    }
-    params_str = ", ".join(f"{k}: {v}" for k, v in properties.items())
+    params_str = ", ".join(f"{k}: {params.add(v, k)}" for k, v in properties.items())
     return f"{{{params_str}}}" if params_str else ""
 
 
 def to_neo4j_predicates(
-    properties: dict, varname: str = "node", list_properties: Optional[List[str]] = None
+    properties: dict,
+    params: QueryParameters,
+    varname: str = "node",
+    list_properties: Optional[List[str]] = None,
 ) -> str:
     """This function creates a neo4j predicates cypher query.
     The idea is to create a predicates which will filter the node by the properties, in case we cannot use neo4j map.
 
     Args:
         properties (dict): The properties to filter by.
+        params (QueryParameters): The parameters of the query, the values of the properties are added to them.
         varname (str, optional): The varname of the node of the query. Defaults to "node".
         list_properties (Optional[List[str]], optional): List of list properties in the neo4j database. Defaults to None.
 
@@ -79,13 +144,15 @@ def to_neo4j_predicates(
     if not list_properties:
         list_properties = []
     predicates = [
-        f"{varname}.{k} IN {list(v)}"
+        f"{varname}.{k} IN {params.add(v, k)}"
         for k, v in properties.items()
         if k not in list_properties
     ]
 
     list_predicates = [
-        f"'{v}' IN {varname}.{k}" for k, v in properties.items() if k in list_properties
+        f"{params.add(v, k)} IN {varname}.{k}"
+        for k, v in properties.items()
+        if k in list_properties
     ]
     return (
         f"WHERE {' AND '.join(predicates + list_predicates)}"
@@ -96,6 +163,7 @@ def to_neo4j_predicates(
 
 def to_node_pattern(
     properties: dict,
+    params: QueryParameters,
     varname: str = "node",
     content_type: ContentType = ContentType.BASE_NODE,
     list_properties: Optional[List[str]] = None,
@@ -106,6 +174,7 @@ def to_node_pattern(
 
     Args:
         properties (dict): The properties to filter by.
+        params (QueryParameters): The parameters of the query, the values of the properties are added to them.
         varname (str, optional): The varname of the node of the query. Defaults to "node".
         content_type (ContentType, optional): The content type to filter on. Defaults to ContentType.BASE_NODE.
         list_properties (Optional[List[str]], optional): List of list properties in the neo4j database. Defaults to None.
@@ -127,14 +196,25 @@ def to_node_pattern(
         if k in list_properties
         or (not isinstance(v, neo4j_primitive_types) and isinstance(v, Iterable))
     }
-    return f"({varname}:{content_type}{to_neo4j_map(exact_match_properties)} {to_neo4j_predicates(predicates_match_properties, varname, list_properties)})"
+    # all the nodes have the BaseNode label, so the label is added for the queries to use its indexes
+    labels = (
+        ContentType.BASE_NODE
+        if content_type == ContentType.BASE_NODE
+        else f"{ContentType.BASE_NODE}:{content_type}"
+    )
+    return f"({varname}:{labels}{to_neo4j_map(exact_match_properties, params)} {to_neo4j_predicates(predicates_match_properties, params, varname, list_properties)})"
 
 
-def run_query(tx: Transaction, query: str, **kwargs) -> Result:
+def run_query(
+    tx: Transaction,
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Result:
     try:
         start_time: datetime = datetime.now()
         logger.debug(f"Running query:\n{query}")
-        result = tx.run(query, **kwargs)
+        result = tx.run(query, parameters, **kwargs)
         logger.debug(f"Took {(datetime.now() - start_time).total_seconds()} seconds")
         return result
     except Exception as e:
@@ -1,7 +1,8 @@
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 
+import networkx
 from neo4j import Transaction
 
 from demisto_sdk.commands.common.constants import (
@@ -17,6 +18,7 @@ from demisto_sdk.commands.content_graph.common import (
     RelationshipType,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
+    QueryParameters,
     is_target_available,
     run_query,
     to_neo4j_map,
@@ -26,6 +28,12 @@ json = JSON_Handler()
 IGNORED_PACKS_IN_DEPENDENCY_CALC = ["NonSupported", "ApiModules"]
 
 MAX_DEPTH = 5
+# the prefix of the pack properties which store the all level mandatory dependencies in each marketplace
+ALL_LEVEL_DEPENDENCIES_PROPERTY_PREFIX = "all_level_dependencies"
+
+
+def all_level_dependencies_property(marketplace: MarketplaceVersions) -> str:
+    return f"{ALL_LEVEL_DEPENDENCIES_PROPERTY_PREFIX}_{marketplace.value}"
 
 
 def get_all_level_packs_relationships(
@@ -35,15 +43,28 @@ def get_all_level_packs_relationships(
     marketplace: MarketplaceVersions,
     mandatorily: bool = False,
     **properties,
-) -> Dict[int, Neo4jRelationshipResult]:
-    params_str = to_neo4j_map(properties)
+) -> Dict[str, Neo4jRelationshipResult]:
+    precomputed_result: Dict[str, Neo4jRelationshipResult] = {}
+    if relationship_type == RelationshipType.DEPENDS_ON and mandatorily and marketplace:
+        precomputed_result = get_precomputed_all_level_dependencies(
+            tx, ids_list, marketplace, **properties
+        )
+        # packs of a graph which was created before the dependencies were precomputed are searched by their paths
+        ids_list = [
+            node_id for node_id in ids_list if node_id not in precomputed_result
+        ]
+        if not ids_list:
+            return precomputed_result
+
+    params = QueryParameters(ids_list=list(ids_list))
+    params_str = to_neo4j_map(properties, params)
 
     if relationship_type == RelationshipType.DEPENDS_ON:
         query = f"""
             UNWIND $ids_list AS node_id
             MATCH path = shortestPath((p1:{ContentType.PACK}{params_str})-[r:{relationship_type}*..{MAX_DEPTH}]->(p2:{ContentType.PACK}))
             WHERE elementId(p1) = node_id AND elementId(p1) <> elementId(p2)
-            AND all(n IN nodes(path) WHERE "{marketplace}" IN n.marketplaces)
+            AND all(n IN nodes(path) WHERE {params.add(marketplace, "marketplace")} IN n.marketplaces)
             AND all(r IN relationships(path) WHERE NOT r.is_test {"AND r.mandatorily = true)" if mandatorily else ""}
             RETURN node_id, collect(r) as relationships, collect(p2) AS nodes_to
         """
@@ -56,15 +77,57 @@ def get_all_level_packs_relationships(
             collect(node_to) AS nodes_to
         """
 
-    result = run_query(tx, query, ids_list=list(ids_list))
+    result = run_query(tx, query, params)
     logger.debug("Found dependencies.")
+    return {
+        **precomputed_result,
+        **{
+            item.get("node_id"): Neo4jRelationshipResult(
+                node_from=item.get("node_from"),
+                nodes_to=item.get("nodes_to"),
+                relationships=item.get("relationships"),
+            )
+            for item in result
+        },
+    }
+
+
+def get_precomputed_all_level_dependencies(
+    tx: Transaction,
+    ids_list: List[str],
+    marketplace: MarketplaceVersions,
+    **properties,
+) -> Dict[str, Neo4jRelationshipResult]:
+    """Reads the all level mandatory dependencies of packs, which `create_all_level_dependencies` stored on them.
+
+    Args:
+        tx (Transaction): The neo4j transaction.
+        ids_list (List[str]): The element ids of the packs.
+        marketplace (MarketplaceVersions): The marketplace of the dependencies.
+        **properties: A key, value filter for the packs.
+
+    Returns:
+        Dict[str, Neo4jRelationshipResult]: The dependency packs of the packs which have the stored dependencies,
+            by the element ids of the packs. The paths to the dependencies are not stored, so there are no
+            relationships.
+    """
+    params = QueryParameters(ids_list=list(ids_list))
+    params_str = to_neo4j_map(properties, params)
+    dependencies_property = params.add(
+        all_level_dependencies_property(marketplace), "dependencies_property"
+    )
+    query = f"""// Reads the precomputed all level dependencies of packs
+UNWIND $ids_list AS node_id
+MATCH (p1:{ContentType.PACK}{params_str})
+WHERE elementId(p1) = node_id AND p1[{dependencies_property}] IS NOT NULL
+OPTIONAL MATCH (p2:{ContentType.PACK})
+WHERE p2.object_id IN p1[{dependencies_property}]
+RETURN node_id, collect(p2) AS nodes_to"""
     return {
         item.get("node_id"): Neo4jRelationshipResult(
-            node_from=item.get("node_from"),
-            nodes_to=item.get("nodes_to"),
-            relationships=item.get("relationships"),
+            node_from=None, nodes_to=item.get("nodes_to"), relationships=[]
         )
-        for item in result
+        for item in run_query(tx, query, params)
     }
 
 
@@ -73,9 +136,118 @@ def create_pack_dependencies(tx: Transaction) -> dict:
     update_uses_for_integration_commands(tx)
     delete_deprecatedcontent_relationship(tx)  # TODO decide what to do with this
     depends_on_data = create_depends_on_relationships(tx)
+    create_all_level_dependencies(tx)
     return depends_on_data
 
 
+def calculate_all_level_dependencies(
+    pack_marketplaces: Dict[str, List[str]],
+    dependencies: Iterable[Tuple[str, str]],
+    marketplace: str,
+) -> Dict[str, List[str]]:
+    """Calculates the transitive closure of the dependencies between the packs of a marketplace.
+    A pack depends on all the packs which are reachable from it by a path of dependencies, on which all the packs
+    are in the marketplace, with no limit on the length of the path.
+
+    The packs which depend on each other (directly or not) have the same dependencies, so they are grouped to
+    strongly connected components, and the dependencies of every component are calculated once as a bitmap of packs,
+    from the dependencies of the components it depends on.
+
+    Args:
+        pack_marketplaces (Dict[str, List[str]]): The marketplaces of every pack, by the object ids of the packs.
+        dependencies (Iterable[Tuple[str, str]]): The direct dependencies, as (pack, dependency pack) pairs.
+        marketplace (str): The marketplace to calculate the dependencies in.
+
+    Returns:
+        Dict[str, List[str]]: The sorted object ids of the all level dependencies of every pack of the marketplace.
+    """
+    dependency_graph = networkx.DiGraph()
+    dependency_graph.add_nodes_from(
+        pack_id
+        for pack_id, marketplaces in pack_marketplaces.items()
+        if marketplace in marketplaces
+    )
+    dependency_graph.add_edges_from(
+        (pack_id, dependency_id)
+        for pack_id, dependency_id in dependencies
+        if pack_id in dependency_graph and dependency_id in dependency_graph
+    )
+    pack_ids = sorted(dependency_graph)
+    pack_bits = {pack_id: 1 << index for index, pack_id in enumerate(pack_ids)}
+
+    components = networkx.condensation(dependency_graph)
+    members_bitmap: Dict[int, int] = {}
+    reachable_bitmap: Dict[int, int] = {}
+    # the components are visited after all the components they depend on
+    for component in reversed(list(networkx.topological_sort(components))):
+        members = components.nodes[component]["members"]
+        members_bitmap[component] = sum(pack_bits[pack_id] for pack_id in members)
+        reachable = members_bitmap[component] if len(members) > 1 else 0
+        for dependency_component in components.successors(component):
+            reachable |= (
+                members_bitmap[dependency_component]
+                | reachable_bitmap[dependency_component]
+            )
+        reachable_bitmap[component] = reachable
+
+    all_level_dependencies: Dict[str, List[str]] = {}
+    for pack_id, component in components.graph["mapping"].items():
+        reachable = reachable_bitmap[component] & ~pack_bits[pack_id]
+        all_level_dependencies[pack_id] = [
+            dependency_id
+            for dependency_id in pack_ids
+            if reachable & pack_bits[dependency_id]
+        ]
+    return all_level_dependencies
+
+
+def create_all_level_dependencies(tx: Transaction) -> None:
+    """Stores the all level mandatory dependencies of every pack in every marketplace as a property of the pack,
+    so they are read without searching the paths of dependencies.
+    The dependencies are the same as `get_all_level_packs_relationships` finds by the paths of non-test, mandatory
+    dependencies, without the limit of the length of the paths.
+    """
+    query = f"""// Gets the mandatory dependencies between the packs
+MATCH (pack:{ContentType.PACK})
+OPTIONAL MATCH (pack)-[r:{RelationshipType.DEPENDS_ON}]->(dependency:{ContentType.PACK})
+WHERE NOT r.is_test AND r.mandatorily = true
+RETURN pack.object_id AS pack_id, pack.marketplaces AS marketplaces,
+collect(dependency.object_id) AS dependencies"""
+    pack_marketplaces: Dict[str, List[str]] = {}
+    dependencies: List[Tuple[str, str]] = []
+    for row in run_query(tx, query):
+        pack_marketplaces[row["pack_id"]] = row["marketplaces"] or []
+        dependencies.extend(
+            (row["pack_id"], dependency_id) for dependency_id in row["dependencies"]
+        )
+
+    pack_properties: Dict[str, Dict[str, List[str]]] = {
+        pack_id: {} for pack_id in pack_marketplaces
+    }
+    for marketplace in MarketplaceVersions:
+        all_level_dependencies = calculate_all_level_dependencies(
+            pack_marketplaces, dependencies, marketplace.value
+        )
+        for pack_id, pack_dependencies in pack_properties.items():
+            pack_dependencies[
+                all_level_dependencies_property(marketplace)
+            ] = all_level_dependencies.get(pack_id, [])
+
+    query = f"""// Stores the all level dependencies of the packs
+UNWIND $packs AS pack_data
+MATCH (pack:{ContentType.PACK}{{object_id: pack_data.pack_id}})
+SET pack += pack_data.properties"""
+    run_query(
+        tx,
+        query,
+        packs=[
+            {"pack_id": pack_id, "properties": properties}
+            for pack_id, properties in pack_properties.items()
+        ],
+    )
+    logger.debug(f"Stored the all level dependencies of {len(pack_properties)} packs")
+
+
 def delete_deprecatedcontent_relationship(tx: Transaction) -> None:
     """
     This will delete any USES relationship between a content item and a content item in the deprecated content pack.
@@ -115,7 +287,7 @@ MATCH (content_item:{ContentType.BASE_NODE})
         (command:{ContentType.COMMAND})<-[rcmd:{RelationshipType.HAS_COMMAND}]
         -(integration:{ContentType.INTEGRATION})
 WHERE {is_target_available("content_item", "integration")}
-AND NOT command.object_id IN {list(GENERIC_COMMANDS_NAMES)}
+AND NOT command.object_id IN $generic_commands
 WITH command, count(DISTINCT rcmd) as command_count
 
 MATCH (content_item:{ContentType.BASE_NODE})
@@ -123,7 +295,7 @@ MATCH (content_item:{ContentType.BASE_NODE})
         (command)<-[rcmd:{RelationshipType.HAS_COMMAND}]
         -(integration:{ContentType.INTEGRATION})
 WHERE {is_target_available("content_item", "integration")}
-AND NOT command.object_id IN {list(GENERIC_COMMANDS_NAMES)}
+AND NOT command.object_id IN $generic_commands
 
 MERGE (content_item)-[u:{RelationshipType.USES}]->(integration)
 ON CREATE
@@ -136,7 +308,7 @@ RETURN
     collect(integration.object_id) AS integrations,
     u.mandatorily AS is_integ_mandatory,
     command.name AS command"""
-    run_query(tx, query)
+    run_query(tx, query, generic_commands=list(GENERIC_COMMANDS_NAMES))
 
 
 def create_depends_on_relationships(tx: Transaction) -> dict:
@@ -146,8 +318,8 @@ MATCH (pack_a:{ContentType.BASE_NODE})<-[:{RelationshipType.IN_PACK}]-(a)
 WHERE ANY(marketplace IN pack_a.marketplaces WHERE marketplace IN pack_b.marketplaces)
 AND elementId(pack_a) <> elementId(pack_b)
 AND NOT pack_b.object_id IN pack_a.excluded_dependencies
-AND NOT pack_a.name IN {IGNORED_PACKS_IN_DEPENDENCY_CALC}
-AND NOT pack_b.name IN {IGNORED_PACKS_IN_DEPENDENCY_CALC}
+AND NOT pack_a.name IN $ignored_packs
+AND NOT pack_b.name IN $ignored_packs
 WITH pack_a, a, r, b, pack_b
 MERGE (pack_a)-[dep:{RelationshipType.DEPENDS_ON}]->(pack_b)
 ON CREATE
@@ -169,7 +341,7 @@ WITH
     }}) AS reasons
 RETURN
     pack_a, pack_b, reasons"""
-    result = run_query(tx, query)
+    result = run_query(tx, query, ignored_packs=list(IGNORED_PACKS_IN_DEPENDENCY_CALC))
     outputs: Dict[str, Dict[str, list]] = {}
     for row in result:
         pack_a = row["pack_a"]
@@ -1,11 +1,21 @@
-from typing import List
+import os
+from pathlib import Path
+from typing import Any, Dict, List
 
 from neo4j import Transaction
 
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import run_query
 
-CREATE_NODE_INDEX_TEMPLATE = "CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON ({props})"
+# A mapping of node labels to the property combinations to index, e.g: {"Pack": [["object_id"]]}
+IndexProfile = Dict[str, List[List[str]]]
+
+# Either "full", or a path to a JSON file of an index profile, e.g: one which was created by `index_profile_from_usage`
+DEMISTO_SDK_GRAPH_INDEX_PROFILE = "DEMISTO_SDK_GRAPH_INDEX_PROFILE"
+FULL_INDEX_PROFILE_NAME = "full"
+
 NODE_INDEX_OPTIONS = [
     ["id"],
     ["node_id"],
@@ -16,6 +26,8 @@ NODE_INDEX_OPTIONS = [
     ["object_id", "name"],
     ["object_id", "content_type"],
     ["object_id", "content_type", "fromversion", "marketplaces"],
+    ["from_version_key"],
+    ["to_version_key"],
     ["name"],
     ["name", "not_in_repository"],
     ["name", "content_type"],
@@ -31,30 +43,123 @@ NODE_INDEX_OPTIONS = [
     ["content_type", "not_in_repository"],
 ]
 
+# The indexes of the lookups of the graph queries: creating relationships by the properties of their source and
+# target nodes, matching nodes by id, name or path (on the BaseNode label, which all the nodes have), and comparing
+# version keys.
+DEFAULT_INDEX_PROFILE: IndexProfile = {
+    ContentType.BASE_NODE.value: [
+        ["object_id"],
+        ["object_id", "content_type"],
+        ["object_id", "content_type", "fromversion", "marketplaces"],
+        ["object_id", "not_in_repository"],
+        ["name"],
+        ["name", "not_in_repository"],
+        ["cli_name"],
+        ["cli_name", "not_in_repository"],
+        ["path"],
+        ["content_type"],
+        ["not_in_repository"],
+        ["from_version_key"],
+        ["to_version_key"],
+    ],
+    ContentType.PACK.value: [["object_id"]],
+    ContentType.INTEGRATION.value: [
+        ["object_id", "content_type", "fromversion", "marketplaces"]
+    ],
+    ContentType.TEST_PLAYBOOK.value: [["object_id"]],
+}
+
 CREATE_REL_INDEX_TEMPLATE = (
     "CREATE INDEX IF NOT EXISTS FOR ()-[r:{rel}]->() ON ({props})"
 )
 
+CREATE_NODE_INDEXES = """// Creates the node indexes of the index profile in a single call
+CALL apoc.schema.assert($indexes, {}, false)
+YIELD label, key, action
+RETURN count(*) AS indexes"""
+
+AWAIT_INDEXES = "CALL db.awaitIndexes($timeout)"
+
+DROP_INDEX_TEMPLATE = "DROP INDEX `{name}` IF EXISTS"
+
+NODE_INDEXES = """// Returns the node indexes which are not owned by constraints
+SHOW INDEXES
+YIELD name, type, entityType, labelsOrTypes, properties, owningConstraint
+WHERE type = "RANGE" AND entityType = "NODE" AND owningConstraint IS NULL
+RETURN name, labelsOrTypes[0] AS label, properties"""
+
+INDEX_USAGE = """// Returns the node indexes and the number of times they were read since they were created
+SHOW INDEXES
+YIELD type, entityType, labelsOrTypes, properties, readCount
+WHERE type = "RANGE" AND entityType = "NODE"
+RETURN labelsOrTypes[0] AS label, properties, readCount"""
+
 
-def create_indexes(tx: Transaction) -> None:
-    for content_type in ContentType:
-        if content_type != ContentType.COMMAND:
-            for index_option in NODE_INDEX_OPTIONS:
-                create_single_node_index(tx, content_type, index_option)
+def full_index_profile() -> IndexProfile:
+    """
+    Returns:
+        IndexProfile: every combination of NODE_INDEX_OPTIONS on every content type, except for commands.
+    """
+    return {
+        content_type.value: NODE_INDEX_OPTIONS
+        for content_type in ContentType
+        if content_type != ContentType.COMMAND
+    }
+
+
+def get_index_profile() -> IndexProfile:
+    """
+    Returns:
+        IndexProfile: the index profile set by the DEMISTO_SDK_GRAPH_INDEX_PROFILE environment variable,
+            or the default index profile.
+    """
+    profile = os.getenv(DEMISTO_SDK_GRAPH_INDEX_PROFILE)
+    if not profile:
+        return DEFAULT_INDEX_PROFILE
+    if profile == FULL_INDEX_PROFILE_NAME:
+        return full_index_profile()
+    logger.debug(f"Using the graph index profile {profile}")
+    return json.loads(Path(profile).read_text())
+
+
+def create_indexes(tx: Transaction, profile: IndexProfile) -> None:
+    create_node_indexes(tx, profile)
     create_single_relationship_index(tx, RelationshipType.USES, ["mandatorily"])
     create_single_relationship_index(
         tx, RelationshipType.HAS_COMMAND, ["deprecated", "description"]
     )
 
 
-def create_single_node_index(
-    tx: Transaction,
-    content_type: ContentType,
-    indexed_properties: List[str],
-) -> None:
-    properties = ", ".join([f"n.{p}" for p in indexed_properties])
-    query = CREATE_NODE_INDEX_TEMPLATE.format(label=content_type, props=properties)
-    run_query(tx, query)
+def create_node_indexes(tx: Transaction, profile: IndexProfile) -> None:
+    """Creates all the node indexes of a profile in a single query, instead of a query per index.
+
+    Args:
+        tx: Neo4j transaction.
+        profile: The index profile to create.
+    """
+    result = run_query(tx, CREATE_NODE_INDEXES, indexes=profile).single()
+    logger.debug(f"Asserted {result['indexes']} node indexes.")
+
+
+def get_indexes_not_in_profile(tx: Transaction, profile: IndexProfile) -> List[str]:
+    """
+    Args:
+        tx: Neo4j transaction.
+        profile: The index profile.
+
+    Returns:
+        List[str]: the names of the node indexes which are not in the profile, e.g: of a previous profile.
+    """
+    return [
+        index["name"]
+        for index in run_query(tx, NODE_INDEXES).data()
+        if list(index["properties"]) not in profile.get(index["label"], [])
+    ]
+
+
+def drop_indexes(tx: Transaction, names: List[str]) -> None:
+    for name in names:
+        run_query(tx, DROP_INDEX_TEMPLATE.format(name=name))
 
 
 def create_single_relationship_index(
@@ -65,3 +170,40 @@ def create_single_relationship_index(
     properties = ", ".join([f"r.{p}" for p in indexed_properties])
     query = CREATE_REL_INDEX_TEMPLATE.format(rel=rel, props=properties)
     run_query(tx, query)
+
+
+def await_indexes(tx: Transaction, timeout: int = 300) -> None:
+    """Waits until all the indexes are populated, e.g: after creating them on a graph which already has nodes."""
+    run_query(tx, AWAIT_INDEXES, timeout=timeout)
+
+
+def get_index_usage(tx: Transaction) -> List[Dict[str, Any]]:
+    """
+    Args:
+        tx: Neo4j transaction.
+
+    Returns:
+        List[Dict[str, Any]]: the label, properties and read count of each node index.
+    """
+    return run_query(tx, INDEX_USAGE).data()
+
+
+def index_profile_from_usage(
+    index_usage: List[Dict[str, Any]], min_reads: int = 1
+) -> IndexProfile:
+    """Creates an index profile of the indexes which a query workload used.
+
+    Args:
+        index_usage: The index usage, as returned by `get_index_usage` after running the workload.
+        min_reads: The minimal number of reads of an index to keep it.
+
+    Returns:
+        IndexProfile: The index profile of the used indexes.
+    """
+    profile: IndexProfile = {}
+    for index in sorted(
+        index_usage, key=lambda index: (index["label"], index["properties"])
+    ):
+        if (index["readCount"] or 0) >= min_reads:
+            profile.setdefault(index["label"], []).append(list(index["properties"]))
+    return profile
@@ -11,8 +11,11 @@ from demisto_sdk.commands.content_graph.common import (
     get_server_content_items,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
+    QueryParameters,
     run_query,
     to_node_pattern,
+    version_key,
+    version_key_expression,
 )
 
 NESTING_LEVEL = 5
@@ -44,15 +47,24 @@ RETURN count(n) AS nodes_created"""
 
 REMOVE_NODES_BY_TYPE = """// Removes parsed nodes of type {content_type} (according to constants)
 MATCH (a)
-WHERE (a:{label} OR a.content_type = "{content_type}")
+WHERE (a:{label} OR a.content_type = $content_type)
 AND a.not_in_repository = true
 AND any(
     identifier IN [a.object_id, a.name]
-    WHERE toLower(identifier) IN {content_items_identifiers}
+    WHERE toLower(identifier) IN $content_items_identifiers
 )
 DETACH DELETE a"""
 
 
+SET_MISSING_VERSION_KEYS = f"""// Sets the version keys of nodes which have versions but no keys, e.g: imported from an older graph
+MATCH (n)
+WHERE (n.fromversion IS NOT NULL AND n.from_version_key IS NULL)
+OR (n.toversion IS NOT NULL AND n.to_version_key IS NULL)
+SET n.from_version_key = {version_key_expression("n.fromversion")},
+    n.to_version_key = {version_key_expression("n.toversion")}
+RETURN count(n) AS nodes_updated"""
+
+
 REMOVE_EMPTY_PROPERTIES = """// Removes string properties with empty values ("") from nodes
 CALL apoc.periodic.iterate(
     "MATCH (n) RETURN n",
@@ -74,23 +86,23 @@ def get_relationships_to_preserve(
     query = f"""// Gets the relationships to preserve before removing packs
 MATCH (s)-[r]->(t)-[:{RelationshipType.IN_PACK}]->(p)
 WHERE NOT (s)-[:{RelationshipType.IN_PACK}]->(p)
-AND p.object_id in {pack_ids}
+AND p.object_id in $pack_ids
 RETURN elementId(s) as source_id, s as source, type(r) as r_type, properties(r) as r_properties, t as target
 
 UNION
 
 MATCH (s)-[r]->(t)<-[:{RelationshipType.HAS_COMMAND}]-()-[:{RelationshipType.IN_PACK}]->(p)
 WHERE NOT (s)-[:{RelationshipType.IN_PACK}]->(p)
-AND p.object_id in {pack_ids}
+AND p.object_id in $pack_ids
 RETURN elementId(s) as source_id, s as source, type(r) as r_type, properties(r) as r_properties, t as target
 
 UNION
 
 MATCH (s)-[r]->(t)
 WHERE NOT (s)-[:{RelationshipType.IN_PACK}]->(t)
-AND t.object_id in {pack_ids}
+AND t.object_id in $pack_ids
 RETURN elementId(s) as source_id, s as source, type(r) as r_type, properties(r) as r_properties, t as target"""
-    return run_query(tx, query).data()
+    return run_query(tx, query, pack_ids=list(pack_ids)).data()
 
 
 def remove_packs_before_creation(
@@ -99,19 +111,19 @@ def remove_packs_before_creation(
 ) -> None:
     query = f"""// Removes packs commands before recreating them
 MATCH (c)<-[:{RelationshipType.HAS_COMMAND}]-()-[:{RelationshipType.IN_PACK}]->(p)
-WHERE p.object_id IN {pack_ids}
+WHERE p.object_id IN $pack_ids
 OPTIONAL MATCH (c)<-[:{RelationshipType.HAS_COMMAND}]-()-[:{RelationshipType.IN_PACK}]->(p2)
-WHERE NOT p2.object_id IN {pack_ids}
+WHERE NOT p2.object_id IN $pack_ids
 WITH c, p2
 WHERE p2 IS NULL
 DETACH DELETE c
 """
-    run_query(tx, query)
+    run_query(tx, query, pack_ids=list(pack_ids))
     query = f"""// Removes packs and their content items before recreating them
 MATCH (n)-[:{RelationshipType.IN_PACK}]->(p)
-WHERE p.object_id in {pack_ids}
+WHERE p.object_id in $pack_ids
 DETACH DELETE n, p"""
-    run_query(tx, query)
+    run_query(tx, query, pack_ids=list(pack_ids))
 
 
 def return_preserved_relationships(
@@ -133,12 +145,34 @@ RETURN rel"""
     run_query(tx, query, rels_data=rels_to_preserve)
 
 
+def add_version_keys(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Adds the sortable version keys of the nodes' fromversion and toversion, which the version predicates compare.
+
+    Args:
+        data: The properties of the nodes to create.
+
+    Returns:
+        List[Dict[str, Any]]: The same nodes' properties, with the version keys.
+    """
+    for node_data in data:
+        if "fromversion" in node_data:
+            node_data["from_version_key"] = version_key(node_data["fromversion"])
+        if "toversion" in node_data:
+            node_data["to_version_key"] = version_key(node_data["toversion"])
+    return data
+
+
 def create_nodes(
     tx: Transaction,
-    nodes: Dict[ContentType, List[Dict[str, Any]]],
+    nodes: Dict[ContentType, Iterable[Dict[str, Any]]],
 ) -> None:
     for content_type, data in nodes.items():
-        create_nodes_by_type(tx, content_type, data)
+        create_nodes_by_type(tx, content_type, add_version_keys(list(data)))
+
+
+def set_missing_version_keys(tx: Transaction) -> None:
+    nodes_count: int = run_query(tx, SET_MISSING_VERSION_KEYS).single()["nodes_updated"]
+    logger.debug(f"Set the version keys of {nodes_count} nodes.")
 
 
 def remove_nodes(tx: Transaction, content_type_to_identifiers: dict) -> None:
@@ -148,12 +182,13 @@ def remove_nodes(tx: Transaction, content_type_to_identifiers: dict) -> None:
         else:
             label = ContentType.BASE_NODE
 
-        query = REMOVE_NODES_BY_TYPE.format(
-            label=label,
-            content_type=content_type,
+        query = REMOVE_NODES_BY_TYPE.format(label=label, content_type=content_type)
+        run_query(
+            tx,
+            query,
+            content_type=content_type.value,
             content_items_identifiers=[c.lower() for c in content_items_identifiers],
         )
-        run_query(tx, query)
 
 
 def remove_server_nodes(tx: Transaction) -> None:
@@ -200,15 +235,16 @@ def _match(
     if marketplace:
         properties["marketplaces"] = marketplace.value
 
+    params = QueryParameters()
     query = f"""// Retrieves nodes according to given parameters.
-MATCH {to_node_pattern(properties, content_type=content_type, list_properties=get_list_properties(tx))}
+MATCH {to_node_pattern(properties, params, content_type=content_type, list_properties=get_list_properties(tx))}
 {"WHERE elementId(node) IN $filter_list" if ids_list else ""}
 RETURN node"""
 
     return [
         item.get("node")
         for item in run_query(
-            tx, query, filter_list=list(ids_list) if ids_list else None
+            tx, query, params, filter_list=list(ids_list) if ids_list else None
         )
     ]
 
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from neo4j import Transaction
 
@@ -14,6 +14,7 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
     labels_of,
     node_map,
     run_query,
+    to_neo4j_value,
 )
 
 
@@ -174,7 +175,7 @@ RETURN count(r) AS relationships_merged"""
 
 def create_relationships(
     tx: Transaction,
-    relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+    relationships: Dict[RelationshipType, Iterable[Dict[str, Any]]],
     timeout: Optional[int] = None,
 ) -> None:
     if relationships.get(RelationshipType.HAS_COMMAND):
@@ -188,7 +189,7 @@ def create_relationships(
 def create_relationships_by_type(
     tx: Transaction,
     relationship: RelationshipType,
-    data: List[Dict[str, Any]],
+    data: Iterable[Dict[str, Any]],
 ) -> None:
     if relationship == RelationshipType.HAS_COMMAND:
         query = build_has_command_relationships_query()
@@ -220,7 +221,7 @@ def create_relationships_by_type(
         query = build_depends_on_relationships_query()
     else:
         query = build_default_relationships_query(relationship)
-    run_query(tx, query, data=data)
+    run_query(tx, query, data=list(data))
     logger.debug(f"Merged relationships of type {relationship}.")
 
 
@@ -240,7 +241,7 @@ def _match_relationships(
         Dict[int, Neo4jRelationshipResult]: Dictionary of neo4j ids to Neo4jRelationshipResult
     """
     marketplace_where = (
-        f"AND '{marketplace}' IN node_from.marketplaces AND '{marketplace}' IN node_to.marketplaces"
+        "AND $marketplace IN node_from.marketplaces AND $marketplace IN node_to.marketplaces"
         if marketplace
         else ""
     )
@@ -256,7 +257,12 @@ RETURN node_from, collect(relationship) AS relationships, collect(node_to) AS no
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query, ids_list=list(ids_list) if ids_list else None)
+        for item in run_query(
+            tx,
+            query,
+            ids_list=list(ids_list) if ids_list else None,
+            marketplace=to_neo4j_value(marketplace),
+        )
     }
 
 
@@ -273,12 +279,12 @@ def get_sources_by_path(
     include_hidden: bool,
 ) -> List[Dict[str, Any]]:
     query = f"""// Returns all paths to a given node by relationship type and depth.
-MATCH (n{{path: "{path}"}})
+MATCH (n:{ContentType.BASE_NODE}{{path: $path}})
 CALL apoc.path.expandConfig(n, {{
-    relationshipFilter: "<{relationship}",
-    labelFilter: ">{content_type}",
+    relationshipFilter: $relationship_filter,
+    labelFilter: $label_filter,
     minLevel: 1,
-    maxLevel: {depth},
+    maxLevel: $depth,
     uniqueness: "NODE_PATH"
 }})
 YIELD path
@@ -305,7 +311,7 @@ WITH
     CASE WHEN any(n IN nodes WHERE n.hidden) THEN TRUE ELSE FALSE END AS hidden
 WHERE
     source.path IS NOT NULL
-    AND all(n IN nodes WHERE "{marketplace}" IN n.marketplaces)
+    AND all(n IN nodes WHERE $marketplace IN n.marketplaces)
     {"AND NOT is_test" if not include_tests else ""}
     {"AND NOT deprecated" if not include_deprecated else ""}
     {"AND NOT hidden" if not include_hidden else ""}
@@ -339,7 +345,15 @@ RETURN
     CASE WHEN all(p IN paths WHERE p.mandatorily IS NOT NULL) THEN FALSE END END AS mandatorily,
     minDepth
 ORDER BY content_type, object_id"""
-    return run_query(tx, query).data()
+    return run_query(
+        tx,
+        query,
+        path=str(path),
+        relationship_filter=f"<{relationship}",
+        label_filter=f">{content_type}",
+        depth=depth,
+        marketplace=to_neo4j_value(marketplace),
+    ).data()
 
 
 def get_targets_by_path(
@@ -355,12 +369,12 @@ def get_targets_by_path(
     include_hidden: bool,
 ) -> List[Dict[str, Any]]:
     query = f"""// Returns all paths from a given node by relationship type and depth.
-MATCH (n{{path: "{path}"}})
+MATCH (n:{ContentType.BASE_NODE}{{path: $path}})
 CALL apoc.path.expandConfig(n, {{
-    relationshipFilter: "{relationship}>",
-    labelFilter: ">{content_type}",
+    relationshipFilter: $relationship_filter,
+    labelFilter: $label_filter,
     minLevel: 1,
-    maxLevel: {depth},
+    maxLevel: $depth,
     uniqueness: "NODE_PATH"
 }})
 YIELD path
@@ -386,7 +400,7 @@ WITH
     CASE WHEN any(n IN nodes WHERE n.hidden) THEN TRUE ELSE FALSE END AS hidden
 WHERE
     target.path IS NOT NULL
-    AND all(n IN nodes WHERE "{marketplace}" IN n.marketplaces)
+    AND all(n IN nodes WHERE $marketplace IN n.marketplaces)
     {"AND NOT is_test" if not include_tests else ""}
     {"AND NOT deprecated" if not include_deprecated else ""}
     {"AND NOT hidden" if not include_hidden else ""}
@@ -420,7 +434,15 @@ RETURN
     CASE WHEN all(p IN paths WHERE p.mandatorily IS NOT NULL) THEN FALSE END END AS mandatorily,
     minDepth
 ORDER BY content_type, object_id"""
-    return run_query(tx, query).data()
+    return run_query(
+        tx,
+        query,
+        path=str(path),
+        relationship_filter=f"{relationship}>",
+        label_filter=f">{content_type}",
+        depth=depth,
+        marketplace=to_neo4j_value(marketplace),
+    ).data()
 
 
 def delete_all_graph_relationships(tx: Transaction) -> None:
@@ -16,7 +16,8 @@ from demisto_sdk.commands.content_graph.common import (
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
     is_target_available,
     run_query,
-    versioned,
+    to_neo4j_value,
+    version_key,
 )
 
 
@@ -41,14 +42,14 @@ def validate_unknown_content(
     if include_optional:
         query = f"""// Returns USES relationships to content items not in the repository
         MATCH (content_item_from{{deprecated: false, is_test: false}})-[r:{RelationshipType.USES}]->(n{{not_in_repository: true}})
-        {f'WHERE content_item_from.path in {file_paths}' if file_paths else ''}
+        {'WHERE content_item_from.path in $file_paths' if file_paths else ''}
         RETURN content_item_from, collect(r) as relationships, collect(n) as nodes_to
         """
     else:
         query = f"""// Returns USES relationships to content items not in the repository
         MATCH (content_item_from{{deprecated: false, is_test: false}})-[r:{RelationshipType.USES}]->(n{{not_in_repository: true}})
         WHERE{' NOT' if raises_error else ''} NOT r.mandatorily
-        {f'AND content_item_from.path in {file_paths}' if file_paths else ''}
+        {'AND content_item_from.path in $file_paths' if file_paths else ''}
         RETURN content_item_from, collect(r) as relationships, collect(n) as nodes_to
         """
     return {
@@ -57,7 +58,7 @@ def validate_unknown_content(
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     }
 
 
@@ -67,18 +68,16 @@ def validate_fromversion(
     op = ">=" if for_supported_versions else "<"
     query = f"""// Returning all the USES relationships with where the target's fromversion is higher than the source's
 MATCH (content_item_from{{deprecated: false, is_test: false}})-[r:{RelationshipType.USES}{{mandatorily:true}}]->(n)
-WHERE {versioned('content_item_from.fromversion')} < {versioned('n.fromversion')}
-AND {versioned('n.fromversion')} {op} {versioned(GENERAL_DEFAULT_FROMVERSION)}
-AND n.fromversion <> "{DEFAULT_CONTENT_ITEM_FROM_VERSION}"  // skips types with no "fromversion"
+WHERE content_item_from.from_version_key < n.from_version_key
+AND n.from_version_key {op} {version_key(GENERAL_DEFAULT_FROMVERSION)}
+AND n.from_version_key <> {version_key(DEFAULT_CONTENT_ITEM_FROM_VERSION)}  // skips types with no "fromversion"
 """
     if file_paths:
-        query += (
-            f"AND (content_item_from.path in {file_paths} OR n.path in {file_paths})"
-        )
+        query += "AND (content_item_from.path in $file_paths OR n.path in $file_paths)"
     query += f"""
 OPTIONAL MATCH (n2{{object_id: n.object_id, content_type: n.content_type}})
 WHERE elementId(n) <> elementId(n2)
-AND {versioned('content_item_from.fromversion')} >= {versioned('n2.fromversion')}
+AND content_item_from.from_version_key >= n2.from_version_key
 
 WITH content_item_from, r, n, n2
 WHERE NOT exists((content_item_from)-[:{RelationshipType.USES}{{mandatorily:true}}]->(n2))
@@ -89,7 +88,7 @@ RETURN content_item_from, collect(r) as relationships, collect(n) as nodes_to"""
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     }
 
 
@@ -99,17 +98,15 @@ def validate_toversion(
     op = ">=" if for_supported_versions else "<"
     query = f"""// Returning all the USES relationships with where the target's toversion is lower than the source's
 MATCH (content_item_from{{deprecated: false}})-[r:{RelationshipType.USES}{{mandatorily:true}}]->(n)
-WHERE {versioned('content_item_from.toversion')} > {versioned('n.toversion')}
-AND {versioned('content_item_from.toversion')} {op} {versioned(GENERAL_DEFAULT_FROMVERSION)}
+WHERE content_item_from.to_version_key > n.to_version_key
+AND content_item_from.to_version_key {op} {version_key(GENERAL_DEFAULT_FROMVERSION)}
 """
     if file_paths:
-        query += (
-            f"AND (content_item_from.path in {file_paths} OR n.path in {file_paths})"
-        )
+        query += "AND (content_item_from.path in $file_paths OR n.path in $file_paths)"
     query += f"""
 OPTIONAL MATCH (n2{{object_id: n.object_id, content_type: n.content_type}})
 WHERE elementId(n) <> elementId(n2)
-AND {versioned('content_item_from.toversion')} <= {versioned('n2.toversion')}
+AND content_item_from.to_version_key <= n2.to_version_key
 
 WITH content_item_from, r, n, n2
 WHERE NOT exists((content_item_from)-[:{RelationshipType.USES}{{mandatorily:true}}]->(n2))
@@ -120,7 +117,7 @@ RETURN content_item_from, collect(r) as relationships, collect(n) as nodes_to"""
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     }
 
 
@@ -132,7 +129,7 @@ def get_items_using_deprecated(tx: Transaction, file_paths: List[str]):
 
 def get_items_using_deprecated_commands(tx: Transaction, file_paths: List[str]):
     files_filter = (
-        f"AND (p.path in {file_paths} OR i.path IN {file_paths})" if file_paths else ""
+        "AND (p.path in $file_paths OR i.path IN $file_paths)" if file_paths else ""
     )
     command_query = f"""// Returning all the items which using deprecated commands
 MATCH (p{{deprecated: false}})-[:USES]->(c:Command)<-[:HAS_COMMAND{{deprecated: true}}]-(i:Integration) WHERE NOT p.is_test
@@ -142,12 +139,12 @@ WITH p, c, i2
 WHERE i2 IS NULL
 {files_filter}
 RETURN c.object_id AS deprecated_command, c.content_type AS deprecated_content_type, collect(p.path) AS object_using_deprecated"""
-    return list(run_query(tx, command_query))
+    return list(run_query(tx, command_query, file_paths=file_paths))
 
 
 def get_items_using_deprecated_content_items(tx: Transaction, file_paths: List[str]):
     files_filter = (
-        f"AND (p.path IN {file_paths} OR d.path IN {file_paths})" if file_paths else ""
+        "AND (p.path IN $file_paths OR d.path IN $file_paths)" if file_paths else ""
     )
     query = f"""
     MATCH (p{{deprecated: false}})-[:USES]->(d{{deprecated: true}}) WHERE not p.is_test
@@ -158,7 +155,7 @@ WHERE c1 IS NULL
 {files_filter}
 RETURN d.object_id AS deprecated_content, d.content_type AS deprecated_content_type, collect(p.path) AS object_using_deprecated
     """
-    return list(run_query(tx, query))
+    return list(run_query(tx, query, file_paths=file_paths))
 
 
 def validate_marketplaces(tx: Transaction, pack_ids: List[str]):
@@ -171,7 +168,7 @@ WHERE not content_item_from.is_test
 AND not all(elem IN content_item_from.marketplaces WHERE elem IN n.marketplaces)
 """
     if pack_ids:
-        query += f"AND (p1.object_id in {pack_ids} OR p2.object_id in {pack_ids})"
+        query += "AND (p1.object_id in $pack_ids OR p2.object_id in $pack_ids)"
     query += f"""
 OPTIONAL MATCH (n2{{object_id: n.object_id, content_type: n.content_type}})
 WHERE not content_item_from.is_test
@@ -188,7 +185,7 @@ RETURN content_item_from, collect(r) as relationships, collect(n) as nodes_to
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, pack_ids=pack_ids)
     }
 
 
@@ -200,14 +197,14 @@ MATCH (a:{ContentType.PACK}), (b:{ContentType.PACK})
 WHERE a.name = b.name
 """
     if file_paths:
-        query += f"AND a.path in {file_paths}"
+        query += "AND a.path in $file_paths"
     query += """
 AND elementId(a) <> elementId(b)
 RETURN a.object_id AS a_object_id, collect(b.object_id) AS b_object_ids
 """
     return [
         (item.get("a_object_id"), item.get("b_object_ids"))
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     ]
 
 
@@ -220,7 +217,7 @@ WHERE toLower(a.name) contains "alert"
 AND 'marketplacev2' IN a.marketplaces
 """
     if file_paths:
-        query += f"AND a.path in {file_paths}"
+        query += "AND a.path in $file_paths"
     query += """
     RETURN a.name AS a_name, a.path AS a_path
     """
@@ -228,19 +225,19 @@ AND 'marketplacev2' IN a.marketplaces
     content_item_names_and_paths = {
         # replace the name of the script.
         replace_alert_to_incident(item["a_name"]): item["a_path"]
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     }
 
     query = f"""// Returns script names if they match the replaced name
 MATCH (b:{ContentType.SCRIPT})
-WHERE b.name in {list(content_item_names_and_paths.keys())}
+WHERE b.name in $names
 AND NOT 'script-name-incident-to-alert' IN b.skip_prepare
 AND '{MarketplaceVersions.MarketplaceV2}' IN b.marketplaces
 RETURN b.name AS b_name
 """
     return {
         item["b_name"]: content_item_names_and_paths[item["b_name"]]
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, names=list(content_item_names_and_paths))
     }
 
 
@@ -251,12 +248,12 @@ def validate_core_packs_dependencies(
     core_pack_list: List[str],
 ):
     query = f"""// Returns DEPENDS_ON relationships to content items who are not core packs
-    MATCH (pack1)-[r:DEPENDS_ON{{mandatorily:true}}]->(pack2)
-    WHERE pack1.object_id in {pack_ids}
+    MATCH (pack1)-[r:{RelationshipType.DEPENDS_ON}{{mandatorily:true}}]->(pack2)
+    WHERE pack1.object_id in $pack_ids
     AND NOT r.is_test
-    AND NOT pack2.object_id IN {core_pack_list}
-    AND "{marketplace}" IN pack1.marketplaces
-    AND "{marketplace}" IN pack2.marketplaces
+    AND NOT pack2.object_id IN $core_pack_list
+    AND $marketplace IN pack1.marketplaces
+    AND $marketplace IN pack2.marketplaces
     RETURN pack1, collect(r) as relationships, collect(pack2) as nodes_to
     """
     return {
@@ -265,7 +262,13 @@ def validate_core_packs_dependencies(
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(
+            tx,
+            query,
+            pack_ids=pack_ids,
+            marketplace=to_neo4j_value(marketplace),
+            core_pack_list=core_pack_list,
+        )
     }
 
 
@@ -275,7 +278,7 @@ def validate_hidden_pack_dependencies(
 ):
     query = f"""// Returns DEPENDS_ON relationships to packs which are hidden
 MATCH (pack1)-[r:{RelationshipType.DEPENDS_ON}{{mandatorily:true}}]->(pack2{{hidden: true}})
-WHERE {f'(pack1.object_id in {pack_ids} OR pack2.object_id in {pack_ids}) AND' if pack_ids else ""}
+WHERE {'(pack1.object_id in $pack_ids OR pack2.object_id in $pack_ids) AND' if pack_ids else ""}
 NOT r.is_test
 and NOT pack1.hidden
 and NOT pack1.deprecated
@@ -287,7 +290,7 @@ RETURN pack1, collect(r) as relationships, collect(pack2) as nodes_to
             relationships=item.get("relationships"),
             nodes_to=item.get("nodes_to"),
         )
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, pack_ids=pack_ids)
     }
 
 
@@ -301,10 +304,10 @@ def validate_duplicate_ids(
     AND content_item.object_id = duplicate_content_item.object_id
     AND content_item.content_type = duplicate_content_item.content_type
     AND {is_target_available('content_item', 'duplicate_content_item')}
-    {f'AND content_item.path in {file_paths}' if file_paths else ''}
+    {'AND content_item.path in $file_paths' if file_paths else ''}
     RETURN content_item, collect(duplicate_content_item) AS duplicate_content_items
     """
     return [
         (item.get("content_item"), item.get("duplicate_content_items"))
-        for item in run_query(tx, query)
+        for item in run_query(tx, query, file_paths=file_paths)
     ]
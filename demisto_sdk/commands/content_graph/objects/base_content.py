@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -52,6 +53,65 @@ CONTENT_TYPE_TO_MODEL: Dict[ContentType, Type["BaseContent"]] = {}
 json = JSON_Handler()
 
 
+class LazyRelationshipsData(defaultdict):
+    """The relationships of a content item which were not fetched from the graph yet.
+
+    The relationships are fetched on the first access, by the loader which the search shared between all the
+    content items it returned, so they are fetched in a single query.
+    """
+
+    def __init__(self, loader: Callable[[], None]) -> None:
+        super().__init__(set)
+        self.loader: Optional[Callable[[], None]] = loader
+
+    def load(self) -> None:
+        # the loader is removed first, so the accesses while loading do not load again
+        loader, self.loader = self.loader, None
+        if loader:
+            loader()
+
+    def __getitem__(self, key):
+        self.load()
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self.load()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.load()
+        return super().__len__()
+
+    def get(self, key, default=None):
+        self.load()
+        return super().get(key, default)
+
+    def items(self):
+        self.load()
+        return super().items()
+
+    def keys(self):
+        self.load()
+        return super().keys()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def copy(self) -> defaultdict:
+        self.load()
+        return defaultdict(set, dict.items(self))
+
+    def __reduce__(self):
+        # the loader can not be pickled, so the relationships are pickled as a regular defaultdict
+        self.load()
+        return defaultdict, (set,), None, None, iter(dict.items(self))
+
+
 class BaseContentMetaclass(ModelMetaclass):
     def __new__(
         cls, name, bases, namespace, content_type: ContentType = None, **kwargs
@@ -103,6 +163,8 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
     relationships_data: Dict[RelationshipType, Set["RelationshipData"]] = Field(
         defaultdict(set), exclude=True, repr=False
     )
+    # fields which are set from the relationships, so they are loaded with them when the relationships are lazy
+    relationship_fields: ClassVar[Tuple[str, ...]] = ()
 
     class Config:
         arbitrary_types_allowed = (
@@ -112,8 +174,30 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
         allow_population_by_field_name = True  # when loading from orm, ignores the aliases and uses the property name
         keep_untouched = (cached_property,)
 
+    def __getattr__(self, name: str) -> Any:
+        """Loads the lazy relationships when a field which is set from them is accessed for the first time"""
+        if name in self.relationship_fields:
+            self.load_relationships()
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def load_relationships(self) -> None:
+        """Fetches the relationships from the graph, if they were not fetched by the search which returned the item"""
+        relationships_data = self.__dict__.get("relationships_data")
+        if isinstance(relationships_data, LazyRelationshipsData):
+            relationships_data.load()
+
+    def _iter(self, *args, **kwargs):
+        # `dict()`, `json()` and `copy()` iterate over the fields, which are loaded with the relationships
+        self.load_relationships()
+        return super()._iter(*args, **kwargs)
+
     def __getstate__(self):
         """Needed to for the object to be pickled correctly (to use multiprocessing)"""
+        self.load_relationships()
         if "relationships_data" not in self.__dict__:
             # if we don't have relationships, we can use the default __getstate__ method
             return super().__getstate__()
@@ -185,7 +269,13 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
     def add_relationship(
         self, relationship_type: RelationshipType, relationship: "RelationshipData"
     ) -> None:
-        if relationship.content_item_to == self:
+        content_item_to = relationship.content_item_to
+        if self.database_id and content_item_to.database_id:
+            # nodes of the graph are compared by their ids, to not load their lazy relationships
+            is_circular = content_item_to.database_id == self.database_id
+        else:
+            is_circular = content_item_to == self
+        if is_circular:
             # skip adding circular dependency
             return
         self.relationships_data[relationship_type].add(relationship)
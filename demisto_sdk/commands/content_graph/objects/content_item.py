@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Union
@@ -223,8 +224,9 @@ class ContentItem(BaseContent):
             else YAML_Handler(width=50_000)
         )
 
-    @property
+    @cached_property
     def data(self) -> dict:
+        # kept on the content item, as get_file returns a new copy on each call and the fixers edit the data in place
         return get_file(self.path, keep_order=False)
 
     @property
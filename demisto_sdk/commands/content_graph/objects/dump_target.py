@@ -0,0 +1,133 @@
+import shutil
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from demisto_sdk.commands.common.logger import logger
+
+
+def write_dir_to_zip(zip_file: ZipFile, source: Path, prefix: str = "") -> None:
+    """
+    Write the files and directories under a directory as entries of an open zip file.
+
+    Args:
+        zip_file: the zip file to write to
+        source: the directory to write
+        prefix: a prefix of the entry names, e.g: "HelloWorld/"
+    """
+    for path in sorted(source.rglob("*")):
+        zip_file.write(path, f"{prefix}{path.relative_to(source).as_posix()}")
+
+
+def zip_dir(source: Path) -> bytes:
+    """
+    Zip a directory in memory, with the same layout as `shutil.make_archive`.
+
+    Args:
+        source: the directory to zip
+
+    Returns:
+        bytes: the content of the zip file
+    """
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as zip_file:
+        write_dir_to_zip(zip_file, source)
+    return buffer.getvalue()
+
+
+class DumpTarget:
+    """
+    Receives the packs dumped by ContentDTO.dump, each pack in its own directory under `dir`.
+
+    The default target keeps the dumped packs in place.
+    """
+
+    def __init__(self, dir: Path):
+        self.dir = dir
+
+    def __enter__(self) -> "DumpTarget":
+        self.dir.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def pack_dir(self, pack_name: str) -> Path:
+        """
+        Args:
+            pack_name: the name of the pack's folder
+
+        Returns:
+            Path: the directory to dump the pack into
+        """
+        return self.dir / pack_name
+
+    def add_pack(self, pack_dir: Path) -> None:
+        """
+        Called once the pack was dumped into its directory, may be called from several threads.
+
+        Args:
+            pack_dir: the directory of the dumped pack
+        """
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        """
+        Called instead of close when the dump failed.
+        """
+
+
+class ZipDumpTarget(DumpTarget):
+    """
+    Streams each dumped pack into the entries of a single zip file as soon as it is dumped, and removes its directory.
+
+    Only the packs which are being dumped at the moment are kept on the disk, instead of a staging tree of all the
+    packs which is archived at the end.
+    """
+
+    def __init__(self, dir: Path, zip_path: Path):
+        """
+        Args:
+            dir: the directory to dump the packs into before they are zipped
+            zip_path: the path of the zip file to create
+        """
+        super().__init__(dir)
+        self.zip_path = zip_path
+        self._lock = Lock()
+        self._zip_file: Optional[ZipFile] = None
+
+    def __enter__(self) -> "ZipDumpTarget":
+        super().__enter__()
+        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip_file = ZipFile(self.zip_path, "w", ZIP_DEFLATED)
+        return self
+
+    def add_pack(self, pack_dir: Path) -> None:
+        if self._zip_file is None:
+            raise RuntimeError("ZipDumpTarget must be used as a context manager")
+        if pack_dir.exists():
+            with self._lock:
+                write_dir_to_zip(self._zip_file, pack_dir, f"{pack_dir.name}/")
+            shutil.rmtree(pack_dir)
+
+    def close(self) -> None:
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+            logger.debug(f"Created {self.zip_path}")
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        # a zip of only some of the packs must not be mistaken for the complete content zip
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+        self.zip_path.unlink(missing_ok=True)
+        shutil.rmtree(self.dir, ignore_errors=True)
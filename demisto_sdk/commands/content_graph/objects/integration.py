@@ -1,6 +1,6 @@
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 import demisto_client
 
@@ -111,6 +111,7 @@ class Integration(IntegrationScript, content_type=ContentType.INTEGRATION):  # t
     category: str
     commands: List[Command] = []
     params: List[Parameter] = Field([], exclude=True)
+    relationship_fields: ClassVar[Tuple[str, ...]] = ("commands",)
 
     @property
     def imports(self) -> List["Script"]:
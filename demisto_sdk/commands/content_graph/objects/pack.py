@@ -3,7 +3,8 @@ from collections import defaultdict
 from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple, Union
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
@@ -41,6 +42,7 @@ from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.content_item_xsiam import (
     NotIndivitudallyUploadableException,
 )
+from demisto_sdk.commands.content_graph.objects.dump_target import zip_dir
 from demisto_sdk.commands.content_graph.objects.exceptions import (
     FailedUploadException,
     FailedUploadMultipleException,
@@ -62,7 +64,6 @@ from demisto_sdk.commands.prepare_content.markdown_images_handler import (
 from demisto_sdk.commands.upload.constants import (
     CONTENT_TYPES_EXCLUDED_FROM_UPLOAD,
     MULTIPLE_ZIPPED_PACKS_FILE_NAME,
-    MULTIPLE_ZIPPED_PACKS_FILE_STEM,
 )
 from demisto_sdk.commands.upload.exceptions import IncompatibleUploadVersionException
 from demisto_sdk.commands.upload.tools import (
@@ -131,6 +132,7 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         PackContentItems(), alias="contentItems", exclude=True
     )
     pack_metadata_dict: Optional[dict] = Field({}, exclude=True)
+    relationship_fields: ClassVar[Tuple[str, ...]] = ("content_items",)
 
     @classmethod
     def from_orm(cls, obj) -> "Pack":
@@ -430,22 +432,20 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             temp_dir_path = Path(temp_dump_dir)
             self.dump(temp_dir_path, marketplace=marketplace)
 
-            # 2) zip the dumped pack
+            # 2) zip the dumped pack, once, in memory
+            pack_zip = zip_dir(temp_dir_path)
             with TemporaryDirectory() as pack_zips_dir:
-                pack_zip_path = Path(
-                    shutil.make_archive(
-                        str(Path(pack_zips_dir, self.name)), "zip", temp_dir_path
-                    )
-                )
-                str(pack_zip_path)
+                pack_zip_path = Path(pack_zips_dir, f"{self.name}.zip")
+                pack_zip_path.write_bytes(pack_zip)
 
                 # 3) zip the zipped pack into uploadable_packs.zip under the result directory
                 try:
-                    shutil.make_archive(
-                        str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_STEM),
-                        "zip",
-                        pack_zips_dir,
-                    )
+                    with ZipFile(
+                        destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME,
+                        "w",
+                        ZIP_DEFLATED,
+                    ) as uploadable_packs_zip:
+                        uploadable_packs_zip.writestr(pack_zip_path.name, pack_zip)
                 except Exception:
                     logger.exception(
                         f"Cannot write to {str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME)}"
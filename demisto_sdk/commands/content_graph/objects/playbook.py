@@ -1,8 +1,10 @@
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 
 from demisto_sdk.commands.common.constants import TEST_PLAYBOOKS_DIR
+from demisto_sdk.commands.common.playbook_task_graph import PlaybookTaskGraph
 from demisto_sdk.commands.content_graph.common import ContentType
 from demisto_sdk.commands.content_graph.objects.base_playbook import BasePlaybook
 
@@ -10,6 +12,25 @@ from demisto_sdk.commands.content_graph.objects.base_playbook import BasePlayboo
 class Playbook(BasePlaybook, content_type=ContentType.PLAYBOOK):  # type: ignore[call-arg]
     is_test: bool = False
     tasks: dict = Field({}, exclude=True)
+    # the task graph which the parser compiled
+    compiled_task_graph: Optional[PlaybookTaskGraph] = Field(
+        None, alias="task_graph", exclude=True, repr=False
+    )
+
+    @property
+    def task_graph(self) -> PlaybookTaskGraph:
+        """The task graph of the playbook, which is compiled again only if the tasks were replaced since."""
+        if (
+            self.compiled_task_graph is None
+            or self.compiled_task_graph.tasks is not self.tasks
+        ):
+            start_task_id = (
+                self.compiled_task_graph.start_task_id
+                if self.compiled_task_graph
+                else ""
+            )
+            self.compiled_task_graph = PlaybookTaskGraph(self.tasks, start_task_id)
+        return self.compiled_task_graph
 
     @staticmethod
     def match(_dict: dict, path: Path) -> bool:
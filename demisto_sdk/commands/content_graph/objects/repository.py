@@ -1,9 +1,8 @@
-import shutil
 import time
 from functools import lru_cache
 from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 
 import tqdm
 from pydantic import BaseModel, DirectoryPath
@@ -12,10 +11,17 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.objects.dump_target import (
+    DumpTarget,
+    ZipDumpTarget,
+)
 from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+from demisto_sdk.commands.content_graph.parsers.pack import PackParser
 from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
 
-USE_MULTIPROCESSING = False  # toggle this for better debugging
+USE_MULTIPROCESSING = True  # toggle this for better debugging
 
 
 @lru_cache
@@ -39,6 +45,98 @@ def from_path(path: Path = CONTENT_PATH, packs_to_parse: Optional[Tuple[str]] =
     return ContentDTO.from_orm(repo_parser)
 
 
+class PackDependency(NamedTuple):
+    object_id: str
+    name: str
+    author: str
+    current_version: Optional[str]
+    certification: str
+    hidden: Optional[bool]
+    is_direct: bool
+    mandatorily: bool
+
+
+class PackDumpPayload(NamedTuple):
+    """
+    The data needed to dump a pack in a worker process which can not be derived from the files of the pack.
+
+    Workers get this payload together with the pack path, and parse the pack by themselves,
+    instead of getting the whole Pack model pickled with its relationships.
+    """
+
+    server_min_version: Optional[str]
+    dependencies: Tuple[PackDependency, ...]
+
+    @classmethod
+    def from_pack(cls, pack: Pack) -> "PackDumpPayload":
+        return cls(
+            server_min_version=pack.server_min_version,
+            dependencies=tuple(
+                PackDependency(
+                    object_id=dependency.object_id,
+                    name=dependency.name,
+                    author=dependency.author,
+                    current_version=dependency.current_version,
+                    certification=dependency.certification,
+                    hidden=dependency.hidden,
+                    is_direct=r.is_direct,
+                    mandatorily=r.mandatorily,
+                )
+                for r in pack.depends_on
+                if isinstance(dependency := r.content_item_to, Pack)
+            ),
+        )
+
+    def apply(self, pack: Pack) -> None:
+        """
+        Set the data of the payload on a pack which was parsed from its files.
+
+        Args:
+            pack: the parsed pack
+        """
+        if self.server_min_version:
+            pack.server_min_version = self.server_min_version
+        for dependency in self.dependencies:
+            pack.add_relationship(
+                RelationshipType.DEPENDS_ON,
+                RelationshipData(
+                    relationship_type=RelationshipType.DEPENDS_ON,
+                    source_id=pack.object_id,
+                    target_id=dependency.object_id,
+                    content_item_to=Pack.construct(
+                        database_id=dependency.object_id,
+                        object_id=dependency.object_id,
+                        name=dependency.name,
+                        author=dependency.author,
+                        current_version=dependency.current_version,
+                        certification=dependency.certification,
+                        hidden=dependency.hidden,
+                    ),
+                    is_direct=dependency.is_direct,
+                    mandatorily=dependency.mandatorily,
+                ),
+            )
+
+
+def _dump_pack(args: Tuple[Pack, Path, MarketplaceVersions]) -> Path:
+    pack, path, marketplace = args
+    pack.dump(path, marketplace)
+    return path
+
+
+def _dump_pack_from_path(
+    args: Tuple[Path, Path, MarketplaceVersions, PackDumpPayload]
+) -> Path:
+    pack_path, path, marketplace, payload = args
+    if not pack_path.exists():
+        logger.warning(f"Pack {pack_path.name} does not exist in {pack_path}")
+        return path
+    pack = Pack.from_orm(PackParser(pack_path))
+    payload.apply(pack)
+    pack.dump(path, marketplace)
+    return path
+
+
 class ContentDTO(BaseModel):
     path: DirectoryPath = Path(CONTENT_PATH)  # type: ignore
     packs: List[Pack]
@@ -59,8 +157,19 @@ class ContentDTO(BaseModel):
         zip: bool = True,
         packs_to_dump: Optional[list] = None,
         output_stem: str = "content_packs",  # without extension
+        processes: Optional[int] = None,
     ):
-        dir.mkdir(parents=True, exist_ok=True)
+        """
+        Dump the packs of the repository, prepared for the given marketplace.
+
+        Args:
+            dir: the directory to dump the packs into
+            marketplace: the marketplace to prepare the packs for
+            zip: whether to zip the dumped packs into `<output_stem>.zip` next to `dir`
+            packs_to_dump: the IDs of the packs to dump, all the packs by default
+            output_stem: the name of the zip file, without extension
+            processes: the number of processes to dump the packs with, the number of CPUs by default
+        """
         logger.debug(f"Got packs to dump: {packs_to_dump}")
         packs_to_dump = (
             [pack for pack in self.packs if pack.object_id in packs_to_dump]
@@ -69,34 +178,49 @@ class ContentDTO(BaseModel):
         )
 
         if not packs_to_dump:
+            dir.mkdir(parents=True, exist_ok=True)
             logger.debug("didn't got packs to dump, skipping")
             return
 
         logger.debug(
             f"Starting repository dump for packs: {[pack.object_id for pack in packs_to_dump]}"
         )
+        if processes is None:
+            processes = cpu_count() if USE_MULTIPROCESSING else 1
+        processes = min(processes, len(packs_to_dump))
         start_time = time.time()
-        if USE_MULTIPROCESSING:
-            with Pool(processes=cpu_count()) as pool:
-                pool.starmap(
-                    Pack.dump,
+        # when zipping, each pack is streamed into the zip as soon as it is dumped
+        with (
+            ZipDumpTarget(dir, dir.parent / f"{output_stem}.zip")
+            if zip
+            else DumpTarget(dir)
+        ) as target:
+            if processes > 1:
+                # the workers parse the packs by themselves, pickling the packs with their relationships is slower
+                dump_args = [
                     (
-                        (pack, dir / pack.path.name, marketplace)
-                        for pack in packs_to_dump
-                    ),
-                )
-
-        else:
-            for pack in packs_to_dump:
-                pack.dump(dir / pack.path.name, marketplace)
+                        pack.path,
+                        target.pack_dir(pack.path.name),
+                        marketplace,
+                        PackDumpPayload.from_pack(pack),
+                    )
+                    for pack in packs_to_dump
+                ]
+                with Pool(processes=processes) as pool:
+                    for pack_dir in pool.imap_unordered(
+                        _dump_pack_from_path, dump_args
+                    ):
+                        target.add_pack(pack_dir)
+
+            else:
+                for pack in packs_to_dump:
+                    target.add_pack(
+                        _dump_pack((pack, target.pack_dir(pack.path.name), marketplace))
+                    )
 
         time_taken = time.time() - start_time
         logger.debug(f"Repository dump ended. Took {time_taken} seconds")
 
-        if zip:
-            shutil.make_archive(str(dir.parent / output_stem), "zip", dir)
-            shutil.rmtree(dir)
-
     class Config:
         orm_mode = True
         allow_population_by_field_name = True
@@ -2,12 +2,10 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import networkx
-
 from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.playbook_task_graph import PlaybookTaskGraph
 from demisto_sdk.commands.common.update_id_set import (
     BUILT_IN_FIELDS,
-    build_tasks_graph,
     get_fields_by_script_argument,
 )
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
@@ -46,7 +44,9 @@ class BasePlaybookParser(YAMLContentItemParser, content_type=ContentType.BASE_PL
         """
         super().__init__(path, pack_marketplaces, git_sha=git_sha)
         self.is_test: bool = is_test_playbook
-        self.graph: networkx.DiGraph = build_tasks_graph(self.yml_data)
+        self.task_graph: PlaybookTaskGraph = PlaybookTaskGraph.from_playbook(
+            self.yml_data
+        )
         self.connect_to_dependencies()
         self.connect_to_tests()
 
@@ -56,11 +56,8 @@ class BasePlaybookParser(YAMLContentItemParser, content_type=ContentType.BASE_PL
         return super().field_mapping
 
     def is_mandatory_dependency(self, task_id: str) -> bool:
-        try:
-            return self.graph.nodes[task_id]["mandatory"]
-        except KeyError:
-            # task is not connected to a branch
-            return False
+        # a task which is not connected to a branch is not mandatory
+        return self.task_graph.is_mandatory(task_id)
 
     def handle_playbook_task(self, task: Dict[str, Any], is_mandatory: bool) -> None:
         """Collects a playbook dependency.
@@ -1,7 +1,30 @@
-from demisto_sdk.commands.content_graph.common import ContentType
+import pickle
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph import common
+from demisto_sdk.commands.content_graph.common import (
+    Columns,
+    ContentType,
+    Nodes,
+    Relationships,
+    RelationshipType,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries import (
+    dependencies,
+    nodes,
+    relationships,
+    validations,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
+    QueryParameters,
     to_node_pattern,
+    version_key,
 )
+from demisto_sdk.commands.content_graph.parsers.pack import PackParser
+from TestSuite.repo import Repo
 
 
 def test_content_type_does_not_contain_colon():
@@ -23,12 +46,445 @@ def test_to_neo4j_pattern():
         "version": 1,
         "version_float": 1.0,
     }
+    params = QueryParameters()
     pattern = to_node_pattern(
         properties=properties,
+        params=params,
         content_type=ContentType.INTEGRATION,
         list_properties=["marketplaces"],
     )
     assert (
         pattern
-        == "(node:Integration{name: \"test\", version: 1, version_float: 1.0} WHERE node.object_ids IN ['1', '2'] AND 'xsoar' IN node.marketplaces)"
+        == "(node:BaseNode:Integration{name: $name, version: $version, version_float: $version_float} WHERE node.object_ids IN $object_ids AND $marketplaces IN node.marketplaces)"
+    )
+    assert params == {
+        "name": "test",
+        "object_ids": ["1", "2"],
+        "marketplaces": "xsoar",
+        "version": 1,
+        "version_float": 1.0,
+    }
+
+
+def test_query_parameters_names_and_values():
+    """
+    Given:
+        - values of several types, two of them with the same name
+
+    When:
+        - adding them to a QueryParameters
+
+    Then:
+        - ensure the placeholders are named after the parameters, and a repeated name gets a suffix
+        - ensure the values are converted to types neo4j accepts
+    """
+    params = QueryParameters()
+
+    assert params.add(Path("Packs/HelloWorld"), "path") == "$path"
+    assert params.add(MarketplaceVersions.XSOAR, "marketplace") == "$marketplace"
+    assert params.add({"a"}, "path") == "$path_2"
+    assert params == {
+        "path": "Packs/HelloWorld",
+        "marketplace": "xsoar",
+        "path_2": ["a"],
+    }
+
+
+def run_and_get_query(mocker, query_function, *args, **kwargs):
+    tx = mocker.MagicMock()
+    query_function(tx, *args, **kwargs)
+    query, parameters = tx.run.call_args.args
+    return query, {**(parameters or {}), **tx.run.call_args.kwargs}
+
+
+@pytest.mark.parametrize(
+    "query_function, first_args, second_args",
+    [
+        (
+            validations.validate_core_packs_dependencies,
+            (["PackA"], MarketplaceVersions.XSOAR, ["Base"]),
+            (["PackB", "PackC"], MarketplaceVersions.MarketplaceV2, []),
+        ),
+        (
+            validations.validate_duplicate_ids,
+            (["Packs/A/a.yml"],),
+            (["Packs/B/b.yml", 'Packs/"C"/c.yml'],),
+        ),
+        (
+            nodes.remove_packs_before_creation,
+            (["PackA"],),
+            (["PackB", "PackC"],),
+        ),
+        (
+            relationships.get_sources_by_path,
+            (
+                Path("Packs/A/a.yml"),
+                RelationshipType.USES,
+                ContentType.BASE_NODE,
+                2,
+                MarketplaceVersions.XSOAR,
+                True,
+                False,
+                False,
+                False,
+            ),
+            (
+                Path("Packs/B/b.yml"),
+                RelationshipType.USES,
+                ContentType.BASE_NODE,
+                5,
+                MarketplaceVersions.MarketplaceV2,
+                True,
+                False,
+                False,
+                False,
+            ),
+        ),
+    ],
+)
+def test_query_text_is_stable_across_inputs(
+    mocker, query_function, first_args, second_args
+):
+    """
+    Given:
+        - a query function, and two different inputs of the same shape
+
+    When:
+        - running the query function with each input
+
+    Then:
+        - ensure the query text is the same for both inputs, so neo4j can reuse its cached plan
+        - ensure the inputs are sent as parameters
+    """
+    first_query, first_params = run_and_get_query(mocker, query_function, *first_args)
+    second_query, second_params = run_and_get_query(
+        mocker, query_function, *second_args
+    )
+
+    assert first_query == second_query
+    assert first_params != second_params
+
+
+def test_match_query_text_is_stable_across_inputs(mocker):
+    """
+    Given:
+        - two different sets of property values to match nodes by
+
+    When:
+        - matching nodes with each of them
+
+    Then:
+        - ensure the query text is the same for both, and the values are sent as parameters
+    """
+    mocker.patch.object(nodes, "LIST_PROPERTIES", ["marketplaces"])
+
+    first_query, first_params = run_and_get_query(
+        mocker,
+        nodes._match,
+        MarketplaceVersions.XSOAR,
+        ContentType.INTEGRATION,
+        object_id="HelloWorld",
+        deprecated=False,
+    )
+    second_query, second_params = run_and_get_query(
+        mocker,
+        nodes._match,
+        MarketplaceVersions.MarketplaceV2,
+        ContentType.INTEGRATION,
+        object_id="Other",
+        deprecated=True,
+    )
+
+    assert first_query == second_query
+    assert "HelloWorld" not in first_query
+    assert first_params["object_id"] == "HelloWorld"
+    assert second_params["marketplaces"] == "marketplacev2"
+
+
+@pytest.mark.parametrize(
+    "lower, higher",
+    [
+        ("6.9.0", "6.10.0"),
+        ("0.0.0", "5.5.0"),
+        ("6.10.0", "6.10.1"),
+        ("6.10", "6.10.0.1"),
+        ("8.0.0", "99.99.99"),
+    ],
+)
+def test_version_key_is_ordered_like_the_version(lower, higher):
+    """
+    Given:
+        - two versions, where the second is higher
+
+    When:
+        - computing their version keys
+
+    Then:
+        - ensure the keys are ordered like the versions, unlike the version strings
+    """
+    assert version_key(lower) < version_key(higher)
+    assert version_key("6.10") == version_key("6.10.0")
+
+
+@pytest.mark.parametrize("version", [None, "", "6.x.0"])
+def test_version_key_of_invalid_version(version):
+    """
+    Given:
+        - a missing or non numeric version
+
+    When:
+        - computing its version key
+
+    Then:
+        - ensure there is no key, like toIntegerList which returns nulls for such versions
+    """
+    assert version_key(version) is None
+
+
+def test_create_nodes_adds_version_keys(mocker):
+    """
+    Given:
+        - a content item with fromversion and toversion, and a pack without them
+
+    When:
+        - creating the nodes
+
+    Then:
+        - ensure the content item is created with its version keys, and the pack without version keys
+    """
+    tx = mocker.MagicMock()
+
+    nodes.create_nodes(
+        tx,
+        {
+            ContentType.SCRIPT: [
+                {
+                    "object_id": "Script",
+                    "fromversion": "6.10.0",
+                    "toversion": "99.99.99",
+                }
+            ],
+            ContentType.PACK: [{"object_id": "Pack"}],
+        },
+    )
+
+    script_data, pack_data = (call.kwargs["data"][0] for call in tx.run.call_args_list)
+    assert script_data["from_version_key"] == version_key("6.10.0")
+    assert script_data["to_version_key"] == version_key("99.99.99")
+    assert "from_version_key" not in pack_data
+
+
+def test_calculate_all_level_dependencies():
+    """
+    Given:
+        - packs which depend on each other in a cycle, and a longer chain of dependencies than the old maximal depth
+        - a dependency of a pack, through a pack which is not in the marketplace
+
+    When:
+        - calculating the all level dependencies in the marketplace
+
+    Then:
+        - ensure the packs in the cycle depend on each other, but not on themselves
+        - ensure the end of the chain is found
+        - ensure the path through the pack which is not in the marketplace is not used
+    """
+    chain = [f"Chain{index}" for index in range(8)]
+    pack_marketplaces = {
+        pack_id: ["xsoar"] for pack_id in ("A", "B", "C", "D", "E", *chain)
+    }
+    pack_marketplaces["XsiamOnly"] = ["marketplacev2"]
+    pack_dependencies = [
+        ("A", "B"),
+        ("B", "A"),
+        ("B", "C"),
+        ("D", "XsiamOnly"),
+        ("XsiamOnly", "E"),
+        *zip(chain, chain[1:]),
+    ]
+
+    all_level_dependencies = dependencies.calculate_all_level_dependencies(
+        pack_marketplaces, pack_dependencies, "xsoar"
+    )
+
+    assert all_level_dependencies["A"] == ["B", "C"]
+    assert all_level_dependencies["B"] == ["A", "C"]
+    assert all_level_dependencies["C"] == []
+    assert all_level_dependencies["D"] == []
+    assert all_level_dependencies[chain[0]] == chain[1:]
+    assert "XsiamOnly" not in all_level_dependencies
+
+
+def test_get_all_level_dependencies_uses_precomputed_dependencies(mocker):
+    """
+    Given:
+        - a pack with precomputed all level dependencies, and a pack without them (e.g, from an older graph)
+
+    When:
+        - getting the all level mandatory dependencies of both packs
+
+    Then:
+        - ensure the dependencies of the first pack are read from its property
+        - ensure only the second pack is searched by the paths of its dependencies
+    """
+    precomputed_result = {"1": mocker.MagicMock(nodes_to=["dependency"])}
+    mocker.patch.object(
+        dependencies,
+        "get_precomputed_all_level_dependencies",
+        return_value=precomputed_result,
     )
+    run_query = mocker.patch.object(
+        dependencies,
+        "run_query",
+        return_value=[{"node_id": "2", "nodes_to": [], "relationships": []}],
+    )
+
+    result = dependencies.get_all_level_packs_relationships(
+        mocker.MagicMock(),
+        RelationshipType.DEPENDS_ON,
+        ["1", "2"],
+        MarketplaceVersions.XSOAR,
+        True,
+    )
+
+    assert set(result) == {"1", "2"}
+    assert result["1"] is precomputed_result["1"]
+    assert run_query.call_args.args[2]["ids_list"] == ["2"]
+
+
+def test_columns_records_round_trip():
+    """
+    Given:
+        - records with different properties, including None values and lists of strings
+
+    When:
+        - storing them in a columns collection
+
+    Then:
+        - ensure the records are returned as they were added, without the properties they do not have
+        - ensure equal lists of strings are stored once
+    """
+    records = [
+        {"object_id": "a", "marketplaces": ["xsoar", "xsiam"], "toversion": None},
+        {"object_id": "b", "marketplaces": ["xsoar", "xsiam"], "deprecated": True},
+        {},
+    ]
+
+    columns = Columns(records)
+
+    assert list(columns) == records
+    assert columns[1] == records[1]
+    assert columns[-1] == {}
+    assert len(columns) == 3
+    marketplaces = columns.columns["marketplaces"]
+    assert marketplaces[0] is marketplaces[1]
+
+
+def test_parsed_pack_relationships_survive_pickling(mocker, repo: Repo):
+    """
+    Given:
+        - a parsed pack, with relationships which do not have some of the optional properties
+
+    When:
+        - pickling and unpickling the parser, as when it is sent back from a parsing process
+
+    Then:
+        - ensure the relationships do not get the properties they did not have
+    """
+    import demisto_sdk.commands.content_graph.objects.base_content as bc
+
+    mocker.patch.object(bc, "CONTENT_PATH", Path(repo.path))
+    pack = repo.setup_one_pack("MyPack")
+    parser = PackParser(Path(pack.path))
+
+    unpickled = pickle.loads(pickle.dumps(parser))
+
+    assert unpickled.relationships.keys() == parser.relationships.keys()
+    for relationship_type, columns in parser.relationships.items():
+        assert list(unpickled.relationships[relationship_type]) == list(columns)
+    assert common.MISSING is pickle.loads(pickle.dumps(common.MISSING))
+
+
+def test_relationships_are_validated_once(mocker):
+    """
+    Given:
+        - relationships of a content item, which were validated when they were added
+
+    When:
+        - adding them to the relationships of a pack, and then to the relationships of the graph
+
+    Then:
+        - ensure they are not validated again
+        - ensure the boolean properties are stored in a byte array, and the relationships are returned as they were
+    """
+    item_relationships = Relationships()
+    item_relationships.add(
+        RelationshipType.USES_BY_ID,
+        source_id="MyScript",
+        source_type=ContentType.SCRIPT,
+        source_marketplaces=[MarketplaceVersions.XSOAR],
+        target="OtherScript",
+        target_type=ContentType.SCRIPT,
+        mandatorily="true",
+    )
+    item_relationships.add(
+        RelationshipType.USES_BY_ID,
+        source_id="MyScript",
+        target="SomeIntegration",
+    )
+    parse_obj = mocker.spy(common.Relationship, "parse_obj")
+
+    pack_relationships = Relationships()
+    pack_relationships.update(item_relationships)
+    graph_relationships = Relationships()
+    graph_relationships.update(pack_relationships)
+    graph_relationships.update(pack_relationships)
+
+    parse_obj.assert_not_called()
+    uses = graph_relationships[RelationshipType.USES_BY_ID]
+    assert uses.columns["mandatorily"].typecode == "b"
+    assert list(uses) == 2 * [
+        {
+            "source_id": "MyScript",
+            "source_type": ContentType.SCRIPT,
+            "source_marketplaces": [MarketplaceVersions.XSOAR],
+            "target": "OtherScript",
+            "target_type": ContentType.SCRIPT,
+            "mandatorily": True,
+        },
+        {"source_id": "MyScript", "target": "SomeIntegration"},
+    ]
+
+
+def test_nodes_update():
+    """
+    Given:
+        - the nodes of two packs
+
+    When:
+        - adding them to the nodes of the graph
+
+    Then:
+        - ensure the nodes are grouped by their content type, in the order they were added
+    """
+    graph_nodes = Nodes()
+    graph_nodes.update(
+        Nodes(
+            {"object_id": "PackA", "content_type": "Pack"},
+            {"object_id": "ScriptA", "content_type": "Script", "type": "python"},
+        )
+    )
+    graph_nodes.update(
+        Nodes(
+            {"object_id": "PackB", "content_type": "Pack", "hidden": False},
+            {"object_id": "ScriptB", "content_type": "Script"},
+        )
+    )
+
+    assert graph_nodes[ContentType.PACK] == [
+        {"object_id": "PackA", "content_type": "Pack"},
+        {"object_id": "PackB", "content_type": "Pack", "hidden": False},
+    ]
+    assert graph_nodes[ContentType.SCRIPT] == [
+        {"object_id": "ScriptA", "content_type": "Script", "type": "python"},
+        {"object_id": "ScriptB", "content_type": "Script"},
+    ]
@@ -0,0 +1,183 @@
+import shutil
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.objects.dump_target import (
+    ZipDumpTarget,
+    zip_dir,
+)
+from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+
+def create_dumped_pack(path: Path) -> Path:
+    (path / "Scripts").mkdir(parents=True)
+    (path / "Scripts" / "script-Test.yml").write_text("name: Test\n")
+    (path / "metadata.json").write_text("{}")
+    return path
+
+
+def test_zip_dir_is_like_make_archive(tmp_path):
+    """
+    Given:
+        - a dumped pack directory
+
+    When:
+        - zipping it in memory
+
+    Then:
+        - ensure the zip has the same entries and content as the zip of shutil.make_archive
+    """
+    pack_dir = create_dumped_pack(tmp_path / "HelloWorld")
+    archive = shutil.make_archive(str(tmp_path / "archive"), "zip", pack_dir)
+
+    with ZipFile(BytesIO(zip_dir(pack_dir))) as zip_file, ZipFile(archive) as expected:
+        assert sorted(zip_file.namelist()) == sorted(expected.namelist())
+        for name in expected.namelist():
+            assert zip_file.read(name) == expected.read(name)
+
+
+def test_zip_dump_target_streams_each_pack(tmp_path):
+    """
+    Given:
+        - a ZipDumpTarget
+
+    When:
+        - adding two dumped packs
+
+    Then:
+        - ensure each pack directory is removed once it is added
+        - ensure the zip has the files of both packs under the pack names
+        - ensure the dump directory is removed when the target is closed
+    """
+    dump_dir = tmp_path / "dump"
+    with ZipDumpTarget(dump_dir, tmp_path / "content_packs.zip") as target:
+        for pack_name in ("PackA", "PackB"):
+            pack_dir = create_dumped_pack(target.pack_dir(pack_name))
+            target.add_pack(pack_dir)
+            assert not pack_dir.exists()
+
+    assert not dump_dir.exists()
+    with ZipFile(tmp_path / "content_packs.zip") as zip_file:
+        assert zip_file.read("PackA/Scripts/script-Test.yml") == b"name: Test\n"
+        assert zip_file.read("PackB/metadata.json") == b"{}"
+
+
+def test_content_dto_dump_zip(mocker, tmp_path):
+    """
+    Given:
+        - a repository with two packs
+
+    When:
+        - dumping the repository into a zip
+
+    Then:
+        - ensure the packs are in the zip, and no dumped pack is left on the disk
+    """
+    packs = [
+        mocker.MagicMock(spec=Pack, object_id=name, path=Path("Packs", name))
+        for name in ("PackA", "PackB")
+    ]
+    for pack in packs:
+        pack.dump.side_effect = lambda path, marketplace: create_dumped_pack(path)
+
+    ContentDTO.construct(packs=packs).dump(
+        tmp_path / "dump", MarketplaceVersions.XSOAR, output_stem="xsoar", processes=1
+    )
+
+    assert not (tmp_path / "dump").exists()
+    with ZipFile(tmp_path / "xsoar.zip") as zip_file:
+        assert {name.split("/")[0] for name in zip_file.namelist()} == {
+            "PackA",
+            "PackB",
+        }
+
+
+def test_content_dto_dump_zip_failure(mocker, tmp_path):
+    """
+    Given:
+        - a repository with two packs, the dump of the second pack fails
+
+    When:
+        - dumping the repository into a zip
+
+    Then:
+        - ensure the error is raised
+        - ensure no zip is left with only the first pack, and no dumped pack is left on the disk
+    """
+    packs = [
+        mocker.MagicMock(spec=Pack, object_id=name, path=Path("Packs", name))
+        for name in ("PackA", "PackB")
+    ]
+    packs[0].dump.side_effect = lambda path, marketplace: create_dumped_pack(path)
+    packs[1].dump.side_effect = RuntimeError("failed to dump PackB")
+
+    with pytest.raises(RuntimeError, match="failed to dump PackB"):
+        ContentDTO.construct(packs=packs).dump(
+            tmp_path / "dump",
+            MarketplaceVersions.XSOAR,
+            output_stem="xsoar",
+            processes=1,
+        )
+
+    assert not (tmp_path / "xsoar.zip").exists()
+    assert not (tmp_path / "dump").exists()
+
+
+def read_dumped_files(path: Path) -> dict:
+    return {
+        file.relative_to(path).as_posix(): file.read_text()
+        for file in path.rglob("*")
+        if file.is_file()
+    }
+
+
+def test_content_dto_dump_in_processes(mocker, repo: Repo, tmp_path):
+    """
+    Given:
+        - a repository with two packs, one depends on the other
+
+    When:
+        - dumping the repository in a single process, and in two processes
+
+    Then:
+        - ensure the dumped files are the same
+        - ensure the dependency, which is not in the files of the pack, is in the metadata of both dumps
+    """
+    import demisto_sdk.commands.content_graph.objects.base_content as bc
+
+    mocker.patch.object(bc, "CONTENT_PATH", Path(repo.path))
+    for pack_name in ("PackA", "PackB"):
+        repo.setup_one_pack(pack_name)
+    content_dto = ContentDTO.from_path(Path(repo.path))
+    pack_a, pack_b = sorted(content_dto.packs, key=lambda pack: pack.object_id)
+    pack_a.add_relationship(
+        RelationshipType.DEPENDS_ON,
+        RelationshipData(
+            relationship_type=RelationshipType.DEPENDS_ON,
+            source_id=pack_a.object_id,
+            target_id=pack_b.object_id,
+            content_item_to=pack_b.copy(update={"database_id": pack_b.object_id}),
+            mandatorily=True,
+        ),
+    )
+
+    for processes in (1, 2):
+        content_dto.dump(
+            tmp_path / str(processes),
+            MarketplaceVersions.XSOAR,
+            zip=False,
+            processes=processes,
+        )
+
+    assert read_dumped_files(tmp_path / "1") == read_dumped_files(tmp_path / "2")
+    metadata = json.loads((tmp_path / "2" / "PackA" / "metadata.json").read_text())
+    assert metadata["dependencies"]["PackB"]["mandatory"]
@@ -0,0 +1,163 @@
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.content_graph_builder import (
+    ContentGraphBuilder,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.indexes import (
+    DEFAULT_INDEX_PROFILE,
+    DEMISTO_SDK_GRAPH_INDEX_PROFILE,
+    NODE_INDEX_OPTIONS,
+    create_indexes,
+    full_index_profile,
+    get_index_profile,
+    get_indexes_not_in_profile,
+    index_profile_from_usage,
+)
+
+
+def test_default_index_profile_is_minimal():
+    """
+    Given:
+        - the default and the full index profiles
+
+    When:
+        - comparing them
+
+    Then:
+        - ensure every index of the default profile is one of the index options
+        - ensure the default profile has a small fraction of the indexes of the full profile
+    """
+    default_indexes = [
+        properties
+        for properties_list in DEFAULT_INDEX_PROFILE.values()
+        for properties in properties_list
+    ]
+    full_indexes_count = sum(
+        len(properties_list) for properties_list in full_index_profile().values()
+    )
+
+    assert all(properties in NODE_INDEX_OPTIONS for properties in default_indexes)
+    assert len(default_indexes) * 10 < full_indexes_count
+
+
+def test_create_indexes_in_a_single_query(mocker):
+    """
+    Given:
+        - the default index profile
+
+    When:
+        - creating the indexes
+
+    Then:
+        - ensure all the node indexes are created by a single query, which gets the profile as a parameter
+    """
+    tx = mocker.MagicMock()
+
+    create_indexes(tx, DEFAULT_INDEX_PROFILE)
+
+    node_index_queries = [
+        call for call in tx.run.call_args_list if "apoc.schema.assert" in call.args[0]
+    ]
+    assert len(node_index_queries) == 1
+    assert node_index_queries[0].kwargs["indexes"] == DEFAULT_INDEX_PROFILE
+    assert tx.run.call_count == 3  # the node indexes and two relationship indexes
+
+
+def test_get_indexes_not_in_profile(mocker):
+    """
+    Given:
+        - node indexes of a previous index profile
+
+    When:
+        - getting the indexes which are not in the current profile
+
+    Then:
+        - ensure only the names of the indexes which are not in the profile are returned
+    """
+    tx = mocker.MagicMock()
+    tx.run.return_value.data.return_value = [
+        {"name": "index_1", "label": "BaseNode", "properties": ["object_id"]},
+        {"name": "index_2", "label": "Integration", "properties": ["object_id"]},
+        {"name": "index_3", "label": "BaseNode", "properties": ["deprecated"]},
+    ]
+
+    assert get_indexes_not_in_profile(tx, DEFAULT_INDEX_PROFILE) == [
+        "index_2",
+        "index_3",
+    ]
+
+
+def test_get_index_profile(monkeypatch, tmp_path):
+    """
+    Given:
+        - the DEMISTO_SDK_GRAPH_INDEX_PROFILE environment variable unset, set to "full", and set to a profile file
+
+    When:
+        - getting the index profile
+
+    Then:
+        - ensure the default, full and file profiles are returned respectively
+    """
+    monkeypatch.delenv(DEMISTO_SDK_GRAPH_INDEX_PROFILE, raising=False)
+    assert get_index_profile() == DEFAULT_INDEX_PROFILE
+
+    monkeypatch.setenv(DEMISTO_SDK_GRAPH_INDEX_PROFILE, "full")
+    assert get_index_profile() == full_index_profile()
+
+    profile_path = tmp_path / "index_profile.json"
+    profile_path.write_text(json.dumps({"Pack": [["object_id"]]}))
+    monkeypatch.setenv(DEMISTO_SDK_GRAPH_INDEX_PROFILE, str(profile_path))
+    assert get_index_profile() == {"Pack": [["object_id"]]}
+
+
+def test_index_profile_from_usage():
+    """
+    Given:
+        - the usage of indexes after running a workload, some of them were not read
+
+    When:
+        - creating an index profile from the usage
+
+    Then:
+        - ensure only the read indexes are in the profile, grouped by label
+    """
+    index_usage = [
+        {"label": "Pack", "properties": ["object_id"], "readCount": 3},
+        {"label": "BaseNode", "properties": ["path"], "readCount": 1},
+        {"label": "BaseNode", "properties": ["deprecated"], "readCount": 0},
+        {"label": "BaseNode", "properties": ["name"], "readCount": None},
+        {"label": "BaseNode", "properties": ["object_id"], "readCount": 10},
+    ]
+
+    assert index_profile_from_usage(index_usage) == {
+        "BaseNode": [["object_id"], ["path"]],
+        "Pack": [["object_id"]],
+    }
+    assert index_profile_from_usage(index_usage, min_reads=5) == {
+        "BaseNode": [["object_id"]],
+    }
+
+
+def test_builder_defers_indexes_until_the_nodes_are_created(mocker):
+    """
+    Given:
+        - a graph builder which defers the indexes
+
+    When:
+        - initializing the database and creating the graph
+
+    Then:
+        - ensure only the constraints are created at first
+        - ensure the indexes are created after the nodes, and before the relationships
+    """
+    content_graph = mocker.MagicMock()
+    builder = ContentGraphBuilder(content_graph, defer_indexes=True)
+
+    builder.init_database()
+    builder._create_or_update_graph()
+
+    content_graph.create_indexes_and_constraints.assert_called_once_with(indexes=False)
+    called_methods = [call[0] for call in content_graph.method_calls]
+    assert called_methods.index("create_nodes") < called_methods.index("create_indexes")
+    assert called_methods.index("create_indexes") < called_methods.index(
+        "create_relationships"
+    )
@@ -0,0 +1,97 @@
+import pickle
+from collections import defaultdict
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+    Neo4jContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.queries.relationships import (
+    _match_relationships,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import (
+    LazyRelationshipsData,
+)
+from demisto_sdk.commands.content_graph.objects.integration import Integration
+from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.content_graph.objects.pack_content_items import (
+    PackContentItems,
+)
+
+
+def test_lazy_relationships_data_loads_once(mocker):
+    """
+    Given:
+        - lazy relationships data
+
+    When:
+        - accessing it a few times, and pickling it
+
+    Then:
+        - ensure the loader is called once, on the first access
+        - ensure it is pickled as a regular defaultdict
+    """
+    loader = mocker.MagicMock()
+    relationships_data = LazyRelationshipsData(loader)
+    loader.assert_not_called()
+
+    assert not relationships_data[RelationshipType.USES]
+    assert RelationshipType.USES in relationships_data
+    unpickled = pickle.loads(pickle.dumps(relationships_data))
+
+    loader.assert_called_once()
+    assert type(unpickled) is defaultdict
+    assert unpickled == {RelationshipType.USES: set()}
+
+
+def test_search_with_lazy_relationships(mocker):
+    """
+    Given:
+        - a pack and an integration in the graph, without relationships
+
+    When:
+        - searching them with lazy relationships
+        - accessing the content items of the pack, and then the commands of the integration
+
+    Then:
+        - ensure the relationships are not fetched by the search
+        - ensure the relationships of both are fetched in a single query, on the first access
+    """
+    pack = Pack.construct(
+        object_id="MyPack",
+        database_id="1",
+        relationships_data=defaultdict(set),
+        content_items=PackContentItems(),
+    )
+    integration = Integration.construct(
+        object_id="MyIntegration",
+        database_id="2",
+        relationships_data=defaultdict(set),
+        commands=[],
+    )
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface._pool = None
+    interface._id_to_obj = {"1": pack, "2": integration}
+    interface.driver = mocker.MagicMock()
+    session = interface.driver.session.return_value.__enter__.return_value
+    session.execute_read.side_effect = [
+        [mocker.MagicMock(element_id="1"), mocker.MagicMock(element_id="2")],
+        {},
+    ]
+
+    results = interface.search(
+        MarketplaceVersions.XSOAR,
+        object_id=["MyPack", "MyIntegration"],
+        lazy_relationships=True,
+    )
+
+    assert results == [pack, integration]
+    assert session.execute_read.call_count == 1
+    assert "content_items" not in pack.__dict__
+
+    assert pack.content_items == PackContentItems()
+    assert integration.commands == []
+    assert session.execute_read.call_count == 2
+    session.execute_read.assert_called_with(
+        _match_relationships, {"1", "2"}, MarketplaceVersions.XSOAR
+    )
@@ -2,7 +2,11 @@ from typing import List
 
 import pytest
 
+from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+    Neo4jContentGraphInterface,
+)
 
 
 class TestNeo4jQueries:
@@ -72,3 +76,50 @@ class TestNeo4jQueries:
             )
             == "{object_id: rel_data.source_id, content_type: rel_data.source_type}"
         )
+
+
+def test_export_graph_for_several_marketplaces(mocker, tmp_path):
+    """
+    Given:
+        - a graph to export for several marketplaces, one of them is given twice
+
+    When:
+        - exporting the graph
+
+    Then:
+        - ensure the graph is exported and zipped once
+        - ensure there is the same zip for every marketplace
+    """
+    import_path = tmp_path / "import"
+    import_path.mkdir()
+    (import_path / "content.graphml").write_text("graph")
+    output_path = tmp_path / "output"
+    output_path.mkdir()
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface.driver = mocker.MagicMock()
+    interface.repo_path = tmp_path
+    mocker.patch.object(
+        Neo4jContentGraphInterface,
+        "import_path",
+        new_callable=mocker.PropertyMock,
+        return_value=import_path,
+    )
+    mocker.patch.object(Neo4jContentGraphInterface, "dump_metadata")
+    zip_import_dir = mocker.spy(Neo4jContentGraphInterface, "zip_import_dir")
+    marketplaces = [
+        MarketplaceVersions.XSOAR,
+        MarketplaceVersions.MarketplaceV2,
+        MarketplaceVersions.XPANSE,
+        MarketplaceVersions.XSOAR,
+    ]
+
+    interface.export_graph(
+        output_path, clean_import_dir=False, marketplaces=marketplaces
+    )
+
+    session = interface.driver.session.return_value.__enter__.return_value
+    session.execute_write.assert_called_once()
+    zip_import_dir.assert_called_once()
+    zips = {path.name: path.read_bytes() for path in output_path.iterdir()}
+    assert set(zips) == {"xsoar.zip", "marketplacev2.zip", "xpanse.zip"}
+    assert len(set(zips.values())) == 1
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.interface.neo4j import neo4j_graph
+from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
+    Neo4jContentGraphInterface,
+)
+from demisto_sdk.commands.content_graph.interface.neo4j.node_materializer import (
+    materialize_node,
+)
+from demisto_sdk.commands.content_graph.objects.base_content import (
+    CONTENT_TYPE_TO_MODEL,
+    UnknownContent,
+)
+from demisto_sdk.commands.content_graph.objects.integration import Integration
+from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+from TestSuite.repo import Repo
+
+
+def graph_node_properties(content_item) -> dict:
+    """Returns the properties of the graph node of a content item, as neo4j returns them"""
+    return json.loads(json.dumps(content_item.to_dict(), default=str))
+
+
+def test_materialize_node_equals_parse_obj(mocker, repo: Repo):
+    """
+    Given:
+        - the graph node properties of all the content items of a pack
+
+    When:
+        - materializing the nodes
+
+    Then:
+        - ensure the models are equal to the models which `parse_obj` creates, including the set fields
+    """
+    import demisto_sdk.commands.content_graph.objects.base_content as bc
+
+    mocker.patch.object(bc, "CONTENT_PATH", Path(repo.path))
+    repo.setup_one_pack("MyPack")
+    content_dto = ContentDTO.from_path(Path(repo.path))
+
+    for pack in content_dto.packs:
+        for content_item in [pack, *pack.content_items]:
+            model = CONTENT_TYPE_TO_MODEL[content_item.content_type]
+            node = graph_node_properties(content_item)
+
+            materialized = materialize_node(model, node)
+            parsed = model.parse_obj(node)
+
+            assert type(materialized) is model
+            assert materialized == parsed
+            assert materialized.__fields_set__ == parsed.__fields_set__
+
+
+def test_materialize_node_ignores_unknown_properties():
+    """
+    Given:
+        - the properties of an unknown content node, with properties which are not fields of the model
+
+    When:
+        - materializing the node
+
+    Then:
+        - ensure the unknown properties are ignored, like `parse_obj` does
+    """
+    node = {
+        "object_id": "SomeScript",
+        "name": "SomeScript",
+        "content_type": "Script",
+        "not_in_repository": True,
+        "from_version_key": 50000000000,
+    }
+
+    materialized = materialize_node(UnknownContent, node)
+
+    assert materialized == UnknownContent.parse_obj(node)
+    assert "from_version_key" not in materialized.__dict__
+    assert materialized.not_in_repository
+
+
+def test_materialize_node_falls_back_to_parse_obj(mocker):
+    """
+    Given:
+        - integration node properties without a required property
+
+    When:
+        - materializing the node
+
+    Then:
+        - ensure the node is parsed with `parse_obj`, so it fails the same as before
+    """
+    parse_obj = mocker.patch.object(Integration, "parse_obj")
+
+    materialize_node(Integration, {"object_id": "MyIntegration"})
+
+    parse_obj.assert_called_once_with({"object_id": "MyIntegration"})
+
+
+def test_add_nodes_to_mapping_in_process(mocker):
+    """
+    Given:
+        - a few graph nodes, one of them twice, and one which is already in the mapping
+
+    When:
+        - adding the nodes to the mapping
+
+    Then:
+        - ensure the nodes are parsed in the current process, without a process pool
+        - ensure every node is parsed once
+    """
+    pool = mocker.patch.object(neo4j_graph, "Pool")
+    parse_node = mocker.spy(neo4j_graph, "_parse_node")
+    interface = Neo4jContentGraphInterface.__new__(Neo4jContentGraphInterface)
+    interface._pool = None
+    interface._id_to_obj = {"0": mocker.MagicMock()}
+    nodes = []
+    for element_id in ("0", "1", "2", "2"):
+        node = mocker.MagicMock(element_id=element_id)
+        node.items.return_value = {
+            "object_id": f"Script{element_id}",
+            "name": f"Script{element_id}",
+            "content_type": "Script",
+            "not_in_repository": True,
+        }.items()
+        nodes.append(node)
+
+    interface._add_nodes_to_mapping(nodes)
+
+    pool.assert_not_called()
+    assert parse_node.call_count == 2
+    assert interface._id_to_obj["1"].object_id == "Script1"
+    assert interface._id_to_obj["2"].database_id == "2"
@@ -1,15 +1,22 @@
+import multiprocessing
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from demisto_sdk.commands.common.constants import (
+    DEMISTO_GIT_PRIMARY_BRANCH,
     JOB,
     TESTS_AND_DOC_DIRECTORIES,
     FileType,
 )
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import find_type, get_files_in_dir
+from demisto_sdk.commands.common.tools import (
+    find_type,
+    get_files_in_dir,
+    get_pack_name,
+)
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
     Neo4jContentGraphInterface as ContentGraphInterface,
@@ -28,8 +35,12 @@ from demisto_sdk.commands.format.update_connection import ConnectionJSONFormat
 from demisto_sdk.commands.format.update_correlation_rule import CorrelationRuleYMLFormat
 from demisto_sdk.commands.format.update_dashboard import DashboardJSONFormat
 from demisto_sdk.commands.format.update_description import DescriptionFormat
+from demisto_sdk.commands.format.update_generic import BaseUpdate
 from demisto_sdk.commands.format.update_generic_json import BaseUpdateJSON
-from demisto_sdk.commands.format.update_generic_yml import BaseUpdateYML
+from demisto_sdk.commands.format.update_generic_yml import (
+    BaseUpdateYML,
+    set_conf_json_lock,
+)
 from demisto_sdk.commands.format.update_genericdefinition import (
     GenericDefinitionJSONFormat,
 )
@@ -56,6 +67,7 @@ from demisto_sdk.commands.format.update_readme import ReadmeFormat
 from demisto_sdk.commands.format.update_report import ReportJSONFormat
 from demisto_sdk.commands.format.update_script import ScriptYMLFormat
 from demisto_sdk.commands.format.update_widget import WidgetJSONFormat
+from demisto_sdk.commands.validate.old_validate_manager import OldValidateManager
 
 FILE_TYPE_AND_LINKED_CLASS = {
     "integration": IntegrationYMLFormat,
@@ -144,6 +156,7 @@ def format_manager(
     id_set_path: str = None,
     clear_cache: bool = False,
     use_graph: bool = True,
+    workers: int = 1,
 ):
     """
     Format_manager is a function that activated format command on different type of files.
@@ -163,6 +176,7 @@ def format_manager(
         id_set_path (str): The path of the id_set.json file.
         clear_cache (bool): wether to clear the cache
         use_graph (bool): wheter to use the graph in format
+        workers (int): The number of processes to format with, used only when running non-interactively
     Returns:
         int 0 in case of success 1 otherwise
     """
@@ -202,6 +216,9 @@ def format_manager(
 
     log_list = []
     error_list: List[Tuple[int, int]] = []
+    # formatting in batch requires not prompting the user, the validation is deferred to a single run over all files
+    batch_mode = workers > 1 and assume_answer is not None and not output
+    batch_files: List[Tuple[str, str]] = []
     if files:
         graph = (
             ContentGraphInterface()
@@ -238,6 +255,10 @@ def format_manager(
 
             if file_type and file_type.value not in UNFORMATTED_FILES:
                 file_type = file_type.value
+                # the graph connection can not be shared with other processes, these files are formatted serially
+                if batch_mode and not (graph and file_type in CONTENT_ITEMS_WITH_GRAPH):
+                    batch_files.append((file_path, file_type))
+                    continue
                 info_res, err_res, skip_res = run_format_on_file(
                     input=file_path,
                     file_type=file_type,
@@ -276,6 +297,20 @@ def format_manager(
                         "red",
                     )
                 )
+        if batch_files:
+            log_list.extend(
+                run_batch_format(
+                    batch_files,
+                    workers=workers,
+                    from_version=from_version,
+                    interactive=interactive,
+                    no_validate=no_validate,
+                    update_docker=update_docker,
+                    assume_answer=assume_answer,
+                    deprecate=deprecate,
+                    add_tests=add_tests,
+                )
+            )
         if (
             graph
         ):  # In case that the graph was activated, we need to call exit in order to close it.
@@ -369,17 +404,168 @@ def update_content_entity_ids(files: List[str]):
             f.truncate()
 
 
-def run_format_on_file(
+def group_files_by_pack(files: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """Group the files to format by their pack, so the files of a pack are formatted by the same worker.
+    Args:
+        files (list): The paths and types of the files to format.
+    Returns:
+        list. The groups of files, files which are not part of a pack are each in a group of their own.
+    """
+    groups: Dict[Optional[str], List[Tuple[str, str]]] = defaultdict(list)
+    standalone_files = []
+    for file_path, file_type in files:
+        if pack_name := get_pack_name(file_path):
+            groups[pack_name].append((file_path, file_type))
+        else:
+            standalone_files.append([(file_path, file_type)])
+    return list(groups.values()) + standalone_files
+
+
+def _init_format_worker(conf_json_lock: Any):
+    set_conf_json_lock(conf_json_lock)
+
+
+def _format_files_without_validation(
+    files: List[Tuple[str, str]], from_version: str, interactive: bool, kwargs: Dict
+) -> List[Tuple[str, int, Dict]]:
+    """Format a group of files one after the other, without validating them.
+    Args:
+        files (list): The paths and types of the files to format.
+        from_version (str): The fromVersion value that was set by User.
+        interactive (bool): Whether to run the format interactively or not
+        kwargs (dict): The rest of the arguments of the formatters.
+    Returns:
+        list. The path, format result and updated content entity ids of each file.
+    """
+    results = []
+    for file_path, file_type in files:
+        format_res, _, updated_ids = format_file(
+            input=file_path,
+            file_type=file_type,
+            from_version=from_version,
+            interactive=interactive,
+            no_validate=True,
+            **kwargs,
+        )
+        results.append((file_path, format_res, updated_ids))
+    return results
+
+
+def run_batch_format(
+    files: List[Tuple[str, str]],
+    workers: int,
+    from_version: str,
+    interactive: bool,
+    no_validate: bool,
+    **kwargs,
+) -> List[Tuple[List[str], str]]:
+    """Format files across a pool of processes, then validate all the formatted files at once.
+
+    The files of each pack are formatted by the same process, so files of a pack are never written concurrently.
+    Args:
+        files (list): The paths and types of the files to format.
+        workers (int): The number of processes to format with.
+        from_version (str): The fromVersion value that was set by User.
+        interactive (bool): Whether to run the format interactively or not
+        no_validate (bool): Whether to skip the validation of the formatted files.
+    Returns:
+        list. The messages to log and their color.
+    """
+    groups = group_files_by_pack(files)
+    logger.info(
+        f"Formatting {len(files)} files of {len(groups)} groups with {workers} processes"
+    )
+    with multiprocessing.Manager() as manager, multiprocessing.Pool(
+        processes=min(workers, len(groups)),
+        initializer=_init_format_worker,
+        initargs=(manager.Lock(),),
+    ) as pool:
+        group_results = pool.starmap(
+            _format_files_without_validation,
+            [(group, from_version, interactive, kwargs) for group in groups],
+        )
+
+    format_results = {}
+    for group_result in group_results:
+        for file_path, format_res, updated_ids in group_result:
+            format_results[file_path] = format_res
+            CONTENT_ENTITY_IDS_TO_UPDATE.update(updated_ids)
+
+    log_list: List[Tuple[List[str], str]] = []
+    formatted_files = []
+    for file_path, _ in files:
+        format_res = format_results[file_path]
+        if not format_res:
+            formatted_files.append(file_path)
+        # the formatted files are validated together below, so the validate status of each file is not reported
+        info_res, err_res, skip_res = format_output(
+            file_path,
+            format_res,
+            VALIDATE_RES_SKIPPED_CODE,
+            skip_validate=not no_validate,
+        )
+        if err_res:
+            log_list.append((err_res, "red"))
+        if info_res:
+            log_list.append((info_res, "green"))
+        if skip_res:
+            log_list.append((skip_res, "yellow"))
+
+    if not no_validate and formatted_files:
+        log_list.append(validate_formatted_files(formatted_files))
+    return log_list
+
+
+def validate_formatted_files(
+    files: List[str], prev_ver: str = DEMISTO_GIT_PRIMARY_BRANCH
+) -> Tuple[List[str], str]:
+    """Run a single validation over all the formatted files.
+    As in the validation of each formatted file, files which already exist in prev_ver are validated using git, so
+    their backwards compatibility is validated as well.
+    Args:
+        files (list): The paths of the formatted files.
+        prev_ver (str): Against which branch to check whether the files already exist.
+    Returns:
+        tuple. The messages to log and their color.
+    """
+    old_files = [file for file in files if BaseUpdate.is_old_file(file, prev_ver)]
+    new_files = [file for file in files if file not in old_files]
+    is_valid = True
+    for files_to_validate, use_git in ((old_files, True), (new_files, False)):
+        if not files_to_validate:
+            continue
+        validate_manager = OldValidateManager(
+            file_path=",".join(files_to_validate),
+            silence_init_prints=True,
+            skip_conf_json=True,
+            skip_dependencies=True,
+            skip_pack_rn_validation=True,
+            check_is_unskipped=False,
+            validate_id_set=False,
+        )
+        if use_git:
+            is_valid = validate_manager.run_validation_using_git() and is_valid
+        else:
+            is_valid = validate_manager.run_validation_on_specific_files() and is_valid
+    if is_valid:
+        return [f"Validate Status on {len(files)} formatted files - Success"], "green"
+    return [
+        f"Validate Status on {len(files)} formatted files - Failed",
+        f"For more information run: `demisto-sdk validate -i {','.join(files)}`",
+    ], "red"
+
+
+def format_file(
     input: str, file_type: str, from_version: str, interactive: bool, **kwargs
-) -> Tuple[List[str], List[str], List[str]]:
-    """Run the relevent format of file type.
+) -> Tuple[int, int, Dict]:
+    """Run the relevent formatter of file type.
     Args:
         input (str): The input file path.
         file_type (str): The type of input file
         from_version (str): The fromVersion value that was set by User.
         interactive (bool): Whether to run the format interactively or not (usually for contribution management)
     Returns:
-        List of Success , List of Error.
+        The format result, the validate result and the content entity ids which were updated.
     """
 
     if file_type == "betaintegration":
@@ -402,7 +588,7 @@ def run_format_on_file(
         logger.info(
             f"[yellow]No updater_class was found for file type {file_type}[/yellow]"
         )
-        return format_output(input, 1, VALIDATE_RES_SKIPPED_CODE)
+        return 1, VALIDATE_RES_SKIPPED_CODE, {}
 
     update_object = updater_class(
         input=input,
@@ -412,7 +598,25 @@ def run_format_on_file(
         **kwargs,
     )
     format_res, validate_res = update_object.format_file()  # type: ignore
-    CONTENT_ENTITY_IDS_TO_UPDATE.update(update_object.updated_ids)
+    return format_res, validate_res, update_object.updated_ids
+
+
+def run_format_on_file(
+    input: str, file_type: str, from_version: str, interactive: bool, **kwargs
+) -> Tuple[List[str], List[str], List[str]]:
+    """Run the relevent format of file type.
+    Args:
+        input (str): The input file path.
+        file_type (str): The type of input file
+        from_version (str): The fromVersion value that was set by User.
+        interactive (bool): Whether to run the format interactively or not (usually for contribution management)
+    Returns:
+        List of Success , List of Error.
+    """
+    format_res, validate_res, updated_ids = format_file(
+        input, file_type, from_version, interactive, **kwargs
+    )
+    CONTENT_ENTITY_IDS_TO_UPDATE.update(updated_ids)
     return format_output(input, format_res, validate_res)
 
 
@@ -420,11 +624,18 @@ def format_output(
     input: str,
     format_res: int,
     validate_res: int,
+    skip_validate: bool = False,
 ) -> Tuple[List[str], List[str], List[str]]:
     info_list = []
     error_list = []
     skipped_list = []
-    if format_res and validate_res:
+    if skip_validate:
+        # the file is validated separately, only its format status is reported
+        if format_res:
+            error_list.append(f"Format Status   on file: {input} - Failed")
+        else:
+            info_list.append(f"Format Status   on file: {input} - Success")
+    elif format_res and validate_res:
         if validate_res == VALIDATE_RES_SKIPPED_CODE:
             error_list.append(f"Format Status   on file: {input} - Failed")
             skipped_list.append(f"Validate Status on file: {input} - Skipped")
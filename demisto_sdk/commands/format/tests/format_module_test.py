@@ -1,4 +1,14 @@
-from demisto_sdk.commands.format.format_module import format_manager
+import pytest
+
+from demisto_sdk.commands.format.format_module import (
+    VALIDATE_RES_SKIPPED_CODE,
+    format_manager,
+    format_output,
+    group_files_by_pack,
+    validate_formatted_files,
+)
+from demisto_sdk.commands.format.update_generic import BaseUpdate
+from demisto_sdk.commands.validate.old_validate_manager import OldValidateManager
 from TestSuite.test_tools import ChangeCWD
 
 
@@ -29,3 +39,134 @@ def test_format_venv_in_dir(mocker, repo):
     assert format_file_call.called
     for call_args in format_file_call.call_args_list:
         assert ".venv" not in call_args.kwargs["input"]
+
+
+def test_group_files_by_pack():
+    """
+    Given:
+        - Files of two packs, and a file which is not part of a pack
+    When:
+        - Grouping the files to format in batch
+    Then:
+        - Ensure the files of each pack are in the same group, and the other file is in a group of its own.
+    """
+    files = [
+        ("Packs/A/Integrations/I/I.yml", "integration"),
+        ("Packs/B/Scripts/S/S.yml", "script"),
+        ("Packs/A/pack_metadata.json", "metadata"),
+        ("/tmp/playbook.yml", "playbook"),
+    ]
+
+    assert group_files_by_pack(files) == [
+        [files[0], files[2]],
+        [files[1]],
+        [files[3]],
+    ]
+
+
+def test_format_in_batch_validates_once(mocker, repo):
+    """
+    Given:
+        - Two packs with an integration and a script
+    When:
+        - Running format non-interactively with several workers
+    Then:
+        - Ensure all the files were formatted
+        - Ensure the formatted files were validated by a single validation run.
+    """
+    pack_1 = repo.create_pack("Pack1")
+    integration = pack_1.create_integration(name="SomeIntegration")
+    integration.yml.update({"fromversion": "5.0.0"})
+    pack_2 = repo.create_pack("Pack2")
+    script = pack_2.create_script(name="SomeScript")
+    script.yml.update({"fromversion": "5.0.0"})
+    validations = mocker.patch.object(
+        OldValidateManager, "run_validation_on_specific_files", return_value=True
+    )
+
+    with ChangeCWD(repo.path):
+        assert (
+            format_manager(
+                input=f"{integration.yml.path},{script.yml.path}",
+                assume_answer=True,
+                workers=2,
+                use_graph=False,
+            )
+            == 0
+        )
+
+    assert integration.yml.read_dict()["fromversion"] != "5.0.0"
+    assert script.yml.read_dict()["fromversion"] != "5.0.0"
+    validations.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "format_res, expected_info, expected_errors",
+    [
+        (0, ["Format Status   on file: file.yml - Success"], []),
+        (1, [], ["Format Status   on file: file.yml - Failed"]),
+    ],
+)
+def test_format_output_skip_validate(format_res, expected_info, expected_errors):
+    """
+    Given:
+        - The format result of a file which is validated separately
+    When:
+        - Creating the output of the format with skip_validate
+    Then:
+        - Ensure only the format status of the file is reported
+    """
+    assert format_output(
+        "file.yml", format_res, VALIDATE_RES_SKIPPED_CODE, skip_validate=True
+    ) == (expected_info, expected_errors, [])
+
+
+def test_validate_formatted_files_checks_backwards_compatibility(mocker, repo):
+    """
+    Given:
+        - A formatted integration which already exists in the previous version, and breaks backwards compatibility
+        - A formatted script which is new
+    When:
+        - Validating the formatted files
+    Then:
+        - Ensure the integration was validated using git, which validates its backwards compatibility
+        - Ensure the script was validated as a specific file
+        - Ensure the validation failed
+    """
+    integration = "Packs/Pack1/Integrations/SomeIntegration/SomeIntegration.yml"
+    script = "Packs/Pack2/Scripts/SomeScript/SomeScript.yml"
+    mocker.patch.object(
+        BaseUpdate,
+        "is_old_file",
+        side_effect=lambda path, prev_ver: {"name": "old"}
+        if path == integration
+        else {},
+    )
+    validated_files = {}
+
+    def run_validation(use_git, is_valid):
+        def validate(validate_manager):
+            validated_files[use_git] = validate_manager.file_path
+            return is_valid
+
+        return validate
+
+    mocker.patch.object(
+        OldValidateManager,
+        "run_validation_using_git",
+        autospec=True,
+        side_effect=run_validation(use_git=True, is_valid=False),
+    )
+    mocker.patch.object(
+        OldValidateManager,
+        "run_validation_on_specific_files",
+        autospec=True,
+        side_effect=run_validation(use_git=False, is_valid=True),
+    )
+
+    with ChangeCWD(repo.path):
+        messages, color = validate_formatted_files([integration, script])
+
+    assert validated_files == {True: integration, False: script}
+    assert color == "red"
+    assert messages[0] == "Validate Status on 2 formatted files - Failed"
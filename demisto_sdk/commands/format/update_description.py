@@ -3,7 +3,7 @@ from typing import Tuple
 
 from demisto_sdk.commands.common.constants import BETA_INTEGRATION_DISCLAIMER
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import find_type
+from demisto_sdk.commands.common.tools import find_type, write_file_if_changed
 from demisto_sdk.commands.format.format_constants import (
     ERROR_RETURN_CODE,
     SKIP_RETURN_CODE,
@@ -68,9 +68,7 @@ class DescriptionFormat(BaseUpdate):
         """Safely saves formatted YML data to destination file."""
         if self.source_file != self.output_file:
             logger.debug(f"Saving output description file to {self.output_file} \n")
-        with open(self.output_file, "w") as f:
-            f.write(self.description_content)
-        f.close()
+        write_file_if_changed(self.output_file, self.description_content)
 
     def run_format(self) -> int:
         try:
@@ -9,7 +9,7 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import is_uuid
+from demisto_sdk.commands.common.tools import is_uuid, write_dict
 from demisto_sdk.commands.format.format_constants import (
     ARGUMENTS_DEFAULT_VALUES,
     ERROR_RETURN_CODE,
@@ -65,15 +65,15 @@ class BaseUpdateJSON(BaseUpdate):
         """Save formatted JSON data to destination file."""
         if self.source_file != self.output_file:
             logger.info(f"Saving output JSON file to {self.output_file}")
-        with open(self.output_file, "w") as file:
-            json.dump(
-                self.data,
-                file,
-                indent=indent,
-                encode_html_chars=encode_html_chars,
-                escape_forward_slashes=escape_forward_slashes,
-                ensure_ascii=ensure_ascii,
-            )
+        write_dict(
+            self.output_file,
+            self.data,
+            handler=json,
+            indent=indent,
+            encode_html_chars=encode_html_chars,
+            escape_forward_slashes=escape_forward_slashes,
+            ensure_ascii=ensure_ascii,
+        )
 
     def update_json(
         self, default_from_version: Optional[str] = "", file_type: str = ""
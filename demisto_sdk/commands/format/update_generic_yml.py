@@ -1,6 +1,8 @@
+import functools
 import os
 import traceback
-from typing import Dict, List, Optional, Tuple, Union
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import click
 
@@ -29,6 +31,7 @@ from demisto_sdk.commands.common.tools import (
     is_uuid,
     listdir_fullpath,
     search_and_delete_from_conf,
+    write_dict,
 )
 from demisto_sdk.commands.format.format_constants import (
     ERROR_RETURN_CODE,
@@ -37,6 +40,23 @@ from demisto_sdk.commands.format.format_constants import (
 )
 from demisto_sdk.commands.format.update_generic import BaseUpdate
 
+# serializes the read-modify-write of conf.json, replaced by a lock shared between the processes of a parallel format
+CONF_JSON_LOCK: Any = RLock()
+
+
+def set_conf_json_lock(lock: Any):
+    global CONF_JSON_LOCK
+    CONF_JSON_LOCK = lock
+
+
+def with_conf_json_lock(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with CONF_JSON_LOCK:
+            return func(*args, **kwargs)
+
+    return wrapper
+
 
 class BaseUpdateYML(BaseUpdate):
     """BaseUpdateYML is the base class for all yml updaters.
@@ -134,8 +154,9 @@ class BaseUpdateYML(BaseUpdate):
         """Safely saves formatted YML data to destination file."""
         if self.source_file != self.output_file:
             logger.debug(f"Saving output YML file to {self.output_file} \n")
-        with open(self.output_file, "w") as f:
-            yaml.dump(self.data, f)  # ruamel preservers multilines
+        write_dict(
+            self.output_file, self.data, handler=yaml
+        )  # ruamel preservers multilines
 
     def copy_tests_from_old_file(self):
         """Copy the tests key from old file if exists."""
@@ -269,6 +290,7 @@ class BaseUpdateYML(BaseUpdate):
                 else:
                     logger.debug(f'Not formatting {self.source_file} with "No tests"')
 
+    @with_conf_json_lock
     def remove_from_conf_json(self, file_type, content_item_id) -> None:
         """
         Updates conf.json remove the file's test playbooks.
@@ -299,6 +321,7 @@ class BaseUpdateYML(BaseUpdate):
         )
         self._save_to_conf_json(conf_json_content)
 
+    @with_conf_json_lock
     def update_conf_json(self, file_type: str) -> None:
         """
         Updates conf.json with the file's test playbooks if not registered already according to user's answer
@@ -353,8 +376,7 @@ class BaseUpdateYML(BaseUpdate):
 
     def _save_to_conf_json(self, conf_json_content: Dict) -> None:
         """Save formatted JSON data to destination file."""
-        with open(CONF_PATH, "w") as file:
-            json.dump(conf_json_content, file, indent=4)
+        write_dict(CONF_PATH, conf_json_content, handler=json, indent=4)
 
     def update_deprecate(self, file_type=None):
         """
@@ -116,6 +116,7 @@ class IncidentFieldJSONFormat(BaseUpdateJSON):
             self.graph.search(
                 cli_name=alias_ids,
                 content_type=ContentType.INCIDENT_FIELD,
+                lazy_relationships=True,
             )
             if self.graph
             else []
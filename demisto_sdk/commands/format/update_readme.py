@@ -7,6 +7,7 @@ from demisto_sdk.commands.common.hook_validations.readme import (
 )
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.markdown_lint import run_markdownlint
+from demisto_sdk.commands.common.tools import write_file_if_changed
 from demisto_sdk.commands.format.format_constants import (
     ERROR_RETURN_CODE,
     SKIP_RETURN_CODE,
@@ -108,9 +109,7 @@ class ReadmeFormat(BaseUpdate):
         """Safely saves formatted data to destination file."""
         if self.source_file != self.output_file:
             logger.debug(f"Saving output description file to {self.output_file} \n")
-        with open(self.output_file, "w") as f:
-            f.write(self.readme_content)
-        f.close()
+        write_file_if_changed(self.output_file, self.readme_content)
 
     def run_format(self) -> int:
         try:
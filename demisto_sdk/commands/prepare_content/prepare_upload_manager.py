@@ -18,6 +18,7 @@ from demisto_sdk.commands.content_graph.interface import (
 )
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
+from demisto_sdk.commands.content_graph.objects.dump_target import zip_dir
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 
 
@@ -67,7 +68,7 @@ class PrepareUploadManager:
         output: Path  # Output is not optional anymore (for mypy)
         if isinstance(content_item, Pack):
             Pack.dump(content_item, output, marketplace)
-            shutil.make_archive(str(output), "zip", output)
+            output.with_suffix(".zip").write_bytes(zip_dir(output))
             shutil.rmtree(output)
             return output.with_suffix(".zip")
         if not isinstance(content_item, ContentItem):
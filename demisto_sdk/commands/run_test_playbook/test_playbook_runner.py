@@ -6,6 +6,10 @@ from pathlib import Path
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
 
+from demisto_sdk.commands.common.clients.xsoar.incidents_poller import (
+    IncidentsPoller,
+)
+from demisto_sdk.commands.common.constants import InvestigationPlaybookState
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import get_yaml
 from demisto_sdk.commands.upload.uploader import Uploader
@@ -13,6 +17,7 @@ from demisto_sdk.commands.upload.uploader import Uploader
 SUCCESS_RETURN_CODE = 0
 ERROR_RETURN_CODE = 1
 ENTRY_TYPE_ERROR = 4
+POLLING_INTERVAL = 10
 
 
 class TestPlaybookRunner:
@@ -22,6 +27,7 @@ class TestPlaybookRunner:
         test_playbook_path (str): the input of the test playbook to run
         all (bool): whether to wait until the playbook run is completed or not.
         should_wait (bool): whether to wait until the test playbook run is completed or not.
+        run_concurrently (bool): whether to run all the test playbooks at once, instead of one after the other.
         timeout (int): timeout for the command. The test playbook will continue to run in your xsoar instance.
         demisto_client (DefaultApi): Demisto-SDK client object.
         base_link_to_workplan (str): the base link to see the full test playbook run in your xsoar instance.
@@ -34,11 +40,13 @@ class TestPlaybookRunner:
         wait: bool = True,
         timeout: int = 90,
         insecure: bool = False,
+        concurrent: bool = False,
         **kwargs,
     ):
         self.test_playbook_path = test_playbook_path
         self.all_test_playbooks = all
         self.should_wait = wait
+        self.run_concurrently = concurrent
         self.timeout = timeout
 
         # we set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
@@ -59,6 +67,9 @@ class TestPlaybookRunner:
 
         test_playbooks.extend(self.collect_all_tpb_files_paths())
 
+        if self.run_concurrently and self.should_wait and len(test_playbooks) > 1:
+            return self.run_test_playbooks_and_wait(test_playbooks) or status_code
+
         for tpb in test_playbooks:
             self.upload_tpb(tpb_file=tpb)
             test_playbook_id = self.get_test_playbook_id(tpb)
@@ -175,31 +186,114 @@ class TestPlaybookRunner:
         while elapsed_time < self.timeout:
             test_playbook_result = self.get_test_playbook_results_dict(incident_id)
             if test_playbook_result["state"] == "inprogress":
-                time.sleep(10)
+                time.sleep(POLLING_INTERVAL)
                 elapsed_time = int(time.time() - start_time)
             else:  # the test playbook has finished running
                 break
 
         # Ended the loop because of timeout
         if elapsed_time >= self.timeout:
-            logger.info(
-                f"[red]The command had timed out while the playbook is in progress.\n"
-                f"To keep tracking the test playbook please go to : {work_plan_link}[/red]"
-            )
+            self.print_tpb_timeout(work_plan_link)
         else:
-            if test_playbook_result["state"] == "failed":
-                self.print_tpb_error_details(test_playbook_result, test_playbook_id)
-                logger.info(
-                    "[red]The test playbook finished running with status: FAILED[/red]"
+            status_code = self.check_tpb_result(test_playbook_result, test_playbook_id)
+
+        return status_code
+
+    def run_test_playbooks_and_wait(self, test_playbooks: list) -> int:
+        """
+        Runs all the test playbooks at once, and waits for all of them to finish.
+        The states of all the running test playbooks are polled together with a single incidents search per poll.
+
+        Args:
+            test_playbooks (list): The paths of the test playbooks to run
+
+        Returns:
+            int. 0 in success, 1 in a failure.
+        """
+        status_code = SUCCESS_RETURN_CODE
+        incidents_poller = IncidentsPoller(
+            self.demisto_client, interval=POLLING_INTERVAL
+        )
+        running_test_playbooks = []
+        for tpb in test_playbooks:
+            self.upload_tpb(tpb_file=tpb)
+            test_playbook_id = self.get_test_playbook_id(tpb)
+            try:
+                incident_id = self.create_incident_with_test_playbook(
+                    incident_name=f"inc_{test_playbook_id}",
+                    test_playbook_id=test_playbook_id,
                 )
+            except ApiException as a:
+                logger.info(f"[red]{a}[/red]")
+                status_code = ERROR_RETURN_CODE
+                continue
+            work_plan_link = self.base_link_to_workplan + str(incident_id)
+            logger.info(
+                f"[green]Waiting for the test playbook to finish running.. \n"
+                f"To see the test playbook run in real-time please go to : {work_plan_link}[/green]"
+            )
+            future = incidents_poller.watch_playbook(
+                incident_id,
+                expected_states=tuple(
+                    state
+                    for state in InvestigationPlaybookState
+                    if state
+                    not in {
+                        InvestigationPlaybookState.NEW,
+                        InvestigationPlaybookState.IN_PROGRESS,
+                    }
+                ),
+                timeout=self.timeout,
+            )
+            running_test_playbooks.append(
+                (test_playbook_id, incident_id, work_plan_link, future)
+            )
+
+        incidents_poller.wait(future for *_, future in running_test_playbooks)
+
+        for (
+            test_playbook_id,
+            incident_id,
+            work_plan_link,
+            future,
+        ) in running_test_playbooks:
+            if future.exception():
+                self.print_tpb_timeout(work_plan_link)
+                continue
+            test_playbook_result = self.get_test_playbook_results_dict(incident_id)
+            if (
+                self.check_tpb_result(test_playbook_result, test_playbook_id)
+                == ERROR_RETURN_CODE
+            ):
                 status_code = ERROR_RETURN_CODE
-            else:
-                logger.info(
-                    "[green]The test playbook has completed its run successfully[/green]"
-                )
 
         return status_code
 
+    @staticmethod
+    def print_tpb_timeout(work_plan_link):
+        logger.info(
+            f"[red]The command had timed out while the playbook is in progress.\n"
+            f"To keep tracking the test playbook please go to : {work_plan_link}[/red]"
+        )
+
+    def check_tpb_result(self, test_playbook_result, test_playbook_id) -> int:
+        """
+        Reports the result of a test playbook which finished running.
+
+        Returns:
+            int. 0 in success, 1 in a failure.
+        """
+        if test_playbook_result["state"] == "failed":
+            self.print_tpb_error_details(test_playbook_result, test_playbook_id)
+            logger.info(
+                "[red]The test playbook finished running with status: FAILED[/red]"
+            )
+            return ERROR_RETURN_CODE
+        logger.info(
+            "[green]The test playbook has completed its run successfully[/green]"
+        )
+        return SUCCESS_RETURN_CODE
+
     def create_incident_with_test_playbook(
         self, incident_name: str, test_playbook_id: str
     ) -> int:
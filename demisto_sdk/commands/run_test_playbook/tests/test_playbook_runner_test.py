@@ -6,6 +6,9 @@ import pytest
 from demisto_client.demisto_api import DefaultApi
 
 from demisto_sdk.__main__ import run_test_playbook
+from demisto_sdk.commands.common.clients.xsoar.incidents_poller import (
+    IncidentsPoller,
+)
 from demisto_sdk.commands.run_test_playbook.test_playbook_runner import (
     TestPlaybookRunner,
 )
@@ -26,6 +29,12 @@ SUCCESS_MESSAGE = "The test playbook has completed its run successfully"
 FAILED_MESSAGE = "The test playbook finished running with status: FAILED"
 
 
+def search_finished_incidents(incident_ids):
+    return [
+        {"id": incident_id, "runStatus": "completed"} for incident_id in incident_ids
+    ]
+
+
 class TestTestPlaybookRunner:
     @pytest.mark.parametrize(
         argnames="tpb_result, res", argvalues=[("failed", 1), ("success", 0)]
@@ -86,6 +95,11 @@ class TestTestPlaybookRunner:
             "get_test_playbook_results_dict",
             return_value={"state": tpb_result},
         )
+        mocker.patch.object(
+            IncidentsPoller,
+            "_search_incidents",
+            side_effect=search_finished_incidents,
+        )
         result = click.Context(command=run_test_playbook).invoke(
             run_test_playbook, test_playbook_path=VALID_PACK
         )
@@ -122,6 +136,11 @@ class TestTestPlaybookRunner:
                 "get_test_playbook_results_dict",
                 return_value={"state": tpb_result},
             )
+            mocker.patch.object(
+                IncidentsPoller,
+                "_search_incidents",
+                side_effect=search_finished_incidents,
+            )
             result = click.Context(command=run_test_playbook).invoke(
                 run_test_playbook, all=True, test_playbook_path=""
             )
@@ -155,6 +174,11 @@ class TestTestPlaybookRunner:
             "get_test_playbook_results_dict",
             return_value={"state": "success"},
         )
+        mocker.patch.object(
+            IncidentsPoller,
+            "_search_incidents",
+            side_effect=search_finished_incidents,
+        )
 
         self.test_playbook_input = input_tpb
         test_playbook = TestPlaybookRunner(test_playbook_path=self.test_playbook_input)
@@ -323,3 +347,87 @@ class TestTestPlaybookRunner:
                 ),
             ],
         )
+
+
+def test_run_pack_test_playbooks_polls_all_incidents_together(mocker):
+    """
+    Given:
+        - A pack with 4 test playbooks, each of them runs on a different incident
+    When:
+        - Running all the pack test playbooks concurrently and waiting for them to finish
+    Then:
+        - Ensure the states of all the incidents are polled with a single search request per poll
+        - Ensure the result of each test playbook is fetched once, after it finished running
+    """
+    mocker.patch.object(demisto_client, "configure", return_value=DefaultApi())
+    mocker.patch.object(TestPlaybookRunner, "upload_tpb")
+    mocker.patch.object(
+        TestPlaybookRunner,
+        "create_incident_with_test_playbook",
+        side_effect=["1", "2", "3", "4"],
+    )
+    get_results = mocker.patch.object(
+        TestPlaybookRunner,
+        "get_test_playbook_results_dict",
+        return_value={"state": "completed"},
+    )
+    mocker.patch("time.sleep")
+    run_statuses = iter(
+        [
+            {"1": "completed", "2": "", "3": "inprogress", "4": "inprogress"},
+            {"2": "completed", "3": "completed", "4": "error"},
+        ]
+    )
+
+    def search_incidents(incident_ids):
+        statuses = next(run_statuses)
+        return [
+            {"id": incident_id, "runStatus": statuses[incident_id]}
+            for incident_id in incident_ids
+        ]
+
+    search = mocker.patch.object(
+        IncidentsPoller, "_search_incidents", side_effect=search_incidents
+    )
+
+    assert (
+        TestPlaybookRunner(
+            test_playbook_path=VALID_PACK, concurrent=True
+        ).manage_and_run_test_playbooks()
+        == 0
+    )
+    assert [call.args[0] for call in search.call_args_list] == [
+        ["1", "2", "3", "4"],
+        ["2", "3", "4"],
+    ]
+    assert [call.args[0] for call in get_results.call_args_list] == ["1", "2", "3", "4"]
+
+
+def test_run_pack_test_playbooks_one_after_the_other_by_default(mocker):
+    """
+    Given:
+        - A pack with 4 test playbooks
+    When:
+        - Running all the pack test playbooks without the concurrent option
+    Then:
+        - Ensure the test playbooks are run one after the other, and not all at once
+    """
+    mocker.patch.object(demisto_client, "configure", return_value=DefaultApi())
+    mocker.patch.object(TestPlaybookRunner, "upload_tpb")
+    run_concurrently = mocker.patch.object(
+        TestPlaybookRunner, "run_test_playbooks_and_wait"
+    )
+    run_by_id = mocker.patch.object(
+        TestPlaybookRunner,
+        "run_test_playbook_by_id",
+        return_value=0,
+    )
+
+    assert (
+        TestPlaybookRunner(
+            test_playbook_path=VALID_PACK
+        ).manage_and_run_test_playbooks()
+        == 0
+    )
+    assert run_by_id.call_count == 4
+    run_concurrently.assert_not_called()
@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import os
 import re
@@ -6,12 +7,13 @@ import sys
 import time
 import urllib.parse
 import uuid
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from copy import deepcopy
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
 from pprint import pformat
-from queue import Empty, Queue
+from threading import Lock, Thread, current_thread
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import demisto_client
@@ -25,10 +27,15 @@ from packaging.version import Version
 from slack_sdk import WebClient as SlackClient
 from urllib3.exceptions import ReadTimeoutError
 
+from demisto_sdk.commands.common.clients.errors import PollTimeout
+from demisto_sdk.commands.common.clients.xsoar.incidents_poller import (
+    IncidentsPoller,
+)
 from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_FROM_VERSION,
     DEFAULT_CONTENT_ITEM_TO_VERSION,
     FILTER_CONF,
+    InvestigationPlaybookState,
     MarketplaceVersions,
     PB_Status,
 )
@@ -44,7 +51,9 @@ from demisto_sdk.commands.test_content.mock_server import (
 from demisto_sdk.commands.test_content.ParallelLoggingManager import (
     ParallelLoggingManager,
 )
+from demisto_sdk.commands.test_content.TestsScheduler import TestsScheduler
 from demisto_sdk.commands.test_content.tools import (
+    backoff_intervals,
     get_ui_url,
     is_redhat_instance,
     update_server_configuration,
@@ -57,6 +66,10 @@ FAILED_MATCH_INSTANCE_MSG = (
 )
 ENTRY_TYPE_ERROR = 4
 DEFAULT_INTERVAL = 4
+INITIAL_POLLING_INTERVAL = 1
+PLAYBOOK_STATE_MAX_POLLING_INTERVAL = 10
+# the maximal time to wait for the batched poll of the playbook states, before checking the state of a test playbook
+BATCHED_PLAYBOOK_STATE_MAX_WAIT = 60
 MAX_RETRIES = 3
 RETRIES_THRESHOLD = ceil(MAX_RETRIES / 2)
 
@@ -259,6 +272,11 @@ class TestPlaybook:
             for integration in self.integrations
             if integration.name not in self.build_context.conf.parallel_integrations
         ]
+        self.requires_exclusive_server: bool = any(
+            "server_keys" in configuration.params
+            for configuration in self.build_context.secret_conf.integrations
+            if configuration.name in self.configuration.test_integrations
+        )
         self.populate_test_suite()
 
     def log_debug(self, message: str, real_time: bool = False):
@@ -654,7 +672,8 @@ class TestPlaybook:
         Args:
             client: The demisto_client to use.
             timeout: The timeout to wait for the incident to be created, in seconds.
-            sleep_interval: The interval to sleep between each poll, in seconds.
+            sleep_interval: The maximal interval to sleep between each poll, in seconds.
+                            The polling starts with a short interval which is doubled up to this value.
 
         Returns:
             - The created incident or None
@@ -703,6 +722,7 @@ class TestPlaybook:
 
         # poll the incidents queue, until the timeout is reached.
         end_time = time.time() + timeout
+        intervals = backoff_intervals(INITIAL_POLLING_INTERVAL, sleep_interval)
         while True:
             try:
                 incidents = client.search_incidents(filter=search_filter)
@@ -725,7 +745,7 @@ class TestPlaybook:
                     self.log_error(f"Got timeout for searching incident id {inc_id}")
                 return None
 
-            time.sleep(sleep_interval)
+            time.sleep(next(intervals))
 
     def delete_incident(self, client: DefaultApi, incident_id: str) -> bool:
         """
@@ -864,7 +884,7 @@ class BuildContext:
             self.mockable_tests_to_run,
             self.unmockable_tests_to_run,
         ) = self._get_tests_to_run()
-        self.test_retries_queue: Queue = Queue()
+        self.test_retries_queue: TestsScheduler = TestsScheduler()
         self.slack_user_id = self._retrieve_slack_user_id()
         self.all_integrations_configurations = self._get_all_integration_config(
             self.instances_ips
@@ -934,25 +954,27 @@ class BuildContext:
 
             time.sleep(sleep_interval)
 
-    def _generate_tests_queue(self, tests_to_run: List[TestConfiguration]) -> Queue:
+    def _generate_tests_queue(
+        self, tests_to_run: List[TestConfiguration]
+    ) -> TestsScheduler:
         """
-        Generates a queue containing test playbooks to run
+        Generates a scheduler containing test playbooks to run
         Args:
             tests_to_run: A list containing playbook names
         """
-        queue: Queue = Queue()
+        queue = TestsScheduler()
         for test in tests_to_run:
             playbook = TestPlaybook(self, test)
             if playbook.should_test_run():
                 queue.put(playbook)
         return queue
 
-    def _get_tests_to_run(self) -> Tuple[Queue, Queue]:
+    def _get_tests_to_run(self) -> Tuple[TestsScheduler, TestsScheduler]:
         """
         Gets tests to run in the current build and updates the unmockable tests ids set
         Returns:
-            - A queue with mockable TestPlaybook instances to run in the current build
-            - A queue with unmockable TestPlaybook instances to run in the current build
+            - A scheduler with mockable TestPlaybook instances to run in the current build
+            - A scheduler with unmockable TestPlaybook instances to run in the current build
         """
         all_tests = self._get_all_tests()
         # In XSIAM or XSOAR SAAS - Set all tests to unmockable.
@@ -1947,7 +1969,8 @@ class TestContext:
             self.playbook.log_debug(f"{err.status=}", real_time=True)
             if err.status == 401:
                 # resetting client due to possible session timeouts
-                self.server_context.configure_new_client()
+                self.server_context.configure_new_client(stale_client=self.client)
+                self.client = self.server_context.client
                 self.playbook.log_debug(
                     f"new demisto_client created because of err: {err}", real_time=True
                 )
@@ -2027,10 +2050,16 @@ class TestContext:
         """
         timeout = time.time() + self.playbook.configuration.timeout
         number_of_attempts = 1
+        intervals = backoff_intervals(
+            INITIAL_POLLING_INTERVAL, PLAYBOOK_STATE_MAX_POLLING_INTERVAL
+        )
         # wait for playbook to finish run
         while True:
             # give playbook time to run
-            time.sleep(5)
+            if incidents_poller := self.server_context.incidents_poller:
+                self._wait_for_playbook_run_to_end(incidents_poller, timeout)
+            else:
+                time.sleep(next(intervals))
             try:
                 # fetch status
                 playbook_state = self._get_investigation_playbook_state()
@@ -2057,6 +2086,31 @@ class TestContext:
             number_of_attempts = number_of_attempts + 1
         return playbook_state
 
+    def _wait_for_playbook_run_to_end(
+        self, incidents_poller: IncidentsPoller, timeout: float
+    ):
+        """
+        Waits for the playbook run to end together with the other tests running on the server.
+        The wait is bounded, since the batched poll only detects completed and failed runs, the state of the playbook
+        is then checked by the test itself.
+        Args:
+            incidents_poller: The poller of the incidents of the tests running on the server
+            timeout: The time in which the test times out
+        """
+        wait = max(
+            min(BATCHED_PLAYBOOK_STATE_MAX_WAIT, timeout - time.time()),
+            INITIAL_POLLING_INTERVAL,
+        )
+        with contextlib.suppress(PollTimeout, FuturesTimeoutError):
+            incidents_poller.watch_playbook(
+                self.incident_id,  # type: ignore[arg-type]
+                expected_states=(
+                    InvestigationPlaybookState.COMPLETED,
+                    InvestigationPlaybookState.FAILED,
+                ),
+                timeout=wait,
+            ).result(timeout=wait + incidents_poller.interval)
+
     def replace_external_playbook_configuration(
         self,
         external_playbook_configuration: dict,
@@ -2861,7 +2915,16 @@ class ServerContext:
         build_context: BuildContext,
         server_private_ip: str,
         use_retries_mechanism: bool = True,
+        max_concurrent_tests: int = 1,
     ):
+        """
+        Args:
+            build_context: The context of the build
+            server_private_ip: The IP (or URL in SaaS servers) of the server to run the tests on
+            use_retries_mechanism: Whether to re-run failed tests
+            max_concurrent_tests: The maximal number of unmockable tests to run in parallel on the server.
+                                  Only tests that use disjoint integrations and do not set server keys are run together.
+        """
         self.build_context = build_context
         self.server_ip = server_private_ip
         if self.build_context.is_saas_server_type:
@@ -2871,6 +2934,11 @@ class ServerContext:
         else:
             self.server_url = f"https://{self.server_ip}"
         self.client: Optional[DefaultApi] = None
+        self._client_lock = Lock()
+        # clients replaced while tests run concurrently, closed when the tests are done
+        self._retired_clients: List[DefaultApi] = []
+        # polls the states of all the tests running concurrently on the server with a single request
+        self.incidents_poller: Optional[IncidentsPoller] = None
         self.configure_new_client()
         # currently not supported on XSIAM (CIAC-514)
         if self.build_context.is_saas_server_type:
@@ -2885,9 +2953,9 @@ class ServerContext:
             )
         self.is_instance_using_docker = not is_redhat_instance(self.server_ip)
         self.executed_tests: Set[str] = set()
-        self.executed_in_current_round: Set[str] = set()
         self.prev_system_conf: dict = {}
         self.use_retries_mechanism: bool = use_retries_mechanism
+        self.max_concurrent_tests: int = max(max_concurrent_tests, 1)
         if self.build_context.is_saas_server_type:
             self.check_if_can_create_manual_alerts()
 
@@ -2895,34 +2963,96 @@ class ServerContext:
         """
         Iterates the mockable tests queue and executes them as long as there are tests to execute
         """
-        self._execute_tests(self.build_context.unmockable_tests_to_run)
+        self._execute_tests(
+            self.build_context.unmockable_tests_to_run, self.max_concurrent_tests
+        )
+
+    @staticmethod
+    def _can_run_concurrently(test_playbook: TestPlaybook, running_tests: list) -> bool:
+        """
+        Checks whether a test can run on the server alongside the tests which currently run on it.
+        Tests that set server keys change the server configuration and reset its containers, so they run alone.
+        Args:
+            test_playbook: The test to check
+            running_tests: The tests that currently run on the server
+
+        Returns:
+            True if the test does not conflict with any of the running tests, else False
+        """
+        if not running_tests:
+            return True
+        if test_playbook.requires_exclusive_server or any(
+            running_test.requires_exclusive_server for running_test in running_tests
+        ):
+            return False
+        running_integrations = {
+            integration.name
+            for running_test in running_tests
+            for integration in running_test.integrations
+        }
+        return not running_integrations.intersection(
+            integration.name for integration in test_playbook.integrations
+        )
 
-    def _execute_tests(self, queue: Queue):
+    def _execute_tests(self, queue: TestsScheduler, max_concurrent_tests: int = 1):
         """
-        Iterates the tests queue and executes them as long as there are tests to execute.
+        Fetches runnable tests from the tests scheduler and executes them as long as there are tests to execute.
+        The scheduler blocks until a test whose integrations are not in use is available, and re-schedules tests that
+        could not lock their integrations, so no busy-waiting is done here.
         Before the tests execution starts we will reset the containers to make sure the proxy configuration is correct
         - We need it before the mockable tests because the server starts the python2 default container when it starts,
             and it has no proxy configurations.
         - We need it before the unmockable tests because at that point all containers will have the proxy configured,
             and we want to clean those configurations when testing unmockable playbooks
         Args:
-            queue: The queue to fetch tests to execute from
+            queue: The scheduler to fetch tests to execute from
+            max_concurrent_tests: The number of workers that execute tests in parallel on the server
         """
         self.reset_containers()
-        while queue.unfinished_tasks:
+        if max_concurrent_tests <= 1:
+            self._execute_tests_worker(queue)
+            return
+        self.incidents_poller = IncidentsPoller(self.client).start()  # type: ignore[arg-type]
+        workers = [
+            Thread(
+                target=self._execute_tests_worker,
+                args=(queue,),
+                name=f"{current_thread().name}-worker-{worker_number}",
+            )
+            for worker_number in range(max_concurrent_tests)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            self.incidents_poller.stop()
+            with self._client_lock:
+                self.incidents_poller = None
+                while self._retired_clients:
+                    self._close_client(self._retired_clients.pop())
+
+    def _execute_tests_worker(self, queue: TestsScheduler):
+        """
+        Executes tests from the scheduler until it is exhausted.
+        Args:
+            queue: The scheduler to fetch tests to execute from
+        """
+        while (
+            test_playbook := queue.get(
+                consumer=self, can_run=self._can_run_concurrently
+            )
+        ) is not None:
+            executed = False
             try:
-                test_playbook: TestPlaybook = queue.get(block=False)
-                self._reset_tests_round_if_necessary(test_playbook, queue)
-            except Empty:
-                continue
-            self.configure_new_client()
-            if TestContext(
-                self.build_context, test_playbook, self.client, self
-            ).execute_test(self.proxy):
-                self.executed_tests.add(test_playbook.configuration.playbook_id)
-            else:
-                queue.put(test_playbook)
-            queue.task_done()
+                executed = TestContext(
+                    self.build_context, test_playbook, self.client, self
+                ).execute_test(self.proxy)
+                if executed:
+                    self.executed_tests.add(test_playbook.configuration.playbook_id)
+            finally:
+                queue.task_done(test_playbook, executed=executed, consumer=self)
 
     def _execute_mockable_tests(self):
         """
@@ -2945,47 +3075,42 @@ class ServerContext:
             )
 
     def _execute_failed_tests(self):
-        self._execute_tests(self.build_context.test_retries_queue)
+        # Failed mockable tests are re-recorded through the server's proxy, which can record one playbook at a time
+        self._execute_tests(
+            self.build_context.test_retries_queue,
+            1 if self.proxy else self.max_concurrent_tests,
+        )
 
-    def _reset_tests_round_if_necessary(
-        self, test_playbook: TestPlaybook, queue_: Queue
-    ):
+    def configure_new_client(self, stale_client: Optional[DefaultApi] = None):
         """
-        Checks if the string representation of the current test configuration is already in
-        the executed_in_current_round set.
-        If it is- it means we have already executed this test, and we have reached a round and there are tests that
-        were not able to be locked by this execution.
-        In that case we want to start a new round monitoring by emptying the 'executed_in_current_round' set and sleep
-        in order to let the tests be unlocked
-        Since this operation can be performed by multiple threads - this operation is protected by the queue's lock
+        Replaces the client of the server.
         Args:
-            test_playbook: Test playbook to check if has been executed in the current round
-            queue_: The queue from which the current tests are executed
+            stale_client: The client which failed to authenticate. It is replaced only if it is still the client of
+                          the server, so tests which run concurrently and fail together create a single new client.
         """
-        queue_.mutex.acquire()
-        if str(test_playbook.configuration) in self.executed_in_current_round:
-            self.build_context.logging_module.info(
-                "all tests in the queue were executed, sleeping for 30 seconds to let locked tests get unlocked."
+        with self._client_lock:
+            if stale_client is not None and self.client is not stale_client:
+                return
+            if self.client:
+                if self.incidents_poller:
+                    # the tests which run concurrently may still use the client, it is closed once they are done
+                    self._retired_clients.append(self.client)
+                else:
+                    self._close_client(self.client)
+                del self.client
+            self.client = demisto_client.configure(
+                base_url=self.server_url,
+                api_key=self.build_context.api_key,
+                auth_id=self.build_context.auth_id,
+                verify_ssl=False,
             )
-            self.executed_in_current_round = {str(test_playbook.configuration)}
-            queue_.mutex.release()
-            time.sleep(30)
-            return
-        else:
-            self.executed_in_current_round.add(str(test_playbook.configuration))
-        queue_.mutex.release()
-
-    def configure_new_client(self):
-        if self.client:
-            self.client.api_client.pool.close()
-            self.client.api_client.pool.terminate()
-            del self.client
-        self.client = demisto_client.configure(
-            base_url=self.server_url,
-            api_key=self.build_context.api_key,
-            auth_id=self.build_context.auth_id,
-            verify_ssl=False,
-        )
+            if self.incidents_poller:
+                self.incidents_poller.client = self.client
+
+    @staticmethod
+    def _close_client(client: DefaultApi):
+        client.api_client.pool.close()
+        client.api_client.pool.terminate()
 
     def reset_containers(self):
         if self.build_context.is_saas_server_type:
@@ -3018,7 +3143,6 @@ class ServerContext:
             self.build_context.logging_module.info(
                 "Running mock-disabled tests", real_time=True
             )
-            self.configure_new_client()
             self._execute_unmockable_tests()
             if self.use_retries_mechanism:
                 self.build_context.logging_module.info(
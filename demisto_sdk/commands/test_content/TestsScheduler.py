@@ -0,0 +1,171 @@
+import itertools
+import time
+from collections import Counter, defaultdict
+from threading import Condition
+from typing import Callable, DefaultDict, Hashable, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_LOCK_RETRY_INTERVAL = 30
+
+
+class TestsScheduler:
+    __test__ = False  # prevents pytest from collecting this class
+
+    def __init__(
+        self,
+        test_playbooks: Iterable = (),
+        lock_retry_interval: float = DEFAULT_LOCK_RETRY_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        A thread safe scheduler of test playbooks, shared by all the ServerContext instances of the build.
+        Unlike a plain queue, consumers block until a test is actually runnable:
+        * A test is runnable only if none of its integrations to lock is used by a test that currently runs in this
+          build.
+        * A test that could not acquire its integrations lock is deferred for 'lock_retry_interval' seconds, while
+          other tests keep being scheduled.
+        * A consumer (e.g. a ServerContext running several tests in parallel) may restrict which tests it can run
+          alongside the tests it is already running.
+        Tests are handed out by priority - the earliest eligible time first, and then by insertion order.
+        Args:
+            test_playbooks: The TestPlaybook instances to schedule
+            lock_retry_interval: The time in seconds to wait before re-scheduling a test that could not be locked
+            clock: A monotonic clock, in seconds
+        """
+        self._condition = Condition()
+        self._clock = clock
+        self._counter = itertools.count()
+        self._pending: List[Tuple[float, int, object]] = []
+        self._busy_integrations: Counter = Counter()
+        self._running: DefaultDict[Hashable, List] = defaultdict(list)
+        self._in_progress = 0
+        self.lock_retry_interval = lock_retry_interval
+        for test_playbook in test_playbooks:
+            self.put(test_playbook)
+
+    @staticmethod
+    def _integrations_to_lock(test_playbook) -> Set[str]:
+        return {
+            integration.name
+            for integration in getattr(test_playbook, "integrations_to_lock", [])
+        }
+
+    def put(self, test_playbook, delay: float = 0):
+        """
+        Schedules a test playbook to run in 'delay' seconds from now.
+        Args:
+            test_playbook (TestPlaybook): The test playbook to schedule
+            delay: The minimal time in seconds before the test is handed out
+        """
+        with self._condition:
+            self._pending.append(
+                (self._clock() + delay, next(self._counter), test_playbook)
+            )
+            self._condition.notify_all()
+
+    def _pop_runnable(
+        self,
+        now: float,
+        running_tests: List,
+        can_run: Optional[Callable[[object, List], bool]],
+    ):
+        """
+        Pops the first test (by priority) which is eligible and whose integrations are not used by another test.
+        Must be called while holding the condition lock.
+        """
+        busy_integrations = set(+self._busy_integrations)
+        for entry in sorted(self._pending):
+            not_before, _, test_playbook = entry
+            if not_before > now:
+                # the pending tests are sorted, no later test is eligible either
+                return None
+            if self._integrations_to_lock(test_playbook) & busy_integrations:
+                continue
+            if can_run and not can_run(test_playbook, running_tests):
+                continue
+            self._pending.remove(entry)
+            return test_playbook
+        return None
+
+    def get(
+        self,
+        timeout: Optional[float] = None,
+        consumer: Hashable = None,
+        can_run: Optional[Callable[[object, List], bool]] = None,
+    ):
+        """
+        Blocks until a runnable test playbook is available and returns it.
+        The returned test must be reported back with 'task_done'.
+        Args:
+            timeout: The maximal time in seconds to wait, None to wait until the scheduler is exhausted
+            consumer: An identifier of the consumer, used to track the tests the consumer currently runs
+            can_run: A predicate that gets a pending test and the tests the consumer currently runs,
+                     and returns whether the consumer can run the pending test alongside them
+
+        Returns:
+            The next runnable TestPlaybook, or None if all tests were done or the timeout has expired.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._condition:
+            while True:
+                if not self._pending and not self._in_progress:
+                    return None
+                now = self._clock()
+                test_playbook = self._pop_runnable(
+                    now, self._running[consumer], can_run
+                )
+                if test_playbook is not None:
+                    self._in_progress += 1
+                    self._running[consumer].append(test_playbook)
+                    self._busy_integrations.update(
+                        self._integrations_to_lock(test_playbook)
+                    )
+                    return test_playbook
+                # Nothing is runnable yet - sleep until the next deferred test is due, or until a running test is done
+                wait_time = None
+                if self._pending:
+                    next_eligible_time = min(self._pending)[0]
+                    if next_eligible_time > now:
+                        wait_time = next_eligible_time - now
+                if deadline is not None:
+                    if now >= deadline:
+                        return None
+                    wait_time = min(wait_time or deadline - now, deadline - now)
+                self._condition.wait(wait_time)
+
+    def task_done(
+        self, test_playbook, executed: bool = True, consumer: Hashable = None
+    ):
+        """
+        Reports that a test playbook returned by 'get' has finished its run attempt.
+        Args:
+            test_playbook (TestPlaybook): The test playbook returned by 'get'
+            executed: Whether the test was executed. If not (e.g. its integrations were locked by another build),
+                      it will be re-scheduled after 'lock_retry_interval' seconds.
+            consumer: The consumer identifier that was given to 'get'
+        """
+        with self._condition:
+            self._in_progress -= 1
+            self._running[consumer].remove(test_playbook)
+            self._busy_integrations.subtract(self._integrations_to_lock(test_playbook))
+            if not executed:
+                self._pending.append(
+                    (
+                        self._clock() + self.lock_retry_interval,
+                        next(self._counter),
+                        test_playbook,
+                    )
+                )
+            self._condition.notify_all()
+
+    def empty(self) -> bool:
+        with self._condition:
+            return not self._pending and not self._in_progress
+
+    def qsize(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    @property
+    def unfinished_tasks(self) -> int:
+        with self._condition:
+            return len(self._pending) + self._in_progress
@@ -92,6 +92,7 @@ def execute_test_content(**kwargs):
             build_context,
             server_private_ip=server_ip,
             use_retries_mechanism=use_retries_mechanism,
+            max_concurrent_tests=kwargs.get("concurrent_tests_per_server") or 1,
         )
         threads_list.append(Thread(target=tests_execution_instance.execute_tests))
 
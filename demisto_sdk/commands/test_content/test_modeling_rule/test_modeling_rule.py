@@ -1,9 +1,13 @@
 import logging
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from time import sleep
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 import dateparser
@@ -49,6 +53,9 @@ from demisto_sdk.commands.test_content.test_modeling_rule.constants import (
     TIME_ZONE_WARNING,
     XQL_QUERY_ERROR_EXPLANATION,
 )
+from demisto_sdk.commands.test_content.test_modeling_rule.xql_query_planner import (
+    XqlQueryPlanner,
+)
 from demisto_sdk.commands.test_content.xsiam_tools.test_data import (
     TestData,
     Validations,
@@ -412,26 +419,26 @@ def verify_results_against_test_data(
     return result_test_case
 
 
-def generate_xql_query(rule: SingleModelingRule, test_data_event_ids: List[str]) -> str:
-    """Generate an XQL query from the given rule and test data event IDs.
+def get_rule_test_data_event_ids(
+    rule: SingleModelingRule, test_data: TestData
+) -> List[str]:
+    return [
+        str(d.test_data_event_id) for d in test_data.data if d.dataset == rule.dataset
+    ]
 
-    Args:
-        rule (SingleModelingRule): Rule object parsed from the modeling rule file.
-        test_data_event_ids (List[str]): List of test data event IDs to query.
 
-    Returns:
-        str: The XQL query.
-    """
-    fields = ", ".join(list(rule.fields))
-    td_event_ids = ", ".join(
-        [f'"{td_event_id}"' for td_event_id in test_data_event_ids]
-    )
-    return (
-        f"config timeframe = 10y | datamodel dataset in({rule.dataset}) | "
-        f"filter {rule.dataset}.test_data_event_id in({td_event_ids}) | "
-        f"dedup {rule.dataset}.test_data_event_id by desc _insert_time | "
-        f"fields {rule.dataset}.test_data_event_id, {fields}"
-    )
+def add_expected_values_queries(
+    query_planner: XqlQueryPlanner, modeling_rule: ModelingRule, test_data: TestData
+):
+    """Add the queries which verify the expected values of the given modeling rule to the query planner."""
+    for rule in modeling_rule.rules:
+        query_planner.add(rule, get_rule_test_data_event_ids(rule, test_data))
+
+
+def create_query_planner(
+    xsiam_client: XsiamApiClient, retrying_caller: Retrying
+) -> XqlQueryPlanner:
+    return XqlQueryPlanner(partial(retrying_caller, xsiam_execute_query, xsiam_client))
 
 
 def validate_expected_values(
@@ -439,8 +446,17 @@ def validate_expected_values(
     retrying_caller: Retrying,
     modeling_rule: ModelingRule,
     test_data: TestData,
+    query_planner: Optional[XqlQueryPlanner] = None,
 ) -> List[TestCase]:
-    """Validate the expected_values in the given test data file."""
+    """Validate the expected_values in the given test data file.
+
+    The rules which target the same dataset are verified by a single XQL query.
+    A query planner may be passed in order to share the queries with other modeling rules, in which case the queries
+    of the given modeling rule must already be added to it.
+    """
+    if query_planner is None:
+        query_planner = create_query_planner(xsiam_client, retrying_caller)
+        add_expected_values_queries(query_planner, modeling_rule, test_data)
     validate_expected_values_test_cases = []
     for rule in modeling_rule.rules:
         validate_expected_values_test_case = TestCase(
@@ -448,19 +464,14 @@ def validate_expected_values(
             f"vendor:{rule.vendor} product:{rule.product}",
             classname="Validate expected values query",
         )
-        query = generate_xql_query(
-            rule,
-            [
-                str(d.test_data_event_id)
-                for d in test_data.data
-                if d.dataset == rule.dataset
-            ],
-        )
+        query = query_planner.generate_query(rule.dataset)
         query_info = f"Query for dataset {rule.dataset}:\n{query}"
         logger.debug(query_info)
         validate_expected_values_test_case_system_out = [query_info]
         try:
-            results = retrying_caller(xsiam_execute_query, xsiam_client, query)
+            results = query_planner.get_results(
+                rule, get_rule_test_data_event_ids(rule, test_data)
+            )
         except requests.exceptions.RequestException:
             logger.error(
                 f"[red]{XQL_QUERY_ERROR_EXPLANATION}[/red]",
@@ -945,6 +956,117 @@ def verify_data_sets_exists(xsiam_client, retrying_caller, test_data):
     return datasets_test_case_ls
 
 
+def check_datasets_exist(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    datasets: List[str],
+    executor: Executor,
+    init_sleep_time: int = 30,
+) -> Dict[str, TestCase]:
+    """Check if the given datasets exist in the tenant, polling all of them together.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        datasets (List[str]): The data set names.
+        executor (Executor): The executor used to check the datasets concurrently.
+        init_sleep_time (int, optional): The number of seconds to wait for datasets installation. Defaults to 30.
+    Returns:
+        Dict[str, TestCase]: Test case for checking if the dataset exists in the tenant, by the dataset name.
+    """
+    if not datasets:
+        return {}
+    logger.debug(
+        f"Sleeping for {init_sleep_time} seconds before query for the datasets, to make sure the datasets were "
+        "installed correctly."
+    )
+    sleep(init_sleep_time)
+    datasets_test_cases = executor.map(
+        partial(check_dataset_exists, xsiam_client, retrying_caller, init_sleep_time=0),
+        datasets,
+    )
+    return dict(zip(datasets, datasets_test_cases))
+
+
+@dataclass
+class ModelingRuleTestRun:
+    """The state of a modeling rule test which passed its local validations and is ready to run on the tenant."""
+
+    modeling_rule: ModelingRule
+    test_data: TestData
+    test_suite: TestSuite
+    executed_command: str
+    missing_event_data: List[UUID]
+
+
+def push_modeling_rule_test_data(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    test_run: ModelingRuleTestRun,
+) -> Optional[Tuple[bool, TestSuite]]:
+    """Push the test data of a modeling rule test run to the tenant.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        test_run (ModelingRuleTestRun): The modeling rule test run.
+    Returns:
+        Optional[Tuple[bool, TestSuite]]: The final result of the test run if it can not proceed, otherwise None.
+    """
+    event_id_exists_test_case = verify_event_id_does_not_exist_on_tenant(
+        xsiam_client, test_run.modeling_rule, test_run.test_data, retrying_caller
+    )
+    test_run.test_suite.add_testcases(event_id_exists_test_case)
+    if test_run.missing_event_data:
+        return handle_missing_event_data_in_modeling_rule(
+            test_run.missing_event_data,
+            test_run.modeling_rule,
+            test_run.test_suite,
+            test_run.executed_command,
+        )
+    push_test_data_test_case = push_test_data_to_tenant(
+        xsiam_client, retrying_caller, test_run.modeling_rule, test_run.test_data
+    )
+    test_run.test_suite.add_testcase(push_test_data_test_case)
+    if not push_test_data_test_case.is_passed:
+        return False, test_run.test_suite
+    return None
+
+
+def verify_modeling_rule_expected_values(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    test_run: ModelingRuleTestRun,
+    query_planner: Optional[XqlQueryPlanner] = None,
+) -> Tuple[bool, TestSuite]:
+    """Validate the expected values of a modeling rule test run against the data in the tenant.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        test_run (ModelingRuleTestRun): The modeling rule test run.
+        query_planner (XqlQueryPlanner, optional): A query planner shared with other modeling rules test runs.
+    Returns:
+        Tuple[bool, TestSuite]: Tuple of a boolean indicating whether the test passed and the test suite.
+    """
+    logger.info("[cyan]Validating expected_values...[/cyan]", extra={"markup": True})
+    validate_expected_values_test_cases = validate_expected_values(
+        xsiam_client,
+        retrying_caller,
+        test_run.modeling_rule,
+        test_run.test_data,
+        query_planner=query_planner,
+    )
+    test_run.test_suite.add_testcases(validate_expected_values_test_cases)
+    if not test_run.test_suite.errors and not test_run.test_suite.failures:
+        logger.info(
+            "[green]All mappings validated successfully[/green]",
+            extra={"markup": True},
+        )
+        return True, test_run.test_suite
+    return False, test_run.test_suite
+
+
 def validate_modeling_rule(
     modeling_rule_directory: Path,
     xsiam_url: str,
@@ -969,6 +1091,208 @@ def validate_modeling_rule(
         xsiam_client (XsiamApiClient): The XSIAM client used to do API calls to the tenant.
         tenant_demisto_version (Version): The demisto version of the XSIAM tenant.
     """
+    test_run = prepare_modeling_rule_test(
+        modeling_rule_directory,
+        xsiam_url,
+        retrying_caller,
+        push,
+        interactive,
+        ctx,
+        delete_existing_dataset,
+        xsiam_client=xsiam_client,
+        tenant_demisto_version=tenant_demisto_version,
+    )
+    if not isinstance(test_run, ModelingRuleTestRun):
+        return test_run
+    if push:
+        if result := push_modeling_rule_test_data(
+            xsiam_client, retrying_caller, test_run
+        ):
+            return result
+        datasets_test_case = verify_data_sets_exists(
+            xsiam_client, retrying_caller, test_run.test_data
+        )
+        test_run.test_suite.add_testcases(datasets_test_case)
+    else:
+        logger.info(
+            '[cyan]The command flag "--no-push" was passed - skipping pushing of test data[/cyan]',
+            extra={"markup": True},
+        )
+    return verify_modeling_rule_expected_values(xsiam_client, retrying_caller, test_run)
+
+
+def validate_modeling_rules(
+    modeling_rule_directories: List[Path],
+    xsiam_url: str,
+    retrying_caller: Retrying,
+    push: bool,
+    interactive: bool,
+    ctx: typer.Context,
+    delete_existing_dataset: bool,
+    xsiam_client: XsiamApiClient,
+    tenant_demisto_version: Version,
+) -> Iterator[Tuple[bool, Union[TestSuite, None]]]:
+    """Validate the modeling rules one after the other.
+
+    Yields:
+        Tuple[bool, Union[TestSuite, None]]: The result of each modeling rule, by the order of the given directories.
+    """
+    for i, modeling_rule_directory in enumerate(modeling_rule_directories, start=1):
+        logger.info(
+            f"[cyan][{i}/{len(modeling_rule_directories)}] Test Modeling Rule: "
+            f"{get_relative_path_to_content(modeling_rule_directory)}[/cyan]",
+            extra={"markup": True},
+        )
+        yield validate_modeling_rule(
+            modeling_rule_directory,
+            xsiam_url,
+            retrying_caller,
+            push,
+            interactive,
+            ctx,
+            delete_existing_dataset,
+            xsiam_client=xsiam_client,
+            tenant_demisto_version=tenant_demisto_version,
+        )
+
+
+def validate_modeling_rules_in_parallel(
+    modeling_rule_directories: List[Path],
+    xsiam_url: str,
+    retrying_caller: Retrying,
+    push: bool,
+    interactive: bool,
+    ctx: typer.Context,
+    delete_existing_dataset: bool,
+    xsiam_client: XsiamApiClient,
+    tenant_demisto_version: Version,
+    workers: int,
+) -> List[Tuple[bool, Union[TestSuite, None]]]:
+    """Validate the modeling rules concurrently, stage by stage.
+
+    The test data of all the modeling rules is pushed up front, the readiness of all the datasets is polled together
+    (waiting for the datasets installation only once), and the XQL verification queries run concurrently.
+    The test suites are identical to the ones created by validating the modeling rules one after the other.
+
+    Args:
+        workers (int): The maximal number of concurrent requests to the tenant.
+        For the rest of the arguments, see validate_modeling_rule.
+    Returns:
+        List[Tuple[bool, Union[TestSuite, None]]]: The result of each modeling rule, by the order of the given
+            directories.
+    """
+    results: Dict[int, Tuple[bool, Union[TestSuite, None]]] = {}
+    test_runs: Dict[int, ModelingRuleTestRun] = {}
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="test-modeling-rule"
+    ) as executor:
+        logger.info(
+            f"[cyan]Preparing {len(modeling_rule_directories)} modeling rules...[/cyan]",
+            extra={"markup": True},
+        )
+        prepare = partial(
+            prepare_modeling_rule_test,
+            xsiam_url=xsiam_url,
+            retrying_caller=retrying_caller,
+            push=push,
+            interactive=interactive,
+            ctx=ctx,
+            delete_existing_dataset=delete_existing_dataset,
+            xsiam_client=xsiam_client,
+            tenant_demisto_version=tenant_demisto_version,
+        )
+        # prompting the user can not be done concurrently
+        for i, test_run in enumerate(
+            (map if interactive else executor.map)(prepare, modeling_rule_directories)
+        ):
+            if isinstance(test_run, ModelingRuleTestRun):
+                test_runs[i] = test_run
+            else:
+                results[i] = test_run
+
+        if push:
+            logger.info(
+                f"[cyan]Pushing test data of {len(test_runs)} modeling rules...[/cyan]",
+                extra={"markup": True},
+            )
+            push_results = executor.map(
+                partial(push_modeling_rule_test_data, xsiam_client, retrying_caller),
+                test_runs.values(),
+            )
+            for i, result in list(zip(test_runs, push_results)):
+                if result:
+                    results[i] = result
+                    del test_runs[i]
+
+            datasets = sorted(
+                {
+                    data.dataset
+                    for test_run in test_runs.values()
+                    for data in test_run.test_data.data
+                }
+            )
+            datasets_test_cases = check_datasets_exist(
+                xsiam_client, retrying_caller, datasets, executor
+            )
+            for test_run in test_runs.values():
+                test_run.test_suite.add_testcases(
+                    [
+                        deepcopy(datasets_test_cases[data.dataset])
+                        for data in test_run.test_data.data
+                    ]
+                )
+        else:
+            logger.info(
+                '[cyan]The command flag "--no-push" was passed - skipping pushing of test data[/cyan]',
+                extra={"markup": True},
+            )
+
+        # the verification queries of all the modeling rules are merged by dataset
+        query_planner = create_query_planner(xsiam_client, retrying_caller)
+        for test_run in test_runs.values():
+            add_expected_values_queries(
+                query_planner, test_run.modeling_rule, test_run.test_data
+            )
+        verification_results = executor.map(
+            partial(
+                verify_modeling_rule_expected_values,
+                xsiam_client,
+                retrying_caller,
+                query_planner=query_planner,
+            ),
+            test_runs.values(),
+        )
+        results.update(zip(test_runs, verification_results))
+    return [results[i] for i in range(len(modeling_rule_directories))]
+
+
+def prepare_modeling_rule_test(
+    modeling_rule_directory: Path,
+    xsiam_url: str,
+    retrying_caller: Retrying,
+    push: bool,
+    interactive: bool,
+    ctx: typer.Context,
+    delete_existing_dataset: bool,
+    xsiam_client: XsiamApiClient,
+    tenant_demisto_version: Version,
+) -> Union[ModelingRuleTestRun, Tuple[bool, Union[TestSuite, None]]]:
+    """Run the validations of a modeling rule which precede pushing its test data to the tenant.
+
+    Args:
+        modeling_rule_directory (Path): Path to the modeling rule directory.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        xsiam_url (str): URL of the xsiam tenant.
+        push (bool): Whether to push test event data to the tenant.
+        interactive (bool): Whether command is being run in interactive mode.
+        ctx (typer.Context): Typer context.
+        delete_existing_dataset (bool): Whether to delete the existing dataset in the tenant.
+        xsiam_client (XsiamApiClient): The XSIAM client used to do API calls to the tenant.
+        tenant_demisto_version (Version): The demisto version of the XSIAM tenant.
+    Returns:
+        The modeling rule test run if the modeling rule should be tested on the tenant, otherwise the final result
+        of the modeling rule.
+    """
     modeling_rule = ModelingRule(modeling_rule_directory.as_posix())
     modeling_rule_file_name = Path(modeling_rule.path).name
     containing_pack = get_containing_pack(modeling_rule)
@@ -1120,50 +1444,13 @@ def validate_modeling_rule(
                 schema_test_case.result += [Skipped(skipped)]  #  type:ignore[arg-type]
                 modeling_rule_test_suite.add_testcase(schema_test_case)
 
-            if push:
-                event_id_exists_test_case = verify_event_id_does_not_exist_on_tenant(
-                    xsiam_client, modeling_rule, test_data, retrying_caller
-                )
-                modeling_rule_test_suite.add_testcases(event_id_exists_test_case)
-                if missing_event_data:
-                    return handle_missing_event_data_in_modeling_rule(
-                        missing_event_data,
-                        modeling_rule,
-                        modeling_rule_test_suite,
-                        executed_command,
-                    )
-                push_test_data_test_case = push_test_data_to_tenant(
-                    xsiam_client, retrying_caller, modeling_rule, test_data
-                )
-                modeling_rule_test_suite.add_testcase(push_test_data_test_case)
-                if not push_test_data_test_case.is_passed:
-                    return False, modeling_rule_test_suite
-                datasets_test_case = verify_data_sets_exists(
-                    xsiam_client, retrying_caller, test_data
-                )
-                modeling_rule_test_suite.add_testcases(datasets_test_case)
-            else:
-                logger.info(
-                    '[cyan]The command flag "--no-push" was passed - skipping pushing of test data[/cyan]',
-                    extra={"markup": True},
-                )
-            logger.info(
-                "[cyan]Validating expected_values...[/cyan]", extra={"markup": True}
-            )
-            validate_expected_values_test_cases = validate_expected_values(
-                xsiam_client, retrying_caller, modeling_rule, test_data
+            return ModelingRuleTestRun(
+                modeling_rule=modeling_rule,
+                test_data=test_data,
+                test_suite=modeling_rule_test_suite,
+                executed_command=executed_command,
+                missing_event_data=missing_event_data,
             )
-            modeling_rule_test_suite.add_testcases(validate_expected_values_test_cases)
-            if (
-                not modeling_rule_test_suite.errors
-                and not modeling_rule_test_suite.failures
-            ):
-                logger.info(
-                    "[green]All mappings validated successfully[/green]",
-                    extra={"markup": True},
-                )
-                return True, modeling_rule_test_suite
-            return False, modeling_rule_test_suite
         else:
             logger.info(
                 "[green]test data config is ignored skipping the test data validation[/green]",
@@ -1477,6 +1764,18 @@ def test_modeling_rule(
         "-dd",
         help="Deletion of the existing dataset from the tenant. Default: False.",
     ),
+    workers: int = typer.Option(
+        1,
+        "-w",
+        "--workers",
+        min=1,
+        show_default=True,
+        help=(
+            "The number of concurrent requests to the tenant. When larger than 1, the test data of all the "
+            "modeling rules is pushed up front, the datasets are polled together and the verification queries "
+            "run in parallel."
+        ),
+    ),
     console_log_threshold: str = typer.Option(
         "INFO",
         "-clt",
@@ -1532,23 +1831,26 @@ def test_modeling_rule(
     )
     xsiam_client = XsiamApiClient(xsiam_client_cfg)
     tenant_demisto_version: Version = xsiam_client.get_demisto_version()
-    for i, modeling_rule_directory in enumerate(inputs, start=1):
-        logger.info(
-            f"[cyan][{i}/{len(inputs)}] Test Modeling Rule: {get_relative_path_to_content(modeling_rule_directory)}[/cyan]",
-            extra={"markup": True},
-        )
-        success, modeling_rule_test_suite = validate_modeling_rule(
-            modeling_rule_directory,
-            # can ignore the types since if they are not set to str values an error occurs
-            xsiam_url,  # type: ignore[arg-type]
-            retrying_caller,
-            push,
-            interactive,
-            ctx,
-            delete_existing_dataset,
-            xsiam_client=xsiam_client,
-            tenant_demisto_version=tenant_demisto_version,
-        )
+    validate_kwargs: Dict[str, Any] = dict(
+        modeling_rule_directories=inputs,
+        xsiam_url=xsiam_url,
+        retrying_caller=retrying_caller,
+        push=push,
+        interactive=interactive,
+        ctx=ctx,
+        delete_existing_dataset=delete_existing_dataset,
+        xsiam_client=xsiam_client,
+        tenant_demisto_version=tenant_demisto_version,
+    )
+    if workers > 1:
+        results: Iterable[
+            Tuple[bool, Union[TestSuite, None]]
+        ] = validate_modeling_rules_in_parallel(**validate_kwargs, workers=workers)
+    else:
+        results = validate_modeling_rules(**validate_kwargs)
+    for modeling_rule_directory, (success, modeling_rule_test_suite) in zip(
+        inputs, results
+    ):
         if success:
             logger.info(
                 f"[green]Test Modeling rule {get_relative_path_to_content(modeling_rule_directory)} passed[/green]",
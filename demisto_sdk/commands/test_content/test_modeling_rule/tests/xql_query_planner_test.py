@@ -0,0 +1,170 @@
+from threading import Barrier, Thread
+
+import pytest
+import requests
+
+from demisto_sdk.commands.common.content.objects.pack_objects.modeling_rule.modeling_rule import (
+    SingleModelingRule,
+)
+from demisto_sdk.commands.test_content.test_modeling_rule.xql_query_planner import (
+    XqlQueryPlanner,
+)
+
+RULE_1 = SingleModelingRule(
+    """[MODEL: dataset=fake_fakerson_raw]
+alter
+    xdm.event.type = type,
+    xdm.source.ipv4 = src;"""
+)
+RULE_2 = SingleModelingRule(
+    """[MODEL: dataset=fake_fakerson_raw]
+alter
+    xdm.event.type = type,
+    xdm.target.ipv4 = dst;"""
+)
+OTHER_DATASET_RULE = SingleModelingRule(
+    """[MODEL: dataset=other_raw]
+alter
+    xdm.event.type = type;"""
+)
+ID_KEY = "fake_fakerson_raw.test_data_event_id"
+
+
+class FakeXql:
+    def __init__(self, results: dict):
+        self.results = results
+        self.queries = []
+
+    def __call__(self, query: str):
+        self.queries.append(query)
+        for dataset, results in self.results.items():
+            if f"dataset in({dataset})" in query:
+                return results
+        return []
+
+
+def test_queries_of_same_dataset_are_merged():
+    """
+    Given:
+        - Two rules of the same dataset and a rule of another dataset
+    When:
+        - Getting the results of all the rules
+    Then:
+        - Ensure a single query was executed per dataset
+        - Ensure the merged query filters by the event IDs and selects the fields of both rules
+        - Ensure each rule gets only its own events, without the fields of the other rule
+    """
+    execute_query = FakeXql(
+        {
+            "fake_fakerson_raw": [
+                {
+                    ID_KEY: "1",
+                    "xdm.event.type": "a",
+                    "xdm.source.ipv4": "1.1.1.1",
+                    "xdm.target.ipv4": None,
+                },
+                {
+                    ID_KEY: "2",
+                    "xdm.event.type": "b",
+                    "xdm.source.ipv4": None,
+                    "xdm.target.ipv4": "2.2.2.2",
+                },
+            ],
+            "other_raw": [{"other_raw.test_data_event_id": "3"}],
+        }
+    )
+    planner = XqlQueryPlanner(execute_query)
+    planner.add(RULE_1, ["1"])
+    planner.add(RULE_2, ["2"])
+    planner.add(OTHER_DATASET_RULE, ["3"])
+
+    assert planner.get_results(RULE_1, ["1"]) == [
+        {ID_KEY: "1", "xdm.event.type": "a", "xdm.source.ipv4": "1.1.1.1"}
+    ]
+    assert planner.get_results(RULE_2, ["2"]) == [
+        {ID_KEY: "2", "xdm.event.type": "b", "xdm.target.ipv4": "2.2.2.2"}
+    ]
+    assert planner.get_results(OTHER_DATASET_RULE, ["3"]) == [
+        {"other_raw.test_data_event_id": "3"}
+    ]
+    assert len(execute_query.queries) == 2
+    assert execute_query.queries[0] == (
+        "config timeframe = 10y | datamodel dataset in(fake_fakerson_raw) | "
+        f'filter {ID_KEY} in("1", "2") | dedup {ID_KEY} by desc _insert_time | '
+        f"fields {ID_KEY}, _time, xdm.event.type, xdm.source.ipv4, xdm.target.ipv4"
+    )
+
+
+def test_query_is_executed_once_by_concurrent_callers():
+    """
+    Given:
+        - Two rules of the same dataset
+    When:
+        - Getting the results of both rules from two threads at the same time
+    Then:
+        - Ensure the merged query was executed only once
+    """
+    execute_query = FakeXql({"fake_fakerson_raw": [{ID_KEY: "1"}, {ID_KEY: "2"}]})
+    planner = XqlQueryPlanner(execute_query)
+    planner.add(RULE_1, ["1"])
+    planner.add(RULE_2, ["2"])
+    barrier = Barrier(2, timeout=5)
+    results = {}
+
+    def get_results(rule, event_ids):
+        barrier.wait()
+        results[event_ids[0]] = planner.get_results(rule, event_ids)
+
+    threads = [
+        Thread(target=get_results, args=(RULE_1, ["1"])),
+        Thread(target=get_results, args=(RULE_2, ["2"])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(execute_query.queries) == 1
+    assert results == {"1": [{ID_KEY: "1"}], "2": [{ID_KEY: "2"}]}
+
+
+def test_query_error_is_raised_for_all_rules():
+    """
+    Given:
+        - Two rules of the same dataset, whose merged query fails
+    When:
+        - Getting the results of both rules
+    Then:
+        - Ensure the error is raised for both rules, and the query was not executed again
+    """
+    calls = []
+
+    def execute_query(query):
+        calls.append(query)
+        raise requests.exceptions.HTTPError("Failed to execute XQL query")
+
+    planner = XqlQueryPlanner(execute_query)
+    planner.add(RULE_1, ["1"])
+    planner.add(RULE_2, ["2"])
+
+    for rule, event_ids in ((RULE_1, ["1"]), (RULE_2, ["2"])):
+        with pytest.raises(requests.exceptions.HTTPError):
+            planner.get_results(rule, event_ids)
+    assert len(calls) == 1
+
+
+def test_add_after_execution_is_not_allowed():
+    """
+    Given:
+        - A planner whose dataset query was already executed
+    When:
+        - Adding another rule of the same dataset
+    Then:
+        - Ensure a ValueError is raised
+    """
+    planner = XqlQueryPlanner(FakeXql({}))
+    planner.add(RULE_1, ["1"])
+    planner.get_results(RULE_1, ["1"])
+
+    with pytest.raises(ValueError):
+        planner.add(RULE_2, ["2"])
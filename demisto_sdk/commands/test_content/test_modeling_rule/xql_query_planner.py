@@ -0,0 +1,128 @@
+from collections import Counter
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, List
+
+from demisto_sdk.commands.common.content.objects.pack_objects.modeling_rule.modeling_rule import (
+    SingleModelingRule,
+)
+
+
+class XqlQueryPlanner:
+    def __init__(self, execute_query: Callable[[str], List[dict]]):
+        """
+        Plans the XQL queries which verify the expected values of modeling rules.
+
+        Instead of running a query per modeling rule, the queries of all the rules that target the same dataset are
+        merged into a single query, filtered by the test data event IDs of all the rules, and the results of the merged
+        query are demultiplexed back per rule. Since the datamodel of a dataset does not depend on the rule that is
+        being verified, the merged query returns the same modeled events as the separate queries would.
+
+        All the rules must be added before the results of their dataset are first requested.
+        The planner is thread safe, the query of each dataset is executed only once.
+
+        Args:
+            execute_query: Executes an XQL query and returns its results.
+        """
+        self._execute_query = execute_query
+        self._lock = Lock()
+        self._fields: Dict[str, List[str]] = {}
+        self._event_ids: Dict[str, List[str]] = {}
+        self._rules_count: Counter = Counter()
+        self._results: Dict[str, Future] = {}
+
+    def add(self, rule: SingleModelingRule, test_data_event_ids: List[str]):
+        """
+        Adds the verification query of a rule to the plan.
+
+        Args:
+            rule (SingleModelingRule): Rule object parsed from the modeling rule file.
+            test_data_event_ids (List[str]): List of test data event IDs to query.
+        """
+        with self._lock:
+            if rule.dataset in self._results:
+                raise ValueError(
+                    f"The query of dataset {rule.dataset} was already executed, can not add more rules to it"
+                )
+            self._rules_count[rule.dataset] += 1
+            fields = self._fields.setdefault(rule.dataset, [])
+            fields.extend(field for field in rule.fields if field not in fields)
+            event_ids = self._event_ids.setdefault(rule.dataset, [])
+            event_ids.extend(
+                event_id
+                for event_id in test_data_event_ids
+                if event_id not in event_ids
+            )
+
+    @property
+    def datasets(self) -> List[str]:
+        with self._lock:
+            return list(self._fields)
+
+    def generate_query(self, dataset: str) -> str:
+        """Generate the merged XQL query of all the rules that target the given dataset.
+
+        Args:
+            dataset (str): The dataset to query.
+
+        Returns:
+            str: The XQL query.
+        """
+        with self._lock:
+            fields = ", ".join(self._fields[dataset])
+            td_event_ids = ", ".join(
+                [f'"{td_event_id}"' for td_event_id in self._event_ids[dataset]]
+            )
+        return (
+            f"config timeframe = 10y | datamodel dataset in({dataset}) | "
+            f"filter {dataset}.test_data_event_id in({td_event_ids}) | "
+            f"dedup {dataset}.test_data_event_id by desc _insert_time | "
+            f"fields {dataset}.test_data_event_id, {fields}"
+        )
+
+    def _get_dataset_results(self, dataset: str) -> List[dict]:
+        with self._lock:
+            if dataset not in self._fields:
+                raise KeyError(f"No rule was added for dataset {dataset}")
+            future = self._results.get(dataset)
+            should_execute = future is None
+            if future is None:
+                future = self._results[dataset] = Future()
+        if should_execute:
+            try:
+                future.set_result(self._execute_query(self.generate_query(dataset)))
+            except BaseException as error:
+                future.set_exception(error)
+        return future.result()
+
+    def get_results(
+        self, rule: SingleModelingRule, test_data_event_ids: List[str]
+    ) -> List[dict]:
+        """
+        Get the results of the verification query of a rule, executing the merged query of its dataset if needed.
+
+        Args:
+            rule (SingleModelingRule): Rule object that was added to the plan.
+            test_data_event_ids (List[str]): List of test data event IDs that were added with the rule.
+
+        Returns:
+            List[dict]: The results of the rule's events, without the fields queried only for other rules.
+        """
+        results = self._get_dataset_results(rule.dataset)
+        with self._lock:
+            if self._rules_count[rule.dataset] == 1:
+                # the query was not merged, there is nothing to demultiplex
+                return results
+            # the fields which were queried only for other rules of the dataset
+            other_rules_fields = set(self._fields[rule.dataset]) - set(rule.fields)
+        id_key = f"{rule.dataset}.test_data_event_id"
+        event_ids = set(test_data_event_ids)
+        return [
+            {
+                key: value
+                for key, value in result.items()
+                if key not in other_rules_fields
+            }
+            for result in results
+            if str(result.get(id_key)) in event_ids
+        ]
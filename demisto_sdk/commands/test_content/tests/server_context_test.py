@@ -1,7 +1,10 @@
+from threading import Barrier, Lock
+
 from demisto_sdk.commands.test_content.mock_server import MITMProxy
 from demisto_sdk.commands.test_content.TestContentClasses import (
     BuildContext,
     ServerContext,
+    TestContext,
 )
 from demisto_sdk.commands.test_content.tests.build_context_test import (
     generate_content_conf_json,
@@ -82,8 +85,8 @@ def test_execute_tests(mocker, tmp_path):
         assert test in server_context.executed_tests
 
     # Validating all queues were emptied
-    assert build_context.mockable_tests_to_run.all_tasks_done
-    assert build_context.unmockable_tests_to_run.all_tasks_done
+    assert build_context.mockable_tests_to_run.empty()
+    assert build_context.unmockable_tests_to_run.empty()
 
     # Validating no failed playbooks
     assert not build_context.tests_data_keeper.failed_playbooks
@@ -137,3 +140,249 @@ def generate_mocked_server_context(
     server_context = ServerContext(build_context, "1.1.1.1")
     server_context.proxy = mocker.MagicMock()
     return server_context
+
+
+class FakeLockStore:
+    def __init__(self, locked_by_other_build: set):
+        """
+        An in-process integrations lock store.
+        Args:
+            locked_by_other_build: Integrations which are locked by another build on the first lock attempt.
+        """
+        self.locked_by_other_build = set(locked_by_other_build)
+        self.locked: set = set()
+        self.lock_attempts: list = []
+
+    def lock(self, test_playbook) -> bool:
+        names = {integration.name for integration in test_playbook.integrations_to_lock}
+        self.lock_attempts.append(test_playbook.configuration.playbook_id)
+        if names & (self.locked_by_other_build | self.locked):
+            # the other build releases its lock after the first attempt
+            self.locked_by_other_build -= names
+            return False
+        self.locked |= names
+        return True
+
+    def unlock(self, test_playbook):
+        self.locked -= {
+            integration.name for integration in test_playbook.integrations_to_lock
+        }
+
+
+def test_execute_tests_with_locked_integrations(mocker, tmp_path):
+    """
+    Given:
+        - A ServerContext instance that should execute two unmockable tests
+        - The integration of the first test is locked by another build on the first lock attempt
+
+    When:
+        - Running execute_tests.
+
+    Then:
+        - Ensure the second test was executed while the first test was deferred
+        - Ensure the first test was executed after its integration was released
+        - Ensure the server's demisto client was reused for all the tests
+        - Ensure no fixed sleep round was used in order to wait for the lock
+    """
+    filtered_tests = [
+        "playbook_with_locked_integration",
+        "playbook_with_free_integration",
+    ]
+    tests = [
+        generate_test_configuration(
+            playbook_id="playbook_with_locked_integration",
+            integrations=["locked_integration"],
+        ),
+        generate_test_configuration(
+            playbook_id="playbook_with_free_integration",
+            integrations=["free_integration"],
+        ),
+    ]
+    integration_names = ["locked_integration", "free_integration"]
+    content_conf_json = generate_content_conf_json(
+        tests=tests,
+        unmockable_integrations={name: "reason" for name in integration_names},
+    )
+    secret_test_conf = generate_secret_conf_json(
+        [generate_integration_configuration(name) for name in integration_names]
+    )
+    build_context = get_mocked_build_context(
+        mocker,
+        tmp_path,
+        content_conf_json=content_conf_json,
+        secret_conf_json=secret_test_conf,
+        filtered_tests_content=filtered_tests,
+    )
+    build_context.unmockable_tests_to_run.lock_retry_interval = 0
+    mocked_demisto_client = DemistoClientMock(integrations=integration_names)
+    server_context = generate_mocked_server_context(
+        build_context, mocked_demisto_client, mocker
+    )
+    lock_store = FakeLockStore(locked_by_other_build={"locked_integration"})
+    mocker.patch(
+        "demisto_sdk.commands.test_content.IntegrationsLock.safe_lock_integrations",
+        side_effect=lock_store.lock,
+    )
+    mocker.patch(
+        "demisto_sdk.commands.test_content.IntegrationsLock.safe_unlock_integrations",
+        side_effect=lock_store.unlock,
+    )
+    configure_client = mocker.spy(server_context, "configure_new_client")
+    sleep = mocker.patch(
+        "demisto_sdk.commands.test_content.TestContentClasses.time.sleep"
+    )
+
+    server_context.execute_tests()
+
+    assert set(filtered_tests) <= server_context.executed_tests
+    assert lock_store.lock_attempts == [
+        "playbook_with_locked_integration",
+        "playbook_with_free_integration",
+        "playbook_with_locked_integration",
+    ]
+    assert not lock_store.locked
+    assert build_context.unmockable_tests_to_run.empty()
+    assert not build_context.tests_data_keeper.failed_playbooks
+    assert configure_client.call_count == 0
+    assert 30 not in [call.args[0] for call in sleep.call_args_list if call.args]
+
+
+def test_execute_tests_concurrently(mocker, tmp_path):
+    """
+    Given:
+        - A ServerContext instance that runs up to 3 tests in parallel
+        - Four unmockable tests, two of them use the same integration
+
+    When:
+        - Running execute_tests.
+
+    Then:
+        - Ensure all tests were executed
+        - Ensure tests were executed in parallel
+        - Ensure the tests that use the same integration were never executed together
+    """
+    tests = [
+        generate_test_configuration(
+            playbook_id=f"playbook_{i}", integrations=[integration]
+        )
+        for i, integration in enumerate(
+            [
+                "shared_integration",
+                "shared_integration",
+                "integration_a",
+                "integration_b",
+            ]
+        )
+    ]
+    filtered_tests = [test["playbookID"] for test in tests]
+    integration_names = ["shared_integration", "integration_a", "integration_b"]
+    content_conf_json = generate_content_conf_json(
+        tests=tests,
+        unmockable_integrations={name: "reason" for name in integration_names},
+    )
+    secret_test_conf = generate_secret_conf_json(
+        [generate_integration_configuration(name) for name in integration_names]
+    )
+    build_context = get_mocked_build_context(
+        mocker,
+        tmp_path,
+        content_conf_json=content_conf_json,
+        secret_conf_json=secret_test_conf,
+        filtered_tests_content=filtered_tests,
+    )
+    server_context = generate_mocked_server_context(
+        build_context, DemistoClientMock(integrations=integration_names), mocker
+    )
+    server_context.max_concurrent_tests = 3
+
+    running: set = set()
+    max_running = []
+    overlaps = []
+    lock = Lock()
+    all_started = Barrier(3, timeout=5)
+
+    def execute_test(test_context, proxy=None):
+        playbook_id = test_context.playbook.configuration.playbook_id
+        with lock:
+            running.add(playbook_id)
+            max_running.append(len(running))
+            if {"playbook_0", "playbook_1"} <= running:
+                overlaps.append(set(running))
+        if playbook_id in {"playbook_0", "playbook_2", "playbook_3"}:
+            # the three non-conflicting tests are expected to run together
+            all_started.wait()
+        with lock:
+            running.discard(playbook_id)
+        return True
+
+    mocker.patch.object(TestContext, "execute_test", execute_test)
+
+    server_context.execute_tests()
+
+    assert set(filtered_tests) <= server_context.executed_tests
+    assert max(max_running) == 3
+    assert not overlaps
+    assert build_context.unmockable_tests_to_run.empty()
+
+
+def test_configure_new_client_while_tests_run_concurrently(mocker, tmp_path):
+    """
+    Given:
+        - A ServerContext instance that runs 2 tests in parallel
+        - Both tests fail to authenticate with the shared client at the same time
+
+    When:
+        - Running execute_tests.
+
+    Then:
+        - Ensure a single new client was created for both tests
+        - Ensure the shared client was not closed while the tests were running, and was closed after they were done
+    """
+    tests = [
+        generate_test_configuration(
+            playbook_id=f"playbook_{i}", integrations=[f"integration_{i}"]
+        )
+        for i in range(2)
+    ]
+    integration_names = ["integration_0", "integration_1"]
+    build_context = get_mocked_build_context(
+        mocker,
+        tmp_path,
+        content_conf_json=generate_content_conf_json(
+            tests=tests,
+            unmockable_integrations={name: "reason" for name in integration_names},
+        ),
+        secret_conf_json=generate_secret_conf_json(
+            [generate_integration_configuration(name) for name in integration_names]
+        ),
+        filtered_tests_content=[test["playbookID"] for test in tests],
+    )
+    mocked_demisto_client = DemistoClientMock(integrations=integration_names)
+    server_context = generate_mocked_server_context(
+        build_context, mocked_demisto_client, mocker
+    )
+    server_context.max_concurrent_tests = 2
+    shared_client = server_context.client
+    new_client = mocker.MagicMock()
+    configure = mocker.patch.object(
+        mocked_demisto_client, "configure", return_value=new_client
+    )
+    close_client = mocker.patch.object(ServerContext, "_close_client")
+    both_failed = Barrier(2, timeout=5)
+    closed_while_running = []
+
+    def execute_test(test_context, proxy=None):
+        both_failed.wait()
+        server_context.configure_new_client(stale_client=test_context.client)
+        both_failed.wait()
+        closed_while_running.append(close_client.called)
+        return True
+
+    mocker.patch.object(TestContext, "execute_test", execute_test)
+
+    server_context.execute_tests()
+
+    assert closed_while_running == [False, False]
+    assert configure.call_count == 1
+    assert server_context.client is new_client
+    close_client.assert_called_once_with(shared_client)
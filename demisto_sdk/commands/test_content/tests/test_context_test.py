@@ -1109,3 +1109,52 @@ def test_replacing_pb_inputs_fails_with_build_fail(
             new_configuration, Version(version)
         )
     assert expected_error in str(e)
+
+
+def test_poll_for_playbook_state_with_batched_poll(mocker, playbook):
+    """
+    Given:
+        - A test running concurrently with other tests on the server, whose playbook states are polled in batch
+        - The batched poll never detects the end of the playbook run, as it ends in a state the poll does not know
+
+    When:
+        - Polling for the playbook state
+
+    Then:
+        - Ensure the batched poll is waited for a bounded time on each round
+        - Ensure the state of the playbook is checked by the test after each round, until it ends
+    """
+    from concurrent.futures import Future
+
+    mocker.patch(
+        "demisto_sdk.commands.test_content.TestContentClasses.BATCHED_PLAYBOOK_STATE_MAX_WAIT",
+        0.01,
+    )
+    mocker.patch(
+        "demisto_sdk.commands.test_content.TestContentClasses.INITIAL_POLLING_INTERVAL",
+        0.01,
+    )
+    server_context = mocker.MagicMock()
+    incidents_poller = server_context.incidents_poller
+    incidents_poller.interval = 0
+    # the batched poll never resolves the watches
+    incidents_poller.watch_playbook.side_effect = lambda *_, **__: Future()
+    test_context = TestContext(
+        build_context=mocker.MagicMock(),
+        playbook=playbook,
+        client=mocker.MagicMock(),
+        server_context=server_context,
+    )
+    test_context.incident_id = "1"
+    mocker.patch.object(
+        test_context,
+        "_get_investigation_playbook_state",
+        side_effect=[PB_Status.IN_PROGRESS, PB_Status.NOT_SUPPORTED_VERSION],
+    )
+
+    assert test_context._poll_for_playbook_state() == PB_Status.NOT_SUPPORTED_VERSION
+    assert incidents_poller.watch_playbook.call_count == 2
+    assert all(
+        call.kwargs["timeout"] == 0.01
+        for call in incidents_poller.watch_playbook.call_args_list
+    )
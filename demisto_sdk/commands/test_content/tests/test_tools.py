@@ -1,7 +1,11 @@
+from itertools import islice
 from subprocess import CalledProcessError
 
 from demisto_sdk.commands.test_content.constants import SSH_USER
-from demisto_sdk.commands.test_content.tools import is_redhat_instance
+from demisto_sdk.commands.test_content.tools import (
+    backoff_intervals,
+    is_redhat_instance,
+)
 
 
 def raise_exception():
@@ -20,3 +24,15 @@ def test_is_redhat_instance_positive(mocker):
 def test_is_redhat_instance_negative(mocker):
     mocker.patch("subprocess.check_output", side_effect=raise_exception)
     assert not is_redhat_instance("instance_ip")
+
+
+def test_backoff_intervals():
+    """
+    Given:
+        - An initial interval of 1 second and a maximal interval of 10 seconds
+    When:
+        - Generating polling intervals
+    Then:
+        - Ensure the intervals are doubled until they reach the maximal interval
+    """
+    assert list(islice(backoff_intervals(1, 10), 6)) == [1, 2, 4, 8, 10, 10]
@@ -0,0 +1,137 @@
+from threading import Thread
+from types import SimpleNamespace
+
+from demisto_sdk.commands.test_content.TestsScheduler import TestsScheduler
+
+
+def generate_test_playbook(name: str, integrations: list = None):
+    return SimpleNamespace(
+        name=name,
+        integrations_to_lock=[
+            SimpleNamespace(name=integration) for integration in integrations or []
+        ],
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_tests_by_insertion_order():
+    """
+    Given:
+        - A scheduler with three tests that do not share integrations
+    When:
+        - Getting tests from the scheduler
+    Then:
+        - Ensure the tests are returned in insertion order
+        - Ensure None is returned once all tests are done
+    """
+    tests = [
+        generate_test_playbook(f"test_{i}", [f"integration_{i}"]) for i in range(3)
+    ]
+    scheduler = TestsScheduler(tests)
+    for test in tests:
+        assert scheduler.get() is test
+        scheduler.task_done(test)
+    assert scheduler.get() is None
+    assert scheduler.empty()
+
+
+def test_get_skips_tests_with_busy_integrations():
+    """
+    Given:
+        - A scheduler with two tests using the same integration, followed by a test using another integration
+    When:
+        - Getting tests while the first test is running
+    Then:
+        - Ensure the second test is skipped in favor of the third one
+        - Ensure the second test is returned once the first test is done
+    """
+    first = generate_test_playbook("first", ["shared"])
+    second = generate_test_playbook("second", ["shared"])
+    third = generate_test_playbook("third", ["other"])
+    scheduler = TestsScheduler([first, second, third])
+
+    assert scheduler.get() is first
+    assert scheduler.get() is third
+    assert scheduler.get(timeout=0) is None
+    scheduler.task_done(first)
+    assert scheduler.get(timeout=0) is second
+
+
+def test_not_executed_test_is_deferred():
+    """
+    Given:
+        - A scheduler with two tests, where the first one could not lock its integrations
+    When:
+        - Reporting the first test as not executed
+    Then:
+        - Ensure the second test is scheduled first
+        - Ensure the first test is not scheduled before the retry interval has passed
+    """
+    clock = FakeClock()
+    first = generate_test_playbook("first", ["locked"])
+    second = generate_test_playbook("second")
+    scheduler = TestsScheduler([first, second], lock_retry_interval=30, clock=clock)
+
+    assert scheduler.get() is first
+    scheduler.task_done(first, executed=False)
+    assert scheduler.get(timeout=0) is second
+    scheduler.task_done(second)
+    assert scheduler.get(timeout=0) is None
+    clock.now = 30
+    assert scheduler.get(timeout=0) is first
+
+
+def test_get_blocks_until_running_test_is_done():
+    """
+    Given:
+        - A scheduler with two tests sharing an integration, where the first one is running
+    When:
+        - Another thread waits for the next test
+    Then:
+        - Ensure the waiting thread gets the second test once the first test is done
+    """
+    first = generate_test_playbook("first", ["shared"])
+    second = generate_test_playbook("second", ["shared"])
+    scheduler = TestsScheduler([first, second])
+    assert scheduler.get() is first
+
+    results = []
+    consumer = Thread(target=lambda: results.append(scheduler.get(timeout=5)))
+    consumer.start()
+    scheduler.task_done(first)
+    consumer.join()
+    assert results == [second]
+
+
+def test_get_respects_consumer_predicate():
+    """
+    Given:
+        - A scheduler with two tests which the consumer can not run together, followed by a third test
+    When:
+        - The consumer gets tests while the first test is running
+    Then:
+        - Ensure the conflicting test is skipped for the consumer but not for other consumers
+        - Ensure the conflicting test is returned to the consumer once its running test is done
+    """
+    first = generate_test_playbook("first")
+    second = generate_test_playbook("second")
+    third = generate_test_playbook("third")
+    scheduler = TestsScheduler([first, second, third])
+
+    def can_run(test_playbook, running_tests):
+        return not (
+            test_playbook is second and any(test is first for test in running_tests)
+        )
+
+    assert scheduler.get(consumer="server", can_run=can_run) is first
+    assert scheduler.get(consumer="server", can_run=can_run) is third
+    assert scheduler.get(timeout=0, consumer="server", can_run=can_run) is None
+    scheduler.task_done(first, consumer="server")
+    assert scheduler.get(timeout=0, consumer="server", can_run=can_run) is second
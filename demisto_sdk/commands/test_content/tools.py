@@ -2,7 +2,7 @@ import ast
 from copy import deepcopy
 from pprint import pformat
 from subprocess import STDOUT, CalledProcessError, check_output
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, Optional, Set
 
 import demisto_client
 
@@ -101,3 +101,23 @@ def get_ui_url(client_host):
 
     """
     return client_host.replace("https://api-", "https://")
+
+
+def backoff_intervals(
+    initial: float, maximum: float, factor: float = 2
+) -> Iterator[float]:
+    """
+    Generates polling intervals which grow exponentially from 'initial' up to 'maximum'.
+    Quick operations are detected fast, while long-running operations are not polled more than necessary.
+    Args:
+        initial: The first interval, in seconds
+        maximum: The maximal interval, in seconds
+        factor: The multiplication factor between two consecutive intervals
+
+    Yields:
+        The next interval to sleep, in seconds
+    """
+    interval = min(initial, maximum)
+    while True:
+        yield interval
+        interval = min(interval * factor, maximum)
@@ -1,7 +1,9 @@
 import logging
+from threading import Barrier
 
 import pytest
 
+from demisto_sdk.commands.update_release_notes.update_rn import MainBranchPrefetch
 from demisto_sdk.commands.update_release_notes.update_rn_manager import (
     UpdateReleaseNotesManager,
 )
@@ -133,6 +135,39 @@ class TestUpdateRNManager:
                 in err.call_args[0][0]
             )
 
+    def test_create_release_notes_concurrently(self, mocker):
+        """
+        Given:
+            - Two changed packs, and a manager which updates two packs concurrently.
+        When:
+            - create_release_notes is called.
+        Then:
+            - Ensure the main branch data of the packs was prefetched once, and passed to both packs.
+            - Ensure the release notes of both packs were created concurrently.
+        """
+        mng = UpdateReleaseNotesManager(workers=2)
+        mng.changed_packs_from_git = {"test1", "test2"}
+        prefetch = mocker.patch.object(MainBranchPrefetch, "create")
+        both_packs_started = Barrier(2, timeout=5)
+
+        def create_pack_release_notes(pack, *args, **kwargs):
+            assert kwargs["prefetch"] is prefetch.return_value
+            both_packs_started.wait()
+
+        mock_func = mocker.patch.object(
+            UpdateReleaseNotesManager,
+            "create_pack_release_notes",
+            side_effect=create_pack_release_notes,
+        )
+
+        mng.create_release_notes(set(), set(), set())
+
+        assert prefetch.call_count == 1
+        assert {call.args[0] for call in mock_func.call_args_list} == {
+            "test1",
+            "test2",
+        }
+
     def test_create_pack_release_notes_pack_success(self, mocker):
         """
         Given:
@@ -2144,6 +2144,83 @@ class TestRNUpdateUnit:
         )
         assert execute_update_mock.call_count == 1
 
+    def test_update_api_modules_dependents_rn__integrations_of_same_pack(self, mocker):
+        """
+        Given
+        - An API module used by two integrations of the same pack, and by an integration of another pack.
+
+        When
+        - update_api_modules_rn is called with several workers
+
+        Then
+        - Ensure the integrations of the same pack are updated one after the other, in a single task
+        - Ensure both packs are returned as updated
+        """
+        import threading
+
+        from demisto_sdk.commands.update_release_notes.update_rn import (
+            MainBranchPrefetch,
+            UpdateRN,
+            update_api_modules_dependents_rn,
+        )
+
+        modified = {"/Packs/ApiModules/Scripts/ApiModules_script/ApiModules_script.yml"}
+        integrations = [
+            mocker.MagicMock(pack_id=pack_id, path=f"Packs/{pack_id}/{name}.yml")
+            for pack_id, name in (
+                ("PackA", "First"),
+                ("PackB", "Other"),
+                ("PackA", "Second"),
+            )
+        ]
+        mocker.patch.object(ContentGraphInterface, "__init__", return_value=None)
+        mocker.patch.object(ContentGraphInterface, "__exit__", return_value=None)
+        mocker.patch(
+            "demisto_sdk.commands.update_release_notes.update_rn.update_content_graph",
+            return_value=None,
+        )
+        mocker.patch(
+            "demisto_sdk.commands.update_release_notes.update_rn.get_api_module_dependencies_from_graph",
+            return_value=integrations,
+        )
+        mocker.patch.object(MainBranchPrefetch, "create", return_value=None)
+        updates = []
+
+        def init(update_rn, pack, modified_files_in_pack, **kwargs):
+            update_rn.pack = pack
+            update_rn.modified_files_in_pack = modified_files_in_pack
+
+        def execute_update(update_rn):
+            updates.append(
+                (
+                    update_rn.pack,
+                    update_rn.modified_files_in_pack,
+                    threading.get_ident(),
+                )
+            )
+            return True
+
+        mocker.patch.object(UpdateRN, "__init__", autospec=True, side_effect=init)
+        mocker.patch.object(
+            UpdateRN, "execute_update", autospec=True, side_effect=execute_update
+        )
+
+        updated_packs = update_api_modules_dependents_rn(
+            pre_release=None,
+            update_type=None,
+            added=set(),
+            modified=modified,
+            workers=3,
+        )
+
+        assert updated_packs == {"PackA", "PackB"}
+        pack_a_updates = [update for update in updates if update[0] == "PackA"]
+        assert [update[1] for update in pack_a_updates] == [
+            {"Packs/PackA/First.yml"},
+            {"Packs/PackA/Second.yml"},
+        ]
+        assert pack_a_updates[0][2] == pack_a_updates[1][2]
+
     def test_update_docker_image_when_yml_has_changed_but_not_docker_image_property(
         self, mocker
     ):
@@ -2955,3 +3032,101 @@ def test_git_add_release_notes(mocker):
     assert Path(filepath).exists()
     Path(filepath).unlink()
     assert not Path(filepath).exists()
+
+
+def test_prefetch_docker_images_with_a_single_git_diff(mocker):
+    """
+    Given:
+        - Three modified yml files, the docker image of one of them was changed
+    When:
+        - Prefetching the docker image changes of the files
+    Then:
+        - Ensure a single git diff command was executed for all the files
+        - Ensure the changed docker image was extracted only for its file
+    """
+    from demisto_sdk.commands.update_release_notes.update_rn import (
+        MainBranchPrefetch,
+    )
+
+    diff = "\n".join(
+        [
+            "diff --git a/Packs/A/Integrations/A/A.yml b/Packs/A/Integrations/A/A.yml",
+            "--- a/Packs/A/Integrations/A/A.yml",
+            "+++ b/Packs/A/Integrations/A/A.yml",
+            "-  dockerimage: demisto/python3:3.10.1.1",
+            "+  dockerimage: demisto/python3:3.10.1.2",
+            "diff --git a/Packs/B/Scripts/B/B.yml b/Packs/B/Scripts/B/B.yml",
+            "--- a/Packs/B/Scripts/B/B.yml",
+            "+++ b/Packs/B/Scripts/B/B.yml",
+            "-comment: old",
+            "+comment: new",
+        ]
+    )
+    run_command = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.run_command",
+        return_value=diff,
+    )
+    prefetch = MainBranchPrefetch("master")
+
+    prefetch.prefetch_docker_images(
+        [
+            UpdateRN.CONTENT_PATH / "Packs/A/Integrations/A/A.yml",
+            "Packs/B/Scripts/B/B.yml",
+            "Packs/C/Scripts/C/C.yml",
+            "Packs/C/pack_metadata.json",
+        ]
+    )
+
+    assert run_command.call_count == 1
+    assert prefetch.get_docker_image(
+        str(UpdateRN.CONTENT_PATH / "Packs/A/Integrations/A/A.yml")
+    ) == (True, "demisto/python3:3.10.1.2")
+    assert prefetch.get_docker_image("Packs/B/Scripts/B/B.yml") == (True, None)
+    assert prefetch.get_docker_image("Packs/C/Scripts/C/C.yml") == (True, None)
+    assert prefetch.get_docker_image("Packs/D/Scripts/D/D.yml") == (False, None)
+
+
+def test_update_rn_uses_prefetched_main_branch_data(mocker):
+    """
+    Given:
+        - Prefetched main branch data of a pack
+    When:
+        - Creating an UpdateRN of the pack and checking its docker image change
+    Then:
+        - Ensure the master version and the docker image were taken from the prefetched data, without git commands
+    """
+    from demisto_sdk.commands.update_release_notes.update_rn import (
+        MainBranchPrefetch,
+    )
+
+    mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.Content.git_util"
+    ).return_value.handle_prev_ver.return_value = ("origin", "master")
+    get_remote_file = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.get_remote_file"
+    )
+    run_command = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.run_command"
+    )
+    prefetch = MainBranchPrefetch("master")
+    prefetch.master_metadata["Packs/HelloWorld/pack_metadata.json"] = {
+        "currentVersion": "1.2.3"
+    }
+    yml_path = "Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.yml"
+    prefetch.docker_images[yml_path] = "demisto/python3:3.10.1.2"
+
+    update_rn = UpdateRN(
+        pack_path="Packs/HelloWorld",
+        update_type="minor",
+        modified_files_in_pack={yml_path},
+        added_files=set(),
+        prefetch=prefetch,
+    )
+
+    assert update_rn.master_version == "1.2.3"
+    assert (
+        update_rn.get_docker_image_changed(str(UpdateRN.CONTENT_PATH / yml_path))
+        == "demisto/python3:3.10.1.2"
+    )
+    assert not get_remote_file.called
+    assert not run_command.called
@@ -5,13 +5,16 @@ import copy
 import errno
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable, Optional, Tuple, Union
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from packaging.version import Version
 
 from demisto_sdk.commands.common.constants import (
     ALL_FILES_VALIDATION_IGNORE_WHITELIST,
+    DEMISTO_GIT_UPSTREAM,
     DEPRECATED_DESC_REGEX,
     DEPRECATED_NO_REPLACE_DESC_REGEX,
     EVENT_COLLECTOR,
@@ -60,6 +63,145 @@ CLASS_BY_FILE_TYPE = {
     FileType.PLAYBOOK: Playbook,
 }
 
+# the maximal number of files passed to a single `git diff` command
+MAX_FILES_PER_GIT_DIFF = 200
+
+# packs can be updated concurrently, while git does not allow concurrent changes of the index
+GIT_INDEX_LOCK = Lock()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], workers: int
+) -> List[R]:
+    """
+    Applies a function on all the items, in a thread pool if more than a single worker is requested.
+
+    Args:
+        func: the function to apply
+        items: the items to apply the function on
+        workers: the maximal number of items to process concurrently
+
+    Returns:
+        List: the results, in the order of the items
+    """
+    if workers <= 1:
+        return list(map(func, items))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="update-release-notes"
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+def _content_relative_path(path: Union[str, Path]) -> str:
+    path = Path(path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(UpdateRN.CONTENT_PATH)
+        except ValueError:
+            pass
+    return path.as_posix()
+
+
+class MainBranchPrefetch:
+    """
+    The pack metadata files and the docker image changes of many packs against the main branch, read in batch.
+
+    The pack metadata files are read through the git object reader, which lists the main branch tree once and reads
+    all the files through a single `git cat-file --batch` process, and the docker image changes of all the yml files
+    are extracted from a single `git diff` command.
+    Files which could not be prefetched are read separately by UpdateRN, as before.
+    """
+
+    def __init__(self, main_branch: str):
+        self.main_branch = main_branch
+        self.master_metadata: Dict[str, dict] = {}
+        self.docker_images: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def create(
+        cls, pack_paths: Iterable[str], yml_files: Iterable[Union[str, Path]]
+    ) -> Optional["MainBranchPrefetch"]:
+        """
+        Prefetch the main branch data of many packs.
+
+        Args:
+            pack_paths: the paths of the packs to read the main branch metadata of
+            yml_files: the yml files to check whether their docker image was changed
+
+        Returns:
+            MainBranchPrefetch: the prefetched data, or None if it could not be prefetched.
+        """
+        try:
+            prefetch = cls(Content.git_util().handle_prev_ver()[1])
+            prefetch.prefetch_master_metadata(pack_paths)
+            prefetch.prefetch_docker_images(yml_files)
+            return prefetch
+        except Exception as e:
+            logger.debug(f"Could not prefetch the main branch data of the packs: {e}")
+            return None
+
+    def prefetch_master_metadata(self, pack_paths: Iterable[str]):
+        git_util = Content.git_util()
+        tag = self.main_branch.replace(f"{DEMISTO_GIT_UPSTREAM}/", "").replace(
+            "demisto/", ""
+        )
+        commits: Dict[str, str] = {}
+        for pack_path in pack_paths:
+            metadata_path = _content_relative_path(
+                os.path.join(pack_path, "pack_metadata.json")
+            )
+            rev, _, git_path = git_util.get_local_remote_file_path(
+                metadata_path, tag
+            ).partition(":")
+            try:
+                if rev not in commits:
+                    commits[rev] = git_util.repo.commit(rev).hexsha
+                content = git_util.object_reader.read_file(commits[rev], git_path)
+                if content:
+                    self.master_metadata[metadata_path] = json.loads(content)
+            except Exception as e:
+                logger.debug(f"Could not prefetch {metadata_path} from {rev}: {e}")
+
+    def prefetch_docker_images(self, yml_files: Iterable[Union[str, Path]]):
+        files = sorted(
+            {
+                _content_relative_path(file)
+                for file in yml_files
+                if str(file).endswith(".yml")
+            }
+        )
+        for start in range(0, len(files), MAX_FILES_PER_GIT_DIFF):
+            chunk = files[start : start + MAX_FILES_PER_GIT_DIFF]
+            try:
+                diff = run_command(
+                    f"git diff {self.main_branch} -- "
+                    + " ".join(str(UpdateRN.CONTENT_PATH / file) for file in chunk),
+                    exit_on_error=False,
+                )
+            except RuntimeError as e:
+                logger.debug(f"Could not prefetch the docker image changes: {e}")
+                continue
+            diffs = split_diff_by_file(diff)
+            for file in chunk:
+                self.docker_images[file] = get_docker_image_from_diff(
+                    diffs.get(file, "")
+                )
+
+    def get_master_metadata(self, metadata_path: str) -> Optional[dict]:
+        """The main branch metadata of a pack, or None if it was not prefetched."""
+        return self.master_metadata.get(_content_relative_path(metadata_path))
+
+    def get_docker_image(self, packfile: str) -> Tuple[bool, Optional[str]]:
+        """
+        Returns:
+            Tuple[bool, Optional[str]]: whether the file was prefetched, and its new docker image if it was changed.
+        """
+        file = _content_relative_path(packfile)
+        return file in self.docker_images, self.docker_images.get(file)
+
 
 def get_deprecated_comment_from_desc(description: str) -> str:
     """
@@ -145,6 +287,7 @@ class UpdateRN:
         existing_rn_version_path: str = "",
         is_force: bool = False,
         is_bc: bool = False,
+        prefetch: Optional[MainBranchPrefetch] = None,
     ):
         self.pack = pack if pack else get_pack_name(pack_path)
         self.update_type = update_type
@@ -174,6 +317,7 @@ class UpdateRN:
         git_util = Content.git_util()
         self.main_branch = git_util.handle_prev_ver()[1]
         self.metadata_path = os.path.join(self.pack_path, "pack_metadata.json")
+        self.prefetch = prefetch
         self.master_version = self.get_master_version()
         self.rn_path = ""
         self.is_bc = is_bc
@@ -264,8 +408,8 @@ class UpdateRN:
                 in [FileType.INTEGRATION, FileType.BETA_INTEGRATION, FileType.SCRIPT]
                 and packfile not in self.added_files
             ):
-                docker_image_name: Optional[str] = check_docker_image_changed(
-                    main_branch=self.main_branch, packfile=packfile
+                docker_image_name: Optional[str] = self.get_docker_image_changed(
+                    packfile
                 )
             else:
                 docker_image_name = None
@@ -282,6 +426,15 @@ class UpdateRN:
         self.pack_metadata_only = (not changed_files) and self.pack_metadata_only
         return self.create_pack_rn(rn_path, changed_files, new_metadata, new_version)
 
+    def get_docker_image_changed(self, packfile: str) -> Optional[str]:
+        if self.prefetch:
+            prefetched, docker_image = self.prefetch.get_docker_image(packfile)
+            if prefetched:
+                return docker_image
+        return check_docker_image_changed(
+            main_branch=self.main_branch, packfile=packfile
+        )
+
     def create_pack_rn(
         self, rn_path: str, changed_files: dict, new_metadata: dict, new_version: str
     ) -> bool:
@@ -423,7 +576,12 @@ class UpdateRN:
         master_current_version = "0.0.0"
         master_metadata = None
         try:
-            master_metadata = get_remote_file(self.metadata_path, tag=self.main_branch)
+            if self.prefetch:
+                master_metadata = self.prefetch.get_master_metadata(self.metadata_path)
+            if master_metadata is None:
+                master_metadata = get_remote_file(
+                    self.metadata_path, tag=self.main_branch
+                )
         except Exception:
             logger.exception(
                 f"[red]Failed fetching {self.metadata_path} from remote master branch."
@@ -645,7 +803,8 @@ class UpdateRN:
                     f"[green]Updated pack metadata version at path : {self.metadata_path}[/green]"
                 )
             try:
-                run_command(f"git add {self.metadata_path}", exit_on_error=False)
+                with GIT_INDEX_LOCK:
+                    run_command(f"git add {self.metadata_path}", exit_on_error=False)
             except RuntimeError:
                 logger.error(f"[red]Failed git-adding {self.metadata_path}[/red]")
 
@@ -938,7 +1097,8 @@ class UpdateRN:
             with open(release_notes_path, "w") as fp:
                 fp.write(rn_string)
         try:
-            run_command(f"git add {release_notes_path}", exit_on_error=False)
+            with GIT_INDEX_LOCK:
+                run_command(f"git add {release_notes_path}", exit_on_error=False)
         except RuntimeError:
             logger.warning(
                 f"Could not add the release note files to git: {release_notes_path}"
@@ -1028,6 +1188,7 @@ def update_api_modules_dependents_rn(
     added: Iterable[str],
     modified: Iterable[str],
     text: str = "",
+    workers: int = 1,
 ) -> set:
     """Updates release notes for any pack that depends on API module that has changed.
     :param
@@ -1037,6 +1198,7 @@ def update_api_modules_dependents_rn(
         modified: The modified files
         id_set_path: The id set path
         text: Text to add to the release notes files
+        workers: The maximal number of dependent packs to update concurrently
 
     :rtype: ``set``
     :return
@@ -1054,22 +1216,39 @@ def update_api_modules_dependents_rn(
         integrations = get_api_module_dependencies_from_graph(api_module_set, graph)
         if integrations:
             logger.info("Executing update-release-notes on those as well.")
+        prefetch = MainBranchPrefetch.create(
+            pack_paths={
+                pack_name_to_path(integration.pack_id) for integration in integrations
+            },
+            yml_files=[integration.path for integration in integrations],
+        )
+
+        # the integrations of a pack bump the same pack metadata and release notes, so they are updated one by one
+        pack_to_integrations: Dict[str, list] = {}
         for integration in integrations:
-            integration_pack_name = integration.pack_id
-            integration_path = integration.path
-            integration_pack_path = pack_name_to_path(integration_pack_name)
-            update_pack_rn = UpdateRN(
-                pack_path=integration_pack_path,
-                update_type=update_type,
-                modified_files_in_pack={integration_path},
-                pre_release=pre_release,
-                added_files=set(),
-                pack=integration_pack_name,
-                text=text,
-            )
-            updated = update_pack_rn.execute_update()
-            if updated:
-                total_updated_packs.add(integration_pack_name)
+            pack_to_integrations.setdefault(integration.pack_id, []).append(integration)
+
+        def update_dependent_pack_rn(pack_name: str) -> Optional[str]:
+            updated = False
+            for integration in pack_to_integrations[pack_name]:
+                update_pack_rn = UpdateRN(
+                    pack_path=pack_name_to_path(pack_name),
+                    update_type=update_type,
+                    modified_files_in_pack={integration.path},
+                    pre_release=pre_release,
+                    added_files=set(),
+                    pack=pack_name,
+                    text=text,
+                    prefetch=prefetch,
+                )
+                updated = update_pack_rn.execute_update() or updated
+            return pack_name if updated else None
+
+        for updated_pack in map_concurrently(
+            update_dependent_pack_rn, pack_to_integrations, workers
+        ):
+            if updated_pack:
+                total_updated_packs.add(updated_pack)
         return total_updated_packs
 
 
@@ -1095,16 +1274,49 @@ def check_docker_image_changed(main_branch: str, packfile: str) -> Optional[str]
             )
             return None
     else:
-        diff_lines = diff.splitlines()
-        for diff_line in diff_lines:
-            if (
-                "dockerimage:" in diff_line
-            ):  # search whether exists a line that notes that the Docker image was
-                # changed.
-                split_line = diff_line.split()
-                if split_line[0].startswith("+"):
-                    return split_line[-1]
-        return None
+        return get_docker_image_from_diff(diff)
+
+
+def get_docker_image_from_diff(diff: str) -> Optional[str]:
+    """Gets the new docker image from the git diff of a yml file.
+
+    :param
+        diff: The git diff of the yml file
+
+    :rtype: ``Optional[str]``
+    :return
+    The latest docker image if it was changed
+    """
+    diff_lines = diff.splitlines()
+    for diff_line in diff_lines:
+        if (
+            "dockerimage:" in diff_line
+        ):  # search whether exists a line that notes that the Docker image was
+            # changed.
+            split_line = diff_line.split()
+            if split_line[0].startswith("+"):
+                return split_line[-1]
+    return None
+
+
+def split_diff_by_file(diff: str) -> Dict[str, str]:
+    """Splits the output of a `git diff` command of many files into the diff of each file.
+
+    :param
+        diff: The output of the git diff command
+
+    :rtype: ``Dict[str, str]``
+    :return
+    The diff of each file, by the file path relative to the repository root
+    """
+    diffs: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in diff.splitlines():
+        if match := re.match(r"^diff --git a/.* b/(.*)$", line):
+            current = diffs.setdefault(match.group(1), [])
+        if current is not None:
+            current.append(line)
+    return {file: "\n".join(lines) for file, lines in diffs.items()}
 
 
 def get_from_version_at_update_rn(path: str) -> Optional[str]:
@@ -18,7 +18,9 @@ from demisto_sdk.commands.common.tools import (
     suppress_stdout,
 )
 from demisto_sdk.commands.update_release_notes.update_rn import (
+    MainBranchPrefetch,
     UpdateRN,
+    map_concurrently,
     update_api_modules_dependents_rn,
 )
 from demisto_sdk.commands.validate.old_validate_manager import OldValidateManager
@@ -37,6 +39,7 @@ class UpdateReleaseNotesManager:
         prev_ver: Optional[str] = None,
         is_force: bool = False,
         is_bc: bool = False,
+        workers: int = 1,
     ):
         self.given_pack = user_input
         self.changed_packs_from_git: set = set()
@@ -56,6 +59,8 @@ class UpdateReleaseNotesManager:
             raise ValueError("Please remove the -g flag when specifying only one pack.")
         self.rn_path: list = list()
         self.is_bc = is_bc
+        # the number of packs to update concurrently
+        self.workers = workers
 
     def manage_rn_update(self):
         """
@@ -240,6 +245,7 @@ class UpdateReleaseNotesManager:
                 added_files,
                 modified_files,
                 self.text,
+                workers=self.workers,
             )
             self.total_updated_packs = self.total_updated_packs.union(updated_packs)
 
@@ -269,17 +275,28 @@ class UpdateReleaseNotesManager:
             )
 
         elif self.changed_packs_from_git:  # update all changed packs
-            for pack in self.changed_packs_from_git:
-                if (
-                    API_MODULES_PACK in pack
-                ):  # We already handled Api Modules so we can skip it.
-                    continue
-                self.create_pack_release_notes(
+            # We already handled Api Modules so we can skip it.
+            packs = [
+                pack
+                for pack in self.changed_packs_from_git
+                if API_MODULES_PACK not in pack
+            ]
+            # read the main branch data of all the packs at once, instead of once per pack
+            prefetch = MainBranchPrefetch.create(
+                pack_paths=[pack_name_to_path(pack) for pack in packs],
+                yml_files=filtered_modified_files.union(old_format_files),
+            )
+            map_concurrently(
+                lambda pack: self.create_pack_release_notes(
                     pack,
                     filtered_modified_files,
                     filtered_added_files,
                     old_format_files,
-                )
+                    prefetch=prefetch,
+                ),
+                packs,
+                self.workers,
+            )
         else:
             logger.info(
                 "[yellow]No changes that require release notes were detected. If such changes were made, "
@@ -292,6 +309,7 @@ class UpdateReleaseNotesManager:
         filtered_modified_files: set,
         filtered_added_files: set,
         old_format_files: set,
+        prefetch: Optional[MainBranchPrefetch] = None,
     ):
         """Creates the release notes for a given pack if was changed.
 
@@ -300,6 +318,7 @@ class UpdateReleaseNotesManager:
             filtered_modified_files: A set of filtered modified files
             filtered_added_files: A set of filtered added files
             old_format_files: A set of old formatted files
+            prefetch: The main branch data of the changed packs, if was read in advance
         """
         existing_rn_version = self.get_existing_rn(pack)
         if (
@@ -328,6 +347,7 @@ class UpdateReleaseNotesManager:
                 is_force=self.is_force,
                 existing_rn_version_path=existing_rn_version,
                 is_bc=self.is_bc,
+                prefetch=prefetch,
             )
             updated = update_pack_rn.execute_update()
             self.rn_path.append(update_pack_rn.rn_path)
@@ -1,8 +1,14 @@
 from pathlib import Path
 from typing import List, Set
 
+from demisto_sdk.commands.common.docker.docker_image_resolver import (
+    DockerImageResolver,
+)
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.objects.integration_script import (
+    IntegrationScript,
+)
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
@@ -19,6 +25,10 @@ from demisto_sdk.commands.validate.validators.base_validator import (
     get_all_validators,
 )
 
+# the docker hub metadata needed by the docker validators, resolved for all the content items at once
+DOCKER_TAG_METADATA_VALIDATORS = {"DO103", "DO106"}
+DOCKER_LATEST_TAG_VALIDATORS = {"DO106"}
+
 
 class ValidateManager:
     def __init__(
@@ -62,6 +72,7 @@ class ValidateManager:
             int: the exit code to obtained from the calculations of post_results.
         """
         logger.info("Starting validate items.")
+        self.resolve_docker_images()
         for validator in self.validators:
             logger.debug(f"Starting execution for {validator.error_code} validator.")
             if filtered_content_objects_for_validator := list(
@@ -108,6 +119,26 @@ class ValidateManager:
             only_throw_warning=self.configured_validations.only_throw_warnings
         )
 
+    def resolve_docker_images(self):
+        """
+        Resolve the docker hub metadata of all the docker images of the content items concurrently,
+        instead of one request after the other when each docker validator checks each content item.
+        """
+        error_codes = {validator.error_code for validator in self.validators}
+        latest_tags = bool(error_codes & DOCKER_LATEST_TAG_VALIDATORS)
+        tags_metadata = bool(error_codes & DOCKER_TAG_METADATA_VALIDATORS)
+        if not latest_tags and not tags_metadata:
+            return
+        docker_images = {
+            content_object.docker_image
+            for content_object in self.objects_to_run
+            if isinstance(content_object, IntegrationScript)
+            and not content_object.is_javascript
+        }
+        DockerImageResolver().resolve(
+            docker_images, latest_tags=latest_tags, tags_metadata=tags_metadata
+        )
+
     def filter_validators(self) -> List[BaseValidator]:
         """
         Filter the validations by their error code
@@ -10,13 +10,6 @@ from demisto_sdk.commands.validate.validators.base_validator import (
 
 ContentTypes = Playbook
 
-MAPPER_DICT = {
-    "YES": ["YES", "TRUE POSITIVE"],
-    "TRUE POSITIVE": ["YES", "TRUE POSITIVE"],
-    "NO": ["NO", "FALSE POSITIVE"],
-    "FALSE POSITIVE": ["NO", "FALSE POSITIVE"],
-}
-
 
 class IsAskConditionHasUnhandledReplyOptionsValidator(BaseValidator[ContentTypes]):
     error_code = "PB123"
@@ -58,40 +51,8 @@ class IsAskConditionHasUnhandledReplyOptionsValidator(BaseValidator[ContentTypes
 
     @staticmethod
     def unhandled_conditions(playbook: ContentTypes):
-        unhandled_conditions = {}
-        tasks = playbook.tasks
-        for task in tasks.values():
-            if task.get("type") == "condition" and task.get("message"):
-                next_tasks: dict = task.get("nexttasks", {})
-
-                # ADD all replyOptions to unhandled_reply_options (UPPER)
-                unhandled_reply_options = set(
-                    map(str.upper, task.get("message", {}).get("replyOptions", []))
-                )
-
-                # Rename the keys in dictionary to upper case
-                next_tasks_upper = {k.upper(): v for k, v in next_tasks.items()}
-
-                # Remove all nexttasks from unhandled_reply_options (UPPER)
-                for next_task_branch, next_task_id in next_tasks_upper.items():
-                    key_to_remove = None
-                    if next_task_id and next_task_branch != "#DEFAULT#":
-                        for mapping in MAPPER_DICT.get(
-                            next_task_branch, [next_task_branch]
-                        ):
-                            if mapping in unhandled_reply_options:
-                                key_to_remove = mapping
-                        if key_to_remove:
-                            unhandled_reply_options.remove(key_to_remove)
-
-                if unhandled_reply_options:
-                    # if there's only one unhandled_reply_options and there's a #default#
-                    # then all good.
-                    # Otherwise - Error
-                    if not (
-                        len(unhandled_reply_options) == 1
-                        and "#DEFAULT#" in next_tasks_upper
-                    ):
-                        unhandled_conditions[task.get("id")] = unhandled_reply_options
-
-        return unhandled_conditions
+        return {
+            branches.task_id: branches.unhandled_reply_options
+            for branches in playbook.task_graph.ask_conditions.values()
+            if branches.unhandled_reply_options
+        }
@@ -30,7 +30,9 @@ class ConfJsonValidator:
                 [
                     item
                     for item in graph.search(
-                        content_type=content_type, object_id=conf_ids
+                        content_type=content_type,
+                        object_id=conf_ids,
+                        lazy_relationships=True,
                     )
                     if not isinstance(
                         item, UnknownContent
@@ -1,12 +1,16 @@
+import gzip
 import logging
 import os
+import re
 from pathlib import Path
+from threading import Lock
 
 import pytest
 import requests_mock
 import typer
 from typer.testing import CliRunner
 
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.test_content.xsiam_tools.test_data import Validations
 from TestSuite.test_tools import str_in_call_args_list
@@ -1795,3 +1799,184 @@ class TestDeleteExistingDataset:
                 )
         except typer.Exit:
             assert False, "No exception should be raised in this scenario."
+
+
+class FakeXsiamTenant:
+    def __init__(self, requests_mocker, base_url: str, installed_pack_ids: list):
+        """
+        A fake XSIAM tenant, which models the events pushed to it according to the expected values of the fake
+        test data file, and answers XQL queries by the modeled events.
+        Args:
+            requests_mocker: The requests mocker to register the tenant endpoints on.
+            base_url: The base url of the tenant.
+            installed_pack_ids: The IDs of the packs installed on the tenant.
+        """
+        from demisto_sdk.commands.test_content.xsiam_tools.test_data import TestData
+
+        self.lock = Lock()
+        self.queries: dict = {}
+        self.pushed_events: dict = {}
+        self.expected_values = {
+            json.dumps(event_log.event_data, sort_keys=True): event_log.expected_values
+            for event_log in TestData.parse_file(TEST_DATA_FILE_PATH.as_posix()).data
+        }
+        requests_mocker.get(
+            f"{base_url}/xsoar/contentpacks/metadata/installed",
+            json=[{"name": pack_id, "id": pack_id} for pack_id in installed_pack_ids],
+        )
+        requests_mocker.post(f"{base_url}/logs/v1/xsiam", json=self.push_to_dataset)
+        requests_mocker.post(
+            f"{base_url}/public_api/v1/xql/start_xql_query/", json=self.start_xql_query
+        )
+        requests_mocker.post(
+            f"{base_url}/public_api/v1/xql/get_query_results/",
+            json=self.get_query_results,
+        )
+
+    def push_to_dataset(self, request, context):
+        dataset = f"{request.headers['vendor']}_{request.headers['product']}_raw"
+        events = [
+            json.loads(line)
+            for line in gzip.decompress(request.body).decode().splitlines()
+        ]
+        with self.lock:
+            self.pushed_events.setdefault(dataset, []).extend(events)
+        return {}
+
+    def start_xql_query(self, request, context):
+        with self.lock:
+            execution_id = f"execution-{len(self.queries)}"
+            self.queries[execution_id] = request.json()["request_data"]["query"]
+        return {"reply": execution_id}
+
+    def run_query(self, query: str) -> list:
+        dataset = re.search(r"dataset(?: =|\s+in\()\s*(\w+)", query).group(1)  # type: ignore[union-attr]
+        with self.lock:
+            events = list(self.pushed_events.get(dataset, []))
+        if "datamodel" not in query:
+            return events
+        event_ids = re.findall(r'"([\w-]+)"', query)
+        return [
+            {
+                f"{dataset}.test_data_event_id": event["test_data_event_id"],
+                **self.expected_values[
+                    json.dumps(
+                        {
+                            key: value
+                            for key, value in event.items()
+                            if key != "test_data_event_id"
+                        },
+                        sort_keys=True,
+                    )
+                ],
+            }
+            for event in events
+            if event["test_data_event_id"] in event_ids
+        ]
+
+    def get_query_results(self, request, context):
+        query = self.queries[json.loads(request.body)["request_data"]["query_id"]]
+        return {
+            "reply": {"status": "SUCCESS", "results": {"data": self.run_query(query)}}
+        }
+
+
+def normalize_junit_xml(junit_xml: str) -> str:
+    """
+    Removes the parts of a JUnit XML which change between runs - durations, start times and the generated test data
+    event IDs.
+    """
+    junit_xml = re.sub(r' time="[^"]*"', "", junit_xml)
+    junit_xml = re.sub(r'<property name="start_time" value="[^"]*"', "", junit_xml)
+    junit_xml = re.sub(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+        "<uuid>",
+        junit_xml,
+    )
+    # the verification queries of different runs may be merged with other modeling rules
+    return re.sub(r"in\((&quot;<uuid>&quot;(, )?)+\)", "in(<uuids>)", junit_xml)
+
+
+class TestTheTestModelingRuleCommandParallel:
+    def test_parallel_run_matches_sequential_run(
+        self, repo, tmp_path, monkeypatch, mocker, requests_mocker
+    ):
+        """
+        Given:
+            - Three modeling rules with test data files, the pack of the last one is not installed on the tenant.
+            - A fake XSIAM tenant.
+
+        When:
+            - Running the command sequentially, and then with 3 workers.
+
+        Then:
+            - Verify both runs fail only because of the missing pack.
+            - Verify the JUnit XML of both runs is identical.
+            - Verify the parallel run waited for the datasets installation only once.
+            - Verify the parallel run merged the verification queries of the dataset.
+        """
+        monkeypatch.setenv("COLUMNS", "1000")
+
+        from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+            app as test_modeling_rule_cmd,
+        )
+
+        runner = CliRunner()
+        sleep = mocker.patch(
+            "demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule.sleep",
+            return_value=None,
+        )
+        modeling_rule_directories = []
+        for i in range(3):
+            pack = repo.create_pack(f"Pack{i}")
+            pack.create_modeling_rule(
+                DEFAULT_MODELING_RULE_NAME, rules=ONE_MODEL_RULE_TEXT
+            )
+            modeling_rule_directory = Path(
+                pack._modeling_rules_path / DEFAULT_MODELING_RULE_NAME
+            )
+            (
+                modeling_rule_directory / f"{DEFAULT_MODELING_RULE_NAME}_testdata.json"
+            ).write_text(TEST_DATA_FILE_PATH.read_text())
+            modeling_rule_directories.append(modeling_rule_directory.as_posix())
+
+        junit_xmls = {}
+        sleeps = {}
+        verification_queries = {}
+        for workers in (1, 3):
+            with SetFakeXsiamClientEnvironmentVars() as fake_env_vars:
+                tenant = FakeXsiamTenant(
+                    requests_mocker, fake_env_vars.demisto_base_url, ["Pack0", "Pack1"]
+                )
+                junit_path = tmp_path / f"junit_{workers}.xml"
+                sleep.reset_mock()
+                result = runner.invoke(
+                    test_modeling_rule_cmd,
+                    [
+                        *modeling_rule_directories,
+                        "--non-interactive",
+                        "--sleep_interval",
+                        "0",
+                        "--retry_attempts",
+                        "0",
+                        "--workers",
+                        str(workers),
+                        "--junit-path",
+                        junit_path.as_posix(),
+                    ],
+                )
+            assert result.exit_code == 1
+            junit_xmls[workers] = normalize_junit_xml(junit_path.read_text())
+            sleeps[workers] = [call.args for call in sleep.call_args_list].count((30,))
+            verification_queries[workers] = [
+                query for query in tenant.queries.values() if "| fields" in query
+            ]
+
+        assert "Pack not installed on tenant" in junit_xmls[1]
+        assert junit_xmls[1].count("<failure") == 0
+        assert junit_xmls[1].count("Check if dataset exists in tenant") == 4
+        assert junit_xmls[3] == junit_xmls[1]
+        assert sleeps == {1: 4, 3: 1}
+        # both modeling rules target the same dataset, so the parallel run verifies them by a single query
+        assert len(verification_queries[1]) == 2
+        assert len(verification_queries[3]) == 1